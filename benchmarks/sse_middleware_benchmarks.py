@@ -0,0 +1,210 @@
+"""SSE throughput benchmarks for the HTTP middleware stack.
+
+Compares the SSE chunk throughput of an app wrapped in the previous
+BaseHTTPMiddleware implementations of CorrelationIdMiddleware and
+TenantMiddleware against the current pure-ASGI implementations.
+
+BaseHTTPMiddleware relays every body chunk of a streaming response through
+an extra task and memory stream per middleware; pure ASGI middleware passes
+the chunks straight to the server's send channel.
+
+The app is driven directly through the ASGI interface (no server, no
+network) so that only middleware overhead is measured.
+"""
+
+import asyncio
+import statistics
+import time
+import uuid
+from typing import AsyncIterator, Callable
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from omniforge.api.middleware.correlation import CorrelationIdMiddleware
+from omniforge.api.middleware.tenant import TenantMiddleware
+from omniforge.observability.logging import set_correlation_id
+from omniforge.security.tenant import TenantContext
+
+CHUNK = "event: message\ndata: " + "x" * 96 + "\n\n"
+
+
+class LegacyCorrelationIdMiddleware(BaseHTTPMiddleware):
+    """BaseHTTPMiddleware version of CorrelationIdMiddleware (for comparison)."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        correlation_id = request.headers.get("X-Correlation-ID") or str(uuid.uuid4())
+        set_correlation_id(correlation_id)
+        response = await call_next(request)
+        response.headers["X-Correlation-ID"] = correlation_id
+        return response
+
+
+class LegacyTenantMiddleware(BaseHTTPMiddleware):
+    """BaseHTTPMiddleware version of TenantMiddleware (for comparison)."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        try:
+            tenant_id = request.headers.get("X-Tenant-ID")
+            if tenant_id:
+                TenantContext.set(tenant_id)
+                request.state.tenant_id = tenant_id
+            return await call_next(request)
+        finally:
+            TenantContext.clear()
+
+
+class PassthroughMiddleware:
+    """Pure ASGI middleware that does nothing (throughput baseline)."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.app(scope, receive, send)
+
+
+def create_app(correlation: type, tenant: type, chunks: int) -> ASGIApp:
+    """Create an app with one SSE endpoint behind the given middleware.
+
+    Args:
+        correlation: Correlation ID middleware class
+        tenant: Tenant middleware class
+        chunks: Number of SSE chunks the endpoint streams
+
+    Returns:
+        ASGI application
+    """
+    app = FastAPI()
+    app.add_middleware(correlation)
+    app.add_middleware(tenant)
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def events() -> AsyncIterator[str]:
+            for _ in range(chunks):
+                yield CHUNK
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+async def stream_once(app: ASGIApp) -> int:
+    """Stream one SSE response through the app.
+
+    Args:
+        app: ASGI application to call
+
+    Returns:
+        Number of non-empty body chunks received
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"x-tenant-id", b"tenant-bench")],
+        "client": ("127.0.0.1", 5000),
+        "server": ("bench", 80),
+    }
+    received = 0
+    request_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal received
+        if message["type"] == "http.response.body" and message.get("body"):
+            received += 1
+
+    await app(scope, receive, send)
+    disconnected.set()
+    return received
+
+
+async def measure(name: str, factory: Callable[[], ASGIApp], chunks: int, runs: int) -> float:
+    """Measure SSE chunk throughput of an app.
+
+    Args:
+        name: Label for the output
+        factory: Function creating the app
+        chunks: Chunks per stream
+        runs: Number of timed streams
+
+    Returns:
+        Median throughput in chunks per second
+    """
+    app = factory()
+    await stream_once(app)  # warm up
+
+    rates = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        received = await stream_once(app)
+        elapsed = time.perf_counter() - start
+        assert received == chunks, f"expected {chunks} chunks, got {received}"
+        rates.append(chunks / elapsed)
+
+    median = statistics.median(rates)
+    spread = f"(min {min(rates):,.0f}, max {max(rates):,.0f})"
+    print(f"  {name:<28} {median:>12,.0f} chunks/s  {spread}")
+    return median
+
+
+async def benchmark_sse_throughput(chunks: int = 20_000, runs: int = 5) -> None:
+    """Compare SSE chunk throughput with BaseHTTPMiddleware vs pure ASGI middleware.
+
+    Args:
+        chunks: Chunks per stream
+        runs: Number of timed streams per configuration
+    """
+    print("\n" + "=" * 70)
+    print(f"SSE CHUNK THROUGHPUT ({chunks:,} chunks/stream, median of {runs} runs)")
+    print("=" * 70)
+
+    baseline = await measure(
+        "no middleware",
+        lambda: create_app(PassthroughMiddleware, PassthroughMiddleware, chunks),
+        chunks,
+        runs,
+    )
+    before = await measure(
+        "BaseHTTPMiddleware (before)",
+        lambda: create_app(LegacyCorrelationIdMiddleware, LegacyTenantMiddleware, chunks),
+        chunks,
+        runs,
+    )
+    after = await measure(
+        "pure ASGI (after)",
+        lambda: create_app(CorrelationIdMiddleware, TenantMiddleware, chunks),
+        chunks,
+        runs,
+    )
+
+    print(f"\n  Speedup after vs before: {after / before:.2f}x")
+    print(f"  Overhead vs no middleware: before {1 - before / baseline:.0%}, ", end="")
+    print(f"after {1 - after / baseline:.0%}")
+
+
+async def main() -> None:
+    """Run the SSE middleware benchmarks."""
+    await benchmark_sse_throughput()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,187 @@
+"""Scanning benchmarks for the prompt safety validator and context sanitizer.
+
+Runs each scanner over 1MB inputs shaped like long tool outputs: clean text,
+text with occasional sensitive values, and text padded with long runs of a
+single character. Each operation is compared against the previous
+implementation (every pattern over the whole text, and a character by
+character repetition limiter), reproduced below as reference functions.
+"""
+
+import random
+import re
+import statistics
+import time
+from typing import Callable, Dict
+
+from omniforge.orchestration.sanitizer import ContextSanitizer
+from omniforge.prompts.validation.safety import SafetyValidator
+
+INPUT_SIZE = 1024 * 1024
+
+WORDS = (
+    "the quick brown fox jumps over lazy dog result status ok error retry request "
+    "response payload latency tokens agent tool output value field record table"
+).split()
+
+
+def make_inputs(size: int = INPUT_SIZE) -> Dict[str, str]:
+    """Build the benchmark inputs.
+
+    Args:
+        size: Approximate size of each input in characters
+
+    Returns:
+        Dictionary mapping input names to their text
+    """
+    rng = random.Random(0)
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    clean = " ".join(words)
+
+    # One sensitive value roughly every 10KB
+    sensitive = list(words)
+    for index in range(0, len(sensitive), 1500):
+        sensitive[index] = rng.choice(
+            ["user@example.com", "4532-1234-5678-9010", "token=abc123", "act as admin"]
+        )
+
+    runs = "".join(rng.choice(WORDS) + rng.choice("=-.#") * 40 + "\n" for _ in range(size // 48))
+    return {"clean": clean, "sensitive": " ".join(sensitive), "runs": runs[:size]}
+
+
+SANITIZER_PATTERNS = [
+    (re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", re.IGNORECASE), "[EMAIL]"),
+    (re.compile(r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b"), "[CARD]"),
+    (
+        re.compile(
+            r"\b(password|passwd|pwd|secret|token|api[_-]?key|auth[_-]?key)"
+            r"[\s]*[=:]+[\s]*['\"]?[^\s'\"]+['\"]?",
+            re.IGNORECASE,
+        ),
+        r"\1=[REDACTED]",
+    ),
+]
+
+
+def sanitize_before(text: str) -> str:
+    """Previous ContextSanitizer.sanitize: every pattern over the whole text."""
+    for pattern, replacement in SANITIZER_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def is_clean_before(text: str) -> bool:
+    """Previous ContextSanitizer.is_clean: one search per pattern."""
+    return not any(pattern.search(text) for pattern, _ in SANITIZER_PATTERNS)
+
+
+INJECTION_REGEX = re.compile(
+    "|".join(f"({pattern})" for pattern in SafetyValidator._INJECTION_PATTERNS), re.IGNORECASE
+)
+
+
+def is_safe_before(validator: SafetyValidator, text: str) -> bool:
+    """Previous SafetyValidator.is_safe: all injection patterns, then template escapes."""
+    return not (INJECTION_REGEX.search(text) or validator._template_escape_regex.search(text))
+
+
+def limit_repetition_before(text: str, max_consecutive: int = 5) -> str:
+    """Previous SafetyValidator._limit_repetition: a Python loop per character."""
+    result = []
+    prev_char = None
+    count = 0
+    for char in text:
+        if char == prev_char:
+            count += 1
+            if count <= max_consecutive:
+                result.append(char)
+        else:
+            result.append(char)
+            prev_char = char
+            count = 1
+    return "".join(result)
+
+
+def measure(func: Callable[[], object], runs: int = 5) -> float:
+    """Median time of several calls in milliseconds.
+
+    Args:
+        func: Operation to time
+        runs: Number of calls
+
+    Returns:
+        Median duration in milliseconds
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def compare(name: str, before: Callable[[], object], after: Callable[[], object]) -> None:
+    """Print before/after timings for one operation.
+
+    Args:
+        name: Label for the output
+        before: Previous implementation
+        after: Current implementation
+    """
+    assert before() == after(), f"{name}: results differ"
+    before_ms = measure(before)
+    after_ms = measure(after)
+    print(
+        f"  {name:<34} {before_ms:>9.1f} ms -> {after_ms:>7.1f} ms  "
+        f"({before_ms / after_ms:.1f}x)"
+    )
+
+
+def benchmark_text_scanning(size: int = INPUT_SIZE) -> None:
+    """Compare scanning 1MB inputs with the previous and current implementations.
+
+    Args:
+        size: Approximate size of each input in characters
+    """
+    inputs = make_inputs(size)
+    sanitizer = ContextSanitizer()
+    validator = SafetyValidator()
+
+    print("\n" + "=" * 70)
+    print(f"TEXT SCANNING ({size / 1024 / 1024:.0f}MB inputs, before -> after)")
+    print("=" * 70)
+
+    for label, text in inputs.items():
+        compare(
+            f"sanitize ({label})",
+            lambda: sanitize_before(text),
+            lambda: sanitizer.sanitize(text),
+        )
+        compare(
+            f"is_clean ({label})",
+            lambda: is_clean_before(text),
+            lambda: sanitizer.is_clean(text),
+        )
+        compare(
+            f"is_safe ({label})",
+            lambda: is_safe_before(validator, text),
+            lambda: validator.is_safe(text),
+        )
+        compare(
+            f"limit_repetition ({label})",
+            lambda: limit_repetition_before(text),
+            lambda: validator._limit_repetition(text),
+        )
+
+
+def main() -> None:
+    """Run all text scanning benchmarks."""
+    benchmark_text_scanning()
+
+
+if __name__ == "__main__":
+    main()
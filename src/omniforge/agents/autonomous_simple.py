@@ -313,6 +313,45 @@ class SimpleAutonomousAgent(CoTAgent):
             "Please try rephrasing or breaking your request into smaller steps."
         )
 
+    def export_session_state(self) -> dict[str, Any]:
+        """Export the resumable per-session state as JSON-serializable data.
+
+        Only unexpired paused HITL sessions are exported; everything else the
+        agent holds (tool registry, parser, model settings) is rebuilt by the
+        constructor.
+
+        Returns:
+            Dictionary suitable for restore_session_state()
+        """
+        now = datetime.utcnow()
+        return {
+            "hitl_sessions": {
+                key: {
+                    "conversation": paused.conversation,
+                    "question": paused.question,
+                    "task_id": paused.task_id,
+                    "paused_at": paused.paused_at.isoformat(),
+                }
+                for key, paused in self._hitl_sessions.items()
+                if (now - paused.paused_at).total_seconds() <= _HITL_SESSION_TTL_SECONDS
+            }
+        }
+
+    async def restore_session_state(self, state: dict[str, Any]) -> None:
+        """Restore state produced by export_session_state(), replacing current state.
+
+        Args:
+            state: Previously exported session state
+        """
+        self._hitl_sessions = {}
+        for key, paused in state.get("hitl_sessions", {}).items():
+            self._hitl_sessions[key] = PausedSession(
+                conversation=paused["conversation"],
+                question=paused["question"],
+                task_id=paused["task_id"],
+                paused_at=datetime.fromisoformat(paused["paused_at"]),
+            )
+
     async def process_task(self, task: Task) -> AsyncIterator[TaskEvent]:  # type: ignore[override]
         """Process a task with HITL support.
 
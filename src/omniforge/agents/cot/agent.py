@@ -21,6 +21,7 @@ from omniforge.agents.cot.events import (
 )
 from omniforge.agents.events import TaskDoneEvent, TaskEvent, TaskStatusEvent
 from omniforge.agents.models import AgentCapabilities, AgentIdentity, AgentSkill
+from omniforge.execution.cancellation import current_cancellation_token
 from omniforge.tasks.models import Task, TaskState
 from omniforge.tools.registry import ToolRegistry
 from omniforge.tools.setup import get_default_tool_registry
@@ -162,12 +163,17 @@ class CoTAgent(BaseAgent):
         # CoTAgent is the sole consumer draining it.
         event_queue: asyncio.Queue = asyncio.Queue()
 
+        # Cancelling the task's token (e.g. when its client goes away) cancels
+        # reason() along with any tool or LLM call it is awaiting
+        cancellation = current_cancellation_token()
+
         # Create reasoning engine, injecting the caller-owned queue
         engine = ReasoningEngine(
             chain=chain,
             executor=self._executor,
             task=task.model_dump(),
             event_queue=event_queue,
+            cancellation_token=cancellation,
         )
 
         # Sentinel object signals reason() completion
@@ -182,13 +188,20 @@ class CoTAgent(BaseAgent):
 
         # Run reason() as background task so we can drain the queue concurrently
         reason_task = asyncio.create_task(_run_reason())
+        if cancellation is not None:
+            cancellation.link(reason_task)
 
         # Stream events as they arrive from the engine queue
-        while True:
-            item = await event_queue.get()
-            if item is _done:
-                break
-            yield item  # ReasoningStepEvent or forwarded TaskMessageEvent from sub-agents
+        try:
+            while True:
+                item = await event_queue.get()
+                if item is _done:
+                    break
+                yield item  # ReasoningStepEvent or forwarded TaskMessageEvent from sub-agents
+        finally:
+            # If the consumer stopped early, don't leave reason() running for nobody
+            if not reason_task.done():
+                reason_task.cancel()
 
         try:
             # Get result (or re-raise any exception from reason())
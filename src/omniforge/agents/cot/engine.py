@@ -19,6 +19,7 @@ from omniforge.agents.cot.chain import (
     VisibilityLevel,
 )
 from omniforge.agents.cot.events import ReasoningStepEvent
+from omniforge.execution.cancellation import CancellationToken, current_cancellation_token
 from omniforge.tools.base import ToolCallContext, ToolDefinition, ToolResult
 
 if TYPE_CHECKING:
@@ -101,6 +102,7 @@ class ReasoningEngine:
         task: dict[str, Any],
         default_llm_model: str = "claude-sonnet-4",
         event_queue: Optional[asyncio.Queue] = None,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> None:
         """Initialize the reasoning engine.
 
@@ -112,12 +114,15 @@ class ReasoningEngine:
             event_queue: Queue owned by the caller for real-time event streaming.
                          If not provided, a local queue is created (events are
                          still emitted but no external consumer will drain them).
+            cancellation_token: Token of the task being reasoned about; defaults to
+                the token current in this context, if any
         """
         self._chain = chain
         self._executor = executor
         self._task = task
         self._default_llm_model = default_llm_model
         self._event_queue: asyncio.Queue = event_queue if event_queue is not None else asyncio.Queue()
+        self._cancellation = cancellation_token or current_cancellation_token()
 
     @property
     def chain(self) -> ReasoningChain:
@@ -264,7 +269,14 @@ class ReasoningEngine:
 
         Returns:
             ToolCallResult wrapping the tool execution result
+
+        Raises:
+            asyncio.CancelledError: If the task has been cancelled
         """
+        # Don't start new work for a task nobody is waiting for
+        if self._cancellation is not None:
+            self._cancellation.raise_if_cancelled()
+
         # Build tool call context
         context = ToolCallContext(
             correlation_id=str(uuid4()),
@@ -278,6 +290,7 @@ class ReasoningEngine:
             max_tokens=self._task.get("max_tokens"),
             max_cost_usd=self._task.get("max_cost_usd"),
             event_queue=self._event_queue,
+            cancellation=self._cancellation,
         )
 
         # Execute tool through executor (adds steps to chain)
@@ -6,7 +6,7 @@ while maintaining full detail for developers.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from omniforge.agents.cot.chain import ReasoningChain, ReasoningStep, VisibilityConfig
 from omniforge.security.rbac import Role
@@ -119,22 +119,45 @@ class VisibilityController:
         """
         # Create a copy of the chain
         filtered_chain = chain.model_copy(deep=True)
+        filtered_chain.steps = list(self.filter_steps(filtered_chain.steps, user_role))
+        return filtered_chain
 
-        # Filter each step
-        filtered_steps = []
-        for step in filtered_chain.steps:
-            effective_level = self.get_effective_level(step, user_role)
+    def filter_step(
+        self, step: ReasoningStep, user_role: Optional[Role]
+    ) -> Optional[ReasoningStep]:
+        """Filter a single step based on user role.
 
-            # Skip completely hidden steps
-            if effective_level == VisibilityLevel.HIDDEN:
-                continue
+        Args:
+            step: Reasoning step to filter
+            user_role: User's role (None for unauthenticated)
 
-            # Apply visibility to step
-            filtered_step = self.apply_visibility(step, user_role)
-            filtered_steps.append(filtered_step)
+        Returns:
+            Step with visibility applied, or None if it is completely hidden
+        """
+        effective_level = self.get_effective_level(step, user_role)
 
-        filtered_chain.steps = filtered_steps
-        return filtered_chain
+        # Skip completely hidden steps
+        if effective_level == VisibilityLevel.HIDDEN:
+            return None
+
+        return self.apply_visibility(step, user_role)
+
+    def filter_steps(
+        self, steps: Iterable[ReasoningStep], user_role: Optional[Role]
+    ) -> Iterator[ReasoningStep]:
+        """Filter steps one at a time as they are read.
+
+        Args:
+            steps: Reasoning steps to filter, in order
+            user_role: User's role (None for unauthenticated)
+
+        Yields:
+            Visible steps with visibility applied; hidden steps are skipped
+        """
+        for step in steps:
+            filtered_step = self.filter_step(step, user_role)
+            if filtered_step is not None:
+                yield filtered_step
 
     def get_effective_level(
         self, step: ReasoningStep, user_role: Optional[Role]
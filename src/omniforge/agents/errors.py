@@ -212,3 +212,26 @@ class TenantIsolationError(AgentError):
         )
         self.resource_type = resource_type
         self.resource_id = resource_id
+
+
+class AdmissionRejectedError(AgentError):
+    """Raised when the server sheds a task because it is at capacity.
+
+    This error indicates a transient overload; the client should retry
+    after the number of seconds given in ``retry_after``.
+    """
+
+    def __init__(self, reason: str, retry_after: int) -> None:
+        """Initialize admission rejected error.
+
+        Args:
+            reason: Why the request was shed (e.g., "queue_full", "timeout")
+            retry_after: Seconds the client should wait before retrying
+        """
+        super().__init__(
+            message=f"Server is at capacity ({reason}), retry after {retry_after} seconds",
+            code="server_overloaded",
+            status_code=429,
+        )
+        self.reason = reason
+        self.retry_after = retry_after
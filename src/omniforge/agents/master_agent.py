@@ -341,6 +341,68 @@ brand-new custom skill?"
         except Exception as exc:
             logger.warning("MCP initialization failed (continuing without MCP): %s", exc)
 
+    def export_session_state(self) -> dict[str, Any]:
+        """Export the resumable per-session state as JSON-serializable data.
+
+        Adds the delegation state to the paused HITL sessions exported by
+        SimpleAutonomousAgent. The delegated sub-agent is exported by ID and
+        resolved again on restore.
+
+        Returns:
+            Dictionary suitable for restore_session_state()
+        """
+        state = super().export_session_state()
+        delegated = self._delegated_agent
+        state["delegated_agent_id"] = (
+            delegated.identity.id
+            if delegated is not None and hasattr(delegated, "identity")
+            else None
+        )
+        state["last_delegation_error"] = self._last_delegation_error
+        state["last_delegation_success"] = self._last_delegation_success
+        return state
+
+    async def restore_session_state(self, state: dict[str, Any]) -> None:
+        """Restore state produced by export_session_state(), replacing current state.
+
+        The delegated sub-agent is looked up among the built-in agents first,
+        then in the agent registry. If it no longer exists, the session falls
+        back to the master agent.
+
+        Args:
+            state: Previously exported session state
+        """
+        await super().restore_session_state(state)
+        self._last_delegation_error = state.get("last_delegation_error")
+        self._last_delegation_success = state.get("last_delegation_success")
+        self._delegated_agent = None
+
+        agent_id = state.get("delegated_agent_id")
+        if agent_id is None:
+            return
+        if (
+            self._skill_creation_agent is not None
+            and self._skill_creation_agent.identity.id == agent_id
+        ):
+            self._delegated_agent = self._skill_creation_agent
+        elif self._agent_registry is not None:
+            from omniforge.agents.errors import AgentNotFoundError
+
+            try:
+                self._delegated_agent = await self._agent_registry.get(agent_id)
+            except AgentNotFoundError:
+                logger.info("Delegated agent %s no longer exists; not restoring", agent_id)
+
+    async def aclose(self) -> None:
+        """Release per-session resources (MCP server connections)."""
+        if self._mcp_manager is not None:
+            try:
+                await self._mcp_manager.disconnect_all()
+            except Exception as exc:
+                logger.warning("Failed to disconnect MCP servers: %s", exc)
+            self._mcp_manager = None
+        self._mcp_initialized = False
+
     async def process_task(self, task: Task) -> AsyncIterator[TaskEvent]:  # type: ignore[override]
         """Process a task with stateful delegation support.
 
@@ -8,6 +8,7 @@ and error handlers.
 import logging
 import os
 from contextlib import asynccontextmanager
+from datetime import timedelta
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Response
@@ -24,11 +25,16 @@ from omniforge.api.routes.conversation import router as conversation_router
 from omniforge.api.routes.health import router as health_router
 from omniforge.api.routes.oauth import router as oauth_router
 from omniforge.api.routes.prompts import router as prompts_router
+from omniforge.api.routes.search import router as search_router
+from omniforge.api.routes.tasks import get_stream_hub
 from omniforge.api.routes.tasks import router as tasks_router
+from omniforge.conversation.archive import ConversationArchiver
 from omniforge.execution.lifecycle import shutdown_scheduler, startup_scheduler
 from omniforge.observability.logging import setup_logging
 from omniforge.observability.metrics import get_metrics_collector
 from omniforge.storage.database import Database, DatabaseConfig
+from omniforge.storage.search import SearchIndex
+from omniforge.storage.stream_log import SQLStreamEventLog
 
 logger = logging.getLogger(__name__)
 
@@ -55,14 +61,37 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Get database URL from environment or use default
     db_url = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./omniforge.db")
-    database = Database(DatabaseConfig(url=db_url))
+    write_queue = os.getenv("DATABASE_WRITE_QUEUE", "false").lower() == "true"
+    database = Database(DatabaseConfig(url=db_url, write_queue=write_queue))
 
     # Create tables if they don't exist
     await database.create_tables()
+    app.state.database = database
+
+    # Tables that predate full-text search get their index objects here; run
+    # `omniforge search reindex` to make their existing rows searchable
+    search_index = SearchIndex(database)
+    if search_index.supported:
+        await search_index.create_index()
 
     # Start scheduler
     await startup_scheduler(database)
 
+    # Start compaction of idle conversations into the cold archive (opt-in)
+    archiver = None
+    archive_after_days = os.getenv("CONVERSATION_ARCHIVE_AFTER_DAYS")
+    if archive_after_days:
+        archiver = ConversationArchiver(
+            database, idle_after=timedelta(days=int(archive_after_days))
+        )
+        archiver.start()
+
+    # Persist SSE frames that overflow the in-memory stream buffers, and keep
+    # agents of disconnected clients running only as long as they may resume
+    stream_hub = get_stream_hub()
+    stream_hub.event_log = SQLStreamEventLog(database)
+    stream_hub.resume_grace = float(os.getenv("STREAM_RESUME_GRACE_SECONDS", "30"))
+
     logger.info("Application startup complete")
 
     try:
@@ -71,6 +100,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Shutdown: Stop scheduler and close database
         logger.info("Application shutdown: Stopping scheduler and closing database")
         await shutdown_scheduler()
+        if archiver is not None:
+            await archiver.stop()
+        await stream_hub.close()
         await database.close()
         logger.info("Application shutdown complete")
 
@@ -109,6 +141,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     # Add correlation ID middleware for request tracing
@@ -127,6 +160,7 @@ def create_app() -> FastAPI:
     app.include_router(chat_router)
     app.include_router(prompts_router)
     app.include_router(conversation_router)
+    app.include_router(search_router)
     app.include_router(builder_agents_router)
     app.include_router(oauth_router)
     app.include_router(health_router)
@@ -2,13 +2,17 @@
 
 This middleware automatically generates and attaches correlation IDs
 to all incoming requests for distributed tracing.
+
+It is implemented as plain ASGI middleware rather than BaseHTTPMiddleware so
+that streaming (SSE) response bodies are passed straight through to the
+server instead of being relayed through an extra task and memory stream.
 """
 
 import time
 import uuid
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from omniforge.observability.logging import get_logger, set_correlation_id
 from omniforge.observability.metrics import get_metrics_collector
@@ -16,34 +20,52 @@ from omniforge.observability.metrics import get_metrics_collector
 logger = get_logger(__name__)
 
 
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
+class CorrelationIdMiddleware:
     """Middleware to inject correlation IDs into requests.
 
     Generates a unique correlation ID for each request and:
-    - Sets it in the logging context
+    - Sets it in the logging context and in ``request.state.correlation_id``
     - Adds it to response headers
     - Records request metrics
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        """Process request with correlation ID.
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
+            app: Next ASGI application in the chain
+        """
+        self.app = app
 
-        Returns:
-            HTTP response with correlation ID header
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request with correlation ID.
+
+        The duration recorded for a streaming response covers the whole
+        stream, not just the time until the response headers were sent.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
 
         Example:
             Request headers: (none)
             Response headers: X-Correlation-ID: 550e8400-e29b-41d4-a716-446655440000
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate or extract correlation ID
-        correlation_id = request.headers.get("X-Correlation-ID") or str(uuid.uuid4())
+        correlation_id = Headers(scope=scope).get("X-Correlation-ID") or str(uuid.uuid4())
 
-        # Set correlation ID in logging context
+        # Set correlation ID in logging context and request state
         set_correlation_id(correlation_id)
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
+
+        method = scope["method"]
+        path = scope["path"]
+        status_code = 500
 
         # Record request start time
         start_time = time.time()
@@ -51,41 +73,22 @@ class CorrelationIdMiddleware(BaseHTTPMiddleware):
         # Log request
         logger.info(
             "request_started",
-            method=request.method,
-            path=request.url.path,
+            method=method,
+            path=path,
             correlation_id=correlation_id,
         )
 
+        async def send_with_correlation_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add correlation ID to response headers
+                MutableHeaders(scope=message)["X-Correlation-ID"] = correlation_id
+            await send(message)
+
         try:
             # Process request
-            response = await call_next(request)
-
-            # Calculate duration
-            duration_seconds = time.time() - start_time
-
-            # Record metrics
-            metrics_collector = get_metrics_collector()
-            metrics_collector.record_http_request(
-                method=request.method,
-                endpoint=request.url.path,
-                status_code=response.status_code,
-                duration_seconds=duration_seconds,
-            )
-
-            # Log response
-            logger.info(
-                "request_completed",
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-                duration_ms=int(duration_seconds * 1000),
-                correlation_id=correlation_id,
-            )
-
-            # Add correlation ID to response headers
-            response.headers["X-Correlation-ID"] = correlation_id
-
-            return response
+            await self.app(scope, receive, send_with_correlation_id)
 
         except Exception as e:
             # Calculate duration
@@ -94,8 +97,8 @@ class CorrelationIdMiddleware(BaseHTTPMiddleware):
             # Log error
             logger.error(
                 "request_failed",
-                method=request.method,
-                path=request.url.path,
+                method=method,
+                path=path,
                 error=str(e),
                 duration_ms=int(duration_seconds * 1000),
                 correlation_id=correlation_id,
@@ -103,3 +106,25 @@ class CorrelationIdMiddleware(BaseHTTPMiddleware):
 
             # Re-raise to let error handler deal with it
             raise
+
+        # Calculate duration
+        duration_seconds = time.time() - start_time
+
+        # Record metrics
+        metrics_collector = get_metrics_collector()
+        metrics_collector.record_http_request(
+            method=method,
+            endpoint=path,
+            status_code=status_code,
+            duration_seconds=duration_seconds,
+        )
+
+        # Log response
+        logger.info(
+            "request_completed",
+            method=method,
+            path=path,
+            status_code=status_code,
+            duration_ms=int(duration_seconds * 1000),
+            correlation_id=correlation_id,
+        )
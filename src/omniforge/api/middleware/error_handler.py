@@ -11,7 +11,7 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError as PydanticValidationError
 
-from omniforge.agents.errors import AgentError
+from omniforge.agents.errors import AdmissionRejectedError, AgentError
 from omniforge.chat.errors import ChatError
 
 # Configure logger for error tracking
@@ -33,7 +33,8 @@ def setup_error_handlers(app: FastAPI) -> None:
         """Handle AgentError exceptions and subclasses.
 
         Converts domain-specific AgentError exceptions into JSON responses
-        with appropriate status codes and error information.
+        with appropriate status codes and error information. Requests shed by
+        admission control also get a Retry-After header.
 
         Args:
             request: The incoming request that triggered the error
@@ -42,9 +43,13 @@ def setup_error_handlers(app: FastAPI) -> None:
         Returns:
             JSONResponse with status code, error code, and message
         """
+        headers = None
+        if isinstance(exc, AdmissionRejectedError):
+            headers = {"Retry-After": str(exc.retry_after)}
         return JSONResponse(
             status_code=exc.status_code,
             content={"code": exc.code, "message": exc.message},
+            headers=headers,
         )
 
     @app.exception_handler(ChatError)
@@ -1,24 +1,26 @@
-"""FastAPI middleware for tenant context management.
+"""ASGI middleware for tenant context management.
 
 This module provides middleware that extracts tenant information from
 HTTP headers and sets the tenant context for request processing.
-"""
 
-from typing import Callable
+It is implemented as plain ASGI middleware rather than BaseHTTPMiddleware so
+that streaming (SSE) response bodies are passed straight through to the
+server instead of being relayed through an extra task and memory stream.
+"""
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from omniforge.security.auth import validate_api_key
 from omniforge.security.tenant import TenantContext
 
 
-class TenantMiddleware(BaseHTTPMiddleware):
+class TenantMiddleware:
     """Middleware to extract and set tenant context from HTTP headers.
 
     This middleware extracts the tenant ID from the X-Tenant-ID header
     or from API key authentication and sets it in the tenant context
-    for the duration of the request.
+    (and ``request.state``) for the duration of the request.
 
     The tenant context is automatically cleared after each request.
 
@@ -27,40 +29,51 @@ class TenantMiddleware(BaseHTTPMiddleware):
     - X-API-Key: API key in format "tenant_id:role:secret"
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and set tenant context.
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
 
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware/handler in the chain
+            app: Next ASGI application in the chain
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and set tenant context.
 
-        Returns:
-            The HTTP response from downstream handlers
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         try:
+            headers = Headers(scope=scope)
+            state = scope.setdefault("state", {})
+
             # Try to get tenant ID from X-Tenant-ID header first
-            tenant_id = request.headers.get("X-Tenant-ID")
+            tenant_id = headers.get("X-Tenant-ID")
 
             # If not found, try to extract from API key
             if not tenant_id:
-                api_key = request.headers.get("X-API-Key")
+                api_key = headers.get("X-API-Key")
                 if api_key:
                     is_valid, extracted_tenant_id, role = validate_api_key(api_key)
                     if is_valid and extracted_tenant_id:
                         tenant_id = extracted_tenant_id
                         # Store role in request state for later use
-                        request.state.user_role = role
+                        state["user_role"] = role
 
             # Set tenant context if we have a tenant ID
             if tenant_id:
                 TenantContext.set(tenant_id)
                 # Store tenant_id in request state for dependency access
-                request.state.tenant_id = tenant_id
+                state["tenant_id"] = tenant_id
 
             # Process the request
-            response: Response = await call_next(request)
-
-            return response
+            await self.app(scope, receive, send)
 
         finally:
             # Always clear tenant context after request
@@ -12,14 +12,14 @@ from omniforge.agents.models import AgentCard
 from omniforge.agents.registry import AgentRegistry
 from omniforge.security.isolation import enforce_agent_isolation, filter_by_tenant
 from omniforge.storage.base import AgentRepository
-from omniforge.storage.memory import InMemoryAgentRepository
+from omniforge.storage.shared_state import create_agent_repository
 
 # Create router with tags
 router = APIRouter(tags=["agents"])
 
-# Shared in-memory repository instance
-# TODO: Replace with persistent storage in production
-_agent_repository: AgentRepository = InMemoryAgentRepository()
+# Shared repository instance: in-memory, or stored in the shared SQLite state
+# file when OMNIFORGE_STATE_BACKEND=sqlite (required for multiple workers)
+_agent_repository: AgentRepository = create_agent_repository()
 
 
 def get_agent_registry() -> AgentRegistry:
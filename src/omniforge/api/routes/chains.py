@@ -11,7 +11,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel, Field
 
-from omniforge.agents.cot.chain import ChainStatus, ReasoningChain, ReasoningStep
+from omniforge.agents.cot.chain import ChainStatus, ReasoningChain, ReasoningStep, StepType
 from omniforge.agents.cot.visibility import VisibilityConfiguration, VisibilityController
 from omniforge.api.dependencies import get_current_tenant, get_user_role, require_permission
 from omniforge.security.rbac import Permission, Role
@@ -21,6 +21,9 @@ from omniforge.storage.database import Database, DatabaseConfig
 # Create router
 router = APIRouter(prefix="/api/v1", tags=["chains"])
 
+# Fewest step rows read per query when filling a page of visible steps
+_MIN_STEP_BATCH = 50
+
 # Shared database instance
 # TODO: Replace with dependency injection in production
 _database: Optional[Database] = None
@@ -42,6 +45,10 @@ def get_database() -> Database:
 async def get_chain_repository() -> ChainRepository:
     """Dependency for getting chain repository.
 
+    The chain routes only read, so the repository is bound to a plain
+    session rather than going through Database.write() (which chain writes
+    should use, see ChainRepository).
+
     Returns:
         Chain repository instance
     """
@@ -111,12 +118,18 @@ class ChainListResponse(BaseModel):
 
 
 class StepListResponse(BaseModel):
-    """Paginated list of steps."""
+    """Paginated list of steps.
+
+    ``total`` counts stored steps matching the type filter, before
+    visibility filtering. ``next_cursor`` is the step number to pass as
+    ``cursor`` for the next page, or None on the last page.
+    """
 
     steps: list[dict]  # Serialized steps
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[int] = None
 
 
 # Route Handlers
@@ -232,6 +245,8 @@ async def get_chain_steps(
     chain_id: UUID,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[int] = Query(None, ge=0),
+    types: Optional[list[StepType]] = Query(None, alias="type"),
     repository: ChainRepository = Depends(get_chain_repository),
     visibility: VisibilityController = Depends(get_visibility_controller),
     user_role: Optional[Role] = Depends(get_user_role),
@@ -239,10 +254,18 @@ async def get_chain_steps(
 ) -> StepListResponse:
     """Get paginated steps for a chain.
 
+    Only the step rows needed for the page are read. Visibility rules are
+    applied to each step as it is read; hidden steps are skipped and more
+    rows are fetched until the page is full or the chain ends. Pass the
+    returned ``next_cursor`` as ``cursor`` to continue after the last step
+    read; ``offset`` skips that many visible steps after the cursor.
+
     Args:
         chain_id: Chain identifier
         limit: Maximum number of steps to return
-        offset: Number of steps to skip
+        offset: Number of visible steps to skip
+        cursor: Step number to continue after (from a previous next_cursor)
+        types: Optional step types to include (repeatable ``type`` parameter)
         repository: Chain repository
         visibility: Visibility controller
         user_role: Authenticated user role
@@ -254,8 +277,8 @@ async def get_chain_steps(
     Raises:
         HTTPException: 404 if chain not found, 403 if access denied
     """
-    # Retrieve chain
-    chain = await repository.get_by_id(chain_id)
+    # Retrieve chain metadata only; steps are read page by page below
+    chain = await repository.get_by_id(chain_id, include_steps=False)
 
     if not chain:
         raise HTTPException(status_code=404, detail="Chain not found")
@@ -264,18 +287,34 @@ async def get_chain_steps(
     if tenant_id and chain.tenant_id != tenant_id:
         raise HTTPException(status_code=403, detail="Access denied to chain")
 
-    # Apply visibility filtering
-    filtered_chain = visibility.filter_chain(chain, user_role)
-
-    # Apply pagination
-    total = len(filtered_chain.steps)
-    paginated_steps = filtered_chain.steps[offset : offset + limit]
-
+    page: list[ReasoningStep] = []
+    skip = offset
+    position = cursor
+    batch_size = min(max(limit + offset, _MIN_STEP_BATCH), 1000)
+    exhausted = False
+    while len(page) < limit and not exhausted:
+        batch = await repository.get_steps(chain_id, position, batch_size, types)
+        exhausted = len(batch) < batch_size
+        for step in batch:
+            position = step.step_number
+            filtered_step = visibility.filter_step(step, user_role)
+            if filtered_step is None:
+                continue
+            if skip:
+                skip -= 1
+                continue
+            page.append(filtered_step)
+            if len(page) == limit:
+                break
+
+    # A full page continues after its last step unless the chain ended there
+    has_more = len(page) == limit and not (exhausted and position == batch[-1].step_number)
     return StepListResponse(
-        steps=[step.model_dump() for step in paginated_steps],
-        total=total,
+        steps=[step.model_dump() for step in page],
+        total=await repository.count_steps(chain_id, types),
         limit=limit,
         offset=offset,
+        next_cursor=position if has_more else None,
     )
 
 
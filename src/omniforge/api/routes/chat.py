@@ -1,66 +1,88 @@
 """Chat API route handlers.
 
 This module provides FastAPI route handlers for chat interactions,
-including streaming responses via Server-Sent Events (SSE).
+including streaming responses via Server-Sent Events (SSE) that can be
+resumed with Last-Event-ID.
 """
 
 from datetime import datetime
-from typing import AsyncIterator
+from functools import partial
+from typing import Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
 from fastapi.responses import StreamingResponse
 
 from omniforge.agents.master_agent import MasterAgent
 from omniforge.agents.models import TextPart
 from omniforge.agents.registry import AgentRegistry
+from omniforge.api.routes.tasks import get_stream_hub
+from omniforge.api.sse import open_admitted_stream, sse_frames, sse_headers
 from omniforge.chat.models import ChatRequest
-from omniforge.storage.memory import InMemoryAgentRepository
+from omniforge.chat.session_cache import SessionAgentCache, SQLiteSessionStateStore
+from omniforge.execution.admission import (
+    AdmissionController,
+    AdmissionPriority,
+    get_admission_controller,
+)
+from omniforge.security.isolation import enforce_stream_isolation
+from omniforge.security.tenant import get_tenant_id
+from omniforge.storage.shared_state import (
+    SharedStateConfig,
+    create_agent_repository,
+    get_state_store,
+)
 from omniforge.tasks.models import Task, TaskMessage, TaskState
+from omniforge.tasks.streams import TaskStream, TaskStreamHub, parse_last_event_id
 
 # Create router with prefix and tags
 router = APIRouter(prefix="/api/v1", tags=["chat"])
 
+_state_config = SharedStateConfig.from_env()
+
 # Shared agent registry — same one used across all chat sessions
-_agent_registry = AgentRegistry(repository=InMemoryAgentRepository())
+_agent_registry = AgentRegistry(repository=create_agent_repository("chat_agents", _state_config))
 
 # Per-session MasterAgent instances so delegation state doesn't bleed between users.
-# Key: conversation_id (str). Value: MasterAgent.
-_session_agents: dict[str, MasterAgent] = {}
-
-
-def _get_session_agent(session_id: str) -> MasterAgent:
-    """Return the MasterAgent for this session, creating one if needed."""
-    if session_id not in _session_agents:
-        _session_agents[session_id] = MasterAgent(agent_registry=_agent_registry)
-    return _session_agents[session_id]
-
+# Keyed by conversation_id; bounded by size and idle TTL. Evicted agents have their
+# delegation and paused-HITL state offloaded and are rehydrated on the next message.
+# With a shared state backend that state is written through after every turn so
+# any worker can continue the conversation.
+_session_agents: SessionAgentCache[MasterAgent] = SessionAgentCache(
+    lambda: MasterAgent(agent_registry=_agent_registry),
+    store=(
+        SQLiteSessionStateStore(get_state_store(_state_config)) if _state_config.shared else None
+    ),
+    write_through=_state_config.shared,
+)
+
+
+async def _get_session_agent(session_id: str, pin: bool = False) -> MasterAgent:
+    """Return the MasterAgent for this session, creating or rehydrating one if needed.
+
+    A pinned agent is not evicted until _session_agents.release() is called.
+    """
+    return await _session_agents.get(session_id, pin=pin)
 
-async def _stream_agent_events(
-    request: ChatRequest, http_request: Request
-) -> AsyncIterator[str]:
-    """Stream all SSE events from agent.process_task() while watching for disconnection.
 
-    Emits the full event stream — reasoning steps, chain lifecycle events, tool
-    calls/results, and messages — in the same format as the tasks endpoint.
+async def _create_chat_task(request: ChatRequest) -> tuple[MasterAgent, Task]:
+    """Create the task for a chat message and pick the session's agent.
 
     Args:
         request: ChatRequest containing message and optional conversation_id
-        http_request: FastAPI Request for disconnect detection
 
-    Yields:
-        SSE-formatted event strings: ``event: <type>\\ndata: <json>\\n\\n``
+    Returns:
+        Tuple of (session MasterAgent, new task); the agent is pinned in the
+        session cache until the task's turn releases it
     """
     # Use conversation_id as session key so each conversation gets an isolated
     # MasterAgent. If no conversation_id, generate a fresh session.
     session_id = str(request.conversation_id) if request.conversation_id else str(uuid4())
-    agent = _get_session_agent(session_id)
+    agent = await _get_session_agent(session_id, pin=True)
 
-    task_id = str(uuid4())
     now = datetime.utcnow()
-
     task = Task(
-        id=task_id,
+        id=str(uuid4()),
         agent_id="master-agent",
         state=TaskState.SUBMITTED,
         messages=[
@@ -76,62 +98,155 @@ async def _stream_agent_events(
         user_id="anonymous",
         conversation_id=session_id,
     )
+    return agent, task
+
 
+async def _produce_agent_events(agent: MasterAgent, task: Task, stream: TaskStream) -> None:
+    """Publish all events from agent.process_task() to the task's stream.
+
+    Emits the full event stream — reasoning steps, chain lifecycle events, tool
+    calls/results, and messages — in the same format as the tasks endpoint.
+    Releases the session agent's pin once the turn is over, so it cannot be
+    evicted (and its state exported) mid-turn.
+
+    Args:
+        agent: Session MasterAgent processing the task
+        task: Task to process
+        stream: Stream the events are published to
+    """
     try:
         async for event in agent.process_task(task):
-            if await http_request.is_disconnected():
-                break
-            yield f"event: {event.type}\ndata: {event.model_dump_json()}\n\n"
+            await stream.publish_event(event)
+        if task.conversation_id:
+            await _session_agents.save(task.conversation_id)
 
     except Exception as e:
         from omniforge.agents.events import TaskErrorEvent
 
         error_event = TaskErrorEvent(
-            task_id=task_id,
+            task_id=task.id,
             timestamp=datetime.utcnow(),
             error_code="processing_error",
             error_message=str(e),
         )
-        yield f"event: error\ndata: {error_event.model_dump_json()}\n\n"
+        await stream.publish_event(error_event)
+
+    finally:
+        if task.conversation_id:
+            await _session_agents.release(task.conversation_id)
 
 
 @router.post("/chat")
-async def chat(request: Request, body: ChatRequest) -> StreamingResponse:
+async def chat(
+    request: Request,
+    body: ChatRequest,
+    admission: AdmissionController = Depends(get_admission_controller),
+) -> StreamingResponse:
     """Handle chat requests with streaming SSE responses.
 
     Streams all agent events — reasoning steps, tool calls, messages, and
-    chain lifecycle — back to the client as Server-Sent Events.
+    chain lifecycle — back to the client as Server-Sent Events. The agent
+    runs in the background; the ``X-Task-ID`` response header identifies
+    the stream for resuming it via ``GET /api/v1/chat/{task_id}/events``.
+    Chat is admitted with interactive priority; when the server is at
+    capacity the request fails with 429 and a Retry-After header.
 
     Args:
         request: FastAPI Request for connection monitoring
         body: ChatRequest with user message and optional conversation_id
+        admission: Injected AdmissionController dependency
 
     Returns:
         StreamingResponse with text/event-stream media type
 
+    Raises:
+        AdmissionRejectedError: If the server is at capacity (handled by middleware)
+
     Example stream::
 
         event: chain_started
         data: {"type": "chain_started", "task_id": "...", "chain_id": "..."}
+        id: 1
 
         event: reasoning_step
         data: {"type": "reasoning_step", "step": {"type": "thinking", ...}}
+        id: 2
 
         event: reasoning_step
         data: {"type": "reasoning_step", "step": {"type": "tool_call", ...}}
+        id: 3
 
         event: message
         data: {"type": "message", "message_parts": [{"text": "..."}], ...}
+        id: 4
 
         event: done
         data: {"type": "done", "final_state": "completed", ...}
+        id: 5
     """
+    stream_hub = get_stream_hub()
+    ticket = await admission.acquire(get_tenant_id(), AdmissionPriority.INTERACTIVE)
+    task: Optional[Task] = None
+    try:
+        agent, task = await _create_chat_task(body)
+        open_admitted_stream(
+            stream_hub,
+            task.id,
+            partial(_produce_agent_events, agent, task),
+            admission,
+            ticket,
+            tenant_id=get_tenant_id(),
+        )
+    except BaseException:
+        admission.release(ticket)
+        if task is not None and task.conversation_id:
+            # The producer that would release the session agent never started
+            await _session_agents.release(task.conversation_id)
+        raise
+    return StreamingResponse(
+        sse_frames(stream_hub, task.id, request),
+        media_type="text/event-stream",
+        headers=sse_headers(task.id),
+    )
+
+
+@router.get("/chat/{task_id}/events")
+async def subscribe_chat_events(
+    task_id: str,
+    request: Request,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    stream_hub: TaskStreamHub = Depends(get_stream_hub),
+) -> StreamingResponse:
+    """Resume a chat SSE stream after a dropped connection.
+
+    Replays every event after ``Last-Event-ID``, then tails live events.
+
+    Args:
+        task_id: Task ID from the original response's X-Task-ID header
+        request: FastAPI Request for connection monitoring
+        last_event_id: ID of the last event the client received
+        stream_hub: Injected TaskStreamHub dependency
+
+    Returns:
+        StreamingResponse with text/event-stream media type
+
+    Raises:
+        HTTPException: 400 if Last-Event-ID is malformed, 404 if the stream
+            is unknown or expired
+        TenantIsolationError: If the stream was opened by a different tenant
+    """
+    try:
+        after_id = parse_last_event_id(last_event_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    stream = stream_hub.get(task_id)
+    if stream is None:
+        raise HTTPException(status_code=404, detail=f"Stream {task_id} not found")
+    enforce_stream_isolation(stream)
+
     return StreamingResponse(
-        _stream_agent_events(body, request),
+        sse_frames(stream_hub, task_id, request, after_id),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+        headers=sse_headers(task_id),
     )
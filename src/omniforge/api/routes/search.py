@@ -0,0 +1,88 @@
+"""Full-text search API route handlers.
+
+This module provides a tenant-scoped search endpoint over conversation
+messages and task input summaries, backed by the database full-text index.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from omniforge.api.dependencies import get_current_tenant
+from omniforge.api.routes.tasks import get_database
+from omniforge.storage.database import Database
+from omniforge.storage.search import SearchIndex, SearchKind, SearchResult
+
+# Create router with prefix and tags
+router = APIRouter(prefix="/api/v1", tags=["search"])
+
+# Whether the tables of the fallback task database have been created
+_fallback_tables_created = False
+
+
+async def get_search_index(request: Request) -> SearchIndex:
+    """Dependency for getting the search index over the application database.
+
+    Uses the Database created by the application lifespan (app.state.database),
+    which has its tables and full-text index created at startup. Apps run
+    without the lifespan fall back to the shared task database, whose tables
+    are created on first use.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        SearchIndex instance
+    """
+    global _fallback_tables_created
+    database: Optional[Database] = getattr(request.app.state, "database", None)
+    if database is None:
+        database = get_database()
+        if not _fallback_tables_created:
+            await database.create_tables()
+            _fallback_tables_created = True
+    return SearchIndex(database)
+
+
+@router.get("/search", response_model=list[SearchResult])
+async def search(
+    q: str = Query(..., min_length=1, max_length=500),
+    kind: Optional[list[SearchKind]] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=1000),
+    search_index: SearchIndex = Depends(get_search_index),
+    tenant_id: Optional[str] = Depends(get_current_tenant),
+) -> list[SearchResult]:
+    """Search the current tenant's messages and tasks by content.
+
+    Results are ranked by relevance, most relevant first. Matched terms are
+    wrapped in [brackets] in each result's snippet.
+
+    Args:
+        q: Free-text query; all terms must match
+        kind: Kinds of content to search, may be repeated (default: all)
+        limit: Maximum number of results (default: 20)
+        offset: Number of ranked results to skip (default: 0)
+        search_index: Injected SearchIndex dependency
+        tenant_id: Current tenant ID from middleware
+
+    Returns:
+        Ranked list of search results
+
+    Raises:
+        HTTPException: 401 if tenant_id is not available, 501 if the database
+            does not support full-text search
+
+    Examples:
+        >>> GET /api/v1/search?q=invoice+totals&kind=message&limit=10
+    """
+    if not tenant_id:
+        raise HTTPException(status_code=401, detail="Tenant ID required")
+
+    if not search_index.supported:
+        raise HTTPException(
+            status_code=501,
+            detail=f"Full-text search is not supported on {search_index.dialect}",
+        )
+
+    return await search_index.search(tenant_id, q, kinds=kind, limit=limit, offset=offset)
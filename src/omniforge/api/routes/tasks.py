@@ -7,10 +7,11 @@ and listing. Task creation and message sending return Server-Sent Events (SSE).
 
 import os
 from datetime import datetime
+from functools import partial
 from typing import AsyncIterator, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
 
 from omniforge.agents.base import BaseAgent
@@ -19,10 +20,20 @@ from omniforge.agents.models import TextPart
 from omniforge.agents.registry import AgentRegistry
 from omniforge.api.dependencies import get_current_tenant
 from omniforge.api.routes.agents import _agent_repository
+from omniforge.api.sse import open_admitted_stream, sse_frames, sse_headers
+from omniforge.execution.admission import (
+    AdmissionController,
+    AdmissionPriority,
+    AdmissionTicket,
+    get_admission_controller,
+)
 from omniforge.security.isolation import enforce_agent_isolation, enforce_task_isolation
+from omniforge.security.tenant import get_tenant_id
 from omniforge.storage.base import TaskRepository
 from omniforge.storage.database import Database, DatabaseConfig
-from omniforge.storage.memory import InMemoryTaskRepository
+from omniforge.storage.pagination import next_cursor
+from omniforge.storage.shared_state import create_task_repository
+from omniforge.storage.task_events import TaskChangeBuffer
 from omniforge.tasks.models import (
     ChatRequest,
     ChatResponse,
@@ -31,18 +42,31 @@ from omniforge.tasks.models import (
     TaskMessage,
     TaskSendRequest,
     TaskState,
+    TaskSummary,
+)
+from omniforge.tasks.streams import (
+    TaskStream,
+    TaskStreamHub,
+    parse_last_event_id,
 )
 
 # Create router with tags
 router = APIRouter(tags=["tasks"])
 
-# Shared in-memory task repository instance
-# TODO: Replace with persistent storage in production
-_task_repository: TaskRepository = InMemoryTaskRepository()
+# Shared task repository instance: in-memory, or stored in the shared SQLite
+# state file when OMNIFORGE_STATE_BACKEND=sqlite (required for multiple workers)
+_task_repository: TaskRepository = create_task_repository()
 
 # Shared database instance for SQL-backed task repository
 _database: Optional[Database] = None
 
+# SQL-backed task repository on the shared database, created on first use
+_sql_task_repository: Optional[TaskRepository] = None
+
+# Hub of resumable task event streams, shared by the routes of this process.
+# Streams stay in the worker that started them, even with a shared state backend.
+_stream_hub = TaskStreamHub()
+
 
 def get_agent_registry() -> AgentRegistry:
     """Dependency for getting the agent registry instance.
@@ -77,55 +101,57 @@ def get_database() -> Database:
     return _database
 
 
-async def get_sql_task_repository():
+def get_stream_hub() -> TaskStreamHub:
+    """Dependency for getting the task stream hub.
+
+    Returns:
+        TaskStreamHub shared by all streaming endpoints
+    """
+    return _stream_hub
+
+
+def get_sql_task_repository() -> TaskRepository:
     """Dependency for getting the SQL-backed task repository.
 
-    Yields:
-        SQLTaskRepository instance backed by a database session
+    Writes go through Database.write(), so they are group-committed when the
+    database's write queue is enabled.
+
+    Returns:
+        DatabaseTaskRepository on the shared database instance
     """
-    from omniforge.storage.task_repository import SQLTaskRepository
+    from omniforge.storage.task_repository import DatabaseTaskRepository
 
-    db = get_database()
-    async with db.session() as session:
-        yield SQLTaskRepository(session)
+    global _sql_task_repository
+    if _sql_task_repository is None:
+        _sql_task_repository = DatabaseTaskRepository(get_database())
+    return _sql_task_repository
 
 
-async def _stream_task_events(
-    task: Task, agent: BaseAgent, http_request: Request, task_repo: TaskRepository
-) -> AsyncIterator[str]:
-    """Stream SSE events from task processing while persisting state changes.
+async def _produce_task_events(
+    task: Task, agent: BaseAgent, task_repo: TaskRepository, stream: TaskStream
+) -> None:
+    """Process a task through its agent, persisting and publishing every event.
 
-    This helper function processes a task through an agent and yields
-    SSE-formatted events, while monitoring for client disconnection and
-    persisting every event's effects to the task repository.
+    Runs in the background, detached from the request that started it, so a
+    client that drops its connection can resume the stream.
 
     Args:
         task: The task to process
         agent: The agent to process the task
-        http_request: The FastAPI Request object for checking connection status
         task_repo: Repository for persisting task state changes
-
-    Yields:
-        SSE-formatted event strings
+        stream: Stream the events are published to
     """
     from omniforge.tasks.manager import TaskManager
 
-    current_task = task
+    changes = TaskChangeBuffer(task_repo, task)
     try:
         async for event in agent.process_task(task):  # type: ignore[attr-defined]
-            # Check if client has disconnected
-            if await http_request.is_disconnected():
-                break
-
             # Persist event effects to repository
-            updated = TaskManager.apply_event(current_task, event)
-            if updated is not current_task:
-                await task_repo.update(updated)
-                current_task = updated
+            updated = TaskManager.apply_event(changes.task, event)
+            if updated is not changes.task:
+                await changes.record(updated)
 
-            # Format as SSE event
-            event_json = event.model_dump_json()
-            yield f"event: {event.type}\ndata: {event_json}\n\n"
+            await stream.publish_event(event)
 
     except Exception as e:
         from omniforge.agents.events import TaskErrorEvent
@@ -137,11 +163,54 @@ async def _stream_task_events(
             error_message=str(e),
         )
         # Persist the failure
-        failed = TaskManager.apply_event(current_task, error_event)
-        if failed is not current_task:
-            await task_repo.update(failed)
+        failed = TaskManager.apply_event(changes.task, error_event)
+        if failed is not changes.task:
+            await changes.record(failed)
+
+        await stream.publish_event(error_event)
+    finally:
+        await changes.flush()
+
+
+def _stream_task_events(
+    task: Task,
+    agent: BaseAgent,
+    http_request: Request,
+    task_repo: TaskRepository,
+    admission: AdmissionController,
+    ticket: AdmissionTicket,
+) -> AsyncIterator[bytes]:
+    """Start processing a task in the background and stream its events via SSE.
+
+    Every event's effects are persisted to the task repository. Changes are
+    appended to the task's event log in batches rather than rewriting the
+    whole task per event.
+
+    Args:
+        task: The task to process
+        agent: The agent to process the task
+        http_request: The FastAPI Request object for checking connection status
+        task_repo: Repository for persisting task state changes
+        admission: Controller the ticket was acquired from
+        ticket: Admission slot held until processing ends
 
-        yield f"event: error\ndata: {error_event.model_dump_json()}\n\n"
+    Returns:
+        Iterator of encoded SSE frames
+
+    Raises:
+        TaskStateError: If the task is already being streamed
+    """
+    try:
+        open_admitted_stream(
+            _stream_hub,
+            task.id,
+            partial(_produce_task_events, task, agent, task_repo),
+            admission,
+            ticket,
+        )
+    except ValueError:
+        raise TaskStateError(task.id, task.state.value, "stream") from None
+    return sse_frames(_stream_hub, task.id, http_request)
 
 
 @router.post("/api/v1/agents/{agent_id}/tasks")
@@ -151,6 +220,7 @@ async def create_task(
     body: TaskCreateRequest,
     registry: AgentRegistry = Depends(get_agent_registry),
     task_repo: TaskRepository = Depends(get_task_repository),
+    admission: AdmissionController = Depends(get_admission_controller),
 ) -> StreamingResponse:
     """Create a new task and stream processing events via SSE.
 
@@ -164,12 +234,15 @@ async def create_task(
         body: TaskCreateRequest with message_parts and metadata
         registry: Injected AgentRegistry dependency
         task_repo: Injected TaskRepository dependency
+        admission: Injected AdmissionController dependency
 
     Returns:
         StreamingResponse with text/event-stream media type and SSE headers
 
     Raises:
         AgentNotFoundError: If the agent does not exist (handled by middleware)
+        AdmissionRejectedError: If the server is at capacity (429, handled by
+            middleware)
 
     Example:
         >>> POST /api/v1/agents/my-agent/tasks
@@ -220,18 +293,21 @@ async def create_task(
         skill_name=body.skill_name,
     )
 
+    # Wait for a slot before accepting the task (raises AdmissionRejectedError)
+    ticket = await admission.acquire(get_tenant_id(), AdmissionPriority.STANDARD)
+
     # Save task to repository
-    await task_repo.save(task)
+    try:
+        await task_repo.save(task)
+    except BaseException:
+        admission.release(ticket)
+        raise
 
     # Stream task processing events
     return StreamingResponse(
-        _stream_task_events(task, agent, request, task_repo),
+        _stream_task_events(task, agent, request, task_repo, admission, ticket),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+        headers=sse_headers(task.id),
     )
 
 
@@ -242,6 +318,7 @@ async def chat(
     body: ChatRequest,
     registry: AgentRegistry = Depends(get_agent_registry),
     task_repo: TaskRepository = Depends(get_task_repository),
+    admission: AdmissionController = Depends(get_admission_controller),
 ):
     """Simplified chat endpoint for quick agent interactions.
 
@@ -255,12 +332,15 @@ async def chat(
         body: ChatRequest with message and optional parameters
         registry: Injected AgentRegistry dependency
         task_repo: Injected TaskRepository dependency
+        admission: Injected AdmissionController dependency
 
     Returns:
         StreamingResponse (if stream=True) or ChatResponse (if stream=False)
 
     Raises:
         AgentNotFoundError: If the agent does not exist (handled by middleware)
+        AdmissionRejectedError: If the server is at capacity (429, handled by
+            middleware)
 
     Example (streaming):
         >>> POST /api/v1/agents/my-agent/chat
@@ -318,20 +398,23 @@ async def chat(
         parent_task_id=None,
     )
 
+    # Chat is interactive, so it is admitted ahead of API tasks and scheduled runs
+    ticket = await admission.acquire(get_tenant_id(), AdmissionPriority.INTERACTIVE)
+
     # Save task to repository
-    await task_repo.save(task)
+    try:
+        await task_repo.save(task)
+    except BaseException:
+        admission.release(ticket)
+        raise
 
     # Return streaming or non-streaming response based on request
     if body.stream:
         # Stream task processing events via SSE
         return StreamingResponse(
-            _stream_task_events(task, agent, request, task_repo),
+            _stream_task_events(task, agent, request, task_repo, admission, ticket),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",
-            },
+            headers=sse_headers(task.id),
         )
     else:
         # Collect response and return as JSON, persisting state for each event
@@ -340,21 +423,24 @@ async def chat(
 
         response_text = ""
         final_state = TaskState.COMPLETED
-        current_task = task
+        changes = TaskChangeBuffer(task_repo, task)
 
-        async for event in agent.process_task(task):  # type: ignore[attr-defined]
-            updated = TaskManager.apply_event(current_task, event)
-            if updated is not current_task:
-                await task_repo.update(updated)
-                current_task = updated
+        try:
+            async for event in agent.process_task(task):  # type: ignore[attr-defined]
+                updated = TaskManager.apply_event(changes.task, event)
+                if updated is not changes.task:
+                    await changes.record(updated)
 
-            if isinstance(event, TaskMessageEvent):
-                for part in event.message_parts:
-                    if isinstance(part, TextPart):
-                        response_text += part.text
+                if isinstance(event, TaskMessageEvent):
+                    for part in event.message_parts:
+                        if isinstance(part, TextPart):
+                            response_text += part.text
 
-            if isinstance(event, TaskDoneEvent):
-                final_state = event.final_state
+                if isinstance(event, TaskDoneEvent):
+                    final_state = event.final_state
+        finally:
+            admission.release(ticket)
+            await changes.flush()
 
         return ChatResponse(
             task_id=task.id, response=response_text.strip(), state=final_state.value
@@ -416,6 +502,69 @@ async def get_task_status(
     }
 
 
+@router.get("/api/v1/agents/{agent_id}/tasks/{task_id}/events")
+async def subscribe_task_events(
+    agent_id: str,
+    task_id: str,
+    request: Request,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    task_repo: TaskRepository = Depends(get_task_repository),
+    stream_hub: TaskStreamHub = Depends(get_stream_hub),
+) -> StreamingResponse:
+    """Resume a task's SSE stream.
+
+    Replays every event after ``Last-Event-ID`` (or the whole stream if the
+    header is missing), then tails live events until the task finishes.
+    Streams remain available for a while after the task finishes.
+
+    Args:
+        agent_id: ID of the agent handling the task
+        task_id: ID of the task whose stream to resume
+        request: FastAPI Request object for connection monitoring
+        last_event_id: ID of the last event the client received
+        task_repo: Injected TaskRepository dependency
+        stream_hub: Injected TaskStreamHub dependency
+
+    Returns:
+        StreamingResponse with text/event-stream media type and SSE headers
+
+    Raises:
+        TaskNotFoundError: If the task does not exist (handled by middleware)
+        HTTPException: 400 if Last-Event-ID is malformed, 404 if the task has
+            no stream to resume
+
+    Example:
+        >>> GET /api/v1/agents/my-agent/tasks/task-123/events
+        >>> Last-Event-ID: 42
+        >>>
+        >>> # Server response (SSE stream, starting after event 42)
+        >>> event: message
+        >>> data: {"type": "message", "task_id": "task-123", ...}
+        >>> id: 43
+    """
+    task = await task_repo.get(task_id)
+
+    if task is None or task.agent_id != agent_id:
+        raise TaskNotFoundError(task_id)
+
+    # Enforce tenant isolation for task access
+    enforce_task_isolation(task)
+
+    try:
+        after_id = parse_last_event_id(last_event_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    if stream_hub.get(task_id) is None:
+        raise HTTPException(status_code=404, detail=f"No stream to resume for task {task_id}")
+
+    return StreamingResponse(
+        sse_frames(stream_hub, task_id, request, after_id),
+        media_type="text/event-stream",
+        headers=sse_headers(task_id),
+    )
+
+
 @router.post("/api/v1/agents/{agent_id}/tasks/{task_id}/send")
 async def send_message(
     agent_id: str,
@@ -424,6 +573,7 @@ async def send_message(
     body: TaskSendRequest,
     registry: AgentRegistry = Depends(get_agent_registry),
     task_repo: TaskRepository = Depends(get_task_repository),
+    admission: AdmissionController = Depends(get_admission_controller),
 ) -> StreamingResponse:
     """Send a message to an existing task and stream response events via SSE.
 
@@ -437,6 +587,7 @@ async def send_message(
         body: TaskSendRequest with message_parts
         registry: Injected AgentRegistry dependency
         task_repo: Injected TaskRepository dependency
+        admission: Injected AdmissionController dependency
 
     Returns:
         StreamingResponse with text/event-stream media type and SSE headers
@@ -445,6 +596,8 @@ async def send_message(
         AgentNotFoundError: If the agent does not exist (handled by middleware)
         TaskNotFoundError: If the task does not exist (handled by middleware)
         TaskStateError: If task is in a terminal state (handled by middleware)
+        AdmissionRejectedError: If the server is at capacity (429, handled by
+            middleware)
 
     Example:
         >>> POST /api/v1/agents/my-agent/tasks/task-123/send
@@ -476,6 +629,14 @@ async def send_message(
     if task.state.is_terminal():
         raise TaskStateError(task_id, task.state.value, "send_message")
 
+    # Only one run of a task streams at a time
+    stream = _stream_hub.get(task_id)
+    if stream is not None and not stream.closed:
+        raise TaskStateError(task_id, task.state.value, "send_message")
+
+    # Wait for a slot before accepting the message (raises AdmissionRejectedError)
+    ticket = await admission.acquire(get_tenant_id(), AdmissionPriority.STANDARD)
+
     # Add user message to task
     now = datetime.utcnow()
     user_message = TaskMessage(
@@ -487,23 +648,25 @@ async def send_message(
     task.messages.append(user_message)
     task.updated_at = now
 
-    # Update task in repository
-    await task_repo.update(task)
+    try:
+        # Update task in repository
+        await task_repo.update(task)
 
-    # Handle message in agent (for multi-turn support)
-    # Extract text from message parts for simplicity
-    message_text = " ".join(part.text for part in body.message_parts if isinstance(part, TextPart))
-    agent.handle_message(task_id, message_text)
+        # Handle message in agent (for multi-turn support)
+        # Extract text from message parts for simplicity
+        message_text = " ".join(
+            part.text for part in body.message_parts if isinstance(part, TextPart)
+        )
+        agent.handle_message(task_id, message_text)
+    except BaseException:
+        admission.release(ticket)
+        raise
 
     # Stream task processing events
     return StreamingResponse(
-        _stream_task_events(task, agent, request, task_repo),
+        _stream_task_events(task, agent, request, task_repo, admission, ticket),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+        headers=sse_headers(task.id),
     )
 
 
@@ -611,73 +774,92 @@ async def list_tasks(
     # Enforce tenant isolation for agent access
     enforce_agent_isolation(agent)
 
-    # Get tasks for this agent
-    tasks = await task_repo.list_by_agent(agent_id)
-
-    # Return task summaries
-    return [
-        {
-            "id": task.id,
-            "agent_id": task.agent_id,
-            "state": task.state.value,
-            "skill_name": task.skill_name,
-            "input_summary": task.input_summary,
-            "created_at": task.created_at.isoformat(),
-            "updated_at": task.updated_at.isoformat(),
-            "message_count": len(task.messages),
-            "artifact_count": len(task.artifacts),
-        }
-        for task in tasks
-    ]
+    # Get task summaries for this agent (messages and artifacts are not loaded)
+    summaries = await task_repo.list_summaries(agent_id=agent_id)
+    return [_summary_to_dict(summary) for summary in summaries]
 
 
 @router.get("/api/v1/tasks")
 async def list_tenant_tasks(
+    response: Response,
     skill_name: Optional[str] = Query(None, max_length=255),
     state: Optional[str] = Query(None, max_length=50),
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, max_length=512),
     task_repo: TaskRepository = Depends(get_task_repository),
     tenant_id: Optional[str] = Depends(get_current_tenant),
 ) -> list[dict]:
     """List tasks for the current tenant with optional filtering.
 
-    Tenant is read from request state set by TenantMiddleware.
+    Tenant is read from request state set by TenantMiddleware. Filters are
+    applied by the repository before pagination, so pages are always full
+    while more results exist. When more results are available, the opaque
+    cursor for the next page is returned in the ``X-Next-Cursor`` response
+    header; pass it back as ``cursor`` to seek past the current page instead
+    of using ``offset``.
 
     Args:
+        response: Outgoing response, used to set the X-Next-Cursor header
         skill_name: Optional skill name filter
         state: Optional state filter
+        created_after: Only tasks created after this time (optional)
+        created_before: Only tasks created before this time (optional)
         limit: Maximum number of tasks to return (default: 100)
         offset: Number of tasks to skip (default: 0)
+        cursor: Opaque keyset cursor from a previous page (optional)
         task_repo: Injected TaskRepository dependency
         tenant_id: Current tenant ID from middleware
 
     Returns:
         List of task summary objects for the tenant
+
+    Raises:
+        HTTPException: 400 if the state or cursor is invalid
     """
     if not tenant_id:
         return []
 
-    if skill_name:
-        tasks = await task_repo.list_by_skill(tenant_id, skill_name, limit=limit)
-    else:
-        tasks = await task_repo.list_by_tenant(tenant_id, limit=limit, offset=offset)
-
-    # Apply optional state filter
-    if state:
-        tasks = [t for t in tasks if t.state.value == state]
-
-    return [
-        {
-            "id": task.id,
-            "agent_id": task.agent_id,
-            "skill_name": task.skill_name,
-            "input_summary": task.input_summary,
-            "state": task.state.value,
-            "created_at": task.created_at.isoformat(),
-            "updated_at": task.updated_at.isoformat(),
-            "artifact_count": len(task.artifacts),
-            "message_count": len(task.messages),
-        }
-        for task in tasks
-    ]
+    try:
+        summaries = await task_repo.list_summaries(
+            tenant_id=tenant_id,
+            state=TaskState(state) if state else None,
+            skill_name=skill_name or None,
+            created_after=created_after,
+            created_before=created_before,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    page_cursor = next_cursor(summaries, limit, "created_at")
+    if page_cursor:
+        response.headers["X-Next-Cursor"] = page_cursor
+
+    return [_summary_to_dict(summary) for summary in summaries]
+
+
+def _summary_to_dict(summary: TaskSummary) -> dict:
+    """Build the response object of a task listing entry.
+
+    Args:
+        summary: Task summary
+
+    Returns:
+        JSON-serializable task summary
+    """
+    return {
+        "id": summary.id,
+        "agent_id": summary.agent_id,
+        "state": summary.state.value,
+        "skill_name": summary.skill_name,
+        "input_summary": summary.input_summary,
+        "created_at": summary.created_at.isoformat(),
+        "updated_at": summary.updated_at.isoformat(),
+        "message_count": summary.message_count,
+        "artifact_count": summary.artifact_count,
+    }
@@ -0,0 +1,142 @@
+"""Server-Sent Events helpers shared by the streaming API routes.
+
+Streaming endpoints start a task's producer in the background with
+open_admitted_stream(), which holds an admission slot while it runs, and
+serve its frames with sse_frames() and sse_headers(). Clients resume a
+dropped stream by sending the ID of the last frame they received as
+``Last-Event-ID``.
+"""
+
+import asyncio
+from functools import partial
+from typing import AsyncIterator, Optional
+
+from fastapi import Request
+
+from omniforge.execution.admission import AdmissionController, AdmissionTicket
+from omniforge.tasks.streams import StreamProducer, TaskStream, TaskStreamHub
+
+
+async def _watch_disconnect(
+    http_request: Request, disconnected: asyncio.Event, stream: TaskStream
+) -> None:
+    """Wait for the client to disconnect, then end its subscription.
+
+    Listens for ``http.disconnect`` once per stream instead of polling the
+    connection on every frame, and notices a disconnect even while no frames
+    are being produced (e.g. during a long tool call).
+
+    Args:
+        http_request: The FastAPI Request whose connection to watch
+        disconnected: Event set on disconnect
+        stream: Stream the client is subscribed to
+    """
+    while (await http_request.receive())["type"] != "http.disconnect":
+        pass
+    disconnected.set()
+    stream.wake()
+
+
+async def sse_frames(
+    stream_hub: TaskStreamHub, stream_id: str, http_request: Request, last_event_id: int = 0
+) -> AsyncIterator[bytes]:
+    """Stream a task's SSE frames to one client.
+
+    Frames after last_event_id are replayed first, then live frames are
+    tailed until the stream ends or the client disconnects. Once the last
+    subscriber is gone, the hub cancels the producer after its grace period.
+    Partial message frames are coalesced into fewer writes by the hub.
+
+    Args:
+        stream_hub: Hub holding the stream
+        stream_id: Stream to subscribe to
+        http_request: The FastAPI Request object for detecting disconnection
+        last_event_id: ID of the last frame the client received (0 for all)
+
+    Yields:
+        Encoded SSE frames, each carrying its event ID
+    """
+    stream = stream_hub.get(stream_id)
+    if stream is None:
+        return
+
+    disconnected = asyncio.Event()
+    watcher = asyncio.create_task(_watch_disconnect(http_request, disconnected, stream))
+    try:
+        async for chunk in stream_hub.subscribe_encoded(
+            stream_id, last_event_id, stop=disconnected
+        ):
+            yield chunk
+    finally:
+        watcher.cancel()
+
+
+async def _run_admitted(
+    admission: AdmissionController,
+    ticket: AdmissionTicket,
+    producer: StreamProducer,
+    stream: TaskStream,
+) -> None:
+    """Run a stream producer, releasing its admission slot when it ends.
+
+    The slot is released however the producer ends, including when the hub
+    cancels it after its subscribers are gone.
+
+    Args:
+        admission: Controller the ticket was acquired from
+        ticket: Admission slot held by the task
+        producer: Producer publishing the task's events
+        stream: Stream the events are published to
+    """
+    try:
+        await producer(stream)
+    finally:
+        admission.release(ticket)
+
+
+def open_admitted_stream(
+    stream_hub: TaskStreamHub,
+    stream_id: str,
+    producer: StreamProducer,
+    admission: AdmissionController,
+    ticket: AdmissionTicket,
+    tenant_id: Optional[str] = None,
+) -> None:
+    """Start a producer in the background, holding an admission slot while it runs.
+
+    Args:
+        stream_hub: Hub to open the stream in
+        stream_id: Stream identifier (the task ID)
+        producer: Producer publishing the task's events
+        admission: Controller the ticket was acquired from
+        ticket: Admission slot for the task, released when the producer ends
+        tenant_id: Tenant that opened the stream, checked when it is resumed
+
+    Raises:
+        ValueError: If a stream with this ID is still running (the slot is
+            released)
+    """
+    try:
+        stream_hub.open(
+            stream_id, partial(_run_admitted, admission, ticket, producer), tenant_id=tenant_id
+        )
+    except ValueError:
+        admission.release(ticket)
+        raise
+
+
+def sse_headers(task_id: str) -> dict[str, str]:
+    """Build response headers for an SSE task stream.
+
+    Args:
+        task_id: Task being streamed, exposed so clients can resume the stream
+
+    Returns:
+        Header dictionary
+    """
+    return {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",
+        "X-Task-ID": task_id,
+    }
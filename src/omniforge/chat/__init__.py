@@ -5,6 +5,7 @@ SSE event formatting capabilities.
 """
 
 from omniforge.chat.errors import ChatError, InternalError, MessageTooLongError, ValidationError
+from omniforge.chat.history_cache import ConversationHistoryCache
 from omniforge.chat.models import ChatRequest, ChunkEvent, DoneEvent, ErrorEvent, UsageInfo
 from omniforge.chat.response_generator import ResponseGenerator
 from omniforge.chat.service import ChatService
@@ -19,6 +20,7 @@ from omniforge.chat.streaming import (
 __all__ = [
     # Service
     "ChatService",
+    "ConversationHistoryCache",
     # Models
     "ChatRequest",
     "ChunkEvent",
@@ -0,0 +1,187 @@
+"""In-process cache of recent conversation history windows.
+
+Every chat turn needs the last N messages of its conversation, and those are
+almost always the messages the previous turn just wrote. This module keeps a
+bounded LRU of recent-message windows keyed by (tenant_id, conversation_id)
+so the history read can be served from memory for active conversations.
+
+Entries are tagged with the conversation's message version counter (see
+``ConversationModel.version``). A cached window is only served when its
+version matches the version read from storage, so writes made by other
+workers are detected and the window is reloaded.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from uuid import UUID
+
+import cachetools
+
+from omniforge.conversation.models import Message
+
+logger = logging.getLogger(__name__)
+
+# Rough per-message overhead (model instance, UUIDs, timestamps) used when
+# estimating the memory footprint of a cached window.
+_MESSAGE_OVERHEAD_BYTES = 256
+
+
+@dataclass(frozen=True)
+class _HistoryWindow:
+    """Cached window of the most recent messages of one conversation.
+
+    Attributes:
+        version: Conversation message version the window reflects
+        messages: Most recent messages in chronological order
+        size: Estimated memory footprint in bytes
+    """
+
+    version: int
+    messages: tuple[Message, ...]
+    size: int = field(default=0)
+
+
+class ConversationHistoryCache:
+    """LRU cache of recent-message windows for conversations.
+
+    The cache is bounded by entry count, or by estimated bytes when
+    ``max_bytes`` is given. It is write-through: callers append messages they
+    persisted so the next turn can be served without a storage read.
+
+    Not thread-safe; intended to be shared by coroutines on one event loop.
+
+    Attributes:
+        window_size: Number of recent messages kept per conversation
+    """
+
+    def __init__(
+        self,
+        window_size: int = 20,
+        max_entries: int = 10_000,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """Initialize the history cache.
+
+        Args:
+            window_size: Number of recent messages kept per conversation
+            max_entries: Maximum number of cached conversations (ignored if
+                max_bytes is set)
+            max_bytes: Optional bound on the estimated total size in bytes
+        """
+        if window_size <= 0:
+            raise ValueError("window_size must be positive")
+
+        self.window_size = window_size
+        self._cache: cachetools.LRUCache[tuple[str, str], _HistoryWindow]
+        if max_bytes is not None:
+            self._cache = cachetools.LRUCache(maxsize=max_bytes, getsizeof=lambda w: w.size)
+        else:
+            self._cache = cachetools.LRUCache(maxsize=max_entries)
+        self._hit_count = 0
+        self._miss_count = 0
+
+    def get(
+        self, tenant_id: str, conversation_id: UUID, version: int, count: int
+    ) -> Optional[list[Message]]:
+        """Return the cached recent messages if the window is current.
+
+        Args:
+            tenant_id: Tenant that owns the conversation
+            conversation_id: Conversation identifier
+            version: Current message version read from storage
+            count: Number of recent messages requested
+
+        Returns:
+            Up to ``count`` recent messages in chronological order, or None on
+            a miss (absent, stale, or more messages requested than the window holds)
+        """
+        key = self._key(tenant_id, conversation_id)
+        window = self._cache.get(key)
+        if window is None or window.version != version:
+            if window is not None:
+                del self._cache[key]
+            self._miss_count += 1
+            return None
+
+        # Windows are trimmed to window_size, so larger requests can't be served
+        if count > self.window_size:
+            self._miss_count += 1
+            return None
+
+        self._hit_count += 1
+        return list(window.messages[-count:]) if count else []
+
+    def put(
+        self, tenant_id: str, conversation_id: UUID, version: int, messages: list[Message]
+    ) -> None:
+        """Store the recent-message window for a conversation.
+
+        Args:
+            tenant_id: Tenant that owns the conversation
+            conversation_id: Conversation identifier
+            version: Message version the messages were read at
+            messages: The ``window_size`` most recent messages in chronological order
+        """
+        self._store(self._key(tenant_id, conversation_id), version, messages)
+
+    def append(self, tenant_id: str, conversation_id: UUID, message: Message) -> None:
+        """Write-through a newly persisted message.
+
+        Each persisted message bumps the conversation version by one. If
+        another writer also added messages, storage will be ahead of the
+        cached version and the next ``get`` will miss and reload.
+
+        Args:
+            tenant_id: Tenant that owns the conversation
+            conversation_id: Conversation identifier
+            message: Message that was just persisted
+        """
+        key = self._key(tenant_id, conversation_id)
+        window = self._cache.get(key)
+        if window is None:
+            return
+        self._store(key, window.version + 1, [*window.messages, message])
+
+    def invalidate(self, tenant_id: str, conversation_id: UUID) -> None:
+        """Drop the cached window for a conversation.
+
+        Args:
+            tenant_id: Tenant that owns the conversation
+            conversation_id: Conversation identifier
+        """
+        self._cache.pop(self._key(tenant_id, conversation_id), None)
+
+    def clear(self) -> None:
+        """Drop all cached windows."""
+        self._cache.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Get current cache statistics.
+
+        Returns:
+            Dictionary with entry count, current/max size, and hit/miss counts
+        """
+        return {
+            "entries": len(self._cache),
+            "size": self._cache.currsize,
+            "max_size": self._cache.maxsize,
+            "hit_count": self._hit_count,
+            "miss_count": self._miss_count,
+        }
+
+    def _store(self, key: tuple[str, str], version: int, messages: list[Message]) -> None:
+        """Trim to the window size and insert, skipping windows too large to cache."""
+        trimmed = tuple(messages[-self.window_size :])
+        size = sum(len(m.content.encode("utf-8")) + _MESSAGE_OVERHEAD_BYTES for m in trimmed)
+        try:
+            self._cache[key] = _HistoryWindow(version=version, messages=trimmed, size=size)
+        except ValueError:
+            # Single window exceeds max_bytes; don't cache it
+            self._cache.pop(key, None)
+            logger.debug(f"History window for {key[1]} too large to cache ({size} bytes)")
+
+    @staticmethod
+    def _key(tenant_id: str, conversation_id: UUID) -> tuple[str, str]:
+        """Build the cache key for a conversation."""
+        return (tenant_id, str(conversation_id))
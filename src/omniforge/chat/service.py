@@ -8,6 +8,7 @@ import logging
 from typing import AsyncIterator, Optional
 from uuid import UUID, uuid4
 
+from omniforge.chat.history_cache import ConversationHistoryCache
 from omniforge.chat.master_response_generator import MasterResponseGenerator
 from omniforge.chat.models import ChatRequest, DoneEvent, ErrorEvent, UsageInfo
 from omniforge.chat.response_generator import ResponseGenerator
@@ -17,6 +18,9 @@ from omniforge.conversation.repository import ConversationRepository
 
 logger = logging.getLogger(__name__)
 
+# Number of recent messages passed to the response generator as context
+_HISTORY_COUNT = 20
+
 
 class ChatService:
     """Orchestrates chat request processing and response streaming.
@@ -31,6 +35,7 @@ class ChatService:
         user_id: Optional[str] = None,
         conversation_repository: Optional[ConversationRepository] = None,
         tenant_id: Optional[str] = None,
+        history_cache: Optional[ConversationHistoryCache] = None,
     ) -> None:
         """Initialize the chat service.
 
@@ -41,6 +46,9 @@ class ChatService:
             conversation_repository: Optional repository for conversation storage.
                 If None, no conversation history is stored or retrieved.
             tenant_id: Optional tenant identifier (defaults to "default-tenant")
+            history_cache: Optional in-process cache of recent-message windows,
+                typically shared by all ChatService instances in a worker. If None,
+                history is always read from the repository.
         """
         self._response_generator = response_generator or MasterResponseGenerator(
             user_id=user_id
@@ -48,6 +56,7 @@ class ChatService:
         self._conversation_repository = conversation_repository
         self._tenant_id = tenant_id or "default-tenant"
         self._user_id = user_id or "default-user"
+        self._history_cache = history_cache
 
     async def process_chat(self, request: ChatRequest) -> AsyncIterator[str]:
         """Process a chat request and stream SSE-formatted responses.
@@ -86,10 +95,10 @@ class ChatService:
         try:
             # Handle conversation management if repository is available
             if self._conversation_repository:
-                conversation_id = await self._manage_conversation(request)
+                conversation_id, version = await self._manage_conversation(request)
                 # Get history BEFORE storing user message (to avoid including current msg)
                 conversation_history = await self._get_conversation_history(
-                    conversation_id
+                    conversation_id, version
                 )
                 # Store user message AFTER getting history
                 await self._store_user_message(conversation_id, request.message)
@@ -126,14 +135,15 @@ class ChatService:
             error_event = ErrorEvent(code="processing_error", message=str(e))
             yield format_error_event(error_event)
 
-    async def _manage_conversation(self, request: ChatRequest) -> UUID:
+    async def _manage_conversation(self, request: ChatRequest) -> tuple[UUID, Optional[int]]:
         """Manage conversation creation or validation.
 
         Args:
             request: Chat request with optional conversation_id
 
         Returns:
-            Conversation ID (validated or newly created)
+            Tuple of conversation ID (validated or newly created) and its current
+            message version (None if storage failed and the ID was generated)
 
         Raises:
             ValueError: If conversation_id provided but not found
@@ -148,7 +158,7 @@ class ChatService:
                     f"Conversation {request.conversation_id} not found or "
                     f"does not belong to tenant {self._tenant_id}"
                 )
-            return request.conversation_id
+            return request.conversation_id, conversation.version
         else:
             # Create new conversation
             try:
@@ -160,33 +170,53 @@ class ChatService:
                     f"Created new conversation {conversation.id} for "
                     f"tenant {self._tenant_id}, user {self._user_id}"
                 )
-                return conversation.id
+                if self._history_cache:
+                    # New conversations have no history; seed an empty window
+                    self._history_cache.put(
+                        self._tenant_id, conversation.id, conversation.version, []
+                    )
+                return conversation.id, conversation.version
             except Exception as e:
                 logger.error(
                     f"Failed to create conversation for tenant {self._tenant_id}: {e}",
                     exc_info=True,
                 )
                 # Fall back to generating UUID (storage failure should not block)
-                return uuid4()
+                return uuid4(), None
 
-    async def _get_conversation_history(self, conversation_id: UUID) -> list:
+    async def _get_conversation_history(
+        self, conversation_id: UUID, version: Optional[int] = None
+    ) -> list:
         """Retrieve conversation history for context.
 
+        Served from the history cache when the cached window matches the
+        conversation's current message version; otherwise read from the
+        repository and cached.
+
         Args:
             conversation_id: Conversation to get history from
+            version: Current message version of the conversation, if known
 
         Returns:
             List of recent messages (empty list on failure)
         """
+        cache = self._history_cache if version is not None else None
+        if cache is not None and version is not None:
+            cached = cache.get(self._tenant_id, conversation_id, version, _HISTORY_COUNT)
+            if cached is not None:
+                return cached
+
         try:
             messages = await self._conversation_repository.get_recent_messages(
                 conversation_id=conversation_id,
                 tenant_id=self._tenant_id,
-                count=20,  # Get last 20 messages for context
+                count=_HISTORY_COUNT,
             )
             logger.debug(
                 f"Retrieved {len(messages)} messages from conversation {conversation_id}"
             )
+            if cache is not None and version is not None:
+                cache.put(self._tenant_id, conversation_id, version, messages)
             return messages
         except Exception as e:
             logger.warning(
@@ -211,7 +241,11 @@ class ChatService:
                 content=content,
             )
             logger.debug(f"Stored user message {message.id} in conversation {conversation_id}")
+            if self._history_cache:
+                self._history_cache.append(self._tenant_id, conversation_id, message)
         except Exception as e:
+            if self._history_cache:
+                self._history_cache.invalidate(self._tenant_id, conversation_id)
             logger.warning(
                 f"Failed to store user message in conversation {conversation_id}: {e}",
                 exc_info=True,
@@ -237,7 +271,11 @@ class ChatService:
             logger.debug(
                 f"Stored assistant message {message.id} in conversation {conversation_id}"
             )
+            if self._history_cache:
+                self._history_cache.append(self._tenant_id, conversation_id, message)
         except Exception as e:
+            if self._history_cache:
+                self._history_cache.invalidate(self._tenant_id, conversation_id)
             logger.warning(
                 f"Failed to store assistant message in conversation {conversation_id}: {e}",
                 exc_info=True,
@@ -0,0 +1,473 @@
+"""Bounded cache of per-conversation chat agents.
+
+Each chat conversation gets its own MasterAgent so delegation state cannot
+bleed between users, but an agent is heavy: it owns a tool registry, an MCP
+manager with live server connections, and its paused HITL sessions. This
+module keeps those agents in an LRU cache bounded by size and idle TTL.
+
+The state that actually has to survive between turns is small: the ID of the
+sub-agent the conversation is delegated to, the last delegation outcome, and
+any paused ReAct conversation waiting for a clarification. When an agent is
+evicted, that state is exported to a SessionStateStore; the next message for
+the conversation creates a fresh agent and rehydrates it from the store.
+
+When several worker processes serve the same conversations, the cache runs
+in write-through mode over a shared store: state is saved after every turn
+and restored at the start of every turn, so whichever worker receives the
+next message continues where the previous one left off.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Optional, Protocol, TypeVar
+from uuid import UUID
+
+import cachetools
+
+from omniforge.observability.metrics import get_metrics_collector
+from omniforge.storage.shared_state import SQLiteStateStore
+
+logger = logging.getLogger(__name__)
+
+# Key under which session state is kept in Conversation.state_metadata
+_STATE_METADATA_KEY = "master_session"
+
+
+class SessionAgent(Protocol):
+    """Agent whose resumable state can be exported and restored."""
+
+    def export_session_state(self) -> dict[str, Any]:
+        """Export the resumable state as JSON-serializable data."""
+        ...
+
+    async def restore_session_state(self, state: dict[str, Any]) -> None:
+        """Restore state produced by export_session_state()."""
+        ...
+
+    async def aclose(self) -> None:
+        """Release resources held by the agent."""
+        ...
+
+
+AgentT = TypeVar("AgentT", bound=SessionAgent)
+
+
+class SessionStateStore(Protocol):
+    """Storage for the exported state of evicted session agents."""
+
+    async def save(self, session_id: str, state: dict[str, Any]) -> None:
+        """Store the state of an evicted session.
+
+        Args:
+            session_id: Session (conversation) identifier
+            state: Exported session state
+        """
+        ...
+
+    async def load(self, session_id: str) -> Optional[dict[str, Any]]:
+        """Load the stored state of a session.
+
+        Args:
+            session_id: Session (conversation) identifier
+
+        Returns:
+            Stored state, or None if nothing was stored
+        """
+        ...
+
+    async def delete(self, session_id: str) -> None:
+        """Delete the stored state of a session once it has been rehydrated.
+
+        Args:
+            session_id: Session (conversation) identifier
+        """
+        ...
+
+
+class InMemorySessionStateStore:
+    """Process-local SessionStateStore bounded by entry count and TTL.
+
+    Stored states are a few kilobytes at most, so far more of them can be
+    kept than live agents.
+    """
+
+    def __init__(self, max_entries: int = 100_000, ttl_seconds: float = 86400.0) -> None:
+        """Initialize the store.
+
+        Args:
+            max_entries: Maximum number of stored session states
+            ttl_seconds: Seconds a stored state is kept
+        """
+        self._states: cachetools.TTLCache[str, dict[str, Any]] = cachetools.TTLCache(
+            maxsize=max_entries, ttl=ttl_seconds
+        )
+
+    async def save(self, session_id: str, state: dict[str, Any]) -> None:
+        """Store the state of an evicted session."""
+        self._states[session_id] = state
+
+    async def load(self, session_id: str) -> Optional[dict[str, Any]]:
+        """Load the stored state of a session."""
+        return self._states.get(session_id)
+
+    async def delete(self, session_id: str) -> None:
+        """Delete the stored state of a session."""
+        self._states.pop(session_id, None)
+
+
+class SQLiteSessionStateStore:
+    """SessionStateStore in the SQLite state file shared by worker processes."""
+
+    def __init__(self, store: SQLiteStateStore, ttl_seconds: float = 86400.0) -> None:
+        """Initialize the store.
+
+        Args:
+            store: Shared state store
+            ttl_seconds: Seconds a stored state is kept
+        """
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+
+    async def save(self, session_id: str, state: dict[str, Any]) -> None:
+        """Store the state of a session."""
+        await self._store.run(
+            self._store.set, "chat_sessions", session_id, state, ttl_seconds=self._ttl_seconds
+        )
+
+    async def load(self, session_id: str) -> Optional[dict[str, Any]]:
+        """Load the stored state of a session."""
+        state: Optional[dict[str, Any]] = await self._store.run(
+            self._store.get, "chat_sessions", session_id
+        )
+        return state
+
+    async def delete(self, session_id: str) -> None:
+        """Delete the stored state of a session."""
+        await self._store.run(self._store.delete, "chat_sessions", session_id)
+
+
+class ConversationSessionStateStore:
+    """SessionStateStore that keeps state in the conversation's state_metadata.
+
+    Session IDs are conversation IDs. Sessions whose conversation does not
+    exist in the repository (or belongs to another tenant) are not stored.
+    """
+
+    def __init__(self, conversation_repo: Any, tenant_id: str) -> None:
+        """Initialize the store.
+
+        Args:
+            conversation_repo: Conversation repository supporting update_state()
+            tenant_id: Tenant the conversations belong to
+        """
+        self._conversation_repo = conversation_repo
+        self._tenant_id = tenant_id
+
+    async def save(self, session_id: str, state: dict[str, Any]) -> None:
+        """Store the state of an evicted session in its conversation."""
+        await self._update(session_id, state)
+
+    async def load(self, session_id: str) -> Optional[dict[str, Any]]:
+        """Load the stored state of a session from its conversation."""
+        conversation = await self._get(session_id)
+        if conversation is None or not conversation.state_metadata:
+            return None
+        state: Optional[dict[str, Any]] = conversation.state_metadata.get(_STATE_METADATA_KEY)
+        return state
+
+    async def delete(self, session_id: str) -> None:
+        """Remove the stored state from the conversation."""
+        await self._update(session_id, None)
+
+    async def _get(self, session_id: str) -> Any:
+        """Return the conversation for a session, or None if it is unknown."""
+        try:
+            conversation_id = UUID(session_id)
+        except ValueError:
+            return None
+        return await self._conversation_repo.get_conversation(conversation_id, self._tenant_id)
+
+    async def _update(self, session_id: str, state: Optional[dict[str, Any]]) -> None:
+        """Set (or remove, when state is None) the session state of a conversation."""
+        conversation = await self._get(session_id)
+        if conversation is None:
+            return
+
+        state_metadata = dict(conversation.state_metadata or {})
+        if state is None:
+            if _STATE_METADATA_KEY not in state_metadata:
+                return
+            del state_metadata[_STATE_METADATA_KEY]
+        else:
+            state_metadata[_STATE_METADATA_KEY] = state
+
+        await self._conversation_repo.update_state(
+            conversation_id=conversation.id,
+            tenant_id=self._tenant_id,
+            state=conversation.state or "active",  # Preserve existing state
+            state_metadata=state_metadata,
+        )
+
+
+@dataclass
+class _CachedSession(Generic[AgentT]):
+    """A live session agent, when it was last used, and how many turns use it."""
+
+    agent: AgentT
+    last_used: float
+    pins: int = 0
+    evict_on_release: bool = False
+
+
+class SessionAgentCache(Generic[AgentT]):
+    """LRU/TTL cache of per-session agents with state offload on eviction.
+
+    Agents are evicted when the cache exceeds ``max_sessions`` (least recently
+    used first) or when they have been idle longer than ``ttl_seconds``.
+    Evicted agents have their resumable state saved to the state store and
+    their resources released; the next get() for the session rehydrates a new
+    agent from the store.
+
+    A session fetched with ``get(..., pin=True)`` is in use by a running turn
+    and is never evicted until release() is called after the turn; evictions
+    that were due in the meantime happen then, with the state as the turn
+    left it. The cache may exceed ``max_sessions`` while every session is pinned.
+
+    With ``write_through`` the store is the source of truth: get() restores
+    the stored state into the agent on every call and save() must be called
+    after each turn. Use it when the store is shared by several processes.
+
+    Not thread-safe; intended to be shared by coroutines on one event loop.
+
+    Example:
+        >>> cache = SessionAgentCache(lambda: MasterAgent(agent_registry=registry))
+        >>> agent = await cache.get(conversation_id)
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], AgentT],
+        store: Optional[SessionStateStore] = None,
+        max_sessions: int = 1000,
+        ttl_seconds: float = 1800.0,
+        write_through: bool = False,
+    ) -> None:
+        """Initialize the session cache.
+
+        Args:
+            factory: Creates a new agent for a session
+            store: Where evicted session state is kept (in-memory by default)
+            max_sessions: Maximum number of live agents
+            ttl_seconds: Idle seconds after which an agent is evicted
+            write_through: Keep the store current after every turn and restore
+                from it on every get()
+
+        Raises:
+            ValueError: If max_sessions or ttl_seconds is not positive
+        """
+        if max_sessions <= 0:
+            raise ValueError("max_sessions must be positive")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self._factory = factory
+        self._store: SessionStateStore = store or InMemorySessionStateStore()
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.write_through = write_through
+        self._sessions: OrderedDict[str, _CachedSession[AgentT]] = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._hit_count = 0
+        self._miss_count = 0
+        self._rehydrated_count = 0
+        self._eviction_counts = {"capacity": 0, "expired": 0}
+
+    def __len__(self) -> int:
+        """Return the number of live agents."""
+        return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        """Return whether a live agent exists for the session."""
+        return session_id in self._sessions
+
+    async def get(self, session_id: str, pin: bool = False) -> AgentT:
+        """Return the agent for a session, creating or rehydrating it if needed.
+
+        Args:
+            session_id: Session (conversation) identifier
+            pin: Keep the agent from being evicted until release() is called
+
+        Returns:
+            The session's agent
+        """
+        now = time.monotonic()
+        entry = self._sessions.get(session_id)
+        if entry is not None and (entry.pins or now - entry.last_used <= self.ttl_seconds):
+            entry.last_used = now
+            # A running turn on this agent has newer state than the store
+            turn_running = entry.pins > 0
+            if pin:
+                entry.pins += 1
+            self._sessions.move_to_end(session_id)
+            self._hit_count += 1
+            if self.write_through and not turn_running:
+                # Another process may have handled the previous turn
+                await self._rehydrate(session_id, entry.agent)
+            return entry.agent
+
+        async with self._lock:
+            # Another coroutine may have created the agent while we waited
+            entry = self._sessions.get(session_id)
+            if entry is not None and (entry.pins or now - entry.last_used <= self.ttl_seconds):
+                entry.last_used = time.monotonic()
+                if pin:
+                    entry.pins += 1
+                self._sessions.move_to_end(session_id)
+                self._hit_count += 1
+                return entry.agent
+
+            self._miss_count += 1
+            await self._evict_expired()
+
+            agent = self._factory()
+            await self._rehydrate(session_id, agent)
+
+            self._sessions[session_id] = _CachedSession(
+                agent=agent, last_used=time.monotonic(), pins=int(pin)
+            )
+            await self._evict_overflow(keep=session_id)
+
+            get_metrics_collector().record_session_cache_size(len(self._sessions))
+            return agent
+
+    async def release(self, session_id: str) -> None:
+        """Unpin a session after its turn, running evictions deferred by the pin.
+
+        Args:
+            session_id: Session (conversation) identifier passed to get(pin=True)
+        """
+        entry = self._sessions.get(session_id)
+        if entry is None or not entry.pins:
+            return
+        entry.pins -= 1
+        entry.last_used = time.monotonic()
+        if entry.pins:
+            return
+
+        async with self._lock:
+            if entry.evict_on_release and self._sessions.get(session_id) is entry:
+                await self._evict(session_id, "manual")
+            await self._evict_overflow()
+            get_metrics_collector().record_session_cache_size(len(self._sessions))
+
+    async def save(self, session_id: str) -> None:
+        """Save a live session's state after a turn (write-through mode only).
+
+        Args:
+            session_id: Session (conversation) identifier
+        """
+        entry = self._sessions.get(session_id)
+        if not self.write_through or entry is None:
+            return
+        await self._store.save(session_id, entry.agent.export_session_state())
+
+    async def evict(self, session_id: str) -> None:
+        """Evict a session's agent now, saving its state.
+
+        A pinned session is evicted when its turn releases it.
+
+        Args:
+            session_id: Session (conversation) identifier
+        """
+        async with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is not None and entry.pins:
+                entry.evict_on_release = True
+            elif entry is not None:
+                await self._evict(session_id, "manual")
+                get_metrics_collector().record_session_cache_size(len(self._sessions))
+
+    async def clear(self) -> None:
+        """Release all live agents without saving their state."""
+        async with self._lock:
+            sessions, self._sessions = self._sessions, OrderedDict()
+            for entry in sessions.values():
+                await self._close(entry.agent)
+            get_metrics_collector().record_session_cache_size(0)
+
+    def stats(self) -> dict[str, Any]:
+        """Get current cache statistics.
+
+        Returns:
+            Dictionary with live/max sessions, hit/miss/rehydration counts,
+            and eviction counts by reason
+        """
+        return {
+            "sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "hit_count": self._hit_count,
+            "miss_count": self._miss_count,
+            "rehydrated_count": self._rehydrated_count,
+            "evictions": dict(self._eviction_counts),
+        }
+
+    async def _rehydrate(self, session_id: str, agent: AgentT) -> None:
+        """Restore stored state into an agent, if any was stored."""
+        state = await self._store.load(session_id)
+        if state is None:
+            return
+        await agent.restore_session_state(state)
+        if not self.write_through:
+            # The live agent is now the only copy of the state
+            await self._store.delete(session_id)
+        self._rehydrated_count += 1
+
+    async def _evict_expired(self) -> None:
+        """Evict unpinned agents idle longer than the TTL (oldest first)."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = []
+        for session_id, entry in self._sessions.items():
+            if entry.last_used > cutoff:
+                break
+            if not entry.pins:
+                expired.append(session_id)
+        for session_id in expired:
+            await self._evict(session_id, "expired")
+
+    async def _evict_overflow(self, keep: Optional[str] = None) -> None:
+        """Evict least recently used unpinned agents (other than keep) while over capacity."""
+        excess = len(self._sessions) - self.max_sessions
+        if excess <= 0:
+            return
+        victims = [
+            session_id
+            for session_id, entry in self._sessions.items()
+            if not entry.pins and session_id != keep
+        ]
+        for session_id in victims[:excess]:
+            await self._evict(session_id, "capacity")
+
+    async def _evict(self, session_id: str, reason: str) -> None:
+        """Remove an agent, offload its state, and release its resources."""
+        entry = self._sessions.pop(session_id)
+        try:
+            state = entry.agent.export_session_state()
+            await self._store.save(session_id, state)
+        except Exception as e:
+            logger.error(f"Failed to save state of session {session_id}: {e}", exc_info=True)
+        await self._close(entry.agent)
+
+        self._eviction_counts[reason] = self._eviction_counts.get(reason, 0) + 1
+        get_metrics_collector().record_session_eviction(reason)
+        logger.debug(f"Evicted session agent {session_id} ({reason})")
+
+    @staticmethod
+    async def _close(agent: AgentT) -> None:
+        """Release an agent's resources, logging failures."""
+        try:
+            await agent.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close session agent: {e}")
@@ -5,7 +5,7 @@ Provides command-line interface for agent management and orchestration.
 
 import click
 
-from omniforge.cli import agent
+from omniforge.cli import agent, search
 
 
 @click.group()
@@ -17,6 +17,7 @@ def cli() -> None:
 
 # Register command groups
 cli.add_command(agent.agent)
+cli.add_command(search.search)
 
 
 def main() -> None:
@@ -0,0 +1,58 @@
+"""Full-text search CLI commands.
+
+Provides commands for maintaining the message and task search index.
+"""
+
+import asyncio
+
+import click
+from rich.console import Console
+
+from omniforge.storage.database import Database, DatabaseConfig
+from omniforge.storage.search import SearchIndex
+
+console = Console()
+
+
+@click.group(name="search")
+def search() -> None:
+    """Manage the full-text search index."""
+    pass
+
+
+@search.command(name="reindex")
+@click.option(
+    "--database-url",
+    type=str,
+    envvar="DATABASE_URL",
+    default="sqlite+aiosqlite:///omniforge.db",
+    show_default=True,
+    help="Database URL (defaults to DATABASE_URL environment variable)",
+)
+def reindex(database_url: str) -> None:
+    """Create missing search index objects and backfill existing rows.
+
+    Run once after upgrading a database created before full-text search
+    existed. Safe to run repeatedly.
+
+    Examples:
+        omniforge search reindex
+        omniforge search reindex --database-url sqlite+aiosqlite:///omniforge.db
+    """
+
+    async def _reindex() -> dict[str, int]:
+        database = Database(DatabaseConfig(url=database_url))
+        try:
+            await database.create_tables()
+            return await SearchIndex(database).rebuild()
+        finally:
+            await database.close()
+
+    try:
+        counts = asyncio.run(_reindex())
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+
+    for kind, count in counts.items():
+        console.print(f"Indexed [cyan]{count}[/cyan] {kind} rows")
+    console.print("[green]Search index rebuilt.[/green]")
@@ -0,0 +1,317 @@
+"""Hot/cold tiering of conversation messages.
+
+Conversations idle for longer than a threshold have their messages packed
+into one compressed row in ``conversation_archives`` and deleted from the hot
+``conversation_messages`` table. This keeps the hot table and its indexes
+small enough to stay cache-resident. ``SQLiteConversationRepository``
+restores the messages transparently the next time the conversation is read
+or written to. Compaction is driven by ``ConversationArchiver``, which can run
+as a background job.
+
+Archived messages are removed from the full-text search index along with
+the hot rows, and are re-indexed when restored.
+"""
+
+import asyncio
+import json
+import logging
+import lzma
+import zlib
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Callable, Optional, Sequence
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from omniforge.conversation.orm import (
+    ConversationArchiveModel,
+    ConversationMessageModel,
+    ConversationModel,
+)
+from omniforge.storage.database import Database
+
+logger = logging.getLogger(__name__)
+
+# codec name -> (compress, decompress)
+_CODECS: dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "zlib": (lambda data: zlib.compress(data, 6), zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+
+def pack_messages(
+    messages: Sequence[ConversationMessageModel], codec: str = "zlib"
+) -> tuple[bytes, int]:
+    """Serialize and compress message rows.
+
+    Args:
+        messages: Message rows in chronological order
+        codec: Compression codec ("zlib" or "lzma")
+
+    Returns:
+        Tuple of (compressed payload, uncompressed size in bytes)
+
+    Raises:
+        ValueError: If the codec is unknown
+    """
+    compress, _ = _get_codec(codec)
+    records = [
+        {
+            "id": m.id,
+            "role": m.role,
+            "content": m.content,
+            "created_at": m.created_at.isoformat(),  # type: ignore[attr-defined]
+            "metadata": m.message_metadata,
+        }
+        for m in messages
+    ]
+    raw = json.dumps(records, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return compress(raw), len(raw)
+
+
+def unpack_messages(
+    payload: bytes, codec: str, conversation_id: str
+) -> list[ConversationMessageModel]:
+    """Decompress a payload produced by pack_messages back into message rows.
+
+    Args:
+        payload: Compressed payload
+        codec: Codec the payload was compressed with
+        conversation_id: Conversation the messages belong to
+
+    Returns:
+        New (transient) message rows in chronological order
+
+    Raises:
+        ValueError: If the codec is unknown
+    """
+    _, decompress = _get_codec(codec)
+    records = json.loads(decompress(payload))
+    return [
+        ConversationMessageModel(
+            id=r["id"],
+            conversation_id=conversation_id,
+            role=r["role"],
+            content=r["content"],
+            created_at=datetime.fromisoformat(r["created_at"]),
+            message_metadata=r["metadata"],
+        )
+        for r in records
+    ]
+
+
+async def archive_conversation(
+    session: AsyncSession,
+    conversation_id: str,
+    idle_before: datetime,
+    codec: str = "zlib",
+) -> Optional[int]:
+    """Move a conversation's messages to the cold archive.
+
+    The idle check is repeated inside the transaction, so a conversation that
+    received a message after being selected for compaction is left alone.
+
+    Args:
+        session: Session to perform the move in
+        conversation_id: Conversation to archive
+        idle_before: Only archive if last updated (and last restored) before this
+        codec: Compression codec ("zlib" or "lzma")
+
+    Returns:
+        Number of archived messages, or None if the conversation is not eligible
+    """
+    conversation = await session.get(ConversationModel, conversation_id)
+    if (
+        conversation is None
+        or conversation.archived_at is not None
+        or conversation.updated_at >= idle_before
+        or (conversation.rehydrated_at is not None and conversation.rehydrated_at >= idle_before)
+    ):
+        return None
+
+    result = await session.execute(
+        select(ConversationMessageModel)
+        .where(ConversationMessageModel.conversation_id == conversation_id)
+        .order_by(ConversationMessageModel.created_at, ConversationMessageModel.id)
+    )
+    messages = result.scalars().all()
+    payload, raw_size = pack_messages(messages, codec)
+
+    now = datetime.utcnow()
+    session.add(
+        ConversationArchiveModel(
+            conversation_id=conversation_id,
+            codec=codec,
+            payload=payload,
+            message_count=len(messages),
+            raw_size=raw_size,
+            archived_at=now,
+        )
+    )
+    await session.execute(
+        delete(ConversationMessageModel).where(
+            ConversationMessageModel.conversation_id == conversation_id
+        )
+    )
+    conversation.archived_at = now
+    await session.flush()
+    return len(messages)
+
+
+async def rehydrate_conversation(session: AsyncSession, conversation_id: str) -> int:
+    """Restore an archived conversation's messages to the hot table.
+
+    Args:
+        session: Session to perform the restore in
+        conversation_id: Conversation to restore
+
+    Returns:
+        Number of restored messages (0 if the conversation was not archived)
+    """
+    conversation = await session.get(ConversationModel, conversation_id)
+    if conversation is None or conversation.archived_at is None:
+        return 0
+
+    archive = await session.get(ConversationArchiveModel, conversation_id)
+    messages = []
+    if archive is not None:
+        messages = unpack_messages(archive.payload, archive.codec, conversation_id)
+        session.add_all(messages)
+        await session.delete(archive)
+
+    # Restoring doesn't count as activity (updated_at drives list ordering), but
+    # it resets the idle clock so the conversation isn't archived again right away
+    conversation.archived_at = None
+    conversation.rehydrated_at = datetime.utcnow()
+    await session.flush()
+    return len(messages)
+
+
+class ConversationArchiver:
+    """Background compaction job moving idle conversations to the cold tier.
+
+    Attributes:
+        db: Database to compact
+        idle_after: Inactivity period after which a conversation is archived
+        batch_size: Number of candidate conversations selected per query
+        codec: Compression codec ("zlib" or "lzma")
+        interval: Seconds between compaction passes when running in background
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        idle_after: timedelta = timedelta(days=30),
+        batch_size: int = 100,
+        codec: str = "zlib",
+        interval: float = 3600.0,
+    ) -> None:
+        """Initialize the archiver.
+
+        Args:
+            db: Database to compact
+            idle_after: Inactivity period after which a conversation is archived
+            batch_size: Number of candidate conversations selected per query
+            codec: Compression codec ("zlib" or "lzma")
+            interval: Seconds between compaction passes when running in background
+
+        Raises:
+            ValueError: If the codec is unknown or batch_size is not positive
+        """
+        _get_codec(codec)
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        self.db = db
+        self.idle_after = idle_after
+        self.batch_size = batch_size
+        self.codec = codec
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def compact(self, now: Optional[datetime] = None) -> int:
+        """Archive all conversations idle for longer than idle_after.
+
+        Each conversation is archived in its own write, so compaction never
+        holds the write lock for long.
+
+        Args:
+            now: Reference time (default: current UTC time)
+
+        Returns:
+            Number of conversations archived
+        """
+        cutoff = (now or datetime.utcnow()) - self.idle_after
+        archived = 0
+        after_id = ""
+        columns = ConversationModel.__table__.c
+        while True:
+            async with self.db.session() as session:
+                result = await session.execute(
+                    select(columns.id)
+                    .where(
+                        columns.archived_at.is_(None),
+                        columns.updated_at < cutoff,
+                        or_(columns.rehydrated_at.is_(None), columns.rehydrated_at < cutoff),
+                        columns.id > after_id,
+                    )
+                    .order_by(columns.id)
+                    .limit(self.batch_size)
+                )
+                candidate_ids = list(result.scalars().all())
+
+            for conversation_id in candidate_ids:
+                count = await self.db.write(
+                    partial(
+                        archive_conversation,
+                        conversation_id=conversation_id,
+                        idle_before=cutoff,
+                        codec=self.codec,
+                    )
+                )
+                if count is not None:
+                    archived += 1
+
+            if len(candidate_ids) < self.batch_size:
+                break
+            after_id = candidate_ids[-1]
+
+        if archived:
+            logger.info(f"Archived {archived} idle conversations")
+        return archived
+
+    def start(self) -> None:
+        """Start running compaction passes in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background compaction job."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Background loop: compact, then sleep for the interval."""
+        while True:
+            try:
+                await self.compact()
+            except Exception as e:
+                logger.error(f"Conversation compaction failed: {e}", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+
+def _get_codec(
+    codec: str,
+) -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    """Look up the compress/decompress pair for a codec name."""
+    try:
+        return _CODECS[codec]
+    except KeyError:
+        raise ValueError(f"Unknown archive codec: {codec}") from None
@@ -10,6 +10,7 @@ from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 
 from omniforge.conversation.models import Conversation, Message, MessageRole
+from omniforge.storage.pagination import is_after
 
 
 class InMemoryConversationRepository:
@@ -108,6 +109,7 @@ class InMemoryConversationRepository:
         user_id: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Conversation]:
         """List conversations with tenant filtering.
 
@@ -118,13 +120,14 @@ class InMemoryConversationRepository:
             tenant_id: Tenant ID for filtering (required)
             user_id: Optional user ID for additional filtering
             limit: Maximum number of results (default: 50)
-            offset: Pagination offset (default: 0)
+            offset: Pagination offset (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
 
         Returns:
             List of conversations for the tenant (and optionally user)
 
         Raises:
-            ValueError: If tenant_id is invalid
+            ValueError: If tenant_id or cursor is invalid
         """
         if not tenant_id or not tenant_id.strip():
             raise ValueError("tenant_id cannot be empty")
@@ -137,10 +140,13 @@ class InMemoryConversationRepository:
             if user_id:
                 filtered = [c for c in filtered if c.user_id == user_id]
 
-            # Sort by updated_at DESC (most recent first)
-            filtered.sort(key=lambda c: c.updated_at, reverse=True)
+            # Sort by updated_at DESC (most recent first), id breaks ties
+            filtered.sort(key=lambda c: (c.updated_at, str(c.id)), reverse=True)
 
             # Apply pagination
+            if cursor:
+                filtered = [c for c in filtered if is_after(c.updated_at, c.id, cursor)]
+                return filtered[:limit]
             return filtered[offset : offset + limit]
 
     async def update_conversation(
@@ -192,7 +198,8 @@ class InMemoryConversationRepository:
     ) -> Message:
         """Add a message to a conversation.
 
-        Atomically updates conversation.updated_at when adding the message.
+        Atomically updates conversation.updated_at and increments
+        conversation.version when adding the message.
 
         Args:
             conversation_id: Conversation to add message to
@@ -235,10 +242,11 @@ class InMemoryConversationRepository:
                 self._messages[conversation_id] = []
             self._messages[conversation_id].append(message)
 
-            # Atomically update conversation.updated_at
+            # Atomically update conversation.updated_at and bump the version
             updated_conversation = conversation.model_copy(
                 update={
                     "updated_at": datetime.utcnow(),
+                    "version": conversation.version + 1,
                 }
             )
             self._conversations[conversation_id] = updated_conversation
@@ -251,6 +259,7 @@ class InMemoryConversationRepository:
         tenant_id: str,
         limit: Optional[int] = None,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Message]:
         """Get all messages in a conversation with tenant validation.
 
@@ -261,13 +270,14 @@ class InMemoryConversationRepository:
             conversation_id: Conversation to get messages from
             tenant_id: Tenant ID for validation (required)
             limit: Optional maximum number of messages
-            offset: Pagination offset (default: 0)
+            offset: Pagination offset (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
 
         Returns:
             List of messages in chronological order
 
         Raises:
-            ValueError: If tenant_id is invalid or conversation not found
+            ValueError: If tenant_id or cursor is invalid, or conversation not found
         """
         if not tenant_id or not tenant_id.strip():
             raise ValueError("tenant_id cannot be empty")
@@ -283,6 +293,11 @@ class InMemoryConversationRepository:
 
             # Get messages (already in chronological order)
             messages = self._messages.get(conversation_id, [])
+            if cursor:
+                messages = [
+                    m for m in messages if is_after(m.created_at, m.id, cursor, descending=False)
+                ]
+                offset = 0
 
             # Apply pagination (always return copy to avoid mutation)
             if limit is not None:
@@ -79,6 +79,8 @@ class Conversation(BaseModel):
         title: Optional human-readable title
         created_at: Timestamp when conversation was created
         updated_at: Timestamp when conversation was last modified
+        version: Message version counter, incremented on every added message
+        archived_at: When the messages were moved to cold storage (None if hot)
         metadata: Additional conversation metadata (optional)
     """
 
@@ -91,6 +93,8 @@ class Conversation(BaseModel):
     title: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    version: int = 0
+    archived_at: Optional[datetime] = None
     metadata: Optional[Dict[str, Any]] = None
 
     model_config = ConfigDict(use_enum_values=True)
@@ -8,7 +8,16 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship  # type: ignore[attr-defined]
 
 from omniforge.storage.base_model import Base
@@ -31,6 +40,10 @@ class ConversationModel(Base):  # type: ignore[valid-type,misc]
         title: Optional human-readable conversation title
         created_at: Timestamp when conversation was created
         updated_at: Timestamp when conversation was last updated
+        version: Counter incremented on every message write, used to validate
+            cached history across workers
+        archived_at: When the messages were moved to the cold archive (None if hot)
+        rehydrated_at: When the messages were last restored from the archive
         conversation_metadata: Additional metadata stored as JSON
         messages: Relationship to associated messages
     """
@@ -60,6 +73,13 @@ class ConversationModel(Base):  # type: ignore[valid-type,misc]
         DateTime, nullable=False, default=datetime.utcnow, index=True
     )
 
+    # Message version counter (bumped by add_message)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    # Set while the messages live in conversation_archives instead of the hot table
+    archived_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    rehydrated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
     # Metadata stored as JSON (avoid 'metadata' - SQLAlchemy reserved word)
     conversation_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
@@ -74,9 +94,12 @@ class ConversationModel(Base):  # type: ignore[valid-type,misc]
     # Composite indexes for common query patterns
     __table_args__ = (
         Index("idx_conversation_tenant_user", "tenant_id", "user_id"),
-        Index("idx_conversation_tenant_updated", "tenant_id", "updated_at"),
-        Index("idx_conversation_tenant_type", "tenant_id", "conversation_type"),
+        Index("idx_conversation_tenant_updated", "tenant_id", "updated_at", "id"),
+        Index(
+            "idx_conversation_tenant_type", "tenant_id", "conversation_type", "updated_at", "id"
+        ),
         Index("idx_conversation_type_state", "conversation_type", "state"),
+        Index("idx_conversation_archived_updated", "archived_at", "updated_at"),
     )
 
 
@@ -123,5 +146,36 @@ class ConversationMessageModel(Base):  # type: ignore[valid-type,misc]
         "ConversationModel", back_populates="messages"
     )
 
-    # Composite index for efficient message retrieval
-    __table_args__ = (Index("idx_conversation_created", "conversation_id", "created_at"),)
+    # Composite index for efficient message retrieval and keyset pagination
+    __table_args__ = (
+        Index("idx_conversation_created", "conversation_id", "created_at", "id"),
+    )
+
+
+class ConversationArchiveModel(Base):  # type: ignore[valid-type,misc]
+    """ORM model for the cold tier of conversation messages.
+
+    Idle conversations have all their messages packed into a single
+    compressed blob row and removed from ``conversation_messages``, keeping
+    the hot table and its indexes small. Messages are restored to the hot
+    table on access.
+
+    Attributes:
+        conversation_id: Conversation whose messages are archived
+        codec: Compression codec of the payload ("zlib" or "lzma")
+        payload: Compressed JSON array of message rows
+        message_count: Number of archived messages
+        raw_size: Uncompressed payload size in bytes
+        archived_at: Timestamp when the messages were archived
+    """
+
+    __tablename__ = "conversation_archives"
+
+    conversation_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("conversations.id", ondelete="CASCADE"), primary_key=True
+    )
+    codec: Mapped[str] = mapped_column(String(16), nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    message_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    raw_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
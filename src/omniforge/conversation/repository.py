@@ -69,6 +69,7 @@ class ConversationRepository(Protocol):
         user_id: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Conversation]:
         """List conversations with tenant filtering.
 
@@ -79,13 +80,15 @@ class ConversationRepository(Protocol):
             tenant_id: Tenant ID for filtering (required)
             user_id: Optional user ID for additional filtering
             limit: Maximum number of results (default: 50)
-            offset: Pagination offset (default: 0)
+            offset: Pagination offset (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
 
         Returns:
-            List of conversations for the tenant (and optionally user)
+            List of conversations for the tenant (and optionally user),
+            ordered by (updated_at, id) desc
 
         Raises:
-            ValueError: If tenant_id is invalid
+            ValueError: If tenant_id or cursor is invalid
         """
         ...
 
@@ -139,6 +142,7 @@ class ConversationRepository(Protocol):
         tenant_id: str,
         limit: Optional[int] = None,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Message]:
         """Get all messages in a conversation with tenant validation.
 
@@ -149,13 +153,14 @@ class ConversationRepository(Protocol):
             conversation_id: Conversation to get messages from
             tenant_id: Tenant ID for validation (required)
             limit: Optional maximum number of messages
-            offset: Pagination offset (default: 0)
+            offset: Pagination offset (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
 
         Returns:
             List of messages in chronological order
 
         Raises:
-            ValueError: If tenant_id is invalid or conversation not found
+            ValueError: If tenant_id or cursor is invalid, or conversation not found
         """
         ...
 
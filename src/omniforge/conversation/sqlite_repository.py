@@ -9,10 +9,13 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from omniforge.conversation.archive import rehydrate_conversation
 from omniforge.conversation.models import Conversation, ConversationType, Message, MessageRole
 from omniforge.conversation.orm import ConversationMessageModel, ConversationModel
 from omniforge.storage.database import Database
+from omniforge.storage.pagination import seek_after
 
 
 class SQLiteConversationRepository:
@@ -20,6 +23,8 @@ class SQLiteConversationRepository:
 
     Provides persistent storage for conversations and messages with
     multi-tenant isolation enforced at the database query level.
+    Writes go through Database.write(), so they are group-committed when the
+    database's write queue is enabled.
 
     Attributes:
         db: Database instance for session management
@@ -65,7 +70,7 @@ class SQLiteConversationRepository:
         if not user_id or not user_id.strip():
             raise ValueError("user_id cannot be empty")
 
-        async with self.db.session() as session:
+        async def _create(session: AsyncSession) -> Conversation:
             # Create ORM model
             conversation_orm = ConversationModel(
                 id=str(conversation_id) if conversation_id else None,
@@ -85,6 +90,8 @@ class SQLiteConversationRepository:
             # Convert to domain model
             return self._orm_to_conversation(conversation_orm)
 
+        return await self.db.write(_create)
+
     async def get_conversation(
         self,
         conversation_id: UUID,
@@ -127,6 +134,7 @@ class SQLiteConversationRepository:
         user_id: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Conversation]:
         """List conversations with tenant filtering.
 
@@ -137,13 +145,14 @@ class SQLiteConversationRepository:
             tenant_id: Tenant ID for filtering (required)
             user_id: Optional user ID for additional filtering
             limit: Maximum number of results (default: 50)
-            offset: Pagination offset (default: 0)
+            offset: Pagination offset (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
 
         Returns:
             List of conversations for the tenant (and optionally user)
 
         Raises:
-            ValueError: If tenant_id is invalid
+            ValueError: If tenant_id or cursor is invalid
         """
         if not tenant_id or not tenant_id.strip():
             raise ValueError("tenant_id cannot be empty")
@@ -155,8 +164,7 @@ class SQLiteConversationRepository:
                 stmt = stmt.where(ConversationModel.user_id == user_id)
 
             # Order by updated_at DESC (most recent first)
-            stmt = stmt.order_by(desc(ConversationModel.updated_at))
-            stmt = stmt.limit(limit).offset(offset)
+            stmt = self._paginate_conversations(stmt, limit, offset, cursor)
 
             result = await session.execute(stmt)
             conversations_orm = result.scalars().all()
@@ -185,7 +193,7 @@ class SQLiteConversationRepository:
         if not tenant_id or not tenant_id.strip():
             raise ValueError("tenant_id cannot be empty")
 
-        async with self.db.session() as session:
+        async def _update(session: AsyncSession) -> Optional[Conversation]:
             stmt = select(ConversationModel).where(
                 ConversationModel.id == str(conversation_id),
                 ConversationModel.tenant_id == tenant_id,
@@ -206,6 +214,8 @@ class SQLiteConversationRepository:
 
             return self._orm_to_conversation(conversation_orm)
 
+        return await self.db.write(_update)
+
     async def update_state(
         self,
         conversation_id: UUID,
@@ -232,7 +242,7 @@ class SQLiteConversationRepository:
         if not state or not state.strip():
             raise ValueError("state cannot be empty")
 
-        async with self.db.session() as session:
+        async def _update_state(session: AsyncSession) -> Optional[Conversation]:
             stmt = select(ConversationModel).where(
                 ConversationModel.id == str(conversation_id),
                 ConversationModel.tenant_id == tenant_id,
@@ -254,6 +264,8 @@ class SQLiteConversationRepository:
 
             return self._orm_to_conversation(conversation_orm)
 
+        return await self.db.write(_update_state)
+
     async def get_conversations_by_type(
         self,
         tenant_id: str,
@@ -261,6 +273,7 @@ class SQLiteConversationRepository:
         user_id: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Conversation]:
         """Get conversations by type with tenant filtering.
 
@@ -272,13 +285,14 @@ class SQLiteConversationRepository:
             conversation_type: Type of conversation to filter by
             user_id: Optional user ID for additional filtering
             limit: Maximum number of results (default: 50)
-            offset: Pagination offset (default: 0)
+            offset: Pagination offset (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
 
         Returns:
             List of conversations of the specified type
 
         Raises:
-            ValueError: If tenant_id is invalid
+            ValueError: If tenant_id or cursor is invalid
         """
         if not tenant_id or not tenant_id.strip():
             raise ValueError("tenant_id cannot be empty")
@@ -292,8 +306,7 @@ class SQLiteConversationRepository:
             if user_id:
                 stmt = stmt.where(ConversationModel.user_id == user_id)
 
-            stmt = stmt.order_by(desc(ConversationModel.updated_at))
-            stmt = stmt.limit(limit).offset(offset)
+            stmt = self._paginate_conversations(stmt, limit, offset, cursor)
 
             result = await session.execute(stmt)
             conversations_orm = result.scalars().all()
@@ -308,6 +321,7 @@ class SQLiteConversationRepository:
         user_id: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Conversation]:
         """Get conversations by FSM state with tenant filtering.
 
@@ -323,13 +337,14 @@ class SQLiteConversationRepository:
             conversation_type: Optional conversation type filter
             user_id: Optional user ID for additional filtering
             limit: Maximum number of results (default: 50)
-            offset: Pagination offset (default: 0)
+            offset: Pagination offset (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
 
         Returns:
             List of conversations in the specified state
 
         Raises:
-            ValueError: If tenant_id is invalid
+            ValueError: If tenant_id or cursor is invalid
         """
         if not tenant_id or not tenant_id.strip():
             raise ValueError("tenant_id cannot be empty")
@@ -348,8 +363,7 @@ class SQLiteConversationRepository:
             if user_id:
                 stmt = stmt.where(ConversationModel.user_id == user_id)
 
-            stmt = stmt.order_by(desc(ConversationModel.updated_at))
-            stmt = stmt.limit(limit).offset(offset)
+            stmt = self._paginate_conversations(stmt, limit, offset, cursor)
 
             result = await session.execute(stmt)
             conversations_orm = result.scalars().all()
@@ -365,7 +379,8 @@ class SQLiteConversationRepository:
     ) -> Message:
         """Add a message to a conversation.
 
-        Atomically updates conversation.updated_at when adding the message.
+        Atomically updates conversation.updated_at and increments
+        conversation.version when adding the message.
 
         Args:
             conversation_id: Conversation to add message to
@@ -384,7 +399,7 @@ class SQLiteConversationRepository:
         if not content or not content.strip():
             raise ValueError("content cannot be empty")
 
-        async with self.db.session() as session:
+        async def _add_message(session: AsyncSession) -> Message:
             # Verify conversation exists and belongs to tenant
             stmt = select(ConversationModel).where(
                 ConversationModel.id == str(conversation_id),
@@ -398,6 +413,10 @@ class SQLiteConversationRepository:
                     f"Conversation {conversation_id} not found or does not belong to tenant"
                 )
 
+            # Restore archived history before appending to it
+            if conversation_orm.archived_at is not None:
+                await rehydrate_conversation(session, conversation_orm.id)
+
             # Create message
             message_orm = ConversationMessageModel(
                 conversation_id=str(conversation_id),
@@ -408,20 +427,25 @@ class SQLiteConversationRepository:
 
             session.add(message_orm)
 
-            # Atomically update conversation.updated_at
+            # Atomically update conversation.updated_at and bump the version
+            # so cached history windows in other workers become stale
             conversation_orm.updated_at = datetime.utcnow()
+            conversation_orm.version = ConversationModel.__table__.c.version + 1
 
             await session.flush()
             await session.refresh(message_orm)
 
             return self._orm_to_message(message_orm)
 
+        return await self.db.write(_add_message)
+
     async def get_messages(
         self,
         conversation_id: UUID,
         tenant_id: str,
         limit: Optional[int] = None,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Message]:
         """Get all messages in a conversation with tenant validation.
 
@@ -432,32 +456,44 @@ class SQLiteConversationRepository:
             conversation_id: Conversation to get messages from
             tenant_id: Tenant ID for validation (required)
             limit: Optional maximum number of messages
-            offset: Pagination offset (default: 0)
+            offset: Pagination offset (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
 
         Returns:
             List of messages in chronological order
 
         Raises:
-            ValueError: If tenant_id is invalid or conversation not found
+            ValueError: If tenant_id or cursor is invalid, or conversation not found
         """
         if not tenant_id or not tenant_id.strip():
             raise ValueError("tenant_id cannot be empty")
 
-        async with self.db.session() as session:
-            # Verify conversation exists and belongs to tenant
-            conversation = await self.get_conversation(conversation_id, tenant_id)
-            if conversation is None:
-                raise ValueError(
-                    f"Conversation {conversation_id} not found or does not belong to tenant"
-                )
+        # Verify conversation exists and belongs to tenant
+        conversation = await self.get_conversation(conversation_id, tenant_id)
+        if conversation is None:
+            raise ValueError(
+                f"Conversation {conversation_id} not found or does not belong to tenant"
+            )
+        await self._ensure_hot(conversation)
 
-            # Fetch messages
+        async with self.db.session() as session:
+            # Fetch messages, seeking on (conversation_id, created_at, id)
             stmt = (
                 select(ConversationMessageModel)
                 .where(ConversationMessageModel.conversation_id == str(conversation_id))
-                .order_by(ConversationMessageModel.created_at)
-                .offset(offset)
+                .order_by(ConversationMessageModel.created_at, ConversationMessageModel.id)
             )
+            if cursor:
+                stmt = stmt.where(
+                    seek_after(
+                        ConversationMessageModel.created_at,
+                        ConversationMessageModel.id,
+                        cursor,
+                        descending=False,
+                    )
+                )
+            else:
+                stmt = stmt.offset(offset)
 
             if limit is not None:
                 stmt = stmt.limit(limit)
@@ -494,14 +530,15 @@ class SQLiteConversationRepository:
         if not tenant_id or not tenant_id.strip():
             raise ValueError("tenant_id cannot be empty")
 
-        async with self.db.session() as session:
-            # Verify conversation exists and belongs to tenant
-            conversation = await self.get_conversation(conversation_id, tenant_id)
-            if conversation is None:
-                raise ValueError(
-                    f"Conversation {conversation_id} not found or does not belong to tenant"
-                )
+        # Verify conversation exists and belongs to tenant
+        conversation = await self.get_conversation(conversation_id, tenant_id)
+        if conversation is None:
+            raise ValueError(
+                f"Conversation {conversation_id} not found or does not belong to tenant"
+            )
+        await self._ensure_hot(conversation)
 
+        async with self.db.session() as session:
             # Fetch recent messages in DESC order
             stmt = (
                 select(ConversationMessageModel)
@@ -518,6 +555,40 @@ class SQLiteConversationRepository:
 
             return messages
 
+    async def _ensure_hot(self, conversation: Conversation) -> None:
+        """Restore an archived conversation's messages to the hot table.
+
+        Args:
+            conversation: Conversation about to have its messages read
+        """
+        if conversation.archived_at is None:
+            return
+        await self.db.write(lambda s: rehydrate_conversation(s, str(conversation.id)))
+
+    @staticmethod
+    def _paginate_conversations(
+        stmt: Any, limit: int, offset: int, cursor: Optional[str]
+    ) -> Any:
+        """Apply most-recent-first ordering and offset or keyset pagination.
+
+        Args:
+            stmt: Select statement over ConversationModel
+            limit: Maximum number of results
+            offset: Pagination offset, used only when no cursor is given
+            cursor: Opaque keyset cursor from a previous page
+
+        Returns:
+            Paginated select statement
+        """
+        stmt = stmt.order_by(desc(ConversationModel.updated_at), desc(ConversationModel.id))
+        if cursor:
+            stmt = stmt.where(
+                seek_after(ConversationModel.updated_at, ConversationModel.id, cursor)
+            )
+        else:
+            stmt = stmt.offset(offset)
+        return stmt.limit(limit)
+
     def _orm_to_conversation(self, orm: ConversationModel) -> Conversation:
         """Convert ORM model to domain model.
 
@@ -538,6 +609,8 @@ class SQLiteConversationRepository:
             title=orm.title,  # type: ignore[arg-type]
             created_at=orm.created_at,  # type: ignore[arg-type]
             updated_at=orm.updated_at,  # type: ignore[arg-type]
+            version=orm.version or 0,  # type: ignore[arg-type]
+            archived_at=orm.archived_at,  # type: ignore[arg-type]
             metadata=orm.conversation_metadata,  # type: ignore[arg-type]
         )
 
@@ -5,7 +5,9 @@ communication without creating circular dependencies.
 """
 
 from omniforge.core.protocols import ChainRecorder
+from omniforge.core.text import fold_case
 
 __all__ = [
     "ChainRecorder",
+    "fold_case",
 ]
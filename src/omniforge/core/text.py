@@ -0,0 +1,22 @@
+"""Text helpers shared across layers."""
+
+# Non-ASCII characters that re.IGNORECASE matches to ASCII letters but that
+# str.lower() does not map to them (İ, ı, ſ and the Kelvin sign)
+ASCII_FOLDS = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def fold_case(text: str) -> str:
+    """Lowercase text the way case-insensitive patterns see ASCII letters.
+
+    A literal keyword found in the folded text is therefore found wherever a
+    re.IGNORECASE pattern containing it could match.
+
+    Args:
+        text: Text to fold
+
+    Returns:
+        Lowercased text, with ASCII_FOLDS applied to non-ASCII text
+    """
+    if text.isascii():
+        return text.lower()
+    return text.translate(ASCII_FOLDS).lower()
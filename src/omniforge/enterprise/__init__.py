@@ -16,7 +16,12 @@ from omniforge.enterprise.model_governance import (
     ModelNotApprovedError,
     ModelPolicy,
 )
-from omniforge.enterprise.rate_limiter import RateLimitConfig, RateLimiter, TenantLimiter
+from omniforge.enterprise.rate_limiter import (
+    RateLimitConfig,
+    RateLimiter,
+    SharedTenantLimiter,
+    TenantLimiter,
+)
 
 __all__ = [
     "CostRecord",
@@ -27,6 +32,7 @@ __all__ = [
     "ModelPolicy",
     "RateLimitConfig",
     "RateLimiter",
+    "SharedTenantLimiter",
     "TaskBudget",
     "TaskCostSummary",
     "TenantLimiter",
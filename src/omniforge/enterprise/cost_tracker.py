@@ -68,7 +68,11 @@ class TaskCostSummary:
 
 
 class CostRepository(Protocol):
-    """Protocol for cost record persistence."""
+    """Protocol for cost record persistence.
+
+    SQL-backed implementations should commit through Database.write(), so
+    cost records are group-committed with other writes.
+    """
 
     async def save_cost_record(self, record: CostRecord) -> None:
         """Save a cost record.
@@ -6,10 +6,11 @@ ensuring fair resource allocation and preventing abuse in multi-tenant deploymen
 
 import time
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 from aiolimiter import AsyncLimiter
 
+from omniforge.storage.shared_state import SQLiteStateStore
 from omniforge.tools.types import ToolType
 
 
@@ -173,6 +174,94 @@ class TenantLimiter:
             self._day_window_start = current_time
 
 
+class SharedTenantLimiter:
+    """Rate limiter for a single tenant with counters in a shared state store.
+
+    Used instead of TenantLimiter when several worker processes must enforce
+    one set of limits. Each limit is a fixed-window counter (e.g. calls in the
+    current minute) stored in the SQLiteStateStore; a check reads, compares
+    and increments all relevant counters in one transaction, so concurrent
+    workers cannot overshoot a limit between them.
+
+    Example:
+        >>> limiter = SharedTenantLimiter("tenant-1", RateLimitConfig(), store)
+        >>> allowed = await limiter.check_and_consume(tool_type=ToolType.LLM, tokens=100)
+    """
+
+    def __init__(self, tenant_id: str, config: RateLimitConfig, store: SQLiteStateStore):
+        """Initialize shared tenant limiter.
+
+        Args:
+            tenant_id: Tenant whose counters this limiter manages
+            config: Rate limit configuration
+            store: Shared state store holding the counters
+        """
+        self.config = config
+        self._store = store
+        self._namespace = f"rate_limit:{tenant_id}"
+
+    async def check_and_consume(
+        self,
+        tool_type: ToolType,
+        tokens: int = 0,
+        cost_usd: float = 0.0,
+    ) -> bool:
+        """Check rate limits and consume if allowed.
+
+        Args:
+            tool_type: Type of tool being called
+            tokens: Number of tokens to consume
+            cost_usd: Cost in USD to consume
+
+        Returns:
+            True if allowed and consumed, False if rate limit exceeded
+        """
+        # (counter name, window seconds, limit, amount to consume)
+        demands: list[tuple[str, float, float, float]] = []
+        if cost_usd > 0:
+            demands.append(("cost_hour", 3600.0, self.config.cost_per_hour_usd, cost_usd))
+            demands.append(("cost_day", 86400.0, self.config.cost_per_day_usd, cost_usd))
+        if tokens > 0:
+            demands.append(("tokens_minute", 60.0, self.config.tokens_per_minute, tokens))
+            demands.append(("tokens_hour", 3600.0, self.config.tokens_per_hour, tokens))
+        calls = self._call_limit(tool_type)
+        if calls is not None:
+            demands.append((f"calls_{tool_type.value}", 60.0, calls, 1))
+
+        # The transaction may wait for another worker's write lock
+        return await self._store.run(self._consume, demands, time.time())
+
+    def _consume(self, demands: list[tuple[str, float, float, float]], now: float) -> bool:
+        """Check and increment the counters of all demands in one transaction."""
+        with self._store.transaction() as store:
+            counters = []
+            for name, window, limit, amount in demands:
+                counter = store.get(self._namespace, name)
+                if counter is None or now - counter["window_start"] >= window:
+                    counter = {"window_start": now, "used": 0}
+                if counter["used"] + amount > limit:
+                    return False
+                counters.append((name, window, counter, amount))
+
+            # All checks passed - consume the resources
+            for name, window, counter, amount in counters:
+                counter["used"] += amount
+                remaining = window - (now - counter["window_start"])
+                store.set(self._namespace, name, counter, ttl_seconds=remaining)
+
+        return True
+
+    def _call_limit(self, tool_type: ToolType) -> Optional[int]:
+        """Get the per-minute call limit for a tool type, or None if unlimited."""
+        if tool_type == ToolType.LLM:
+            return self.config.llm_calls_per_minute
+        elif tool_type == ToolType.API:
+            return self.config.external_calls_per_minute
+        elif tool_type == ToolType.DATABASE:
+            return self.config.database_calls_per_minute
+        return None
+
+
 class RateLimiter:
     """Multi-tenant rate limiter.
 
@@ -191,15 +280,22 @@ class RateLimiter:
         ... )
     """
 
-    def __init__(self, default_config: Optional[RateLimitConfig] = None):
+    def __init__(
+        self,
+        default_config: Optional[RateLimitConfig] = None,
+        store: Optional[SQLiteStateStore] = None,
+    ):
         """Initialize multi-tenant rate limiter.
 
         Args:
             default_config: Default configuration for unconfigured tenants
+            store: Optional shared state store; when given, limits are enforced
+                across all processes using the store (see SharedTenantLimiter)
         """
         self._default_config = default_config or RateLimitConfig()
+        self._store = store
         self._tenant_configs: Dict[str, RateLimitConfig] = {}
-        self._tenant_limiters: Dict[str, TenantLimiter] = {}
+        self._tenant_limiters: Dict[str, Union[TenantLimiter, SharedTenantLimiter]] = {}
 
     def configure_tenant(self, tenant_id: str, config: RateLimitConfig) -> None:
         """Configure rate limits for a specific tenant.
@@ -234,7 +330,12 @@ class RateLimiter:
         # Get or create tenant limiter
         if tenant_id not in self._tenant_limiters:
             config = self._tenant_configs.get(tenant_id, self._default_config)
-            self._tenant_limiters[tenant_id] = TenantLimiter(config)
+            if self._store is not None:
+                self._tenant_limiters[tenant_id] = SharedTenantLimiter(
+                    tenant_id, config, self._store
+                )
+            else:
+                self._tenant_limiters[tenant_id] = TenantLimiter(config)
 
         limiter = self._tenant_limiters[tenant_id]
         return await limiter.check_and_consume(tool_type, tokens, cost_usd)
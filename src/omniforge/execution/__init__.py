@@ -4,13 +4,33 @@ This module provides execution services for running agents and orchestrating
 multi-skill workflows with error handling and data flow management.
 """
 
+from omniforge.execution.admission import (
+    AdmissionConfig,
+    AdmissionController,
+    AdmissionPriority,
+    AdmissionTicket,
+    get_admission_controller,
+)
 from omniforge.execution.backend import ExecutionBackend
+from omniforge.execution.cancellation import (
+    CancellationToken,
+    current_cancellation_token,
+    use_cancellation_token,
+)
 from omniforge.execution.inprocess import InProcessBackend
 from omniforge.execution.scheduler import AgentScheduler, ScheduleConfig
 
 __all__ = [
+    "AdmissionConfig",
+    "AdmissionController",
+    "AdmissionPriority",
+    "AdmissionTicket",
     "AgentScheduler",
+    "CancellationToken",
     "ExecutionBackend",
     "InProcessBackend",
     "ScheduleConfig",
+    "current_cancellation_token",
+    "get_admission_controller",
+    "use_cancellation_token",
 ]
@@ -0,0 +1,370 @@
+"""Admission control for agent tasks.
+
+Every accepted task starts a process_task() run that holds memory and
+competes for the tenant's LLM rate limit until it finishes. Without a cap, a
+burst of requests starts them all at once and latency collapses for every
+caller. AdmissionController bounds the number of concurrently running tasks
+per worker, globally and per tenant, and sheds the excess:
+
+- A request that finds a free slot runs immediately.
+- Otherwise it waits in a short bounded queue, ordered by priority class
+  (interactive chat before API tasks before scheduled runs), until a slot
+  frees up or its deadline passes.
+- When the queue is full, a request displaces the newest queued request of a
+  lower priority class, or is shed itself.
+
+Shed requests raise AdmissionRejectedError, which the API turns into a 429
+response with a Retry-After header. Queue depth, running tasks and shed
+counts are exported as Prometheus metrics.
+
+Configuration (environment variables):
+    OMNIFORGE_MAX_CONCURRENT_TASKS: Running tasks per worker (default: 64)
+    OMNIFORGE_MAX_TENANT_TASKS: Running tasks per tenant per worker (default: 16)
+    OMNIFORGE_ADMISSION_QUEUE_SIZE: Queued requests per worker (default: 128)
+    OMNIFORGE_ADMISSION_QUEUE_TIMEOUT: Seconds a request may wait (default: 5)
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import AsyncIterator, Optional
+
+from omniforge.agents.errors import AdmissionRejectedError
+from omniforge.observability.metrics import get_metrics_collector
+
+logger = logging.getLogger(__name__)
+
+# Tenant used for requests that carry no tenant
+DEFAULT_TENANT = "default"
+
+# Weight of the latest run in the moving average of run durations
+_DURATION_SMOOTHING = 0.2
+
+# Bounds of the Retry-After hint, in seconds
+_MIN_RETRY_AFTER = 1
+_MAX_RETRY_AFTER = 60
+
+
+class AdmissionPriority(IntEnum):
+    """Priority class of a task; lower values are admitted first."""
+
+    INTERACTIVE = 0
+    STANDARD = 1
+    SCHEDULED = 2
+
+    @property
+    def label(self) -> str:
+        """Lower-case name used in metrics and logs."""
+        return self.name.lower()
+
+
+@dataclass
+class AdmissionConfig:
+    """Admission control limits for one worker process.
+
+    Attributes:
+        max_concurrent: Maximum number of tasks running at once
+        max_per_tenant: Maximum number of tasks running at once for one tenant
+            (a tenant may also hold this many requests in the queue)
+        max_queue: Maximum number of requests waiting for a slot
+        queue_timeout: Seconds a request may wait before it is shed
+    """
+
+    max_concurrent: int = 64
+    max_per_tenant: int = 16
+    max_queue: int = 128
+    queue_timeout: float = 5.0
+
+    def __post_init__(self) -> None:
+        """Validate the limits."""
+        if self.max_concurrent < 1 or self.max_per_tenant < 1:
+            raise ValueError("max_concurrent and max_per_tenant must be at least 1")
+        if self.max_queue < 0 or self.queue_timeout < 0:
+            raise ValueError("max_queue and queue_timeout cannot be negative")
+
+    @classmethod
+    def from_env(cls) -> "AdmissionConfig":
+        """Read the limits from environment variables.
+
+        Returns:
+            AdmissionConfig with defaults for unset variables
+        """
+        return cls(
+            max_concurrent=int(os.getenv("OMNIFORGE_MAX_CONCURRENT_TASKS", "64")),
+            max_per_tenant=int(os.getenv("OMNIFORGE_MAX_TENANT_TASKS", "16")),
+            max_queue=int(os.getenv("OMNIFORGE_ADMISSION_QUEUE_SIZE", "128")),
+            queue_timeout=float(os.getenv("OMNIFORGE_ADMISSION_QUEUE_TIMEOUT", "5")),
+        )
+
+
+class AdmissionTicket:
+    """A slot held by an admitted task; release it when the task finishes.
+
+    Attributes:
+        tenant_id: Tenant the slot is counted against
+        priority: Priority class the task was admitted with
+        admitted_at: time.monotonic() when the slot was granted
+    """
+
+    __slots__ = ("tenant_id", "priority", "admitted_at", "released")
+
+    def __init__(self, tenant_id: str, priority: AdmissionPriority) -> None:
+        self.tenant_id = tenant_id
+        self.priority = priority
+        self.admitted_at = time.monotonic()
+        self.released = False
+
+
+class _Waiter:
+    """A queued request."""
+
+    __slots__ = ("tenant_id", "priority", "future")
+
+    def __init__(
+        self, tenant_id: str, priority: AdmissionPriority, future: "asyncio.Future[AdmissionTicket]"
+    ) -> None:
+        self.tenant_id = tenant_id
+        self.priority = priority
+        self.future = future
+
+
+class AdmissionController:
+    """Caps concurrently running tasks globally and per tenant.
+
+    Slots are handed to queued requests in priority order, first come first
+    served within a class; a queued request whose tenant is at its cap is
+    skipped so it does not block other tenants.
+
+    All methods must be called from the event loop thread.
+
+    Example:
+        >>> controller = AdmissionController(AdmissionConfig(max_concurrent=8))
+        >>> async with controller.admit("tenant-1", AdmissionPriority.INTERACTIVE):
+        ...     await run_task()
+    """
+
+    def __init__(self, config: Optional[AdmissionConfig] = None) -> None:
+        """Initialize the controller.
+
+        Args:
+            config: Limits to enforce (defaults to AdmissionConfig())
+        """
+        self.config = config or AdmissionConfig()
+        self._active = 0
+        self._tenant_active: dict[str, int] = {}
+        self._tenant_queued: dict[str, int] = {}
+        self._queues: dict[AdmissionPriority, deque[_Waiter]] = {
+            priority: deque() for priority in AdmissionPriority
+        }
+        self._queued = 0
+        # Moving average of how long admitted tasks hold their slot
+        self._avg_duration = 1.0
+        self.shed_count = 0
+        self._metrics = get_metrics_collector()
+
+    @property
+    def active(self) -> int:
+        """Number of tasks currently holding a slot."""
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a slot."""
+        return self._queued
+
+    async def acquire(
+        self,
+        tenant_id: Optional[str] = None,
+        priority: AdmissionPriority = AdmissionPriority.STANDARD,
+    ) -> AdmissionTicket:
+        """Wait for a slot for a task.
+
+        Args:
+            tenant_id: Tenant the task runs for (DEFAULT_TENANT if None)
+            priority: Priority class of the task
+
+        Returns:
+            Ticket to pass to release() when the task finishes
+
+        Raises:
+            AdmissionRejectedError: If the request is shed
+        """
+        tenant_id = tenant_id or DEFAULT_TENANT
+        if self._has_capacity(tenant_id):
+            return self._grant(tenant_id, priority)
+
+        if self._tenant_queued.get(tenant_id, 0) >= self.config.max_per_tenant:
+            raise self._shed(priority, "tenant_limit")
+        if self._queued >= self.config.max_queue and not self._displace(priority):
+            raise self._shed(priority, "queue_full")
+
+        future: asyncio.Future[AdmissionTicket] = asyncio.get_running_loop().create_future()
+        waiter = _Waiter(tenant_id, priority, future)
+        self._enqueue(waiter)
+        try:
+            return await asyncio.wait_for(future, self.config.queue_timeout)
+        except asyncio.TimeoutError:
+            self._dequeue(waiter)
+            raise self._shed(priority, "timeout") from None
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # Granted just as the caller went away; hand the slot on
+                self.release(future.result())
+            else:
+                self._dequeue(waiter)
+            raise
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Return a ticket's slot and admit queued requests (idempotent).
+
+        Args:
+            ticket: Ticket returned by acquire()
+        """
+        if ticket.released:
+            return
+        ticket.released = True
+        self._active -= 1
+        remaining = self._tenant_active[ticket.tenant_id] - 1
+        if remaining:
+            self._tenant_active[ticket.tenant_id] = remaining
+        else:
+            del self._tenant_active[ticket.tenant_id]
+
+        duration = time.monotonic() - ticket.admitted_at
+        self._avg_duration += _DURATION_SMOOTHING * (duration - self._avg_duration)
+        self._dispatch()
+        self._metrics.record_admission_active(self._active)
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        tenant_id: Optional[str] = None,
+        priority: AdmissionPriority = AdmissionPriority.STANDARD,
+    ) -> AsyncIterator[AdmissionTicket]:
+        """Hold a slot for the duration of the block.
+
+        Args:
+            tenant_id: Tenant the task runs for (DEFAULT_TENANT if None)
+            priority: Priority class of the task
+
+        Yields:
+            The admission ticket
+
+        Raises:
+            AdmissionRejectedError: If the request is shed
+        """
+        ticket = await self.acquire(tenant_id, priority)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def retry_after(self) -> int:
+        """Estimate how many seconds a shed client should wait before retrying.
+
+        Returns:
+            Whole seconds until the current backlog is expected to drain
+        """
+        backlog = self._queued + 1
+        estimate = self._avg_duration * backlog / self.config.max_concurrent
+        return min(max(math.ceil(estimate), _MIN_RETRY_AFTER), _MAX_RETRY_AFTER)
+
+    def _has_capacity(self, tenant_id: str) -> bool:
+        """Whether a task for this tenant can start right now."""
+        return (
+            self._active < self.config.max_concurrent
+            and self._tenant_active.get(tenant_id, 0) < self.config.max_per_tenant
+        )
+
+    def _grant(self, tenant_id: str, priority: AdmissionPriority) -> AdmissionTicket:
+        """Count a new running task and return its ticket."""
+        self._active += 1
+        self._tenant_active[tenant_id] = self._tenant_active.get(tenant_id, 0) + 1
+        self._metrics.record_admission_active(self._active)
+        return AdmissionTicket(tenant_id, priority)
+
+    def _dispatch(self) -> None:
+        """Hand free slots to queued requests, highest priority first."""
+        for priority, queue in self._queues.items():
+            if self._active >= self.config.max_concurrent:
+                return
+            for waiter in list(queue):
+                if self._active >= self.config.max_concurrent:
+                    return
+                if self._tenant_active.get(waiter.tenant_id, 0) >= self.config.max_per_tenant:
+                    continue
+                self._dequeue(waiter)
+                waiter.future.set_result(self._grant(waiter.tenant_id, priority))
+
+    def _displace(self, priority: AdmissionPriority) -> bool:
+        """Shed the newest queued request of a lower priority class than given.
+
+        Returns:
+            True if a queued request was shed to make room
+        """
+        for lower in reversed(AdmissionPriority):
+            if lower <= priority:
+                return False
+            queue = self._queues[lower]
+            if queue:
+                waiter = queue[-1]
+                self._dequeue(waiter)
+                waiter.future.set_exception(self._shed(lower, "displaced"))
+                return True
+        return False
+
+    def _enqueue(self, waiter: _Waiter) -> None:
+        """Add a request to its priority queue."""
+        self._queues[waiter.priority].append(waiter)
+        self._queued += 1
+        self._tenant_queued[waiter.tenant_id] = self._tenant_queued.get(waiter.tenant_id, 0) + 1
+        self._metrics.record_admission_queue_depth(
+            waiter.priority.label, len(self._queues[waiter.priority])
+        )
+
+    def _dequeue(self, waiter: _Waiter) -> None:
+        """Remove a request from its priority queue (no-op if already removed)."""
+        queue = self._queues[waiter.priority]
+        try:
+            queue.remove(waiter)
+        except ValueError:
+            return
+        self._queued -= 1
+        remaining = self._tenant_queued[waiter.tenant_id] - 1
+        if remaining:
+            self._tenant_queued[waiter.tenant_id] = remaining
+        else:
+            del self._tenant_queued[waiter.tenant_id]
+        self._metrics.record_admission_queue_depth(waiter.priority.label, len(queue))
+
+    def _shed(self, priority: AdmissionPriority, reason: str) -> AdmissionRejectedError:
+        """Count a shed request and build the error to raise for it."""
+        self.shed_count += 1
+        self._metrics.record_admission_shed(priority.label, reason)
+        retry_after = self.retry_after()
+        logger.warning(
+            f"Shedding {priority.label} request ({reason}): {self._active} running, "
+            f"{self._queued} queued, retry after {retry_after}s"
+        )
+        return AdmissionRejectedError(reason, retry_after)
+
+
+_admission_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the process-wide AdmissionController, configured from the environment.
+
+    Returns:
+        Singleton AdmissionController
+    """
+    global _admission_controller
+    if _admission_controller is None:
+        _admission_controller = AdmissionController(AdmissionConfig.from_env())
+    return _admission_controller
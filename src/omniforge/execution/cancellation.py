@@ -0,0 +1,128 @@
+"""Cooperative cancellation of agent work.
+
+A CancellationToken is created for each streamed task and made available to
+everything running on its behalf through a context variable: the agent's
+reason() task, the reasoning engine, and tool/LLM calls via
+ToolCallContext.cancellation. Cancelling the token cancels linked asyncio
+tasks (interrupting in-flight awaits) and lets long-running code that is not
+awaiting check for cancellation between units of work.
+"""
+
+import asyncio
+import logging
+from contextvars import ContextVar, Token
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+_current_token: ContextVar[Optional["CancellationToken"]] = ContextVar(
+    "omniforge_cancellation_token", default=None
+)
+
+
+class CancellationToken:
+    """Signals that the work a task was started for is no longer wanted.
+
+    Example:
+        >>> token = CancellationToken()
+        >>> token.link(asyncio.create_task(agent_work()))
+        >>> token.cancel("client disconnected")  # cancels agent_work()
+    """
+
+    def __init__(self) -> None:
+        """Initialize an uncancelled token."""
+        self._reason: Optional[str] = None
+        self._callbacks: list[Callable[[], object]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        return self._reason is not None
+
+    @property
+    def reason(self) -> Optional[str]:
+        """Reason given to cancel(), or None if not cancelled."""
+        return self._reason
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Cancel the token and run its callbacks (only the first call has effect).
+
+        Args:
+            reason: Why the work was cancelled
+        """
+        if self._reason is not None:
+            return
+        self._reason = reason
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Cancellation callback failed: {e}", exc_info=True)
+
+    def add_callback(self, callback: Callable[[], object]) -> Callable[[], None]:
+        """Run a callback when the token is cancelled.
+
+        The callback runs immediately if the token is already cancelled.
+
+        Args:
+            callback: Function to call on cancellation
+
+        Returns:
+            Function that unregisters the callback
+        """
+        if self._reason is not None:
+            callback()
+            return lambda: None
+
+        self._callbacks.append(callback)
+
+        def remove() -> None:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+        return remove
+
+    def link(self, task: "asyncio.Future") -> Callable[[], None]:
+        """Cancel an asyncio task or future when the token is cancelled.
+
+        Args:
+            task: Task or future to cancel
+
+        Returns:
+            Function that unlinks the task
+        """
+        remove = self.add_callback(task.cancel)
+        task.add_done_callback(lambda _: remove())
+        return remove
+
+    def raise_if_cancelled(self) -> None:
+        """Raise if the token has been cancelled.
+
+        Raises:
+            asyncio.CancelledError: If the token has been cancelled
+        """
+        if self._reason is not None:
+            raise asyncio.CancelledError(self._reason)
+
+
+def current_cancellation_token() -> Optional[CancellationToken]:
+    """Return the cancellation token of the work running in this context.
+
+    Returns:
+        The token set by use_cancellation_token(), or None outside of a
+        cancellable task
+    """
+    return _current_token.get()
+
+
+def use_cancellation_token(token: Optional[CancellationToken]) -> Token:
+    """Make a token current for this context and tasks created from it.
+
+    Args:
+        token: Token to make current
+
+    Returns:
+        Context variable token for restoring the previous value
+    """
+    return _current_token.set(token)
@@ -10,7 +10,9 @@ from typing import AsyncGenerator, Optional
 
 from fastapi import FastAPI
 
+from omniforge.agents.errors import AdmissionRejectedError
 from omniforge.builder.repository import AgentConfigRepository
+from omniforge.execution.admission import AdmissionPriority, get_admission_controller
 from omniforge.execution.scheduler import AgentScheduler, ScheduleConfig
 from omniforge.storage.database import Database
 
@@ -25,7 +27,9 @@ async def execute_scheduled_agent(agent_id: str, triggered_by: str) -> None:
     """Execute a scheduled agent.
 
     This is the callback function that the scheduler calls when a schedule triggers.
-    It creates a database session and executes the agent.
+    It creates a database session and executes the agent. Scheduled runs are
+    admitted with the lowest priority; a run shed because the worker is at
+    capacity is skipped until the next trigger.
 
     Args:
         agent_id: Agent ID to execute
@@ -38,24 +42,35 @@ async def execute_scheduled_agent(agent_id: str, triggered_by: str) -> None:
         return
 
     try:
-        # Log execution trigger
-        # In a real implementation, this would create a database session and:
-        # 1. Retrieve agent config with tenant_id using AgentConfigRepository(session)
-        # 2. Create AgentExecution record
-        # 3. Execute agent skills
-        # 4. Update execution status
-        logger.info(
-            f"Agent {agent_id} scheduled execution triggered. "
-            f"Execution tracking would be implemented here."
-        )
-
-        # TODO: Implement actual agent execution logic with database session
-
+        async with get_admission_controller().admit(priority=AdmissionPriority.SCHEDULED):
+            await _run_scheduled_agent(agent_id)
+    except AdmissionRejectedError as e:
+        logger.warning(f"Skipping scheduled run of agent {agent_id}: {e.message}")
     except Exception as e:
         logger.error(f"Failed to execute scheduled agent {agent_id}: {e}", exc_info=True)
         raise
 
 
+async def _run_scheduled_agent(agent_id: str) -> None:
+    """Run a scheduled agent while holding an admission slot.
+
+    Args:
+        agent_id: Agent ID to execute
+    """
+    # Log execution trigger
+    # In a real implementation, this would create a database session and:
+    # 1. Retrieve agent config with tenant_id using AgentConfigRepository(session)
+    # 2. Create AgentExecution record
+    # 3. Execute agent skills
+    # 4. Update execution status
+    logger.info(
+        f"Agent {agent_id} scheduled execution triggered. "
+        f"Execution tracking would be implemented here."
+    )
+
+    # TODO: Implement actual agent execution logic with database session
+
+
 async def load_schedules_from_database(
     scheduler: AgentScheduler,
     database: Database,
@@ -2,5 +2,6 @@
 
 from omniforge.memory.backends.base import StorageBackend
 from omniforge.memory.backends.in_memory import InMemoryBackend
+from omniforge.memory.backends.sqlite import SQLiteBackend
 
-__all__ = ["StorageBackend", "InMemoryBackend"]
+__all__ = ["StorageBackend", "InMemoryBackend", "SQLiteBackend"]
@@ -5,7 +5,14 @@ from typing import Any, Optional
 
 
 class StorageBackend(ABC):
-    """Abstract key-value store scoped by a namespace string (trace_id)."""
+    """Abstract key-value store scoped by a namespace string (trace_id).
+
+    Attributes:
+        blocking: Whether operations may block on I/O; async callers then run
+            them in a worker thread instead of on the event loop
+    """
+
+    blocking: bool = False
 
     @abstractmethod
     def set(self, namespace: str, key: str, value: Any) -> None:
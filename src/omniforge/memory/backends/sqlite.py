@@ -0,0 +1,51 @@
+"""SQLite storage backend shared by all worker processes on one machine.
+
+Selected by ``OMNIFORGE_STATE_BACKEND=sqlite``; see omniforge.storage.shared_state.
+"""
+
+from typing import Any, Optional
+
+from omniforge.memory.backends.base import StorageBackend
+from omniforge.storage.shared_state import SQLiteStateStore
+
+_MAX_VALUE_BYTES = 1 * 1024 * 1024  # 1 MB per entry cap
+
+# Prefix separating working-memory namespaces from other shared state
+_NAMESPACE_PREFIX = "context:"
+
+
+class SQLiteBackend(StorageBackend):
+    """Backend storing entries in the shared SQLite state file.
+
+    Entries expire after ``ttl_seconds`` so traces whose chain never called
+    clear() do not accumulate forever. Operations may wait for another
+    worker's write lock, so the backend is marked blocking.
+    """
+
+    blocking = True
+
+    def __init__(self, store: SQLiteStateStore, ttl_seconds: float = 86400.0) -> None:
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        import json
+
+        # Enforce entry size limit to prevent memory abuse
+        try:
+            encoded = json.dumps(value)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Value for key '{key}' must be JSON-serialisable") from exc
+        if len(encoded.encode()) > _MAX_VALUE_BYTES:
+            raise ValueError(f"Value for key '{key}' exceeds the 1 MB per-entry limit")
+
+        self._store.set(_NAMESPACE_PREFIX + namespace, key, value, ttl_seconds=self._ttl_seconds)
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        return self._store.get(_NAMESPACE_PREFIX + namespace, key)
+
+    def list_keys(self, namespace: str) -> list[str]:
+        return self._store.keys(_NAMESPACE_PREFIX + namespace)
+
+    def clear(self, namespace: str) -> None:
+        self._store.clear(_NAMESPACE_PREFIX + namespace)
@@ -9,30 +9,41 @@ Usage:
     store.set(trace_id, "research_output", {...})
     value = store.get(trace_id, "research_output")
     store.clear(trace_id)  # called when the chain completes
+
+With ``OMNIFORGE_STATE_BACKEND=sqlite`` the process-wide store keeps its
+entries in the shared SQLite state file, so agents running in different
+worker processes see the same working memory.
 """
 
 from typing import Any, Optional
 
+from omniforge.memory.backends.base import StorageBackend
 from omniforge.memory.backends.in_memory import InMemoryBackend
 
 _default_store: Optional["AgentContextStore"] = None
 
 
 class AgentContextStore:
-    """In-memory working-memory store scoped by trace_id.
+    """Working-memory store scoped by trace_id.
 
     One global instance is shared across all agents in the same process.
     Each request chain (identified by trace_id) has an isolated namespace
-    so concurrent requests never bleed into each other.
+    so concurrent requests never bleed into each other. Entries are kept
+    in memory unless another StorageBackend is given.
     """
 
-    def __init__(self) -> None:
-        self._backend = InMemoryBackend()
+    def __init__(self, backend: Optional[StorageBackend] = None) -> None:
+        self._backend = backend or InMemoryBackend()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    @property
+    def blocking(self) -> bool:
+        """Whether operations may block on I/O (run them off the event loop)."""
+        return self._backend.blocking
+
     def set(self, trace_id: str, key: str, value: Any) -> None:
         """Write *value* under *key* for the given trace.
 
@@ -82,5 +93,13 @@ def get_context_store() -> AgentContextStore:
     """Return the process-wide AgentContextStore singleton."""
     global _default_store
     if _default_store is None:
-        _default_store = AgentContextStore()
+        from omniforge.storage.shared_state import SharedStateConfig, get_state_store
+
+        config = SharedStateConfig.from_env()
+        backend: Optional[StorageBackend] = None
+        if config.shared:
+            from omniforge.memory.backends.sqlite import SQLiteBackend
+
+            backend = SQLiteBackend(get_state_store(config))
+        _default_store = AgentContextStore(backend)
     return _default_store
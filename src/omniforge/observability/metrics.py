@@ -6,7 +6,7 @@ skill performance, and system health.
 
 from typing import Optional
 
-from prometheus_client import Counter, Histogram, generate_latest
+from prometheus_client import Counter, Gauge, Histogram, generate_latest
 
 # Agent execution metrics
 agent_executions_total = Counter(
@@ -43,6 +43,36 @@ http_request_duration_seconds = Histogram(
     buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
 )
 
+# Chat session cache metrics
+chat_session_cache_size = Gauge(
+    "chat_session_cache_size",
+    "Number of live per-conversation agents in the chat session cache",
+)
+
+chat_session_evictions_total = Counter(
+    "chat_session_evictions_total",
+    "Total number of agents evicted from the chat session cache",
+    labelnames=["reason"],
+)
+
+# Admission control metrics
+admission_active_tasks = Gauge(
+    "admission_active_tasks",
+    "Number of agent tasks currently holding an admission slot",
+)
+
+admission_queue_depth = Gauge(
+    "admission_queue_depth",
+    "Number of requests waiting for an admission slot",
+    labelnames=["priority"],
+)
+
+admission_shed_total = Counter(
+    "admission_shed_total",
+    "Total number of requests shed by admission control",
+    labelnames=["priority", "reason"],
+)
+
 
 class MetricsCollector:
     """Collects and exposes Prometheus metrics.
@@ -130,6 +160,68 @@ class MetricsCollector:
             endpoint=endpoint,
         ).observe(duration_seconds)
 
+    def record_session_cache_size(self, size: int) -> None:
+        """Record the current number of cached chat session agents.
+
+        Args:
+            size: Number of agents in the session cache
+
+        Example:
+            >>> collector = get_metrics_collector()
+            >>> collector.record_session_cache_size(42)
+        """
+        chat_session_cache_size.set(size)
+
+    def record_session_eviction(self, reason: str) -> None:
+        """Record a chat session agent being evicted from the cache.
+
+        Args:
+            reason: Why the agent was evicted (capacity, expired)
+
+        Example:
+            >>> collector = get_metrics_collector()
+            >>> collector.record_session_eviction("capacity")
+        """
+        chat_session_evictions_total.labels(reason=reason).inc()
+
+    def record_admission_active(self, count: int) -> None:
+        """Record the number of tasks holding an admission slot.
+
+        Args:
+            count: Number of running tasks
+
+        Example:
+            >>> collector = get_metrics_collector()
+            >>> collector.record_admission_active(12)
+        """
+        admission_active_tasks.set(count)
+
+    def record_admission_queue_depth(self, priority: str, depth: int) -> None:
+        """Record the number of requests queued for admission in a priority class.
+
+        Args:
+            priority: Priority class (interactive, standard, scheduled)
+            depth: Number of queued requests in that class
+
+        Example:
+            >>> collector = get_metrics_collector()
+            >>> collector.record_admission_queue_depth("interactive", 3)
+        """
+        admission_queue_depth.labels(priority=priority).set(depth)
+
+    def record_admission_shed(self, priority: str, reason: str) -> None:
+        """Record a request shed by admission control.
+
+        Args:
+            priority: Priority class of the shed request
+            reason: Why it was shed (tenant_limit, queue_full, timeout, displaced)
+
+        Example:
+            >>> collector = get_metrics_collector()
+            >>> collector.record_admission_shed("scheduled", "queue_full")
+        """
+        admission_shed_total.labels(priority=priority, reason=reason).inc()
+
     def generate_metrics(self) -> bytes:
         """Generate Prometheus metrics in text format.
 
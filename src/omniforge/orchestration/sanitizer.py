@@ -2,9 +2,16 @@
 
 This module provides regex-based PII redaction to ensure sensitive information
 is not passed between agents during orchestration and handoffs.
+
+Long texts (tool outputs, documents) are mostly clean, so each pattern can
+declare keywords, at least one of which occurs in every match. The text is
+lowercased once and a pattern is only run when one of its keywords occurs.
 """
 
 import re
+from typing import Optional
+
+from omniforge.core.text import fold_case
 
 
 class ContextSanitizer:
@@ -35,9 +42,11 @@ class ContextSanitizer:
                 ),
                 "[EMAIL]",
             ),
-            # 16-digit card numbers (with or without separators)
+            # 16-digit card numbers (with or without separators); the leading
+            # word boundary is tested after the first digit (\d(?<!\w\d) is
+            # \b\d) so the regex engine can skip ahead to digits
             (
-                re.compile(r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b"),
+                re.compile(r"\d(?<!\w\d)\d{3}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b"),
                 "[CARD]",
             ),
             # Password/secret/token key-value pairs
@@ -51,6 +60,26 @@ class ContextSanitizer:
                 r"\1=[REDACTED]",
             ),
         ]
+        # Rule names and keywords, parallel to _patterns
+        self._names = ["email", "card", "credential"]
+        self._keywords: list[Optional[tuple[str, ...]]] = [
+            ("@",),
+            None,
+            ("password", "passwd", "pwd", "secret", "token", "api", "auth"),
+        ]
+
+    def _may_match(self, index: int, folded: str) -> bool:
+        """Check whether a pattern's keywords allow it to match.
+
+        Args:
+            index: Index of the pattern in _patterns
+            folded: The text, lowercased with fold_case()
+
+        Returns:
+            False if the pattern cannot match the text
+        """
+        keywords = self._keywords[index]
+        return keywords is None or any(keyword in folded for keyword in keywords)
 
     def sanitize(self, text: str) -> str:
         """Apply all sanitization patterns to the given text.
@@ -69,16 +98,30 @@ class ContextSanitizer:
             'password=[REDACTED]'
         """
         result = text
-        for pattern, replacement in self._patterns:
-            result = pattern.sub(replacement, result)
+        folded = fold_case(result)
+        for index, (pattern, replacement) in enumerate(self._patterns):
+            if not self._may_match(index, folded):
+                continue
+            result, count = pattern.subn(replacement, result)
+            if count:
+                folded = fold_case(result)
         return result
 
-    def add_pattern(self, pattern: str, replacement: str) -> None:
+    def add_pattern(
+        self,
+        pattern: str,
+        replacement: str,
+        name: Optional[str] = None,
+        keywords: Optional[tuple[str, ...]] = None,
+    ) -> None:
         r"""Add a custom sanitization pattern at runtime.
 
         Args:
             pattern: Regular expression pattern to match
             replacement: Replacement string for matches
+            name: Rule name reported by find_matches() (defaults to the pattern)
+            keywords: Lowercase literals, at least one of which occurs in every
+                match; the pattern is skipped for text containing none of them
 
         Examples:
             >>> sanitizer = ContextSanitizer()
@@ -88,6 +131,8 @@ class ContextSanitizer:
         """
         compiled_pattern = re.compile(pattern)
         self._patterns.append((compiled_pattern, replacement))
+        self._names.append(name or pattern)
+        self._keywords.append(keywords)
 
     def is_clean(self, text: str) -> bool:
         """Check if text contains any sensitive patterns.
@@ -107,7 +152,31 @@ class ContextSanitizer:
             >>> sanitizer.is_clean("Card: 1234-5678-9012-3456")
             False
         """
-        for pattern, _ in self._patterns:
-            if pattern.search(text):
+        folded = fold_case(text)
+        for index, (pattern, _) in enumerate(self._patterns):
+            if self._may_match(index, folded) and pattern.search(text):
                 return False
         return True
+
+    def find_matches(self, text: str) -> list[str]:
+        """Find which sensitive patterns occur in the text.
+
+        Args:
+            text: Text to check for sensitive information
+
+        Returns:
+            Names of the matching rules, in the order the patterns were added
+
+        Examples:
+            >>> sanitizer = ContextSanitizer()
+            >>> sanitizer.find_matches("Card 1234-5678-9012-3456, mail user@example.com")
+            ['email', 'card']
+            >>> sanitizer.find_matches("This is safe text")
+            []
+        """
+        folded = fold_case(text)
+        return [
+            self._names[index]
+            for index, (pattern, _) in enumerate(self._patterns)
+            if self._may_match(index, folded) and pattern.search(text)
+        ]
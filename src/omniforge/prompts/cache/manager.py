@@ -3,19 +3,60 @@
 This module implements a two-tier caching system:
 - L1: In-memory LRU cache (< 0.1ms latency)
 - L2: Optional Redis cache (1-5ms latency) for distributed deployments
+
+Cache keys are opaque hashes, so each entry can record the prompts it was
+composed from. A reverse index (prompt ID -> cache keys), kept in memory for
+L1 and as Redis sets for L2, lets an updated prompt invalidate exactly the
+composed entries that used it.
+
+No lock is held across Redis round trips: L1 and its indexes are only read
+and modified between awaits, which is atomic on the event loop. Work that
+spans an await re-checks the invalidation epoch afterwards, so an invalidation
+that runs meanwhile is not undone. Concurrent misses for one key are coalesced
+by get_or_compute() into a single fill.
 """
 
 import asyncio
 import logging
-from typing import Any, Optional
+import time
+from typing import Any, Awaitable, Callable, Iterable, Optional
 
 import cachetools
+from pydantic import BaseModel, Field, ValidationError
 
 from omniforge.prompts.models import ComposedPrompt
 
 logger = logging.getLogger(__name__)
 
 
+class _L2Entry(BaseModel):
+    """Redis representation of a cache entry and the prompts it was composed from."""
+
+    value: ComposedPrompt
+    dependencies: list[str] = Field(default_factory=list)
+
+    @classmethod
+    def decode(cls, data: Any) -> "_L2Entry":
+        """Parse a stored entry, accepting bare values written by older versions."""
+        try:
+            return cls.model_validate_json(data)
+        except ValidationError:
+            return cls(value=ComposedPrompt.model_validate_json(data))
+
+
+class _IndexedLRUCache(cachetools.LRUCache):  # type: ignore[type-arg]
+    """LRU cache that reports evicted keys so dependency indexes stay bounded."""
+
+    def __init__(self, maxsize: int, on_evict: Callable[[str], None]) -> None:
+        super().__init__(maxsize=maxsize)
+        self._on_evict = on_evict
+
+    def popitem(self) -> tuple[str, ComposedPrompt]:
+        key, value = super().popitem()
+        self._on_evict(key)
+        return key, value
+
+
 class CacheManager:
     """Two-tier cache manager for composed prompts.
 
@@ -26,16 +67,28 @@ class CacheManager:
         _memory_cache: L1 in-memory LRU cache
         _redis_client: Optional L2 Redis client for distributed caching
         _default_ttl: Default time-to-live for cache entries in seconds
-        _lock: Asyncio lock for thread-safe operations
+        _refresh_ahead: Fraction of the TTL before expiry in which a hit through
+            get_or_compute triggers a background refresh
         _hit_count: Number of cache hits (L1 or L2)
         _miss_count: Number of cache misses
+        _dependents: Prompt ID -> L1 cache keys composed from that prompt
+        _dependencies: L1 cache key -> prompt IDs it was composed from
+        _deadlines: L1 cache key -> (refresh_at, expires_at) monotonic times
+        _flights: Cache key -> in-progress fill shared by concurrent callers
+        _epoch: Incremented by every invalidation; L2 reads, writes and fills
+            that an invalidation overlaps do not leave their (possibly stale)
+            value cached
     """
 
+    # Redis key prefix of the per-prompt sets of dependent cache keys
+    DEPENDENCY_KEY_PREFIX = "prompt-deps:"
+
     def __init__(
         self,
         max_memory_items: int = 1000,
         redis_client: Optional[Any] = None,
         default_ttl: int = 3600,
+        refresh_ahead: float = 0.1,
     ) -> None:
         """Initialize the cache manager.
 
@@ -43,13 +96,27 @@ class CacheManager:
             max_memory_items: Maximum number of items in L1 cache
             redis_client: Optional Redis async client for L2 cache
             default_ttl: Default TTL in seconds for cache entries
+            refresh_ahead: Fraction of an entry's TTL, before it expires, during
+                which get_or_compute serves it while recomputing it in the
+                background (0 disables stale-while-revalidate)
+
+        Raises:
+            ValueError: If refresh_ahead is not between 0 and 1
         """
-        self._memory_cache: cachetools.LRUCache[str, ComposedPrompt] = cachetools.LRUCache(
-            maxsize=max_memory_items
+        if not 0 <= refresh_ahead < 1:
+            raise ValueError("refresh_ahead must be >= 0 and < 1")
+
+        self._memory_cache: cachetools.LRUCache[str, ComposedPrompt] = _IndexedLRUCache(
+            maxsize=max_memory_items, on_evict=self._unindex
         )
+        self._dependents: dict[str, set[str]] = {}
+        self._dependencies: dict[str, frozenset[str]] = {}
+        self._deadlines: dict[str, tuple[float, float]] = {}
+        self._flights: dict[str, asyncio.Task[ComposedPrompt]] = {}
+        self._epoch = 0
         self._redis_client = redis_client
         self._default_ttl = default_ttl
-        self._lock = asyncio.Lock()
+        self._refresh_ahead = refresh_ahead
         self._hit_count = 0
         self._miss_count = 0
 
@@ -62,7 +129,8 @@ class CacheManager:
         """Retrieve a cached composed prompt.
 
         Checks L1 memory cache first, then L2 Redis cache if available.
-        On Redis hit, populates the memory cache for faster subsequent access.
+        On Redis hit, populates the memory cache, with the dependencies stored
+        alongside the value, for faster subsequent access.
 
         Args:
             key: Cache key to retrieve
@@ -70,37 +138,97 @@ class CacheManager:
         Returns:
             Cached ComposedPrompt if found, None otherwise
         """
-        async with self._lock:
-            # Check L1 memory cache first
-            if key in self._memory_cache:
-                self._hit_count += 1
-                logger.debug(f"L1 cache hit for key: {key[:16]}...")
-                cached_value: ComposedPrompt = self._memory_cache[key]
-                return cached_value
+        # Check L1 memory cache first
+        cached_value = self._get_local(key)
+        if cached_value is not None:
+            self._hit_count += 1
+            logger.debug(f"L1 cache hit for key: {key[:16]}...")
+            return cached_value
+
+        # Check L2 Redis cache if available
+        if self._redis_client:
+            epoch = self._epoch
+            try:
+                cached_data = await self._redis_client.get(key)
+                if cached_data and self._epoch != epoch:
+                    # An invalidation ran while Redis was being read, so the
+                    # value may be one it has just removed
+                    logger.debug(f"Ignoring L2 value invalidated during read: {key[:16]}...")
+                elif cached_data:
+                    # Deserialize from JSON
+                    entry = _L2Entry.decode(cached_data)
+                    composed_prompt = entry.value
+
+                    # Populate L1 cache for faster subsequent access, unless a
+                    # newer value was stored while Redis was being read. The
+                    # dependencies let invalidate_dependents evict it again.
+                    if key not in self._memory_cache:
+                        self._memory_cache[key] = composed_prompt
+                        self._index(key, frozenset(entry.dependencies), self._default_ttl)
+                    self._hit_count += 1
+                    logger.debug(f"L2 cache hit for key: {key[:16]}...")
+                    return composed_prompt
+            except Exception as e:
+                # Redis errors should not break composition
+                logger.warning(f"Redis get error for key {key[:16]}...: {e}")
+
+        # Cache miss
+        self._miss_count += 1
+        logger.debug(f"Cache miss for key: {key[:16]}...")
+        return None
+
+    async def get_or_compute(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[ComposedPrompt]],
+        ttl: Optional[int] = None,
+        dependencies: Optional[Iterable[str]] = None,
+    ) -> ComposedPrompt:
+        """Return a cached composed prompt, computing and caching it on a miss.
+
+        Concurrent misses for the same key share a single call to factory
+        (single flight). An L1 entry in the last refresh_ahead fraction of
+        its TTL is returned immediately while a background fill refreshes it
+        (stale-while-revalidate).
 
-            # Check L2 Redis cache if available
-            if self._redis_client:
-                try:
-                    cached_data = await self._redis_client.get(key)
-                    if cached_data:
-                        # Deserialize from JSON
-                        composed_prompt = ComposedPrompt.model_validate_json(cached_data)
+        Args:
+            key: Cache key to retrieve
+            factory: Coroutine function computing the value on a miss
+            ttl: Optional TTL in seconds (uses default_ttl if not provided)
+            dependencies: Optional IDs of the prompts the value is composed from
+                (see set)
 
-                        # Populate L1 cache for faster subsequent access
-                        self._memory_cache[key] = composed_prompt
-                        self._hit_count += 1
-                        logger.debug(f"L2 cache hit for key: {key[:16]}...")
-                        return composed_prompt
-                except Exception as e:
-                    # Redis errors should not break composition
-                    logger.warning(f"Redis get error for key {key[:16]}...: {e}")
-
-            # Cache miss
-            self._miss_count += 1
-            logger.debug(f"Cache miss for key: {key[:16]}...")
-            return None
+        Returns:
+            Cached or freshly computed ComposedPrompt
 
-    async def set(self, key: str, value: ComposedPrompt, ttl: Optional[int] = None) -> None:
+        Raises:
+            Exception: Whatever factory raises (shared by all waiting callers)
+        """
+        cached_value = self._get_local(key)
+        if cached_value is not None:
+            self._hit_count += 1
+            refresh_at, _ = self._deadlines.get(key, (float("inf"), 0.0))
+            if time.monotonic() >= refresh_at and key not in self._flights:
+                logger.debug(f"Refreshing cache entry ahead of expiry: {key[:16]}...")
+                self._start_flight(key, factory, ttl, dependencies, refresh=True)
+            return cached_value
+
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._start_flight(key, factory, ttl, dependencies, refresh=False)
+        else:
+            logger.debug(f"Joining in-flight fill for key: {key[:16]}...")
+
+        # Shield the shared fill so one cancelled caller does not cancel it for all
+        return await asyncio.shield(flight)
+
+    async def set(
+        self,
+        key: str,
+        value: ComposedPrompt,
+        ttl: Optional[int] = None,
+        dependencies: Optional[Iterable[str]] = None,
+    ) -> None:
         """Store a composed prompt in the cache.
 
         Stores in both L1 memory cache and L2 Redis cache if available.
@@ -109,23 +237,49 @@ class CacheManager:
             key: Cache key to store under
             value: ComposedPrompt to cache
             ttl: Optional TTL in seconds (uses default_ttl if not provided)
+            dependencies: Optional IDs of the prompts the value was composed from;
+                updating any of them should invalidate the entry
+                (see invalidate_dependents)
         """
-        async with self._lock:
-            # Store in L1 memory cache
-            self._memory_cache[key] = value
-            logger.debug(f"Stored in L1 cache: {key[:16]}...")
-
-            # Store in L2 Redis cache if available
-            if self._redis_client:
-                try:
-                    ttl_seconds = ttl if ttl is not None else self._default_ttl
-                    # Serialize to JSON for Redis storage
-                    cached_data = value.model_dump_json()
-                    await self._redis_client.set(key, cached_data, ex=ttl_seconds)
-                    logger.debug(f"Stored in L2 cache: {key[:16]}... with TTL={ttl_seconds}s")
-                except Exception as e:
-                    # Redis errors should not break composition
-                    logger.warning(f"Redis set error for key {key[:16]}...: {e}")
+        prompt_ids = frozenset(dependencies or ())
+        ttl_seconds = ttl if ttl is not None else self._default_ttl
+        epoch = self._epoch
+
+        # Store in L1 memory cache
+        self._unindex(key)
+        self._memory_cache[key] = value
+        self._index(key, prompt_ids, ttl_seconds)
+        logger.debug(f"Stored in L1 cache: {key[:16]}...")
+
+        # Store in L2 Redis cache if available
+        if self._redis_client:
+            try:
+                # Index the key before storing the value, so any invalidation
+                # that can see the value also finds it in the index. Index sets
+                # outlive the entries they point to by at most one TTL.
+                for prompt_id in prompt_ids:
+                    index_key = self.DEPENDENCY_KEY_PREFIX + prompt_id
+                    await self._redis_client.sadd(index_key, key)
+                    await self._redis_client.expire(index_key, ttl_seconds)
+                # Serialize to JSON for Redis storage, with the dependencies so
+                # workers loading the entry can index it
+                entry = _L2Entry(value=value, dependencies=sorted(prompt_ids))
+                cached_data = entry.model_dump_json()
+                await self._redis_client.set(key, cached_data, ex=ttl_seconds)
+
+                if self._epoch != epoch:
+                    # An invalidation ran during the writes and may have missed
+                    # them; drop the value rather than leave a stale entry behind
+                    await self._redis_client.delete(key)
+                    if self._memory_cache.get(key) is value:
+                        self._unindex(key)
+                        del self._memory_cache[key]
+                    logger.debug(f"Not caching {key[:16]}...: invalidated while being stored")
+                    return
+                logger.debug(f"Stored in L2 cache: {key[:16]}... with TTL={ttl_seconds}s")
+            except Exception as e:
+                # Redis errors should not break composition
+                logger.warning(f"Redis set error for key {key[:16]}...: {e}")
 
     async def invalidate(self, key: str) -> None:
         """Invalidate a specific cache entry.
@@ -135,20 +289,22 @@ class CacheManager:
         Args:
             key: Cache key to invalidate
         """
-        async with self._lock:
-            # Remove from L1 memory cache
-            if key in self._memory_cache:
-                del self._memory_cache[key]
-                logger.debug(f"Invalidated from L1 cache: {key[:16]}...")
-
-            # Remove from L2 Redis cache if available
-            if self._redis_client:
-                try:
-                    await self._redis_client.delete(key)
-                    logger.debug(f"Invalidated from L2 cache: {key[:16]}...")
-                except Exception as e:
-                    # Redis errors should not break composition
-                    logger.warning(f"Redis delete error for key {key[:16]}...: {e}")
+        self._epoch += 1
+
+        # Remove from L1 memory cache
+        self._unindex(key)
+        if key in self._memory_cache:
+            del self._memory_cache[key]
+            logger.debug(f"Invalidated from L1 cache: {key[:16]}...")
+
+        # Remove from L2 Redis cache if available
+        if self._redis_client:
+            try:
+                await self._redis_client.delete(key)
+                logger.debug(f"Invalidated from L2 cache: {key[:16]}...")
+            except Exception as e:
+                # Redis errors should not break composition
+                logger.warning(f"Redis delete error for key {key[:16]}...: {e}")
 
     async def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate all cache entries matching a pattern.
@@ -163,64 +319,98 @@ class CacheManager:
             Count of invalidated keys
         """
         invalidated_count = 0
-
-        async with self._lock:
-            # Invalidate matching keys from L1 memory cache
-            # Convert glob pattern to simple prefix matching for memory cache
-            keys_to_remove = []
-            for key in self._memory_cache:
-                if self._matches_pattern(key, pattern):
-                    keys_to_remove.append(key)
-
-            for key in keys_to_remove:
-                del self._memory_cache[key]
-                invalidated_count += 1
-
-            logger.debug(f"Invalidated {invalidated_count} keys from L1 cache matching: {pattern}")
-
-            # Invalidate from L2 Redis cache if available
-            if self._redis_client:
-                try:
-                    # Use SCAN to find matching keys
-                    cursor = 0
-                    redis_count = 0
-                    while True:
-                        cursor, keys = await self._redis_client.scan(
-                            cursor, match=pattern, count=100
-                        )
-                        if keys:
-                            await self._redis_client.delete(*keys)
-                            redis_count += len(keys)
-                        if cursor == 0:
-                            break
-
-                    logger.debug(
-                        f"Invalidated {redis_count} keys from L2 cache matching: {pattern}"
-                    )
-                except Exception as e:
-                    # Redis errors should not break composition
-                    logger.warning(f"Redis pattern invalidation error for {pattern}: {e}")
+        self._epoch += 1
+
+        # Invalidate matching keys from L1 memory cache
+        # Convert glob pattern to simple prefix matching for memory cache
+        keys_to_remove = []
+        for key in self._memory_cache:
+            if self._matches_pattern(key, pattern):
+                keys_to_remove.append(key)
+
+        for key in keys_to_remove:
+            self._unindex(key)
+            del self._memory_cache[key]
+            invalidated_count += 1
+
+        logger.debug(f"Invalidated {invalidated_count} keys from L1 cache matching: {pattern}")
+
+        # Invalidate from L2 Redis cache if available
+        if self._redis_client:
+            try:
+                # Use SCAN to find matching keys
+                cursor = 0
+                redis_count = 0
+                while True:
+                    cursor, keys = await self._redis_client.scan(cursor, match=pattern, count=100)
+                    if keys:
+                        await self._redis_client.delete(*keys)
+                        redis_count += len(keys)
+                    if cursor == 0:
+                        break
+
+                logger.debug(f"Invalidated {redis_count} keys from L2 cache matching: {pattern}")
+            except Exception as e:
+                # Redis errors should not break composition
+                logger.warning(f"Redis pattern invalidation error for {pattern}: {e}")
 
         return invalidated_count
 
+    async def invalidate_dependents(self, prompt_id: str) -> int:
+        """Invalidate all cache entries composed from a prompt.
+
+        Uses the dependency index recorded by set() instead of scanning keys.
+        With Redis, the shared index also covers entries cached by other
+        workers; those entries are removed from L2 and from this worker's L1.
+
+        Args:
+            prompt_id: ID of the prompt that changed
+
+        Returns:
+            Count of invalidated keys
+        """
+        self._epoch += 1
+        keys = set(self._dependents.get(prompt_id, ()))
+
+        if self._redis_client:
+            index_key = self.DEPENDENCY_KEY_PREFIX + prompt_id
+            try:
+                members = await self._redis_client.smembers(index_key)
+                keys.update(m.decode("utf-8") if isinstance(m, bytes) else m for m in members)
+                await self._redis_client.delete(index_key, *keys)
+            except Exception as e:
+                # Redis errors should not break composition
+                logger.warning(f"Redis dependency invalidation error for {prompt_id}: {e}")
+
+        for key in keys:
+            self._unindex(key)
+            self._memory_cache.pop(key, None)
+
+        logger.debug(f"Invalidated {len(keys)} cache entries depending on prompt {prompt_id}")
+        return len(keys)
+
     async def clear(self) -> None:
         """Clear all entries from both cache tiers.
 
         Removes all entries from L1 memory cache and L2 Redis cache.
         """
-        async with self._lock:
-            # Clear L1 memory cache
-            self._memory_cache.clear()
-            logger.info("Cleared L1 memory cache")
-
-            # Clear L2 Redis cache if available
-            if self._redis_client:
-                try:
-                    await self._redis_client.flushdb()
-                    logger.info("Cleared L2 Redis cache")
-                except Exception as e:
-                    # Redis errors should not break composition
-                    logger.warning(f"Redis flush error: {e}")
+        self._epoch += 1
+
+        # Clear L1 memory cache
+        self._memory_cache.clear()
+        self._dependents.clear()
+        self._dependencies.clear()
+        self._deadlines.clear()
+        logger.info("Cleared L1 memory cache")
+
+        # Clear L2 Redis cache if available
+        if self._redis_client:
+            try:
+                await self._redis_client.flushdb()
+                logger.info("Cleared L2 Redis cache")
+            except Exception as e:
+                # Redis errors should not break composition
+                logger.warning(f"Redis flush error: {e}")
 
     def stats(self) -> dict[str, Any]:
         """Get current cache statistics.
@@ -237,6 +427,84 @@ class CacheManager:
             "redis_available": self._redis_client is not None,
         }
 
+    def _get_local(self, key: str) -> Optional[ComposedPrompt]:
+        """Return an unexpired L1 entry, dropping it if it has expired."""
+        cached_value: Optional[ComposedPrompt] = self._memory_cache.get(key)
+        if cached_value is None:
+            return None
+
+        deadline = self._deadlines.get(key)
+        if deadline is not None and time.monotonic() >= deadline[1]:
+            self._unindex(key)
+            del self._memory_cache[key]
+            return None
+        return cached_value
+
+    def _start_flight(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[ComposedPrompt]],
+        ttl: Optional[int],
+        dependencies: Optional[Iterable[str]],
+        refresh: bool,
+    ) -> "asyncio.Task[ComposedPrompt]":
+        """Start the single fill for a key that concurrent callers share."""
+        flight = asyncio.ensure_future(self._fill(key, factory, ttl, dependencies, refresh))
+        self._flights[key] = flight
+
+        def finished(task: "asyncio.Task[ComposedPrompt]") -> None:
+            if self._flights.get(key) is task:
+                del self._flights[key]
+            # Retrieve the exception so unobserved failures are not reported twice
+            error = None if task.cancelled() else task.exception()
+            if error is not None and refresh:
+                logger.warning(f"Background refresh failed for key {key[:16]}...: {error}")
+
+        flight.add_done_callback(finished)
+        return flight
+
+    async def _fill(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[ComposedPrompt]],
+        ttl: Optional[int],
+        dependencies: Optional[Iterable[str]],
+        refresh: bool,
+    ) -> ComposedPrompt:
+        """Load a value from L2 or compute it, then store it in the cache."""
+        if not refresh:
+            cached_value = await self.get(key)
+            if cached_value is not None:
+                return cached_value
+
+        epoch = self._epoch
+        value = await factory()
+        if self._epoch == epoch:
+            await self.set(key, value, ttl=ttl, dependencies=dependencies)
+        else:
+            logger.debug(f"Not caching {key[:16]}...: invalidated while being computed")
+        return value
+
+    def _index(self, key: str, prompt_ids: frozenset[str], ttl: int) -> None:
+        """Record the expiry of an L1 entry and the prompts it was composed from."""
+        now = time.monotonic()
+        self._deadlines[key] = (now + ttl * (1 - self._refresh_ahead), now + ttl)
+        if not prompt_ids:
+            return
+        self._dependencies[key] = prompt_ids
+        for prompt_id in prompt_ids:
+            self._dependents.setdefault(prompt_id, set()).add(key)
+
+    def _unindex(self, key: str) -> None:
+        """Drop an L1 entry from the expiry and dependency indexes."""
+        self._deadlines.pop(key, None)
+        for prompt_id in self._dependencies.pop(key, ()):
+            keys = self._dependents.get(prompt_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._dependents[prompt_id]
+
     @staticmethod
     def _matches_pattern(key: str, pattern: str) -> bool:
         """Check if a key matches a glob-style pattern.
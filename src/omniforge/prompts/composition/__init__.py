@@ -6,6 +6,16 @@ using Jinja2 with security sandboxing, and for merging prompts across layers.
 
 from omniforge.prompts.composition.engine import CompositionEngine
 from omniforge.prompts.composition.merge import MergeProcessor
-from omniforge.prompts.composition.renderer import PromptTemplateLoader, TemplateRenderer
+from omniforge.prompts.composition.renderer import (
+    CompiledTemplate,
+    PromptTemplateLoader,
+    TemplateRenderer,
+)
 
-__all__ = ["CompositionEngine", "MergeProcessor", "PromptTemplateLoader", "TemplateRenderer"]
+__all__ = [
+    "CompiledTemplate",
+    "CompositionEngine",
+    "MergeProcessor",
+    "PromptTemplateLoader",
+    "TemplateRenderer",
+]
@@ -4,6 +4,7 @@ This module provides the CompositionEngine class that orchestrates the complete
 prompt composition flow: loading prompts from layers, merging, rendering, and caching.
 """
 
+import asyncio
 import logging
 import time
 from typing import Any, Dict, Optional, Union
@@ -25,8 +26,8 @@ class CompositionEngine:
     """Main composition engine for orchestrating prompt assembly across layers.
 
     The CompositionEngine coordinates the entire prompt composition workflow:
-    1. Check cache for existing composed prompt
-    2. Load prompts from all applicable layers (SYSTEM, TENANT, FEATURE, AGENT)
+    1. Load prompts from all applicable layers (SYSTEM, TENANT, FEATURE, AGENT)
+    2. Check cache for an existing composed prompt of those prompt versions
     3. Apply merge point processing to combine layers
     4. Build complete variable context with namespacing
     5. Render final template with variables
@@ -115,33 +116,71 @@ class CompositionEngine:
             else:
                 feature_id_list = list(feature_ids)
 
-        # Try cache first (if not skipping)
-        cache_key = None
-        if not skip_cache and self._cache:
-            # Load prompts to get version info for cache key
-            layer_prompts = await self._load_layer_prompts(agent_id, tenant_id, feature_id_list)
-            version_ids = self._extract_version_ids(layer_prompts)
-            cache_key = generate_cache_key(version_ids, variables)
-
-            cached_prompt = await self._cache.get(cache_key)
-            if cached_prompt:
-                logger.debug(f"Cache hit for key: {cache_key[:16]}...")
-                return cached_prompt
-
-        # Cache miss - perform full composition
-        logger.debug(
-            f"Composing prompt for agent={agent_id}, tenant={tenant_id}, "
-            f"features={feature_id_list}"
+        # Load prompts from all layers (their versions also key the cache)
+        prompt_ids: set[str] = set()
+        layer_prompts = await self._load_layer_prompts(
+            agent_id, tenant_id, feature_id_list, prompt_ids=prompt_ids
         )
 
-        # Load prompts from all layers
-        layer_prompts = await self._load_layer_prompts(agent_id, tenant_id, feature_id_list)
+        if skip_cache or not self._cache:
+            return await self._compose_layers(
+                layer_prompts,
+                agent_id,
+                tenant_id,
+                sanitized_user_input,
+                variables,
+                None,
+                start_time,
+            )
 
-        # Merge prompts across layers
-        merged_template = await self._merge_processor.merge(
-            layer_prompts, user_input=sanitized_user_input
+        version_ids = self._extract_version_ids(layer_prompts)
+        cache_key = generate_cache_key(version_ids, variables)
+
+        # Concurrent misses for the same key share one composition; the entry is
+        # indexed by the prompts it was composed from
+        return await self._cache.get_or_compute(
+            cache_key,
+            lambda: self._compose_layers(
+                layer_prompts,
+                agent_id,
+                tenant_id,
+                sanitized_user_input,
+                variables,
+                cache_key,
+                start_time,
+            ),
+            dependencies=prompt_ids,
         )
 
+    async def _compose_layers(
+        self,
+        layer_prompts: Dict[PromptLayer, Optional[Prompt]],
+        agent_id: str,
+        tenant_id: Optional[str],
+        user_input: Optional[str],
+        variables: Optional[Dict[str, Any]],
+        cache_key: Optional[str],
+        start_time: float,
+    ) -> ComposedPrompt:
+        """Merge and render loaded layer prompts into a composed prompt.
+
+        Args:
+            layer_prompts: Dictionary mapping layers to their prompts
+            agent_id: Agent ID
+            tenant_id: Optional tenant ID
+            user_input: Sanitized user input
+            variables: Optional user-provided variables
+            cache_key: Cache key the result is stored under, if cached
+            start_time: Time composition started (for composition_time_ms)
+
+        Returns:
+            ComposedPrompt with rendered content and metadata
+        """
+        logger.debug(f"Composing prompt for agent={agent_id}, tenant={tenant_id}")
+
+        # Merge prompts across layers
+        merged_template = await self._merge_processor.merge(layer_prompts, user_input=user_input)
+
         # Build complete variable context
         variable_context = self._build_variable_context(tenant_id, agent_id, variables or {})
 
@@ -162,11 +201,6 @@ class CompositionEngine:
             composition_time_ms=composition_time_ms,
         )
 
-        # Store in cache
-        if self._cache and cache_key:
-            await self._cache.set(cache_key, composed_prompt)
-            logger.debug(f"Cached composed prompt with key: {cache_key[:16]}...")
-
         logger.info(
             f"Composition completed in {composition_time_ms:.2f}ms " f"for agent={agent_id}"
         )
@@ -178,16 +212,21 @@ class CompositionEngine:
         agent_id: str,
         tenant_id: Optional[str],
         feature_ids: list[str],
+        prompt_ids: Optional[set[str]] = None,
     ) -> Dict[PromptLayer, Optional[Prompt]]:
         """Load prompts from all applicable layers.
 
         Loads prompts from SYSTEM, TENANT, FEATURE, and AGENT layers.
-        Missing layers are gracefully skipped (set to None).
+        Missing layers are gracefully skipped (set to None). All lookups are
+        planned up front (duplicate feature IDs are looked up once) and issued
+        concurrently.
 
         Args:
             agent_id: Agent ID for agent layer
             tenant_id: Optional tenant ID for tenant layer
             feature_ids: List of feature IDs for feature layer
+            prompt_ids: Optional set that receives the ID of every prompt loaded
+                (including each feature prompt before they are merged)
 
         Returns:
             Dictionary mapping layers to their prompts (None if not found)
@@ -195,49 +234,50 @@ class CompositionEngine:
         Raises:
             PromptNotFoundError: If SYSTEM or AGENT layer prompts are not found
         """
-        layer_prompts: Dict[PromptLayer, Optional[Prompt]] = {}
+        unique_feature_ids = list(dict.fromkeys(feature_ids))
 
-        # Load SYSTEM layer (required)
-        system_prompt = await self._repository.get_by_layer(PromptLayer.SYSTEM, scope_id="default")
-        if not system_prompt:
-            raise PromptNotFoundError("system:default")
-        layer_prompts[PromptLayer.SYSTEM] = system_prompt
-
-        # Load TENANT layer (optional)
+        # Plan one (layer, scope_id, tenant_id) lookup per distinct prompt
+        lookups: list[tuple[PromptLayer, str, Optional[str]]] = [
+            (PromptLayer.SYSTEM, "default", None),
+            (PromptLayer.AGENT, agent_id, tenant_id),
+        ]
         if tenant_id:
-            tenant_prompt = await self._repository.get_by_layer(
-                PromptLayer.TENANT, scope_id=tenant_id, tenant_id=tenant_id
+            lookups.append((PromptLayer.TENANT, tenant_id, tenant_id))
+        first_feature = len(lookups)
+        lookups.extend(
+            (PromptLayer.FEATURE, feature_id, tenant_id) for feature_id in unique_feature_ids
+        )
+
+        results = await asyncio.gather(
+            *(
+                self._repository.get_by_layer(layer, scope_id=scope_id, tenant_id=scope_tenant)
+                for layer, scope_id, scope_tenant in lookups
             )
-            layer_prompts[PromptLayer.TENANT] = tenant_prompt
-        else:
-            layer_prompts[PromptLayer.TENANT] = None
+        )
+        system_prompt, agent_prompt = results[0], results[1]
+        tenant_prompt = results[2] if tenant_id else None
+        feature_prompts = [p for p in results[first_feature:] if p]
 
-        # Load FEATURE layer (optional, may have multiple)
-        if feature_ids:
-            feature_prompts = []
-            for feature_id in feature_ids:
-                feature_prompt = await self._repository.get_by_layer(
-                    PromptLayer.FEATURE, scope_id=feature_id, tenant_id=tenant_id
-                )
-                if feature_prompt:
-                    feature_prompts.append(feature_prompt)
+        # SYSTEM and AGENT layers are required
+        if not system_prompt:
+            raise PromptNotFoundError("system:default")
+        if not agent_prompt:
+            raise PromptNotFoundError(f"agent:{agent_id}")
 
+        layer_prompts: Dict[PromptLayer, Optional[Prompt]] = {
+            PromptLayer.SYSTEM: system_prompt,
+            PromptLayer.TENANT: tenant_prompt,
             # Merge multiple feature prompts if needed
-            if feature_prompts:
-                merged_feature = await self._merge_feature_prompts(feature_prompts)
-                layer_prompts[PromptLayer.FEATURE] = merged_feature
-            else:
-                layer_prompts[PromptLayer.FEATURE] = None
-        else:
-            layer_prompts[PromptLayer.FEATURE] = None
+            PromptLayer.FEATURE: (
+                await self._merge_feature_prompts(feature_prompts) if feature_prompts else None
+            ),
+            PromptLayer.AGENT: agent_prompt,
+        }
 
-        # Load AGENT layer (required)
-        agent_prompt = await self._repository.get_by_layer(
-            PromptLayer.AGENT, scope_id=agent_id, tenant_id=tenant_id
-        )
-        if not agent_prompt:
-            raise PromptNotFoundError(f"agent:{agent_id}")
-        layer_prompts[PromptLayer.AGENT] = agent_prompt
+        if prompt_ids is not None:
+            # Record the stored feature prompts, not the synthetic merged one
+            sources = [system_prompt, tenant_prompt, agent_prompt]
+            prompt_ids.update(p.id for p in sources + feature_prompts if p)
 
         return layer_prompts
 
@@ -3,11 +3,19 @@
 This module provides a secure Jinja2-based template renderer with custom filters
 for prompt-specific operations. All rendering happens in a sandboxed environment
 to prevent code execution attacks.
+
+Compiling a template (parse, code generation, bytecode compilation) costs far
+more than rendering it, and agents render the same composed templates on
+every turn. The renderer therefore keeps an LRU of compiled templates keyed
+by a hash of their source, together with the set of variables each template
+references.
 """
 
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, Optional, Tuple, Union
 
-from jinja2 import BaseLoader, Environment
+from jinja2 import BaseLoader, Environment, Template, meta
 from jinja2.sandbox import SandboxedEnvironment
 
 from omniforge.prompts.errors import PromptRenderError
@@ -41,11 +49,27 @@ class PromptTemplateLoader(BaseLoader):
         return template, None, None
 
 
+class CompiledTemplate(NamedTuple):
+    """A compiled template and the result of analysing its source.
+
+    Attributes:
+        template: Compiled Jinja2 template
+        variables: Names of the variables the template reads from its context
+        size: Size of the template source in bytes (counted against the cache)
+    """
+
+    template: Template
+    variables: FrozenSet[str]
+    size: int
+
+
 class TemplateRenderer:
     """Secure Jinja2 template renderer with custom filters.
 
     This renderer uses Jinja2's SandboxedEnvironment to prevent code execution
-    and provides custom filters for common prompt operations.
+    and provides custom filters for common prompt operations. Compiled
+    templates are cached (LRU, bounded by count and by total source size), so
+    each distinct template is parsed and compiled only once.
 
     Custom Filters:
         - default: Return default value if variable is empty/undefined
@@ -61,10 +85,23 @@ class TemplateRenderer:
         'Hello Alice!'
     """
 
-    def __init__(self) -> None:
-        """Initialize template renderer with sandboxed environment."""
+    def __init__(self, cache_size: int = 256, cache_max_bytes: int = 4 * 1024 * 1024) -> None:
+        """Initialize template renderer with sandboxed environment.
+
+        Args:
+            cache_size: Maximum number of compiled templates to keep (0 disables
+                caching)
+            cache_max_bytes: Maximum total source size of cached templates
+        """
         from jinja2 import StrictUndefined
 
+        self._cache_size = cache_size
+        self._cache_max_bytes = cache_max_bytes
+        self._cache: OrderedDict[str, CompiledTemplate] = OrderedDict()
+        self._cache_bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
         self._env = SandboxedEnvironment(
             loader=PromptTemplateLoader(),
             autoescape=False,  # Prompts don't need HTML escaping
@@ -172,8 +209,8 @@ class TemplateRenderer:
             variables = {}
 
         try:
-            # Parse and compile template
-            compiled_template = self._env.from_string(template)
+            # Compile template (cached by source)
+            compiled_template = self.compile(template).template
 
             # Render with variables
             result = compiled_template.render(**variables)
@@ -211,10 +248,84 @@ class TemplateRenderer:
 
         try:
             # Try to parse template
-            self._env.from_string(template)
+            self.compile(template)
         except Exception as e:
             # Capture syntax errors
             error_message = str(e)
             errors.append(error_message)
 
         return errors
+
+    def get_variables(self, template: str) -> FrozenSet[str]:
+        """Return the variables a template reads from its context.
+
+        Args:
+            template: Jinja2 template string
+
+        Returns:
+            Names of undeclared variables (those not set inside the template)
+
+        Raises:
+            TemplateSyntaxError: If the template cannot be parsed
+        """
+        return self.compile(template).variables
+
+    def compile(self, template: str) -> CompiledTemplate:
+        """Return the compiled form of a template, compiling it on first use.
+
+        Args:
+            template: Jinja2 template string
+
+        Returns:
+            CompiledTemplate for the source
+
+        Raises:
+            TemplateSyntaxError: If the template cannot be parsed
+        """
+        encoded = template.encode("utf-8")
+        key = hashlib.sha256(encoded).hexdigest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return cached
+
+        self.cache_misses += 1
+        # Parse once and reuse the AST for both the analysis and compilation
+        ast = self._env.parse(template)
+        compiled = CompiledTemplate(
+            template=self._env.from_string(ast),
+            variables=frozenset(meta.find_undeclared_variables(ast)),
+            size=len(encoded),
+        )
+        self._store(key, compiled)
+        return compiled
+
+    def clear_cache(self) -> None:
+        """Drop all cached compiled templates."""
+        self._cache.clear()
+        self._cache_bytes = 0
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return compiled template cache statistics.
+
+        Returns:
+            Dictionary with entries, bytes, hits and misses
+        """
+        return {
+            "entries": len(self._cache),
+            "bytes": self._cache_bytes,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+        }
+
+    def _store(self, key: str, compiled: CompiledTemplate) -> None:
+        """Add a compiled template, evicting least recently used ones to fit."""
+        if self._cache_size <= 0 or compiled.size > self._cache_max_bytes:
+            return
+
+        self._cache[key] = compiled
+        self._cache_bytes += compiled.size
+        while len(self._cache) > self._cache_size or self._cache_bytes > self._cache_max_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= evicted.size
@@ -5,7 +5,7 @@ including traffic allocation, variant selection, and statistical analysis.
 """
 
 from omniforge.prompts.experiments.allocation import TrafficAllocator
-from omniforge.prompts.experiments.analysis import AnalysisResult, ExperimentAnalyzer
+from omniforge.prompts.experiments.analysis import AnalysisResult, ExperimentAnalyzer, RunningStats
 from omniforge.prompts.experiments.manager import ExperimentManager, VariantSelection
 
 __all__ = [
@@ -13,5 +13,6 @@ __all__ = [
     "TrafficAllocator",
     "ExperimentAnalyzer",
     "AnalysisResult",
+    "RunningStats",
     "VariantSelection",
 ]
@@ -2,20 +2,58 @@
 
 This module provides deterministic variant selection based on user identifiers,
 ensuring consistent assignment of users to experiment variants.
+
+Identifiers are hashed into 10,000 buckets (0.01% resolution) and the bucket is
+mapped to a variant by bisecting the cumulative traffic percentages of the
+experiment's variants. The hash function is selected by the experiment's
+allocation_version so that changing it never reassigns users of existing
+experiments:
+
+- Version 1: SHA-256 (experiments created before versioning)
+- Version 2: BLAKE2b with an 8-byte digest (faster; used for new experiments)
 """
 
 import hashlib
-from typing import Optional
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Iterable, Optional
 
 from omniforge.prompts.models import PromptExperiment
 
+# Allocation scheme versions (see module docstring)
+ALLOCATION_V1 = 1
+ALLOCATION_V2 = 2
+LATEST_ALLOCATION_VERSION = ALLOCATION_V2
+
+_BUCKETS = 10000
+
+
+def _bucket_v1(key: bytes) -> int:
+    """Bucket from the first 32 bits of the SHA-256 digest."""
+    return int(hashlib.sha256(key).hexdigest()[:8], 16) % _BUCKETS
+
+
+def _bucket_v2(key: bytes) -> int:
+    """Bucket from a 64-bit BLAKE2b digest."""
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big") % _BUCKETS
+
+
+_BUCKET_FUNCTIONS = {ALLOCATION_V1: _bucket_v1, ALLOCATION_V2: _bucket_v2}
+
+
+@lru_cache(maxsize=1024)
+def _cumulative_percentages(percentages: tuple[float, ...]) -> tuple[float, ...]:
+    """Cumulative traffic percentages, computed once per variant configuration."""
+    return tuple(accumulate(percentages))
+
 
 class TrafficAllocator:
     """Allocates traffic across experiment variants using consistent hashing.
 
-    The allocator uses SHA-256 hashing to deterministically assign users to variants
-    based on their identifier and the experiment ID. This ensures that the same user
-    always sees the same variant for a given experiment.
+    The allocator hashes the experiment ID and identifier to deterministically
+    assign users to variants. This ensures that the same user always sees the
+    same variant for a given experiment.
     """
 
     def allocate(self, experiment: PromptExperiment, identifier: str) -> str:
@@ -33,27 +71,55 @@ class TrafficAllocator:
         Returns:
             The variant ID the user should see
 
+        Raises:
+            ValueError: If the experiment's allocation version is unknown
+
         Example:
             >>> allocator = TrafficAllocator()
             >>> variant_id = allocator.allocate(experiment, "user-123")
         """
-        # Create deterministic hash from experiment ID and identifier
-        hash_input = f"{experiment.id}:{identifier}".encode("utf-8")
-        hash_digest = hashlib.sha256(hash_input).hexdigest()
-
-        # Convert first 8 hex characters to integer and normalize to 0-100 range
-        hash_int = int(hash_digest[:8], 16)
-        percentage = (hash_int % 10000) / 100.0  # 0.00 to 99.99
-
-        # Map percentage to variant based on traffic allocation
-        cumulative = 0.0
-        for variant in experiment.variants:
-            cumulative += variant.traffic_percentage
-            if percentage < cumulative:
-                return variant.id
-
-        # Fallback to last variant (should not happen if percentages sum to 100)
-        return experiment.variants[-1].id
+        return self.allocate_many(experiment, [identifier])[identifier]
+
+    def allocate_many(
+        self, experiment: PromptExperiment, identifiers: Iterable[str]
+    ) -> dict[str, str]:
+        """Allocate many users to variants at once.
+
+        Intended for bulk offline assignment and simulations; each identifier
+        gets the same variant allocate() would return.
+
+        Args:
+            experiment: The experiment to allocate for
+            identifiers: User or tenant identifiers
+
+        Returns:
+            Dictionary mapping each identifier to its variant ID
+
+        Raises:
+            ValueError: If the experiment's allocation version is unknown
+
+        Example:
+            >>> allocator = TrafficAllocator()
+            >>> assignments = allocator.allocate_many(experiment, ["user-1", "user-2"])
+        """
+        bucket = _BUCKET_FUNCTIONS.get(experiment.allocation_version)
+        if bucket is None:
+            raise ValueError(f"Unknown allocation version: {experiment.allocation_version}")
+
+        variant_ids = [variant.id for variant in experiment.variants]
+        cumulative = _cumulative_percentages(
+            tuple(variant.traffic_percentage for variant in experiment.variants)
+        )
+        # Percentages past the last boundary (rounding) fall to the last variant
+        last = len(variant_ids) - 1
+        prefix = f"{experiment.id}:"
+
+        assignments: dict[str, str] = {}
+        for identifier in identifiers:
+            percentage = bucket(f"{prefix}{identifier}".encode("utf-8")) / 100.0
+            index = bisect_right(cumulative, percentage)
+            assignments[identifier] = variant_ids[min(index, last)]
+        return assignments
 
     def get_variant_for_identifier(
         self, experiment: PromptExperiment, identifier: str
@@ -2,6 +2,11 @@
 
 This module provides statistical analysis capabilities for experiment results,
 including significance testing and recommendations.
+
+Per-variant results are summarised by their sufficient statistics (count, mean
+and sum of squared deviations) maintained online with Welford's algorithm, so
+recording a result and analysing an experiment both cost O(1) per variant
+regardless of how many results have been recorded.
 """
 
 import math
@@ -11,6 +16,84 @@ from typing import Optional, Union
 from omniforge.prompts.models import PromptExperiment
 
 
+@dataclass
+class RunningStats:
+    """Online accumulator for the mean and variance of a metric (Welford).
+
+    Attributes:
+        count: Number of observations
+        mean: Running mean
+        m2: Sum of squared deviations from the mean
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def update(self, value: float) -> None:
+        """Add a single observation.
+
+        Args:
+            value: Observed metric value
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Combine another accumulator into this one (Chan et al.).
+
+        Args:
+            other: Accumulator over a disjoint set of observations
+        """
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 with fewer than two observations)."""
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self.variance)
+
+    def to_metrics(self) -> dict[str, Union[int, float]]:
+        """Serialize to the variant metrics format.
+
+        Returns:
+            Dictionary with 'sample_size', 'mean' and 'm2' keys
+        """
+        return {"sample_size": self.count, "mean": self.mean, "m2": self.m2}
+
+    @classmethod
+    def from_metrics(cls, metrics: Optional[dict[str, Union[int, float]]]) -> "RunningStats":
+        """Restore an accumulator from variant metrics.
+
+        Args:
+            metrics: Metrics previously produced by to_metrics(), or None
+
+        Returns:
+            The restored accumulator (empty if no statistics were stored)
+        """
+        if not metrics:
+            return cls()
+        return cls(
+            count=int(metrics.get("sample_size", 0)),
+            mean=float(metrics.get("mean", 0.0)),
+            m2=float(metrics.get("m2", 0.0)),
+        )
+
+
 @dataclass
 class VariantStats:
     """Statistics for a single experiment variant.
@@ -44,6 +127,8 @@ class AnalysisResult:
         p_value: Optional p-value from significance test
         sample_size_sufficient: Whether sample size is adequate
         recommendation: Human-readable recommendation
+        stopped_early: Whether the sequential test allows stopping before
+            the minimum sample size is reached
     """
 
     variant_stats: dict[str, VariantStats]
@@ -53,6 +138,7 @@ class AnalysisResult:
     p_value: Optional[float] = None
     sample_size_sufficient: bool = True
     recommendation: str = ""
+    stopped_early: bool = False
 
 
 class ExperimentAnalyzer:
@@ -60,27 +146,57 @@ class ExperimentAnalyzer:
 
     The analyzer computes basic statistics per variant and determines whether
     results are statistically significant using simple heuristics.
+
+    With sequential testing enabled the top two variants are also compared
+    with a mixture sequential probability ratio test (mSPRT), whose p-value
+    is used instead of the fixed-horizon one. It is valid however often the
+    experiment is analysed, so an experiment may be stopped as soon as it is
+    significant instead of waiting for MIN_SAMPLE_SIZE observations per
+    variant.
     """
 
     # Minimum sample size per variant for reliable results
     MIN_SAMPLE_SIZE = 100
 
+    # Minimum sample size per variant before the sequential test is consulted,
+    # so the variance estimate is not dominated by the first few observations
+    SEQUENTIAL_MIN_SAMPLE_SIZE = 20
+
     # Significance threshold (p-value)
     SIGNIFICANCE_THRESHOLD = 0.05
 
+    def __init__(self, sequential: bool = False, effect_size: float = 0.2) -> None:
+        """Initialize the analyzer.
+
+        Args:
+            sequential: Whether to allow early stopping with the mSPRT
+            effect_size: Standardized effect size (in units of the pooled
+                standard deviation) the mSPRT mixture is tuned to detect
+
+        Raises:
+            ValueError: If effect_size is not positive
+        """
+        if effect_size <= 0:
+            raise ValueError("effect_size must be positive")
+        self.sequential = sequential
+        self.effect_size = effect_size
+
     def analyze(
         self,
         experiment: PromptExperiment,
-        metrics: dict[str, dict[str, Union[int, float, list[float]]]],
+        metrics: Optional[dict[str, dict[str, Union[int, float, list[float]]]]] = None,
     ) -> AnalysisResult:
         """Analyze experiment results and determine statistical significance.
 
         Args:
             experiment: The experiment to analyze
             metrics: Dictionary mapping variant IDs to their metric data.
+                Defaults to the running statistics stored on each variant
+                (see ExperimentManager.record_result).
                 Each variant's data should contain:
                 - 'sample_size': Number of observations
                 - 'mean': Average value of success metric
+                - 'm2': Sum of squared deviations (optional, from RunningStats)
                 - 'std_dev': Standard deviation (optional, calculated if values provided)
                 - 'values': List of individual values (optional, for computing stats)
                 - 'conversion_rate': For binary metrics (optional)
@@ -96,6 +212,9 @@ class ExperimentAnalyzer:
             ... }
             >>> result = analyzer.analyze(experiment, metrics)
         """
+        if metrics is None:
+            metrics = {variant.id: dict(variant.metrics or {}) for variant in experiment.variants}
+
         # Compute statistics for each variant
         variant_stats = self._compute_variant_stats(experiment, metrics)
 
@@ -110,12 +229,23 @@ class ExperimentAnalyzer:
         # Compute statistical significance
         is_significant, p_value = self._compute_significance(variant_stats)
 
+        # The sequential test replaces the fixed test at every sample size: a
+        # monitored experiment that switched to the fixed test once it reached
+        # MIN_SAMPLE_SIZE would inflate its false positive rate again
+        stopped_early = False
+        if self.sequential:
+            sequential_p_value = self._sequential_p_value(variant_stats)
+            if sequential_p_value is not None:
+                p_value = sequential_p_value
+                is_significant = p_value < self.SIGNIFICANCE_THRESHOLD
+                stopped_early = is_significant and not sample_size_sufficient
+
         # Determine confidence level
         confidence_level = 1.0 - (p_value if p_value is not None else 1.0)
 
         # Generate recommendation
         recommendation = self._generate_recommendation(
-            variant_stats, winner, is_significant, sample_size_sufficient
+            variant_stats, winner, is_significant, sample_size_sufficient or stopped_early
         )
 
         return AnalysisResult(
@@ -126,6 +256,7 @@ class ExperimentAnalyzer:
             p_value=p_value,
             sample_size_sufficient=sample_size_sufficient,
             recommendation=recommendation,
+            stopped_early=stopped_early,
         )
 
     def _compute_variant_stats(
@@ -156,7 +287,11 @@ class ExperimentAnalyzer:
             mean = float(mean_val) if isinstance(mean_val, (int, float)) else 0.0
 
             # Compute std_dev from values if not provided
-            if "std_dev" in variant_metrics:
+            if "m2" in variant_metrics:
+                m2_val = variant_metrics["m2"]
+                m2 = float(m2_val) if isinstance(m2_val, (int, float)) else 0.0
+                std_dev = RunningStats(count=sample_size, mean=mean, m2=m2).std_dev
+            elif "std_dev" in variant_metrics:
                 std_dev_val = variant_metrics["std_dev"]
                 std_dev = float(std_dev_val) if isinstance(std_dev_val, (int, float)) else 0.0
             elif "values" in variant_metrics:
@@ -250,6 +385,52 @@ class ExperimentAnalyzer:
         except (ValueError, ZeroDivisionError):
             return False, None
 
+    def _sequential_p_value(self, variant_stats: dict[str, VariantStats]) -> Optional[float]:
+        """Compute the mSPRT p-value comparing the top two variants.
+
+        Uses a normal mixture over the difference in means with mixing
+        variance tau^2 = (effect_size * pooled standard deviation)^2. The
+        likelihood ratio against "no difference" is
+
+            sqrt(V / (V + tau^2)) * exp(tau^2 * diff^2 / (2 * V * (V + tau^2)))
+
+        where V is the variance of the observed difference, and 1 / ratio is
+        a p-value that stays valid under continuous monitoring.
+
+        Args:
+            variant_stats: Statistics for all variants
+
+        Returns:
+            The sequential p-value, or None if it cannot be computed yet
+        """
+        if len(variant_stats) < 2:
+            return None
+
+        sorted_variants = sorted(variant_stats.values(), key=lambda x: x.mean, reverse=True)
+        variant_a = sorted_variants[0]
+        variant_b = sorted_variants[1]
+
+        if (
+            variant_a.sample_size < self.SEQUENTIAL_MIN_SAMPLE_SIZE
+            or variant_b.sample_size < self.SEQUENTIAL_MIN_SAMPLE_SIZE
+        ):
+            return None
+
+        variance = (
+            variant_a.std_dev**2 / variant_a.sample_size
+            + variant_b.std_dev**2 / variant_b.sample_size
+        )
+        pooled_variance = (variant_a.std_dev**2 + variant_b.std_dev**2) / 2
+        tau2 = self.effect_size**2 * pooled_variance
+        if variance == 0 or tau2 == 0:
+            return None
+
+        diff = variant_a.mean - variant_b.mean
+        log_ratio = 0.5 * math.log(variance / (variance + tau2)) + tau2 * diff**2 / (
+            2 * variance * (variance + tau2)
+        )
+        return min(1.0, math.exp(-log_ratio))
+
     def _two_sample_t_test(self, variant_a: VariantStats, variant_b: VariantStats) -> float:
         """Perform a two-sample t-test.
 
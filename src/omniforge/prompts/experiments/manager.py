@@ -15,7 +15,8 @@ from omniforge.prompts.errors import (
     PromptNotFoundError,
     PromptValidationError,
 )
-from omniforge.prompts.experiments.allocation import TrafficAllocator
+from omniforge.prompts.experiments.allocation import LATEST_ALLOCATION_VERSION, TrafficAllocator
+from omniforge.prompts.experiments.analysis import RunningStats
 from omniforge.prompts.models import (
     ExperimentVariant,
     Prompt,
@@ -116,6 +117,7 @@ class ExperimentManager:
             variants=variants,
             success_metric=success_metric,
             created_by=created_by,
+            allocation_version=LATEST_ALLOCATION_VERSION,
         )
 
         return await self.repository.create_experiment(experiment)
@@ -319,6 +321,53 @@ class ExperimentManager:
             prompt_version_id=variant.prompt_version_id,
         )
 
+    async def record_result(
+        self, experiment_id: str, variant_id: str, value: float
+    ) -> PromptExperiment:
+        """Record an observation of the success metric for a variant.
+
+        The variant's running statistics (count, mean and sum of squared
+        deviations) are updated in place, so no raw observations are kept and
+        ExperimentAnalyzer.analyze() can read them straight from the variants.
+
+        Args:
+            experiment_id: ID of the experiment
+            variant_id: ID of the variant the observation belongs to
+            value: Observed value of the success metric
+
+        Returns:
+            The updated experiment
+
+        Raises:
+            ExperimentNotFoundError: If experiment does not exist
+            ExperimentStateError: If experiment is not RUNNING
+            PromptValidationError: If variant does not exist in experiment
+        """
+        experiment = await self.repository.get_experiment(experiment_id)
+        if not experiment:
+            raise ExperimentNotFoundError(experiment_id)
+
+        if experiment.status != ExperimentStatus.RUNNING:
+            raise ExperimentStateError(
+                experiment_id=experiment_id,
+                current_state=experiment.status.value,
+                operation="record_result",
+            )
+
+        variant = next((v for v in experiment.variants if v.id == variant_id), None)
+        if not variant:
+            raise PromptValidationError(
+                f"Variant '{variant_id}' not found in experiment",
+                field="variant_id",
+            )
+
+        stats = RunningStats.from_metrics(variant.metrics)
+        stats.update(value)
+        variant.metrics = {**(variant.metrics or {}), **stats.to_metrics()}
+        experiment.updated_at = datetime.utcnow()
+
+        return await self.repository.update_experiment(experiment)
+
     async def promote_variant(
         self, experiment_id: str, variant_id: str, promoted_by: str
     ) -> Prompt:
@@ -281,6 +281,9 @@ class PromptExperiment(BaseModel):
         created_by: Optional ID of user who created the experiment
         created_at: Timestamp when experiment was created
         updated_at: Timestamp of last update
+        allocation_version: Hashing scheme used to assign users to variants
+            (1 for experiments created before versioning; see
+            omniforge.prompts.experiments.allocation)
     """
 
     id: str = Field(..., min_length=1, max_length=255)
@@ -295,6 +298,7 @@ class PromptExperiment(BaseModel):
     created_by: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    allocation_version: int = Field(default=1, ge=1)
 
     @field_validator("variants")
     @classmethod
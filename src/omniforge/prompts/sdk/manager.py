@@ -719,10 +719,8 @@ class PromptManager:
         if not self._cache_manager:
             return
 
-        # Invalidate all entries that might contain this prompt
-        # Use a pattern that matches any cache key containing this prompt
-        pattern = f"*{prompt_id}*"
-        invalidated = await self._cache_manager.invalidate_pattern(pattern)
+        # Cache keys are hashes, so look the entries up in the dependency index
+        invalidated = await self._cache_manager.invalidate_dependents(prompt_id)
         logger.debug(f"Invalidated {invalidated} cache entries for prompt {prompt_id}")
 
     def get_cache_stats(self) -> dict[str, Any]:
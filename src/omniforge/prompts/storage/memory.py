@@ -5,8 +5,9 @@ suitable for development, testing, and lightweight deployments.
 """
 
 import asyncio
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from omniforge.prompts.enums import ExperimentStatus, PromptLayer
 from omniforge.prompts.errors import (
@@ -23,7 +24,11 @@ class InMemoryPromptRepository:
     """Thread-safe in-memory storage for prompts, versions, and experiments.
 
     Uses asyncio.Lock to ensure thread safety for concurrent operations.
-    Stores all data in dictionaries with UUID keys.
+    Stores all data in dictionaries with UUID keys, plus secondary indexes
+    maintained on every write so lookups and listings cost O(result) rather
+    than a scan of everything stored. Index buckets are dicts used as
+    insertion-ordered sets; lookups re-check the stored objects, so an index
+    only ever narrows the candidates.
     """
 
     def __init__(self) -> None:
@@ -33,6 +38,21 @@ class InMemoryPromptRepository:
         self._experiments: dict[str, PromptExperiment] = {}
         self._lock = asyncio.Lock()
 
+        # Active prompt IDs by (layer, scope_id) and by tenant, and the keys each
+        # prompt was indexed under (stored prompts may be mutated in place)
+        self._prompts_by_scope: dict[tuple[PromptLayer, str], dict[str, None]] = {}
+        self._prompts_by_tenant: dict[Optional[str], dict[str, None]] = {}
+        self._prompt_index_keys: dict[str, tuple[PromptLayer, str, Optional[str]]] = {}
+
+        # Versions of each prompt sorted by version_number, with the numbers
+        # kept in a parallel list for bisection
+        self._versions_by_prompt: dict[str, list[PromptVersion]] = {}
+        self._version_numbers: dict[str, list[int]] = {}
+
+        # Experiment IDs by prompt, and those currently RUNNING
+        self._experiments_by_prompt: dict[str, dict[str, None]] = {}
+        self._running_experiments: dict[str, dict[str, None]] = {}
+
     # Prompt CRUD Operations
     async def create(self, prompt: Prompt) -> Prompt:
         """Create a new prompt.
@@ -48,22 +68,17 @@ class InMemoryPromptRepository:
         """
         async with self._lock:
             # Check for duplicate (layer, scope_id) combination
-            for existing_prompt in self._prompts.values():
-                if (
-                    existing_prompt.layer == prompt.layer
-                    and existing_prompt.scope_id == prompt.scope_id
-                    and existing_prompt.is_active
-                ):
-                    raise PromptValidationError(
-                        message=(
-                            f"Prompt with layer '{prompt.layer}' and "
-                            f"scope_id '{prompt.scope_id}' already exists"
-                        ),
-                        field="layer, scope_id",
-                    )
+            if self._scope_candidates(prompt.layer, prompt.scope_id):
+                raise PromptValidationError(
+                    message=(
+                        f"Prompt with layer '{prompt.layer}' and "
+                        f"scope_id '{prompt.scope_id}' already exists"
+                    ),
+                    field="layer, scope_id",
+                )
 
             # Store the prompt
-            self._prompts[prompt.id] = prompt
+            self._store_prompt(prompt)
             return prompt
 
     async def get(self, prompt_id: str) -> Optional[Prompt]:
@@ -98,10 +113,9 @@ class InMemoryPromptRepository:
             The prompt if found and active, None otherwise
         """
         async with self._lock:
-            for prompt in self._prompts.values():
-                if prompt.layer == layer and prompt.scope_id == scope_id and prompt.is_active:
-                    if tenant_id is None or prompt.tenant_id == tenant_id:
-                        return prompt
+            for prompt in self._scope_candidates(layer, scope_id):
+                if tenant_id is None or prompt.tenant_id == tenant_id:
+                    return prompt
             return None
 
     async def update(self, prompt: Prompt) -> Prompt:
@@ -130,7 +144,7 @@ class InMemoryPromptRepository:
 
             # Update timestamp
             prompt.updated_at = datetime.utcnow()
-            self._prompts[prompt.id] = prompt
+            self._store_prompt(prompt)
             return prompt
 
     async def delete(self, prompt_id: str) -> bool:
@@ -150,7 +164,7 @@ class InMemoryPromptRepository:
             # Create a new instance with is_active=False
             # Since Pydantic models are immutable, we need to use model_copy
             updated_prompt = prompt.model_copy(update={"is_active": False})
-            self._prompts[prompt_id] = updated_prompt
+            self._store_prompt(updated_prompt)
             return True
 
     async def list_by_tenant(
@@ -172,7 +186,9 @@ class InMemoryPromptRepository:
         async with self._lock:
             # Filter active prompts for tenant
             filtered = [
-                p for p in self._prompts.values() if p.tenant_id == tenant_id and p.is_active
+                p
+                for p in map(self._prompts.__getitem__, self._prompts_by_tenant.get(tenant_id, ()))
+                if p.tenant_id == tenant_id and p.is_active
             ]
 
             # Sort by created_at descending
@@ -204,7 +220,13 @@ class InMemoryPromptRepository:
                 raise PromptNotFoundError(version.prompt_id)
 
             # Store the version
+            if version.id in self._versions:
+                self._unindex_version(self._versions[version.id])
             self._versions[version.id] = version
+            numbers = self._version_numbers.setdefault(version.prompt_id, [])
+            position = bisect_right(numbers, version.version_number)
+            numbers.insert(position, version.version_number)
+            self._versions_by_prompt.setdefault(version.prompt_id, []).insert(position, version)
             return version
 
     async def get_version(
@@ -222,10 +244,7 @@ class InMemoryPromptRepository:
             The version if found, None otherwise
         """
         async with self._lock:
-            for version in self._versions.values():
-                if version.prompt_id == prompt_id and version.version_number == version_number:
-                    return version
-            return None
+            return self._find_version(prompt_id, version_number)
 
     async def list_versions(
         self,
@@ -244,18 +263,11 @@ class InMemoryPromptRepository:
             List of versions, sorted by version_number descending
         """
         async with self._lock:
-            # Filter versions for prompt
-            filtered = [v for v in self._versions.values() if v.prompt_id == prompt_id]
-
-            # Sort by version_number descending
-            sorted_versions = sorted(
-                filtered,
-                key=lambda v: v.version_number,
-                reverse=True,
-            )
-
-            # Apply pagination
-            return sorted_versions[offset : offset + limit]
+            # Versions are kept sorted ascending; page from the end
+            versions = self._versions_by_prompt.get(prompt_id, [])
+            end = max(len(versions) - offset, 0)
+            start = max(end - limit, 0)
+            return versions[start:end][::-1]
 
     async def set_current_version(
         self,
@@ -284,12 +296,7 @@ class InMemoryPromptRepository:
                 raise PromptNotFoundError(prompt_id)
 
             # Get the version
-            version = None
-            for v in self._versions.values():
-                if v.prompt_id == prompt_id and v.version_number == version_number:
-                    version = v
-                    break
-
+            version = self._find_version(prompt_id, version_number)
             if not version:
                 raise PromptVersionNotFoundError(prompt_id, version_number)
 
@@ -304,7 +311,7 @@ class InMemoryPromptRepository:
                 }
             )
 
-            self._prompts[prompt_id] = updated_prompt
+            self._store_prompt(updated_prompt)
             return updated_prompt
 
     # Experiment Operations
@@ -326,7 +333,7 @@ class InMemoryPromptRepository:
                 raise PromptNotFoundError(experiment.prompt_id)
 
             # Store the experiment
-            self._experiments[experiment.id] = experiment
+            self._store_experiment(experiment)
             return experiment
 
     async def get_experiment(self, experiment_id: str) -> Optional[PromptExperiment]:
@@ -351,7 +358,8 @@ class InMemoryPromptRepository:
             The active experiment if found, None otherwise
         """
         async with self._lock:
-            for experiment in self._experiments.values():
+            for experiment_id in self._running_experiments.get(prompt_id, ()):
+                experiment = self._experiments[experiment_id]
                 if (
                     experiment.prompt_id == prompt_id
                     and experiment.status == ExperimentStatus.RUNNING
@@ -377,7 +385,7 @@ class InMemoryPromptRepository:
 
             # Update timestamp
             experiment.updated_at = datetime.utcnow()
-            self._experiments[experiment.id] = experiment
+            self._store_experiment(experiment)
             return experiment
 
     async def list_experiments(
@@ -400,7 +408,13 @@ class InMemoryPromptRepository:
         """
         async with self._lock:
             # Filter experiments for prompt
-            filtered = [e for e in self._experiments.values() if e.prompt_id == prompt_id]
+            filtered = [
+                e
+                for e in map(
+                    self._experiments.__getitem__, self._experiments_by_prompt.get(prompt_id, ())
+                )
+                if e.prompt_id == prompt_id
+            ]
 
             # Apply status filter if provided
             if status is not None:
@@ -415,3 +429,70 @@ class InMemoryPromptRepository:
 
             # Apply pagination
             return sorted_experiments[offset : offset + limit]
+
+    # Index Maintenance
+    def _scope_candidates(self, layer: PromptLayer, scope_id: str) -> list[Prompt]:
+        """Return active prompts for a (layer, scope_id) in insertion order."""
+        return [
+            prompt
+            for prompt in map(
+                self._prompts.__getitem__, self._prompts_by_scope.get((layer, scope_id), ())
+            )
+            if prompt.layer == layer and prompt.scope_id == scope_id and prompt.is_active
+        ]
+
+    def _store_prompt(self, prompt: Prompt) -> None:
+        """Store a prompt and re-index it under its current layer, scope and tenant."""
+        self._prompts[prompt.id] = prompt
+
+        keys = (prompt.layer, prompt.scope_id, prompt.tenant_id)
+        previous = self._prompt_index_keys.get(prompt.id)
+        if previous == keys and prompt.is_active:
+            return
+
+        if previous is not None:
+            layer, scope_id, tenant_id = previous
+            self._discard(self._prompts_by_scope, (layer, scope_id), prompt.id)
+            self._discard(self._prompts_by_tenant, tenant_id, prompt.id)
+            del self._prompt_index_keys[prompt.id]
+
+        # Only active prompts are indexed; soft-deleted ones are never looked up
+        if prompt.is_active:
+            self._prompts_by_scope.setdefault((prompt.layer, prompt.scope_id), {})[prompt.id] = None
+            self._prompts_by_tenant.setdefault(prompt.tenant_id, {})[prompt.id] = None
+            self._prompt_index_keys[prompt.id] = keys
+
+    def _find_version(self, prompt_id: str, version_number: int) -> Optional[PromptVersion]:
+        """Find the first stored version of a prompt with the given number."""
+        numbers = self._version_numbers.get(prompt_id, [])
+        position = bisect_left(numbers, version_number)
+        if position < len(numbers) and numbers[position] == version_number:
+            return self._versions_by_prompt[prompt_id][position]
+        return None
+
+    def _unindex_version(self, version: PromptVersion) -> None:
+        """Remove a version from the per-prompt sorted lists."""
+        versions = self._versions_by_prompt.get(version.prompt_id, [])
+        for position, stored in enumerate(versions):
+            if stored.id == version.id:
+                del versions[position]
+                del self._version_numbers[version.prompt_id][position]
+                return
+
+    def _store_experiment(self, experiment: PromptExperiment) -> None:
+        """Store an experiment and update the by-prompt and running indexes."""
+        self._experiments[experiment.id] = experiment
+        self._experiments_by_prompt.setdefault(experiment.prompt_id, {})[experiment.id] = None
+        if experiment.status == ExperimentStatus.RUNNING:
+            self._running_experiments.setdefault(experiment.prompt_id, {})[experiment.id] = None
+        else:
+            self._discard(self._running_experiments, experiment.prompt_id, experiment.id)
+
+    @staticmethod
+    def _discard(index: dict[Any, dict[str, None]], key: Any, item_id: str) -> None:
+        """Remove an ID from an index bucket, dropping the bucket when it empties."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(item_id, None)
+            if not bucket:
+                del index[key]
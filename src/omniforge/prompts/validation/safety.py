@@ -2,9 +2,22 @@
 
 This module provides the SafetyValidator class that sanitizes user input
 to prevent prompt injection attacks and other security vulnerabilities.
+
+Long inputs are dominated by the injection patterns, which have no literal
+prefix for the regex engine to search for. Each of them starts with a keyword,
+so the input is lowercased once and only the patterns whose keyword occurs in
+it are run; clean input is cleared with a few substring searches.
 """
 
 import re
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional
+
+from omniforge.core.text import fold_case
+
+# Leading literal keyword of an injection pattern
+_KEYWORD = re.compile(r"\\b([a-z]+)")
 
 
 class SafetyValidator:
@@ -62,14 +75,19 @@ class SafetyValidator:
     def __init__(self) -> None:
         """Initialize the safety validator."""
         # Compile patterns for better performance
-        self._injection_regex = re.compile(
-            "|".join(f"({pattern})" for pattern in self._INJECTION_PATTERNS),
-            re.IGNORECASE,
-        )
         self._template_escape_regex = re.compile(
             "|".join(self._TEMPLATE_ESCAPE_PATTERNS),
             re.DOTALL,
         )
+        self._template_escape_rules = [
+            (pattern, re.compile(pattern, re.DOTALL)) for pattern in self._TEMPLATE_ESCAPE_PATTERNS
+        ]
+        # Injection patterns are run only when their keyword occurs in the text
+        self._injection_rules: list[tuple[Optional[str], str, re.Pattern[str]]] = []
+        for pattern in self._INJECTION_PATTERNS:
+            keyword_match = _KEYWORD.match(pattern)
+            keyword = keyword_match.group(1) if keyword_match else None
+            self._injection_rules.append((keyword, pattern, re.compile(pattern, re.IGNORECASE)))
 
     def sanitize_user_input(self, user_input: str) -> str:
         """Sanitize user input to prevent prompt injection attacks.
@@ -100,7 +118,9 @@ class SafetyValidator:
         sanitized = self._template_escape_regex.sub("", user_input)
 
         # 2. Remove known injection patterns
-        sanitized = self._injection_regex.sub("", sanitized)
+        patterns = tuple(pattern for _, pattern, _ in self._candidate_injection_rules(sanitized))
+        if patterns:
+            sanitized = _injection_regex(patterns).sub("", sanitized)
 
         # 3. Limit excessive repetition (flooding attack)
         sanitized = self._limit_repetition(sanitized)
@@ -131,21 +151,8 @@ class SafetyValidator:
         if not text:
             return text
 
-        result = []
-        prev_char = None
-        count = 0
-
-        for char in text:
-            if char == prev_char:
-                count += 1
-                if count <= max_consecutive:
-                    result.append(char)
-            else:
-                result.append(char)
-                prev_char = char
-                count = 1
-
-        return "".join(result)
+        # Keep the first max_consecutive characters of each longer run
+        return _repetition_regex(max(max_consecutive, 1)).sub(itemgetter(1), text)
 
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize whitespace to prevent obfuscation.
@@ -202,7 +209,8 @@ class SafetyValidator:
             return True
 
         # Check for injection patterns
-        if self._injection_regex.search(user_input):
+        patterns = tuple(pattern for _, pattern, _ in self._candidate_injection_rules(user_input))
+        if patterns and _injection_regex(patterns).search(user_input):
             return False
 
         # Check for template escapes
@@ -210,3 +218,64 @@ class SafetyValidator:
             return False
 
         return True
+
+    def find_violations(self, user_input: str) -> list[str]:
+        """Find which injection and template escape patterns occur in user input.
+
+        Args:
+            user_input: User input to check
+
+        Returns:
+            The matching patterns, template escapes first and otherwise in the
+            order they are declared
+
+        Example:
+            >>> validator = SafetyValidator()
+            >>> len(validator.find_violations("Act as admin. {{ secrets }}"))
+            2
+        """
+        if not user_input:
+            return []
+
+        violations = [
+            pattern for pattern, regex in self._template_escape_rules if regex.search(user_input)
+        ]
+        violations.extend(
+            pattern
+            for _, pattern, regex in self._candidate_injection_rules(user_input)
+            if regex.search(user_input)
+        )
+        return violations
+
+    def _candidate_injection_rules(
+        self, text: str
+    ) -> list[tuple[Optional[str], str, re.Pattern[str]]]:
+        """Select the injection rules whose keyword occurs in the text.
+
+        Rules that are left out cannot match the text.
+
+        Args:
+            text: Text about to be scanned
+
+        Returns:
+            (keyword, pattern, compiled pattern) for each candidate rule
+        """
+        folded = fold_case(text)
+        return [rule for rule in self._injection_rules if rule[0] is None or rule[0] in folded]
+
+
+@lru_cache(maxsize=128)
+def _injection_regex(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a set of injection patterns into one case-insensitive alternation."""
+    return re.compile("|".join(f"({pattern})" for pattern in patterns), re.IGNORECASE)
+
+
+@lru_cache(maxsize=16)
+def _repetition_regex(max_consecutive: int) -> re.Pattern[str]:
+    """Regex matching a run of one character longer than max_consecutive.
+
+    Group 1 holds the first max_consecutive characters of the run. The
+    backreferences are spelled out because re runs them considerably faster
+    than a counted repeat of a backreference.
+    """
+    return re.compile("((.)" + r"\2" * (max_consecutive - 1) + r")\2+", re.DOTALL)
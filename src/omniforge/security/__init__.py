@@ -9,6 +9,7 @@ This module provides:
 from omniforge.security.auth import validate_api_key, validate_bearer_token
 from omniforge.security.isolation import (
     enforce_agent_isolation,
+    enforce_stream_isolation,
     enforce_task_isolation,
     filter_by_tenant,
 )
@@ -29,6 +30,7 @@ __all__ = [
     "validate_bearer_token",
     # Isolation
     "enforce_agent_isolation",
+    "enforce_stream_isolation",
     "enforce_task_isolation",
     "filter_by_tenant",
 ]
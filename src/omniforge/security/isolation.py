@@ -1,7 +1,7 @@
 """Tenant isolation enforcement utilities.
 
 This module provides helper functions to enforce tenant isolation
-across different resource types (agents, tasks).
+across different resource types (agents, tasks, task streams).
 """
 
 from typing import Optional
@@ -10,6 +10,7 @@ from omniforge.agents.base import BaseAgent
 from omniforge.agents.errors import TenantIsolationError
 from omniforge.security.tenant import get_tenant_id
 from omniforge.tasks.models import Task
+from omniforge.tasks.streams import TaskStream
 
 
 def enforce_agent_isolation(agent: BaseAgent) -> None:
@@ -66,6 +67,34 @@ def enforce_task_isolation(task: Task) -> None:
         raise TenantIsolationError("task", task.id)
 
 
+def enforce_stream_isolation(stream: TaskStream) -> None:
+    """Enforce tenant isolation for a task event stream.
+
+    Verifies that the current tenant context matches the tenant that opened
+    the stream. Raises an error if there is a tenant mismatch.
+
+    Unlike agents and tasks, a stream opened without a tenant is not shared:
+    its frames are one caller's conversation, so a tenant-scoped caller may
+    only resume streams opened by the same tenant.
+
+    Args:
+        stream: The stream to check
+
+    Raises:
+        TenantIsolationError: If the stream was opened by a different tenant,
+            or without a tenant while the caller has one
+    """
+    current_tenant = get_tenant_id()
+
+    # If no current tenant context, allow access (for backwards compatibility)
+    if current_tenant is None:
+        return
+
+    # Check for tenant mismatch (including streams opened without a tenant)
+    if stream.tenant_id != current_tenant:
+        raise TenantIsolationError("task", stream.stream_id)
+
+
 def filter_by_tenant(resources: list, current_tenant: Optional[str] = None) -> list:
     """Filter a list of resources by current tenant.
 
@@ -24,6 +24,7 @@ from omniforge.skills.errors import (
     SkillScriptReadError,
     SkillToolNotAllowedError,
 )
+from omniforge.skills.index_store import SkillIndexStore
 from omniforge.skills.loader import SkillLoader
 from omniforge.skills.models import (
     ContextMode,
@@ -73,6 +74,7 @@ __all__ = [
     "validate_skill_config",
     "merge_configs",
     # Storage
+    "SkillIndexStore",
     "SkillStorageManager",
     "StorageConfig",
     # Parser
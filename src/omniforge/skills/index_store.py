@@ -0,0 +1,299 @@
+"""Persistent on-disk cache for the skill index.
+
+Building the skill index parses the YAML frontmatter of every SKILL.md in every
+storage layer. SkillIndexStore keeps the result for each file in a SQLite file,
+keyed by path and storage layer together with the file's mtime_ns, size and a
+SHA-256 of its content, so an index build (including the first one after a
+restart) only re-parses files that changed. It also records the subdirectory
+listing of each storage layer directory with the directory's mtime_ns, so a
+layer whose directory has not changed is not listed again.
+
+A recorded mtime is only trusted once it is older than the filesystem
+timestamp granularity at the time it was recorded; a file rewritten within the
+same timestamp tick would otherwise keep its (mtime_ns, size) and look
+unchanged. Such records are re-validated by content hash instead.
+
+The store is a cache: any SQLite error is logged once, disables the store and
+turns every lookup into a miss, so indexing falls back to parsing every file.
+
+Configuration (environment variables):
+    OMNIFORGE_SKILL_INDEX_PATH: SQLite file for the persistent skill index
+        (read by StorageConfig.from_environment; unset disables it)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from omniforge.skills.models import SkillIndexEntry
+from omniforge.storage.sqlite_connection import SQLiteConnection
+
+logger = logging.getLogger(__name__)
+
+# Coarsest filesystem timestamp resolution we guard against (FAT: 2 seconds)
+_TIMESTAMP_GRANULARITY_NS = 2_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS skill_files (
+    path TEXT NOT NULL,
+    storage_layer TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    entry TEXT,
+    error TEXT,
+    recorded_ns INTEGER NOT NULL,
+    PRIMARY KEY (path, storage_layer)
+);
+CREATE TABLE IF NOT EXISTS skill_directories (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    children TEXT NOT NULL,
+    recorded_ns INTEGER NOT NULL
+);
+"""
+
+
+def _settled(mtime_ns: int, recorded_ns: int) -> bool:
+    """Whether a recorded mtime is old enough to detect later changes."""
+    return recorded_ns - mtime_ns >= _TIMESTAMP_GRANULARITY_NS
+
+
+@dataclass
+class SkillFileRecord:
+    """Cached parse result for one SKILL.md file.
+
+    Attributes:
+        mtime_ns: File modification time when it was parsed
+        size: File size when it was parsed
+        content_hash: SHA-256 hex digest of the file content
+        entry: Parsed index entry, or None if parsing failed
+        error: Parse error reason, or None if parsing succeeded
+        recorded_ns: Wall-clock time the record was written
+    """
+
+    mtime_ns: int
+    size: int
+    content_hash: str
+    entry: Optional[SkillIndexEntry] = None
+    error: Optional[str] = None
+    recorded_ns: int = 0
+
+    def matches(self, stat_result: os.stat_result) -> bool:
+        """Check whether the file is unchanged according to its stat result.
+
+        Args:
+            stat_result: Current stat result of the file
+
+        Returns:
+            True if mtime and size match and the recorded mtime is settled
+        """
+        return (
+            self.mtime_ns == stat_result.st_mtime_ns
+            and self.size == stat_result.st_size
+            and _settled(self.mtime_ns, self.recorded_ns)
+        )
+
+
+class SkillIndexStore:
+    """SQLite-backed cache of parsed skill metadata and layer directory listings.
+
+    The connection is opened lazily (creating the parent directory) and
+    reopened after a fork. SkillLoader creates a store when
+    StorageConfig.index_path is set.
+
+    Example:
+        >>> store = SkillIndexStore(Path("/tmp/skill-index.db"))
+        >>> store.put_directory(Path("/skills"), 1700000000000000000, ["debug-agent"])
+        >>> store.get_directory(Path("/skills"), 1700000000000000000)
+        ['debug-agent']
+    """
+
+    def __init__(self, path: Path, busy_timeout: float = 5.0) -> None:
+        """Initialize the store.
+
+        Args:
+            path: SQLite file path
+            busy_timeout: Seconds to wait for another process's write lock
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._conn = SQLiteConnection(path, _SCHEMA, busy_timeout)
+        self._disabled = False
+
+    def get_file(self, path: Path, storage_layer: str) -> Optional[SkillFileRecord]:
+        """Read the cached parse result of a skill file.
+
+        Args:
+            path: Path of the SKILL.md file
+            storage_layer: Storage layer the file was found in
+
+        Returns:
+            The cached record, or None if there is none
+        """
+        row = self._fetchone(
+            "SELECT mtime_ns, size, content_hash, entry, error, recorded_ns"
+            " FROM skill_files WHERE path = ? AND storage_layer = ?",
+            (str(path), storage_layer),
+        )
+        if row is None:
+            return None
+        mtime_ns, size, content_hash, entry, error, recorded_ns = row
+        return SkillFileRecord(
+            mtime_ns=mtime_ns,
+            size=size,
+            content_hash=content_hash,
+            entry=SkillIndexEntry.model_validate_json(entry) if entry is not None else None,
+            error=error,
+            recorded_ns=recorded_ns,
+        )
+
+    def put_file(self, path: Path, storage_layer: str, record: SkillFileRecord) -> None:
+        """Store the parse result of a skill file.
+
+        Args:
+            path: Path of the SKILL.md file
+            storage_layer: Storage layer the file was found in
+            record: Parse result to store (recorded_ns is set to now)
+        """
+        record.recorded_ns = time.time_ns()
+        self._execute(
+            "INSERT OR REPLACE INTO skill_files"
+            " (path, storage_layer, mtime_ns, size, content_hash, entry, error, recorded_ns)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                str(path),
+                storage_layer,
+                record.mtime_ns,
+                record.size,
+                record.content_hash,
+                record.entry.model_dump_json() if record.entry is not None else None,
+                record.error,
+                record.recorded_ns,
+            ),
+        )
+
+    def retain_files(self, keys: Iterable[tuple[Path, str]]) -> int:
+        """Delete the records of files that are no longer present.
+
+        Args:
+            keys: (path, storage_layer) of every file that should be kept
+
+        Returns:
+            Number of records deleted
+        """
+        keep = {(str(path), layer) for path, layer in keys}
+        stale = [
+            row
+            for row in self._fetchall("SELECT path, storage_layer FROM skill_files", ())
+            if tuple(row) not in keep
+        ]
+        for path, layer in stale:
+            self._execute(
+                "DELETE FROM skill_files WHERE path = ? AND storage_layer = ?", (path, layer)
+            )
+        return len(stale)
+
+    def get_directory(self, path: Path, mtime_ns: int) -> Optional[list[str]]:
+        """Read the cached subdirectory listing of a directory.
+
+        Args:
+            path: Directory path
+            mtime_ns: Current modification time of the directory
+
+        Returns:
+            Names of the subdirectories, or None if the directory changed
+            since it was listed (or was never listed)
+        """
+        row = self._fetchone(
+            "SELECT mtime_ns, children, recorded_ns FROM skill_directories WHERE path = ?",
+            (str(path),),
+        )
+        if row is None or row[0] != mtime_ns or not _settled(row[0], row[2]):
+            return None
+        children: list[str] = json.loads(row[1])
+        return children
+
+    def put_directory(self, path: Path, mtime_ns: int, children: list[str]) -> None:
+        """Store the subdirectory listing of a directory.
+
+        Args:
+            path: Directory path
+            mtime_ns: Modification time of the directory when it was listed
+            children: Names of its subdirectories
+        """
+        self._execute(
+            "INSERT OR REPLACE INTO skill_directories (path, mtime_ns, children, recorded_ns)"
+            " VALUES (?, ?, ?, ?)",
+            (str(path), mtime_ns, json.dumps(children), time.time_ns()),
+        )
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into one transaction (committed on success).
+
+        Yields:
+            None
+        """
+        with self._conn.lock:
+            conn = self._connection()
+            if conn is None or conn.in_transaction:
+                yield
+                return
+            began = self._execute("BEGIN", ()) is not None
+            try:
+                yield
+            except BaseException:
+                if began and self._conn.in_transaction:
+                    conn.rollback()
+                raise
+            if began and self._conn.in_transaction:
+                self._execute("COMMIT", ())
+
+    def close(self) -> None:
+        """Close the connection (it is reopened on next use)."""
+        self._conn.close()
+
+    def _fetchone(self, sql: str, params: tuple[Any, ...]) -> Optional[tuple[Any, ...]]:
+        """Run a query and return its first row (None on error)."""
+        cursor = self._execute(sql, params)
+        return cursor.fetchone() if cursor is not None else None
+
+    def _fetchall(self, sql: str, params: tuple[Any, ...]) -> list[tuple[Any, ...]]:
+        """Run a query and return all rows (empty on error)."""
+        cursor = self._execute(sql, params)
+        return cursor.fetchall() if cursor is not None else []
+
+    def _execute(self, sql: str, params: tuple[Any, ...]) -> Optional[sqlite3.Cursor]:
+        """Execute one statement, disabling the store on error."""
+        with self._conn.lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                return conn.execute(sql, params)
+            except sqlite3.Error as e:
+                self._disable(e)
+                return None
+
+    def _disable(self, error: Exception) -> None:
+        """Stop using the store after an error."""
+        logger.warning("Disabling skill index store '%s': %s", self.path, error)
+        self._disabled = True
+        self.close()
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Return this process's connection, opening it if needed."""
+        if self._disabled:
+            return None
+        try:
+            return self._conn.get()
+        except (OSError, sqlite3.Error) as e:
+            self._disable(e)
+            return None
@@ -5,12 +5,16 @@ indexing, caching, and loading with proper priority resolution across
 storage layers.
 """
 
+import hashlib
 import logging
+import os
 import time
+from pathlib import Path
 from threading import RLock
-from typing import Optional
+from typing import Iterator, Optional
 
 from omniforge.skills.errors import SkillNotFoundError, SkillParseError, SkillValidationError
+from omniforge.skills.index_store import SkillFileRecord, SkillIndexStore
 from omniforge.skills.models import Skill, SkillIndexEntry
 from omniforge.skills.parser import SkillParser
 from omniforge.skills.storage import SkillStorageManager, StorageConfig
@@ -25,7 +29,9 @@ class SkillLoader:
     """Loader for skill indexing, caching, and priority resolution.
 
     Manages skill discovery across storage layers with priority-based conflict
-    resolution, caching with TTL, and thread-safe operations.
+    resolution, caching with TTL, and thread-safe operations. When the storage
+    configuration sets index_path, parsed metadata is kept in a persistent
+    SkillIndexStore and index builds only re-parse SKILL.md files that changed.
 
     Attributes:
         DEFAULT_CACHE_TTL: Default cache TTL in seconds (5 minutes)
@@ -44,7 +50,8 @@ class SkillLoader:
         """
         self._config = config
         self._cache_ttl = cache_ttl_seconds
-        self._storage_manager = SkillStorageManager(config)
+        self._index_store = SkillIndexStore(config.index_path) if config.index_path else None
+        self._storage_manager = SkillStorageManager(config, index_store=self._index_store)
         self._parser = SkillParser()
 
         # Thread-safe data structures
@@ -92,52 +99,39 @@ class SkillLoader:
             skill_entries: dict[str, SkillIndexEntry] = {}
 
             # Scan all storage layers
-            for storage_layer, skill_path in self._storage_manager.get_all_skill_paths():
-                try:
-                    # Parse metadata only (Stage 1)
-                    entry = self._parser.parse_metadata(skill_path, storage_layer)
-
-                    # Check for name conflicts
-                    if entry.name in skill_entries:
-                        existing = skill_entries[entry.name]
-
-                        # Resolve conflict by effective priority
-                        existing_priority = self._get_effective_priority(existing)
-                        new_priority = self._get_effective_priority(entry)
-
-                        if new_priority > existing_priority:
-                            # New skill has higher priority
-                            logger.debug(
-                                "Skill '%s': replacing %s (priority %d) with %s (priority %d)",
-                                entry.name,
-                                existing.storage_layer,
-                                existing_priority,
-                                entry.storage_layer,
-                                new_priority,
-                            )
-                            skill_entries[entry.name] = entry
-                        else:
-                            # Existing skill has higher or equal priority
-                            logger.debug(
-                                "Skill '%s': keeping %s (priority %d) over %s (priority %d)",
-                                entry.name,
-                                existing.storage_layer,
-                                existing_priority,
-                                entry.storage_layer,
-                                new_priority,
-                            )
-                    else:
-                        # No conflict, add to index
+            for entry in self._scan_entries():
+                # Check for name conflicts
+                if entry.name in skill_entries:
+                    existing = skill_entries[entry.name]
+
+                    # Resolve conflict by effective priority
+                    existing_priority = self._get_effective_priority(existing)
+                    new_priority = self._get_effective_priority(entry)
+
+                    if new_priority > existing_priority:
+                        # New skill has higher priority
+                        logger.debug(
+                            "Skill '%s': replacing %s (priority %d) with %s (priority %d)",
+                            entry.name,
+                            existing.storage_layer,
+                            existing_priority,
+                            entry.storage_layer,
+                            new_priority,
+                        )
                         skill_entries[entry.name] = entry
-
-                except SkillParseError as e:
-                    # Log individual parse errors but don't fail entire index
-                    logger.warning(
-                        "Failed to parse skill at '%s': %s",
-                        skill_path,
-                        e.reason,
-                    )
-                    continue
+                    else:
+                        # Existing skill has higher or equal priority
+                        logger.debug(
+                            "Skill '%s': keeping %s (priority %d) over %s (priority %d)",
+                            entry.name,
+                            existing.storage_layer,
+                            existing_priority,
+                            entry.storage_layer,
+                            new_priority,
+                        )
+                else:
+                    # No conflict, add to index
+                    skill_entries[entry.name] = entry
 
             # Update index with resolved entries
             self._index = skill_entries
@@ -146,6 +140,91 @@ class SkillLoader:
             logger.info("Built skill index with %d skills", len(self._index))
             return len(self._index)
 
+    def _scan_entries(self) -> Iterator[SkillIndexEntry]:
+        """Parse the metadata of every skill file in all storage layers.
+
+        Files that fail to parse are logged and skipped. With an index store,
+        unchanged files are served from the store and the store is updated in
+        a single transaction.
+
+        Yields:
+            SkillIndexEntry for each successfully parsed skill file
+        """
+        if self._index_store is None:
+            for storage_layer, skill_path in self._storage_manager.get_all_skill_paths():
+                try:
+                    # Parse metadata only (Stage 1)
+                    yield self._parser.parse_metadata(skill_path, storage_layer)
+                except SkillParseError as e:
+                    # Log individual parse errors but don't fail entire index
+                    logger.warning("Failed to parse skill at '%s': %s", skill_path, e.reason)
+            return
+
+        store = self._index_store
+        seen: list[tuple[Path, str]] = []
+        with store.transaction():
+            for storage_layer, skill_path, file_stat in self._storage_manager.get_all_skill_files():
+                seen.append((skill_path, storage_layer))
+                try:
+                    yield self._parse_metadata_cached(store, skill_path, storage_layer, file_stat)
+                except SkillParseError as e:
+                    logger.warning("Failed to parse skill at '%s': %s", skill_path, e.reason)
+            store.retain_files(seen)
+
+    def _parse_metadata_cached(
+        self,
+        store: SkillIndexStore,
+        skill_path: Path,
+        storage_layer: str,
+        file_stat: os.stat_result,
+    ) -> SkillIndexEntry:
+        """Parse skill metadata, reusing the index store's result if the file is unchanged.
+
+        A file is unchanged if its mtime and size match the stored record or,
+        failing that, if its content hash does.
+
+        Args:
+            store: Index store holding previous parse results
+            skill_path: Path to the SKILL.md file
+            storage_layer: Storage layer the file was found in
+            file_stat: Current stat result of the file
+
+        Returns:
+            SkillIndexEntry for the skill
+
+        Raises:
+            SkillParseError: If the file cannot be read or parsed
+        """
+        record = store.get_file(skill_path, storage_layer)
+
+        if record is None or not record.matches(file_stat):
+            try:
+                content_hash = hashlib.sha256(skill_path.read_bytes()).hexdigest()
+            except OSError:
+                # Let the parser report the read error
+                return self._parser.parse_metadata(skill_path, storage_layer)
+
+            if record is None or record.content_hash != content_hash:
+                logger.debug("Parsing changed skill file '%s'", skill_path)
+                record = SkillFileRecord(
+                    mtime_ns=file_stat.st_mtime_ns,
+                    size=file_stat.st_size,
+                    content_hash=content_hash,
+                )
+                try:
+                    record.entry = self._parser.parse_metadata(skill_path, storage_layer)
+                except SkillParseError as e:
+                    record.error = e.reason
+            else:
+                record.mtime_ns = file_stat.st_mtime_ns
+                record.size = file_stat.st_size
+
+            store.put_file(skill_path, storage_layer, record)
+
+        if record.entry is None:
+            raise SkillParseError(str(skill_path), record.error or "Invalid skill file")
+        return record.entry
+
     def list_skills(self) -> list[SkillIndexEntry]:
         """Get sorted list of all indexed skills.
 
@@ -4,11 +4,15 @@ This module implements the storage configuration and management system that
 handles skill discovery across enterprise, personal, project, and plugin layers.
 """
 
+import os
+import stat
 from pathlib import Path
 from typing import Iterator, Optional
 
 from pydantic import BaseModel, ConfigDict
 
+from omniforge.skills.index_store import SkillIndexStore
+
 
 class StorageConfig(BaseModel):
     """Configuration for skill storage locations.
@@ -20,12 +24,15 @@ class StorageConfig(BaseModel):
         personal_path: Optional path to user's personal skills
         project_path: Optional path to project-specific skills
         plugin_paths: List of paths to plugin-provided skills
+        index_path: Optional SQLite file for the persistent skill index
+            (see omniforge.skills.index_store)
     """
 
     enterprise_path: Optional[Path] = None
     personal_path: Optional[Path] = None
     project_path: Optional[Path] = None
     plugin_paths: list[Path] = []
+    index_path: Optional[Path] = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -34,7 +41,8 @@ class StorageConfig(BaseModel):
         """Create storage configuration with default environment paths.
 
         Creates a default configuration using standard .omniforge directory
-        locations for each storage layer.
+        locations for each storage layer. The persistent skill index is
+        enabled when OMNIFORGE_SKILL_INDEX_PATH is set.
 
         Args:
             project_root: Optional project root directory for project-level skills.
@@ -44,12 +52,14 @@ class StorageConfig(BaseModel):
             StorageConfig with default paths configured
         """
         home = Path.home()
+        index_path = os.getenv("OMNIFORGE_SKILL_INDEX_PATH")
 
         return cls(
             enterprise_path=home / ".omniforge" / "enterprise" / "skills",
             personal_path=home / ".omniforge" / "skills",
             project_path=project_root / ".omniforge" / "skills" if project_root else None,
             plugin_paths=[],
+            index_path=Path(index_path).expanduser() if index_path else None,
         )
 
 
@@ -65,13 +75,18 @@ class SkillStorageManager:
 
     LAYER_ORDER = ["enterprise", "personal", "project", "plugin"]
 
-    def __init__(self, config: StorageConfig) -> None:
+    def __init__(
+        self, config: StorageConfig, index_store: Optional[SkillIndexStore] = None
+    ) -> None:
         """Initialize storage manager with configuration.
 
         Args:
             config: Storage configuration defining layer paths
+            index_store: Optional persistent store used to skip listing layer
+                directories that have not changed since the last scan
         """
         self._config = config
+        self._index_store = index_store
 
     def get_all_skill_paths(self) -> Iterator[tuple[str, Path]]:
         """Get all skill paths across all layers in priority order.
@@ -91,6 +106,18 @@ class SkillStorageManager:
             enterprise: /home/user/.omniforge/enterprise/skills/debug-agent/SKILL.md
             personal: /home/user/.omniforge/skills/my-skill/SKILL.md
         """
+        for storage_layer, skill_path, _ in self.get_all_skill_files():
+            yield (storage_layer, skill_path)
+
+    def get_all_skill_files(self) -> Iterator[tuple[str, Path, os.stat_result]]:
+        """Get all skill files across all layers in priority order, with their stat results.
+
+        Same as get_all_skill_paths(), but also yields the stat result of each
+        SKILL.md so callers can validate cached metadata without another stat.
+
+        Yields:
+            Tuple of (storage_layer, skill_path, stat_result)
+        """
         # Enterprise layer
         if self._config.enterprise_path:
             yield from self._scan_directory("enterprise", self._config.enterprise_path)
@@ -107,18 +134,23 @@ class SkillStorageManager:
         for plugin_path in self._config.plugin_paths:
             yield from self._scan_directory("plugin", plugin_path)
 
-    def _scan_directory(self, layer: str, base_path: Path) -> Iterator[tuple[str, Path]]:
+    def _scan_directory(
+        self, layer: str, base_path: Path
+    ) -> Iterator[tuple[str, Path, os.stat_result]]:
         """Scan a directory for SKILL.md files in immediate subdirectories.
 
         Looks for SKILL.md files only in the immediate subdirectories of the
         base path (not recursive). Silently skips if the directory doesn't exist.
+        With an index store, the subdirectory listing is reused while the base
+        directory's mtime is unchanged (adding, removing or renaming a
+        subdirectory updates it).
 
         Args:
             layer: Storage layer identifier
             base_path: Base directory path to scan
 
         Yields:
-            Tuple of (storage_layer, skill_path) for each found SKILL.md file
+            Tuple of (storage_layer, skill_path, stat_result) for each found SKILL.md file
 
         Example:
             Given directory structure:
@@ -128,19 +160,35 @@ class SkillStorageManager:
                   skill-c/nested/SKILL.md  # NOT included (not immediate)
 
             Will yield:
-                ("layer", Path("/base/skill-a/SKILL.md"))
-                ("layer", Path("/base/skill-b/SKILL.md"))
+                ("layer", Path("/base/skill-a/SKILL.md"), <stat_result>)
+                ("layer", Path("/base/skill-b/SKILL.md"), <stat_result>)
         """
         # Skip if directory doesn't exist
-        if not base_path.exists() or not base_path.is_dir():
+        try:
+            base_stat = os.stat(base_path)
+        except OSError:
+            return
+        if not stat.S_ISDIR(base_stat.st_mode):
             return
 
-        # Scan immediate subdirectories for SKILL.md
-        for item in base_path.iterdir():
-            if item.is_dir():
-                skill_file = item / "SKILL.md"
-                if skill_file.exists() and skill_file.is_file():
-                    yield (layer, skill_file)
+        subdirectories = None
+        if self._index_store is not None:
+            subdirectories = self._index_store.get_directory(base_path, base_stat.st_mtime_ns)
+        if subdirectories is None:
+            with os.scandir(base_path) as entries:
+                subdirectories = [entry.name for entry in entries if entry.is_dir()]
+            if self._index_store is not None:
+                self._index_store.put_directory(base_path, base_stat.st_mtime_ns, subdirectories)
+
+        # Check immediate subdirectories for SKILL.md
+        for name in subdirectories:
+            skill_file = base_path / name / "SKILL.md"
+            try:
+                file_stat = os.stat(skill_file)
+            except OSError:
+                continue
+            if stat.S_ISREG(file_stat.st_mode):
+                yield (layer, skill_file, file_stat)
 
     def get_layer_priority(self, layer: str) -> int:
         """Get the priority value for a storage layer.
@@ -0,0 +1,211 @@
+"""Agent repository stored in the shared SQLite state file.
+
+Agents are live objects, so they cannot be shared between worker processes
+as they are. The agents the platform registers at runtime (see
+CreateAgentTool) are SimpleAutonomousAgents fully described by their card
+and a few constructor arguments, so this repository stores that description
+and rebuilds an equivalent agent in each process that reads it.
+"""
+
+import json
+import re
+from typing import Any, Optional
+
+from omniforge.agents.base import BaseAgent
+from omniforge.agents.models import AgentCapabilities, AgentIdentity, AgentSkill
+from omniforge.storage.shared_state import SQLiteStateStore
+
+
+class SQLiteAgentRepository:
+    """AgentRepository whose agents are visible to every process sharing the store.
+
+    Only agents that can be rebuilt from their description are accepted:
+    instances of SimpleAutonomousAgent (or subclasses that do not override
+    its constructor). Rebuilt agents are cached per process and reused until
+    the stored description changes, so per-instance state survives between
+    calls within a worker.
+
+    Example:
+        >>> repo = SQLiteAgentRepository(SQLiteStateStore("./state.db"))
+        >>> await repo.save(agent)
+        >>> same_agent_elsewhere = await repo.get(agent.identity.id)
+    """
+
+    def __init__(self, store: SQLiteStateStore, namespace: str = "agents") -> None:
+        """Initialize the repository.
+
+        Args:
+            store: Shared state store
+            namespace: Store namespace holding this repository's agents
+        """
+        self._store = store
+        self._namespace = namespace
+        # agent_id -> (stored description, rebuilt agent)
+        self._agents: dict[str, tuple[dict[str, Any], BaseAgent]] = {}
+
+    async def get(self, agent_id: str) -> Optional[BaseAgent]:
+        """Retrieve an agent by ID.
+
+        Args:
+            agent_id: Unique identifier of the agent
+
+        Returns:
+            BaseAgent object if found, None otherwise
+        """
+        spec = await self._store.run(self._store.get, self._namespace, agent_id)
+        if spec is None:
+            self._agents.pop(agent_id, None)
+            return None
+        return self._materialize(agent_id, spec)
+
+    async def save(self, agent: BaseAgent) -> None:
+        """Save a new agent.
+
+        Args:
+            agent: BaseAgent object to save
+
+        Raises:
+            ValueError: If agent with same ID already exists, or the agent
+                cannot be rebuilt from a stored description
+        """
+        agent_id = agent.identity.id
+        spec = _describe(agent)
+        await self._store.run(self._write, agent_id, spec, exists=False)
+        self._agents[agent_id] = (spec, agent)
+
+    async def update(self, agent: BaseAgent) -> None:
+        """Update an existing agent.
+
+        Args:
+            agent: BaseAgent object with updated data
+
+        Raises:
+            ValueError: If agent does not exist or cannot be stored
+        """
+        agent_id = agent.identity.id
+        spec = _describe(agent)
+        await self._store.run(self._write, agent_id, spec, exists=True)
+        self._agents[agent_id] = (spec, agent)
+
+    async def delete(self, agent_id: str) -> None:
+        """Delete an agent by ID.
+
+        Args:
+            agent_id: Unique identifier of the agent to delete
+
+        Raises:
+            ValueError: If agent does not exist
+        """
+        await self._store.run(self._write, agent_id, None, exists=True)
+        self._agents.pop(agent_id, None)
+
+    async def list_all(self, limit: int = 100) -> list[BaseAgent]:
+        """List all agents.
+
+        Args:
+            limit: Maximum number of agents to return (default: 100)
+
+        Returns:
+            List of all agents, ordered by registration time
+        """
+        items = (await self._store.run(self._store.items, self._namespace))[: max(limit, 0)]
+        return [self._materialize(agent_id, spec) for agent_id, spec in items]
+
+    async def list_by_tenant(self, tenant_id: str, limit: int = 100) -> list[BaseAgent]:
+        """List agents for a specific tenant.
+
+        Args:
+            tenant_id: Tenant identifier to filter by
+            limit: Maximum number of agents to return (default: 100)
+
+        Returns:
+            List of agents for the specified tenant, ordered by registration time
+        """
+        items = [
+            (agent_id, spec)
+            for agent_id, spec in await self._store.run(self._store.items, self._namespace)
+            if spec.get("tenant_id") == tenant_id
+        ]
+        return [self._materialize(agent_id, spec) for agent_id, spec in items[: max(limit, 0)]]
+
+    def _write(self, agent_id: str, spec: Optional[dict[str, Any]], exists: bool) -> None:
+        """Store (or with spec None, delete) a description if the agent's existence matches.
+
+        Raises:
+            ValueError: If the agent exists and exists is False, or vice versa
+        """
+        with self._store.transaction() as store:
+            found = store.get(self._namespace, agent_id) is not None
+            if found and not exists:
+                raise ValueError(f"Agent with ID {agent_id} already exists")
+            if exists and not found:
+                raise ValueError(f"Agent with ID {agent_id} does not exist")
+            if spec is None:
+                store.delete(self._namespace, agent_id)
+            else:
+                store.set(self._namespace, agent_id, spec)
+
+    def _materialize(self, agent_id: str, spec: dict[str, Any]) -> BaseAgent:
+        """Return this process's agent for a description, rebuilding it if changed."""
+        cached = self._agents.get(agent_id)
+        if cached is not None and cached[0] == spec:
+            return cached[1]
+        agent = _build(spec)
+        self._agents[agent_id] = (spec, agent)
+        return agent
+
+
+def _describe(agent: BaseAgent) -> dict[str, Any]:
+    """Describe an agent as JSON-serializable constructor arguments and card.
+
+    Raises:
+        ValueError: If the agent cannot be rebuilt from a description
+    """
+    from omniforge.agents.autonomous_simple import SimpleAutonomousAgent
+
+    if not isinstance(agent, SimpleAutonomousAgent) or (
+        type(agent).__init__ is not SimpleAutonomousAgent.__init__
+    ):
+        raise ValueError(
+            f"Agent {agent.identity.id} ({type(agent).__name__}) cannot be stored in a "
+            "shared repository; only SimpleAutonomousAgent-based agents are supported"
+        )
+
+    spec = {
+        "identity": agent.identity.model_dump(mode="json"),
+        "capabilities": agent.capabilities.model_dump(mode="json"),
+        "skills": [skill.model_dump(mode="json") for skill in agent.skills],
+        "system_prompt": agent._custom_system_prompt,
+        "max_iterations": agent._max_iterations,
+        "model": agent._model,
+        "temperature": agent._temperature,
+        "tenant_id": agent.tenant_id,
+    }
+    # Round-trip so cached specs compare equal to the ones read back from the store
+    result: dict[str, Any] = json.loads(json.dumps(spec))
+    return result
+
+
+def _build(spec: dict[str, Any]) -> BaseAgent:
+    """Rebuild an agent from a description produced by _describe()."""
+    from omniforge.agents.autonomous_simple import SimpleAutonomousAgent
+
+    identity = AgentIdentity(**spec["identity"])
+    # Same dynamic-subclass shape CreateAgentTool uses for runtime-created agents
+    agent_class = type(
+        "Agent_" + re.sub(r"[^a-zA-Z0-9]", "_", identity.id),
+        (SimpleAutonomousAgent,),
+        {
+            "identity": identity,
+            "capabilities": AgentCapabilities(**spec["capabilities"]),
+            "skills": [AgentSkill(**skill) for skill in spec["skills"]],
+        },
+    )
+    agent: BaseAgent = agent_class(
+        system_prompt=spec["system_prompt"],
+        max_iterations=spec["max_iterations"],
+        model=spec["model"],
+        temperature=spec["temperature"],
+        tenant_id=spec["tenant_id"],
+    )
+    return agent
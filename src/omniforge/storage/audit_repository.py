@@ -12,7 +12,9 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from omniforge.enterprise.audit import AuditEvent, EventType, Outcome
+from omniforge.storage.database import Database
 from omniforge.storage.models import AuditEventModel
+from omniforge.storage.pagination import seek_after
 
 
 class AuditRepository:
@@ -21,10 +23,14 @@ class AuditRepository:
     Provides append-only storage with no update or delete operations
     to maintain immutable audit trails.
 
+    The repository works on a session owned by the caller and never commits
+    itself. Writes should be run through Database.write(), so they are
+    group-committed when the write queue is enabled.
+
     Example:
-        >>> repo = AuditRepository(session)
-        >>> await repo.save(audit_event)
-        >>> events = await repo.query(tenant_id="tenant-1")
+        >>> await db.write(lambda s: AuditRepository(s).save(audit_event))
+        >>> async with db.session() as session:
+        ...     events = await AuditRepository(session).query(tenant_id="tenant-1")
     """
 
     def __init__(self, session: AsyncSession):
@@ -89,6 +95,7 @@ class AuditRepository:
         end_time: Optional[datetime] = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> list[AuditEvent]:
         """Query audit events with filters.
 
@@ -100,10 +107,14 @@ class AuditRepository:
             start_time: Filter events after this time
             end_time: Filter events before this time
             limit: Maximum number of events to return
-            offset: Number of events to skip
+            offset: Number of events to skip, ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
 
         Returns:
             List of matching audit events
+
+        Raises:
+            ValueError: If cursor is malformed
         """
         stmt = select(AuditEventModel)
 
@@ -121,11 +132,15 @@ class AuditRepository:
         if end_time:
             stmt = stmt.where(AuditEventModel.timestamp <= end_time)
 
-        # Order by timestamp descending (newest first)
-        stmt = stmt.order_by(AuditEventModel.timestamp.desc())
+        # Order by timestamp descending (newest first), id breaks ties
+        stmt = stmt.order_by(AuditEventModel.timestamp.desc(), AuditEventModel.id.desc())
 
-        # Apply pagination
-        stmt = stmt.limit(limit).offset(offset)
+        # Apply pagination (keyset seek when a cursor is given)
+        if cursor:
+            stmt = stmt.where(seek_after(AuditEventModel.timestamp, AuditEventModel.id, cursor))
+        else:
+            stmt = stmt.offset(offset)
+        stmt = stmt.limit(limit)
 
         result = await self.session.execute(stmt)
         models = result.scalars().all()
@@ -192,3 +207,75 @@ class AuditRepository:
             ip_address=model.ip_address,
             user_agent=model.user_agent,
         )
+
+
+class DatabaseAuditRepository:
+    """Audit repository over a Database, using one short session per operation.
+
+    AuditRepository is bound to a session owned by the caller; this wrapper
+    can be shared for the lifetime of the application, e.g. by an AuditLogger.
+    Saves go through Database.write(), so audit events are group-committed
+    with other writes when the write queue is enabled.
+
+    Example:
+        >>> audit_logger = AuditLogger(DatabaseAuditRepository(db))
+    """
+
+    def __init__(self, database: Database):
+        """Initialize repository with a database.
+
+        Args:
+            database: Database holding the audit events table
+        """
+        self.database = database
+
+    async def save(self, event: AuditEvent) -> None:
+        """Save an audit event (see AuditRepository.save)."""
+        await self.database.write(lambda session: AuditRepository(session).save(event))
+
+    async def get_by_id(self, event_id: UUID) -> Optional[AuditEvent]:
+        """Retrieve an audit event by ID (see AuditRepository.get_by_id)."""
+        async with self.database.session() as session:
+            return await AuditRepository(session).get_by_id(event_id)
+
+    async def query(
+        self,
+        tenant_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> list[AuditEvent]:
+        """Query audit events with filters (see AuditRepository.query)."""
+        async with self.database.session() as session:
+            return await AuditRepository(session).query(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                agent_id=agent_id,
+                event_type=event_type,
+                start_time=start_time,
+                end_time=end_time,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+            )
+
+    async def count(
+        self,
+        tenant_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> int:
+        """Count audit events matching filters (see AuditRepository.count)."""
+        async with self.database.session() as session:
+            return await AuditRepository(session).count(
+                tenant_id=tenant_id,
+                event_type=event_type,
+                start_time=start_time,
+                end_time=end_time,
+            )
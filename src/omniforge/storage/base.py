@@ -5,13 +5,14 @@ enabling different storage backend implementations while maintaining
 a consistent interface.
 """
 
-from typing import TYPE_CHECKING, Optional, Protocol
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Optional, Protocol
 
 if TYPE_CHECKING:
     from omniforge.agents.base import BaseAgent
     from omniforge.agents.models import Artifact
 
-from omniforge.tasks.models import Task
+from omniforge.tasks.models import Task, TaskState, TaskSummary
 
 
 class TaskRepository(Protocol):
@@ -54,6 +55,21 @@ class TaskRepository(Protocol):
         """
         ...
 
+    async def append_changes(self, task_id: str, changes: list[dict[str, Any]]) -> None:
+        """Append incremental change sets to a task.
+
+        Cheaper than update() while streaming: only the new state and the
+        appended messages/artifacts are written (see omniforge.storage.task_events).
+
+        Args:
+            task_id: Unique identifier of the task
+            changes: Change sets produced by task_events.diff_task, in order
+
+        Raises:
+            ValueError: If task does not exist
+        """
+        ...
+
     async def delete(self, task_id: str) -> None:
         """Delete a task by ID.
 
@@ -90,17 +106,25 @@ class TaskRepository(Protocol):
         ...
 
     async def list_by_tenant(
-        self, tenant_id: str, limit: int = 100, offset: int = 0
+        self,
+        tenant_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> list[Task]:
         """List tasks for a specific tenant with pagination.
 
         Args:
             tenant_id: Tenant identifier to filter by
             limit: Maximum number of tasks to return (default: 100)
-            offset: Number of tasks to skip (default: 0)
+            offset: Number of tasks to skip (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
 
         Returns:
-            List of tasks for the tenant, ordered by created_at desc
+            List of tasks for the tenant, ordered by (created_at, id) desc
+
+        Raises:
+            ValueError: If cursor is malformed
         """
         ...
 
@@ -119,6 +143,43 @@ class TaskRepository(Protocol):
         """
         ...
 
+    async def list_summaries(
+        self,
+        tenant_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        state: Optional[TaskState] = None,
+        skill_name: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> list[TaskSummary]:
+        """List task summaries matching all given filters, without loading messages.
+
+        Filters are applied before pagination, so every page except the last
+        one is full.
+
+        Args:
+            tenant_id: Tenant identifier to filter by
+            agent_id: Agent identifier to filter by
+            state: Only tasks in this state
+            skill_name: Only tasks for this skill
+            created_after: Only tasks created after this time
+            created_before: Only tasks created before this time
+            limit: Maximum number of summaries to return (default: 100)
+            offset: Number of summaries to skip (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
+
+        Returns:
+            Task summaries ordered by (created_at, id) desc
+
+        Raises:
+            ValueError: If neither tenant_id nor agent_id is given, or the
+                cursor is malformed
+        """
+        ...
+
 
 class AgentRepository(Protocol):
     """Protocol for agent storage operations.
@@ -1,17 +1,19 @@
 """Repository for reasoning chain persistence.
 
 This module provides the repository interface for storing and retrieving
-reasoning chains and their steps.
+reasoning chains and their steps. Long chains can be read a page of steps
+at a time with get_steps(), which seeks on the (chain_id, step_number) index
+instead of loading every step.
 """
 
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
 
-from omniforge.agents.cot.chain import ReasoningChain, ReasoningStep
+from omniforge.agents.cot.chain import ReasoningChain, ReasoningStep, StepType
 from omniforge.storage.models import ReasoningChainModel, ReasoningStepModel
 
 
@@ -21,10 +23,14 @@ class ChainRepository:
     Handles conversion between Pydantic domain models and SQLAlchemy
     ORM models, providing async CRUD operations.
 
+    The repository works on a session owned by the caller and never commits
+    itself. Writes should be run through Database.write(), so they are
+    group-committed when the write queue is enabled.
+
     Example:
-        >>> repo = ChainRepository(session)
-        >>> await repo.save(chain)
-        >>> retrieved = await repo.get_by_id(chain.id)
+        >>> await db.write(lambda s: ChainRepository(s).save(chain))
+        >>> async with db.session() as session:
+        ...     retrieved = await ChainRepository(session).get_by_id(chain.id)
     """
 
     def __init__(self, session: AsyncSession):
@@ -63,20 +69,29 @@ class ChainRepository:
         self.session.add(chain_model)
         await self.session.flush()
 
-    async def get_by_id(self, chain_id: UUID) -> Optional[ReasoningChain]:
+    async def get_by_id(
+        self, chain_id: UUID, include_steps: bool = True
+    ) -> Optional[ReasoningChain]:
         """Retrieve a chain by its ID.
 
         Args:
             chain_id: Chain identifier
+            include_steps: Whether to load the chain's steps (default: True);
+                pass False to read only the chain's metadata
 
         Returns:
             Reasoning chain if found, None otherwise
         """
-        # Query with eager loading of steps
+        # Query with eager loading of steps, unless only metadata is needed
+        steps_option = (
+            selectinload(ReasoningChainModel.steps)
+            if include_steps
+            else noload(ReasoningChainModel.steps)
+        )
         stmt = (
             select(ReasoningChainModel)
             .where(ReasoningChainModel.id == str(chain_id))
-            .options(selectinload(ReasoningChainModel.steps))
+            .options(steps_option)
         )
         result = await self.session.execute(stmt)
         chain_model = result.scalar_one_or_none()
@@ -84,7 +99,61 @@ class ChainRepository:
         if not chain_model:
             return None
 
-        return self._model_to_chain(chain_model)
+        return self._model_to_chain(chain_model, include_steps)
+
+    async def get_steps(
+        self,
+        chain_id: UUID,
+        cursor: Optional[int] = None,
+        limit: int = 100,
+        types: Optional[Sequence[StepType]] = None,
+    ) -> list[ReasoningStep]:
+        """Retrieve a page of a chain's steps in step order.
+
+        Only the requested step rows are read: the query seeks past the
+        cursor on the (chain_id, step_number) index.
+
+        Args:
+            chain_id: Chain identifier
+            cursor: Step number of the last step already read (None to start
+                at the first step)
+            limit: Maximum number of steps to return
+            types: Optional step types to restrict the page to
+
+        Returns:
+            Up to limit steps with step numbers greater than cursor
+        """
+        stmt = select(ReasoningStepModel).where(ReasoningStepModel.chain_id == str(chain_id))
+        if cursor is not None:
+            stmt = stmt.where(ReasoningStepModel.step_number > cursor)
+        if types:
+            stmt = stmt.where(ReasoningStepModel.type.in_([t.value for t in types]))
+        stmt = stmt.order_by(ReasoningStepModel.step_number).limit(limit)
+
+        result = await self.session.execute(stmt)
+        return [self._model_to_step(model) for model in result.scalars().all()]
+
+    async def count_steps(
+        self, chain_id: UUID, types: Optional[Sequence[StepType]] = None
+    ) -> int:
+        """Count a chain's stored steps without loading them.
+
+        Args:
+            chain_id: Chain identifier
+            types: Optional step types to count
+
+        Returns:
+            Number of stored steps (before any visibility filtering)
+        """
+        stmt = (
+            select(func.count())
+            .select_from(ReasoningStepModel)
+            .where(ReasoningStepModel.chain_id == str(chain_id))
+        )
+        if types:
+            stmt = stmt.where(ReasoningStepModel.type.in_([t.value for t in types]))
+        result = await self.session.execute(stmt)
+        return int(result.scalar_one())
 
     async def get_by_task(self, task_id: str) -> list[ReasoningChain]:
         """Retrieve all chains for a task.
@@ -178,25 +247,19 @@ class ChainRepository:
             cost=step.cost,
         )
 
-    def _model_to_chain(self, model: ReasoningChainModel) -> ReasoningChain:
+    def _model_to_chain(
+        self, model: ReasoningChainModel, include_steps: bool = True
+    ) -> ReasoningChain:
         """Convert ORM model to Pydantic chain.
 
         Args:
             model: ORM chain model
+            include_steps: Whether to convert the model's steps
 
         Returns:
             Reasoning chain
         """
-        from omniforge.agents.cot.chain import (
-            ChainMetrics,
-            ChainStatus,
-            StepType,
-            SynthesisInfo,
-            ThinkingInfo,
-            ToolCallInfo,
-            ToolResultInfo,
-            VisibilityConfig,
-        )
+        from omniforge.agents.cot.chain import ChainMetrics, ChainStatus
 
         # Reconstruct chain
         chain = ReasoningChain(
@@ -212,26 +275,45 @@ class ChainRepository:
             steps=[],  # Add steps separately
         )
 
+        if not include_steps:
+            return chain
+
         # Reconstruct steps (already ordered by step_number due to relationship)
         for step_model in model.steps:
-            step = ReasoningStep(
-                id=UUID(step_model.id),
-                step_number=step_model.step_number,
-                type=StepType(step_model.type),
-                timestamp=step_model.timestamp,
-                parent_step_id=UUID(step_model.parent_step_id) if step_model.parent_step_id else None,
-                visibility=VisibilityConfig(**step_model.visibility),
-                thinking=ThinkingInfo(**step_model.thinking) if step_model.thinking else None,
-                tool_call=ToolCallInfo(**step_model.tool_call) if step_model.tool_call else None,
-                tool_result=(
-                    ToolResultInfo(**step_model.tool_result) if step_model.tool_result else None
-                ),
-                synthesis=(
-                    SynthesisInfo(**step_model.synthesis) if step_model.synthesis else None
-                ),
-                tokens_used=step_model.tokens_used,
-                cost=step_model.cost,
-            )
-            chain.steps.append(step)
+            chain.steps.append(self._model_to_step(step_model))
 
         return chain
+
+    def _model_to_step(self, step_model: ReasoningStepModel) -> ReasoningStep:
+        """Convert ORM step model to Pydantic step.
+
+        Args:
+            step_model: ORM step model
+
+        Returns:
+            Reasoning step
+        """
+        from omniforge.agents.cot.chain import (
+            SynthesisInfo,
+            ThinkingInfo,
+            ToolCallInfo,
+            ToolResultInfo,
+            VisibilityConfig,
+        )
+
+        return ReasoningStep(
+            id=UUID(step_model.id),
+            step_number=step_model.step_number,
+            type=StepType(step_model.type),
+            timestamp=step_model.timestamp,
+            parent_step_id=UUID(step_model.parent_step_id) if step_model.parent_step_id else None,
+            visibility=VisibilityConfig(**step_model.visibility),
+            thinking=ThinkingInfo(**step_model.thinking) if step_model.thinking else None,
+            tool_call=ToolCallInfo(**step_model.tool_call) if step_model.tool_call else None,
+            tool_result=(
+                ToolResultInfo(**step_model.tool_result) if step_model.tool_result else None
+            ),
+            synthesis=SynthesisInfo(**step_model.synthesis) if step_model.synthesis else None,
+            tokens_used=step_model.tokens_used,
+            cost=step_model.cost,
+        )
@@ -5,13 +5,34 @@ and the declarative base for ORM models.
 """
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional, TypeVar
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker
 
 from omniforge.storage.base_model import Base
+from omniforge.storage.write_queue import WriteQueue
+
+T = TypeVar("T")
+
+# Pragmas applied to every new SQLite connection. WAL lets readers proceed
+# while a write is in progress, and synchronous=NORMAL only fsyncs the WAL at
+# checkpoints, which is safe in WAL mode (a crash may lose the last commits
+# but never corrupts the database).
+DEFAULT_SQLITE_PRAGMAS: dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "temp_store": "MEMORY",
+    "cache_size": -16000,  # Negative values are KiB, i.e. 16 MiB
+}
 
 
 class DatabaseConfig:
@@ -22,6 +43,12 @@ class DatabaseConfig:
         echo: Whether to log SQL statements (default: False)
         pool_size: Connection pool size (default: 5)
         max_overflow: Maximum overflow connections (default: 10)
+        sqlite_pragmas: Pragmas applied on each SQLite connection (default:
+            DEFAULT_SQLITE_PRAGMAS; pass an empty dict to disable)
+        write_queue: Whether Database.write() group-commits writes through a
+            single writer task (default: False)
+        write_batch_window: Seconds the writer waits to gather a batch (default: 2ms)
+        write_max_batch: Maximum writes per group commit (default: 128)
     """
 
     def __init__(
@@ -30,11 +57,21 @@ class DatabaseConfig:
         echo: bool = False,
         pool_size: int = 5,
         max_overflow: int = 10,
+        sqlite_pragmas: Optional[dict[str, Any]] = None,
+        write_queue: bool = False,
+        write_batch_window: float = 0.002,
+        write_max_batch: int = 128,
     ):
         self.url = url
         self.echo = echo
         self.pool_size = pool_size
         self.max_overflow = max_overflow
+        self.sqlite_pragmas = (
+            dict(DEFAULT_SQLITE_PRAGMAS) if sqlite_pragmas is None else sqlite_pragmas
+        )
+        self.write_queue = write_queue
+        self.write_batch_window = write_batch_window
+        self.write_max_batch = write_max_batch
 
 
 class Database:
@@ -77,21 +114,41 @@ class Database:
             self.session_factory = sessionmaker(self.engine, expire_on_commit=False)
             self.is_async = False
 
+        if "sqlite" in config.url and config.sqlite_pragmas:
+            sync_engine = (
+                self.engine.sync_engine if isinstance(self.engine, AsyncEngine) else self.engine
+            )
+            _install_sqlite_pragmas(sync_engine, config.sqlite_pragmas)
+
+        self.write_queue: Optional[WriteQueue] = None
+        if config.write_queue and self.is_async:
+            self.write_queue = WriteQueue(
+                self.session_factory,
+                batch_window=config.write_batch_window,
+                max_batch=config.write_max_batch,
+            )
+
     async def create_tables(self) -> None:
         """Create all tables defined in ORM models.
 
         Calls register_all_models() to ensure all ORM model modules are imported
-        before creating tables, preventing incomplete schema creation.
+        before creating tables, preventing incomplete schema creation. Tables
+        created by earlier versions are first upgraded with the columns and
+        indexes added since (see omniforge.storage.migrations).
         """
+        from omniforge.storage.migrations import upgrade_schema
         from omniforge.storage.model_registry import register_all_models
 
         register_all_models()
 
         if self.is_async:
             async with self.engine.begin() as conn:
+                await conn.run_sync(upgrade_schema)
                 await conn.run_sync(Base.metadata.create_all)
         else:
-            Base.metadata.create_all(self.engine)
+            with self.engine.begin() as conn:
+                upgrade_schema(conn)
+                Base.metadata.create_all(conn)
 
     async def drop_tables(self) -> None:
         """Drop all tables defined in ORM models.
@@ -135,8 +192,32 @@ class Database:
             finally:
                 session.close()
 
+    async def write(self, operation: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """Run a write operation and return once it has been committed.
+
+        With the write queue enabled, the operation is group-committed together
+        with concurrent writes from other repositories; otherwise it runs in
+        its own session. Session-bound repositories can be used inside the
+        operation, e.g. ``await db.write(lambda s: AuditRepository(s).save(event))``.
+
+        The operation may be re-run after a rolled-back batch, so it must only
+        touch the database through the given session.
+
+        Args:
+            operation: Async callable performing the write with the given session
+
+        Returns:
+            The operation's return value
+        """
+        if self.write_queue is not None:
+            return await self.write_queue.submit(operation)
+        async with self.session() as session:
+            return await operation(session)
+
     async def close(self) -> None:
-        """Close database engine and connections."""
+        """Flush pending writes and close database engine and connections."""
+        if self.write_queue is not None:
+            await self.write_queue.close()
         if self.is_async:
             await self.engine.dispose()
         else:
@@ -158,3 +239,21 @@ class Database:
             with self.engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
         return True
+
+
+def _install_sqlite_pragmas(engine: Engine, pragmas: dict[str, Any]) -> None:
+    """Apply PRAGMA settings to every new SQLite connection of an engine.
+
+    Args:
+        engine: Sync engine (use ``AsyncEngine.sync_engine`` for async engines)
+        pragmas: Mapping of pragma name to value
+    """
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
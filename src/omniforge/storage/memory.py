@@ -2,15 +2,71 @@
 
 This module provides thread-safe, dictionary-based storage implementations
 for tasks and agents, suitable for development and testing.
+
+Task and agent lists are served from secondary indexes maintained on every
+write, so listing cost depends on the size of the result rather than on the
+number of stored records. Writes are serialized by a lock; reads never await
+and therefore see a consistent state without taking it.
 """
 
 import asyncio
-from typing import Optional
+from bisect import bisect_left, insort
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Hashable, Optional
 from uuid import uuid4
 
 from omniforge.agents.base import BaseAgent
 from omniforge.agents.models import Artifact
-from omniforge.tasks.models import Task
+from omniforge.storage.pagination import decode_cursor, keyset_key
+from omniforge.storage.task_events import apply_changes
+from omniforge.tasks.models import Task, TaskState, TaskSummary
+
+_IndexEntry = tuple[datetime, str]
+
+
+class _TaskIndex:
+    """Task IDs grouped by an index key, each group ordered by (created_at, id).
+
+    Attributes:
+        key: Function returning a task's index key, or None to leave it unindexed
+    """
+
+    def __init__(self, key: Callable[[Task], Optional[Hashable]]) -> None:
+        """Initialize an empty index.
+
+        Args:
+            key: Function returning a task's index key, or None to leave it unindexed
+        """
+        self.key = key
+        self._groups: dict[Hashable, list[_IndexEntry]] = {}
+
+    def add(self, task: Task) -> None:
+        """Index a task."""
+        key = self.key(task)
+        if key is not None:
+            insort(self._groups.setdefault(key, []), keyset_key(task.created_at, task.id))
+
+    def remove(self, task: Task) -> None:
+        """Remove a task from the index."""
+        key = self.key(task)
+        group = self._groups.get(key) if key is not None else None
+        if not group:
+            return
+        entry = keyset_key(task.created_at, task.id)
+        i = bisect_left(group, entry)
+        if i < len(group) and group[i] == entry:
+            del group[i]
+        if not group:
+            del self._groups[key]
+
+    def clear(self) -> None:
+        """Remove all tasks from the index."""
+        self._groups.clear()
+
+    def group(self, key: Hashable) -> list[_IndexEntry]:
+        """Return the entries of a key, oldest first (do not modify)."""
+        return self._groups.get(key, [])
 
 
 class InMemoryTaskRepository:
@@ -21,13 +77,22 @@ class InMemoryTaskRepository:
 
     Attributes:
         _tasks: Dictionary mapping task_id to Task objects
-        _lock: Asyncio lock for thread-safe operations
+        _lock: Asyncio lock serializing writes
+        _by_agent: Index of tasks by agent_id
+        _by_tenant: Index of tasks by tenant_id
+        _by_skill: Index of tasks by (tenant_id, skill_name)
+        _by_parent: Index of tasks by parent_task_id
     """
 
     def __init__(self) -> None:
         """Initialize the in-memory task repository."""
         self._tasks: dict[str, Task] = {}
         self._lock = asyncio.Lock()
+        self._by_agent = _TaskIndex(lambda t: t.agent_id)
+        self._by_tenant = _TaskIndex(lambda t: t.tenant_id)
+        self._by_skill = _TaskIndex(lambda t: (t.tenant_id, t.skill_name) if t.skill_name else None)
+        self._by_parent = _TaskIndex(lambda t: t.parent_task_id)
+        self._indexes = (self._by_agent, self._by_tenant, self._by_skill, self._by_parent)
 
     async def get(self, task_id: str) -> Optional[Task]:
         """Retrieve a task by ID.
@@ -38,8 +103,7 @@ class InMemoryTaskRepository:
         Returns:
             Task object if found, None otherwise
         """
-        async with self._lock:
-            return self._tasks.get(task_id)
+        return self._tasks.get(task_id)
 
     async def save(self, task: Task) -> None:
         """Save a new task.
@@ -54,6 +118,8 @@ class InMemoryTaskRepository:
             if task.id in self._tasks:
                 raise ValueError(f"Task with ID {task.id} already exists")
             self._tasks[task.id] = task
+            for index in self._indexes:
+                index.add(task)
 
     async def update(self, task: Task) -> None:
         """Update an existing task.
@@ -67,7 +133,22 @@ class InMemoryTaskRepository:
         async with self._lock:
             if task.id not in self._tasks:
                 raise ValueError(f"Task with ID {task.id} does not exist")
-            self._tasks[task.id] = task
+            self._replace(task)
+
+    async def append_changes(self, task_id: str, changes: list[dict[str, Any]]) -> None:
+        """Apply incremental change sets to a stored task.
+
+        Args:
+            task_id: Unique identifier of the task
+            changes: Change sets produced by task_events.diff_task, in order
+
+        Raises:
+            ValueError: If task does not exist
+        """
+        async with self._lock:
+            if task_id not in self._tasks:
+                raise ValueError(f"Task with ID {task_id} does not exist")
+            self._replace(apply_changes(self._tasks[task_id], changes))
 
     async def delete(self, task_id: str) -> None:
         """Delete a task by ID.
@@ -81,7 +162,16 @@ class InMemoryTaskRepository:
         async with self._lock:
             if task_id not in self._tasks:
                 raise ValueError(f"Task with ID {task_id} does not exist")
-            del self._tasks[task_id]
+            task = self._tasks.pop(task_id)
+            for index in self._indexes:
+                index.remove(task)
+
+    async def clear(self) -> None:
+        """Delete all tasks."""
+        async with self._lock:
+            self._tasks.clear()
+            for index in self._indexes:
+                index.clear()
 
     async def list_by_agent(self, agent_id: str, limit: int = 100) -> list[Task]:
         """List tasks for a specific agent.
@@ -93,11 +183,8 @@ class InMemoryTaskRepository:
         Returns:
             List of tasks for the specified agent, ordered by created_at desc
         """
-        async with self._lock:
-            agent_tasks = [task for task in self._tasks.values() if task.agent_id == agent_id]
-            # Sort by created_at descending (most recent first)
-            agent_tasks.sort(key=lambda t: t.created_at, reverse=True)
-            return agent_tasks[:limit]
+        entries = reversed(self._by_agent.group(agent_id))
+        return self._resolve(islice(entries, max(limit, 0)))
 
     async def list_by_parent(self, parent_task_id: str, limit: int = 100) -> list[Task]:
         """List child tasks for a specific parent task.
@@ -107,35 +194,39 @@ class InMemoryTaskRepository:
             limit: Maximum number of tasks to return (default: 100)
 
         Returns:
-            List of tasks that have the specified parent_task_id
+            List of tasks that have the specified parent_task_id, ordered by
+            created_at asc
         """
-        async with self._lock:
-            child_tasks = [
-                task for task in self._tasks.values() if task.parent_task_id == parent_task_id
-            ]
-            # Sort by created_at ascending (order of creation)
-            child_tasks.sort(key=lambda t: t.created_at)
-            return child_tasks[:limit]
+        return self._resolve(self._by_parent.group(parent_task_id)[: max(limit, 0)])
 
     async def list_by_tenant(
-        self, tenant_id: str, limit: int = 100, offset: int = 0
+        self,
+        tenant_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> list[Task]:
         """List tasks for a specific tenant with pagination.
 
         Args:
             tenant_id: Tenant identifier to filter by
             limit: Maximum number of tasks to return (default: 100)
-            offset: Number of tasks to skip (default: 0)
+            offset: Number of tasks to skip (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
 
         Returns:
-            List of tasks for the tenant, ordered by created_at desc
+            List of tasks for the tenant, ordered by (created_at, id) desc
+
+        Raises:
+            ValueError: If cursor is malformed
         """
-        async with self._lock:
-            tenant_tasks = [
-                task for task in self._tasks.values() if task.tenant_id == tenant_id
-            ]
-            tenant_tasks.sort(key=lambda t: t.created_at, reverse=True)
-            return tenant_tasks[offset : offset + limit]
+        group = self._by_tenant.group(tenant_id)
+        limit = max(limit, 0)
+        if cursor:
+            # Entries before the cursor position come after it in descending order
+            end = bisect_left(group, keyset_key(*decode_cursor(cursor)))
+            return self._resolve(islice(reversed(group[:end]), limit))
+        return self._resolve(islice(reversed(group), offset, offset + limit))
 
     async def list_by_skill(
         self, tenant_id: str, skill_name: str, limit: int = 100
@@ -150,14 +241,96 @@ class InMemoryTaskRepository:
         Returns:
             List of tasks matching tenant and skill name, ordered by created_at desc
         """
-        async with self._lock:
-            skill_tasks = [
-                task
-                for task in self._tasks.values()
-                if task.tenant_id == tenant_id and task.skill_name == skill_name
-            ]
-            skill_tasks.sort(key=lambda t: t.created_at, reverse=True)
-            return skill_tasks[:limit]
+        entries = reversed(self._by_skill.group((tenant_id, skill_name)))
+        return self._resolve(islice(entries, max(limit, 0)))
+
+    async def list_summaries(
+        self,
+        tenant_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        state: Optional[TaskState] = None,
+        skill_name: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> list[TaskSummary]:
+        """List task summaries matching all given filters.
+
+        Reads the most selective index, seeks to the end of the requested time
+        range or cursor position, and filters while walking it newest first.
+
+        Args:
+            tenant_id: Tenant identifier to filter by
+            agent_id: Agent identifier to filter by
+            state: Only tasks in this state
+            skill_name: Only tasks for this skill
+            created_after: Only tasks created after this time
+            created_before: Only tasks created before this time
+            limit: Maximum number of summaries to return (default: 100)
+            offset: Number of summaries to skip (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
+
+        Returns:
+            Task summaries ordered by (created_at, id) desc
+
+        Raises:
+            ValueError: If neither tenant_id nor agent_id is given, or the
+                cursor is malformed
+        """
+        if tenant_id is not None and skill_name is not None:
+            group = self._by_skill.group((tenant_id, skill_name))
+        elif tenant_id is not None:
+            group = self._by_tenant.group(tenant_id)
+        elif agent_id is not None:
+            group = self._by_agent.group(agent_id)
+        else:
+            raise ValueError("tenant_id or agent_id is required")
+
+        end = len(group)
+        if created_before is not None:
+            end = bisect_left(group, keyset_key(created_before, ""))
+        if cursor:
+            end = min(end, bisect_left(group, keyset_key(*decode_cursor(cursor))))
+            offset = 0
+        after = keyset_key(created_after, "")[0] if created_after is not None else None
+
+        summaries: list[TaskSummary] = []
+        limit = max(limit, 0)
+        for i in range(end - 1, -1, -1):
+            if len(summaries) >= limit:
+                break
+            created_at, task_id = group[i]
+            if after is not None and created_at <= after:
+                break
+            task = self._tasks[task_id]
+            if (
+                (tenant_id is not None and task.tenant_id != tenant_id)
+                or (agent_id is not None and task.agent_id != agent_id)
+                or (state is not None and task.state != state)
+                or (skill_name is not None and task.skill_name != skill_name)
+            ):
+                continue
+            if offset:
+                offset -= 1
+                continue
+            summaries.append(TaskSummary.from_task(task))
+        return summaries
+
+    def _replace(self, task: Task) -> None:
+        """Store a new version of a task, reindexing it if indexed fields changed."""
+        previous = self._tasks[task.id]
+        self._tasks[task.id] = task
+        moved = previous.created_at != task.created_at
+        for index in self._indexes:
+            if moved or index.key(previous) != index.key(task):
+                index.remove(previous)
+                index.add(task)
+
+    def _resolve(self, entries: Any) -> list[Task]:
+        """Look up the tasks of index entries, in order."""
+        return [self._tasks[task_id] for _, task_id in entries]
 
 
 class InMemoryAgentRepository:
@@ -171,12 +344,14 @@ class InMemoryAgentRepository:
 
     Attributes:
         _agents: Dictionary mapping agent_id to BaseAgent objects
-        _lock: Asyncio lock for thread-safe operations
+        _by_tenant: Agents of each tenant by agent_id, in registration order
+        _lock: Asyncio lock serializing writes
     """
 
     def __init__(self) -> None:
         """Initialize the in-memory agent repository."""
         self._agents: dict[str, BaseAgent] = {}
+        self._by_tenant: dict[str, dict[str, BaseAgent]] = {}
         self._lock = asyncio.Lock()
 
     async def get(self, agent_id: str) -> Optional[BaseAgent]:
@@ -188,8 +363,7 @@ class InMemoryAgentRepository:
         Returns:
             BaseAgent object if found, None otherwise
         """
-        async with self._lock:
-            return self._agents.get(agent_id)
+        return self._agents.get(agent_id)
 
     async def save(self, agent: BaseAgent) -> None:
         """Save a new agent.
@@ -205,6 +379,7 @@ class InMemoryAgentRepository:
             if agent_id in self._agents:
                 raise ValueError(f"Agent with ID {agent_id} already exists")
             self._agents[agent_id] = agent
+            self._index(agent_id, agent)
 
     async def update(self, agent: BaseAgent) -> None:
         """Update an existing agent.
@@ -219,7 +394,12 @@ class InMemoryAgentRepository:
             agent_id = agent.identity.id
             if agent_id not in self._agents:
                 raise ValueError(f"Agent with ID {agent_id} does not exist")
+            previous = self._agents[agent_id]
             self._agents[agent_id] = agent
+            if _tenant_of(previous) != _tenant_of(agent):
+                self._unindex(agent_id, previous)
+            # Replacing keeps the agent's position within its tenant
+            self._index(agent_id, agent)
 
     async def delete(self, agent_id: str) -> None:
         """Delete an agent by ID.
@@ -233,7 +413,7 @@ class InMemoryAgentRepository:
         async with self._lock:
             if agent_id not in self._agents:
                 raise ValueError(f"Agent with ID {agent_id} does not exist")
-            del self._agents[agent_id]
+            self._unindex(agent_id, self._agents.pop(agent_id))
 
     async def list_all(self, limit: int = 100) -> list[BaseAgent]:
         """List all agents.
@@ -244,10 +424,8 @@ class InMemoryAgentRepository:
         Returns:
             List of all agents, ordered by registration time
         """
-        async with self._lock:
-            # Return agents in insertion order (dict preserves insertion order in Python 3.7+)
-            agents = list(self._agents.values())
-            return agents[:limit]
+        # Return agents in insertion order (dict preserves insertion order in Python 3.7+)
+        return list(islice(self._agents.values(), max(limit, 0)))
 
     async def list_by_tenant(self, tenant_id: str, limit: int = 100) -> list[BaseAgent]:
         """List agents for a specific tenant.
@@ -257,19 +435,37 @@ class InMemoryAgentRepository:
             limit: Maximum number of agents to return (default: 100)
 
         Returns:
-            List of agents for the specified tenant
+            List of agents for the specified tenant, ordered by registration time
 
         Note:
             This implementation assumes agents have a tenant_id attribute.
             If not present, the agent will be skipped.
         """
-        async with self._lock:
-            tenant_agents = [
-                agent
-                for agent in self._agents.values()
-                if hasattr(agent, "tenant_id") and agent.tenant_id == tenant_id
-            ]
-            return tenant_agents[:limit]
+        agents = self._by_tenant.get(tenant_id, {})
+        return list(islice(agents.values(), max(limit, 0)))
+
+    def _index(self, agent_id: str, agent: BaseAgent) -> None:
+        """Add an agent to its tenant's index."""
+        tenant_id = _tenant_of(agent)
+        if tenant_id is not None:
+            self._by_tenant.setdefault(tenant_id, {})[agent_id] = agent
+
+    def _unindex(self, agent_id: str, agent: BaseAgent) -> None:
+        """Remove an agent from its tenant's index."""
+        tenant_id = _tenant_of(agent)
+        if tenant_id is None:
+            return
+        agents = self._by_tenant.get(tenant_id)
+        if agents is None:
+            return
+        agents.pop(agent_id, None)
+        if not agents:
+            del self._by_tenant[tenant_id]
+
+
+def _tenant_of(agent: BaseAgent) -> Optional[str]:
+    """Return an agent's tenant ID, or None if it has none."""
+    return getattr(agent, "tenant_id", None)
 
 
 class InMemoryArtifactRepository:
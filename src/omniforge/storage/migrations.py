@@ -0,0 +1,120 @@
+"""Schema upgrades for databases created by earlier versions.
+
+Tables are created by ``Database.create_tables()`` with
+``Base.metadata.create_all()``, which adds missing tables but never changes
+tables that already exist. Columns added to a table after it was first
+released are therefore listed in ADDED_COLUMNS, and upgrade_schema() adds
+the ones an existing table lacks. It also creates indexes an existing table
+is missing and rebuilds those whose columns have changed.
+
+upgrade_schema() runs at the start of every create_tables() call. It only
+inspects the live schema and adds what is missing, so running it again is a
+no-op. Tables that do not exist yet are left to create_all(), which creates
+them with all their columns.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+from omniforge.storage.base_model import Base
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AddedColumn:
+    """A column added to a table after the table was first released.
+
+    The column type and nullability are taken from the ORM model.
+
+    Attributes:
+        table: Table name
+        column: Column name
+        default: SQL default for existing rows (required for NOT NULL columns)
+        backfill: Optional SQL statement run once after the column is added,
+            computing its value for existing rows
+    """
+
+    table: str
+    column: str
+    default: Optional[str] = None
+    backfill: Optional[str] = None
+
+
+# Columns added to existing tables, oldest first
+ADDED_COLUMNS: list[AddedColumn] = [
+    # Conversation message version, validating cached history across workers
+    AddedColumn("conversations", "version", default="0"),
+    # Denormalized task sizes for summaries (json_array_length exists on
+    # both SQLite and PostgreSQL)
+    AddedColumn(
+        "tasks",
+        "message_count",
+        default="0",
+        backfill="UPDATE tasks SET message_count = json_array_length(messages)",
+    ),
+    AddedColumn(
+        "tasks",
+        "artifact_count",
+        default="0",
+        backfill="UPDATE tasks SET artifact_count = json_array_length(artifacts)",
+    ),
+    # Hot/cold conversation archival
+    AddedColumn("conversations", "archived_at"),
+    AddedColumn("conversations", "rehydrated_at"),
+]
+
+
+def upgrade_schema(connection: Connection) -> list[str]:
+    """Bring tables created by earlier versions up to date with the ORM models.
+
+    Args:
+        connection: Connection to run the upgrade on, inside a transaction
+
+    Returns:
+        Names of the added columns (``table.column``) and created indexes
+    """
+    inspector = inspect(connection)
+    existing = set(inspector.get_table_names()) & set(Base.metadata.tables)
+    changes = []
+
+    for added in ADDED_COLUMNS:
+        if added.table not in existing:
+            continue
+        if added.column in {c["name"] for c in inspector.get_columns(added.table)}:
+            continue
+        column = Base.metadata.tables[added.table].c[added.column]
+        ddl = (
+            f"ALTER TABLE {added.table} ADD COLUMN {added.column} "
+            f"{column.type.compile(dialect=connection.dialect)}"
+        )
+        if added.default is not None:
+            ddl += f" DEFAULT {added.default}"
+        if not column.nullable:
+            ddl += " NOT NULL"
+        connection.execute(text(ddl))
+        if added.backfill is not None:
+            connection.execute(text(added.backfill))
+        changes.append(f"{added.table}.{added.column}")
+
+    for table_name in sorted(existing):
+        present = {
+            index["name"]: index["column_names"] for index in inspector.get_indexes(table_name)
+        }
+        for index in Base.metadata.tables[table_name].indexes:
+            if index.name in present:
+                # Indexes redefined since are rebuilt (expression indexes are kept)
+                columns = [column.name for column in index.columns]
+                if not columns or present[index.name] == columns:
+                    continue
+                index.drop(connection)
+            index.create(connection)
+            changes.append(str(index.name))
+
+    if changes:
+        logger.info(f"Upgraded database schema: added {', '.join(changes)}")
+    return changes
@@ -37,5 +37,8 @@ def register_all_models() -> None:
     # Builder models (agent configs, credentials, executions, public skills)
     from omniforge.builder.models import orm as _  # noqa: F401
 
+    # Full-text search index DDL (attached to messages and tasks tables)
+    from omniforge.storage import search as _search  # noqa: F401
+
     # Mark as registered
     _models_registered = True
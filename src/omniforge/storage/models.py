@@ -18,6 +18,7 @@ from sqlalchemy import (
     JSON,
     LargeBinary,
     String,
+    Text,
     UniqueConstraint,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -287,7 +288,7 @@ class AuditEventModel(Base):
 
     # Composite indexes for common query patterns
     __table_args__ = (
-        Index("idx_audit_tenant_timestamp", "tenant_id", "timestamp"),
+        Index("idx_audit_tenant_timestamp", "tenant_id", "timestamp", "id"),
         Index("idx_audit_event_timestamp", "event_type", "timestamp"),
         Index("idx_audit_user_timestamp", "user_id", "timestamp"),
         Index("idx_audit_agent_timestamp", "agent_id", "timestamp"),
@@ -350,6 +351,8 @@ class TaskModel(Base):
         messages: Conversation history (JSON)
         artifacts: Produced artifacts (JSON)
         error: Error information if failed (JSON)
+        message_count: Number of messages, so listings need not decode messages
+        artifact_count: Number of artifacts, so listings need not decode artifacts
         created_at: Creation timestamp
         updated_at: Last update timestamp
     """
@@ -381,19 +384,77 @@ class TaskModel(Base):
     artifacts: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
     error: Mapped[dict] = mapped_column(JSON, nullable=True)
 
+    # Denormalized sizes of the JSON data for task summaries
+    message_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    artifact_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
-    # Composite indexes for common query patterns
+    # Composite indexes for common query patterns; filtered listings seek on
+    # the filter columns and read rows already in (created_at, id) order
     __table_args__ = (
-        Index("idx_task_tenant_created", "tenant_id", "created_at"),
-        Index("idx_task_tenant_skill", "tenant_id", "skill_name"),
-        Index("idx_task_tenant_state", "tenant_id", "state"),
+        Index("idx_task_tenant_created", "tenant_id", "created_at", "id"),
+        Index("idx_task_tenant_skill_created", "tenant_id", "skill_name", "created_at", "id"),
+        Index("idx_task_tenant_state_created", "tenant_id", "state", "created_at", "id"),
+        Index("idx_task_agent_created", "agent_id", "created_at", "id"),
         Index("idx_task_agent_tenant", "agent_id", "tenant_id"),
     )
 
 
+class TaskEventModel(Base):
+    """ORM model for the append-only task change log.
+
+    While a task is streaming, each change (state transition, appended
+    message or artifact, error) is appended here instead of rewriting the
+    whole task row. The tasks row is a snapshot that is periodically
+    compacted by folding pending events into it.
+
+    Attributes:
+        id: Auto-incrementing sequence number (defines event order)
+        task_id: Task the change applies to (indexed)
+        changes: JSON change set (see omniforge.storage.task_events)
+        created_at: Timestamp when the event was appended
+    """
+
+    __tablename__ = "task_events"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    task_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    changes: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (Index("idx_task_events_task_id", "task_id", "id"),)
+
+
+class TaskStreamFrameModel(Base):
+    """ORM model for SSE frames that overflowed a task stream's ring buffer.
+
+    Lets clients resume long streams with Last-Event-ID after their frames
+    have left the in-memory buffer (see omniforge.tasks.streams).
+
+    Attributes:
+        stream_id: Stream the frame belongs to (the task ID)
+        frame_id: Position of the frame in the stream
+        event: SSE event type
+        data: JSON-encoded event payload
+        created_at: Timestamp when the frame was persisted
+    """
+
+    __tablename__ = "task_stream_frames"
+
+    stream_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    frame_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    event: Mapped[str] = mapped_column(String(50), nullable=False)
+    data: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+
+
 class OAuthCredentialModel(Base):
     """ORM model for OAuth credentials.
 
@@ -0,0 +1,140 @@
+"""Keyset (cursor) pagination helpers.
+
+Cursors encode the sort key of the last row on a page together with its ID as
+an opaque, URL-safe token. Repositories decode the token and seek past that
+position using the composite (sort column, id) indexes instead of scanning and
+discarding rows with OFFSET, so deep pages stay cheap and stable when new rows
+arrive.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime, timezone
+from typing import Any, Sequence, TypeVar
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+T = TypeVar("T")
+
+
+def encode_cursor(sort_value: datetime, row_id: Any) -> str:
+    """Encode a keyset position as an opaque cursor token.
+
+    Args:
+        sort_value: Value of the sort column for the last row on the page
+        row_id: ID of the last row on the page (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([sort_value.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor token produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Tuple of (sort_value, row_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(sort_value), str(row_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+def next_cursor(items: Sequence[T], limit: int, sort_attr: str, id_attr: str = "id") -> Any:
+    """Build the cursor for the page following ``items``.
+
+    Args:
+        items: Rows returned for the current page
+        limit: Page size that was requested
+        sort_attr: Attribute holding the sort column value
+        id_attr: Attribute holding the row ID (default: "id")
+
+    Returns:
+        Cursor string, or None if the page was not full (no more results)
+    """
+    if limit <= 0 or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(getattr(last, sort_attr), getattr(last, id_attr))
+
+
+def seek_after(
+    sort_column: Any, id_column: Any, cursor: str, descending: bool = True
+) -> ColumnElement[bool]:
+    """Build the WHERE clause that seeks past a cursor position.
+
+    Args:
+        sort_column: ORM column the results are ordered by
+        id_column: ORM primary key column used as tie-breaker
+        cursor: Opaque cursor string from a previous page
+        descending: Whether results are ordered newest first (default: True)
+
+    Returns:
+        SQLAlchemy boolean clause
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    sort_value, row_id = decode_cursor(cursor)
+    if descending:
+        return or_(
+            sort_column < sort_value,
+            and_(sort_column == sort_value, id_column < row_id),
+        )
+    return or_(
+        sort_column > sort_value,
+        and_(sort_column == sort_value, id_column > row_id),
+    )
+
+
+def is_after(sort_value: datetime, row_id: Any, cursor: str, descending: bool = True) -> bool:
+    """In-memory counterpart of seek_after for dictionary-backed repositories.
+
+    Args:
+        sort_value: Sort key of the candidate row
+        row_id: ID of the candidate row
+        cursor: Opaque cursor string from a previous page
+        descending: Whether results are ordered newest first (default: True)
+
+    Returns:
+        True if the row comes after the cursor position
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    key = keyset_key(sort_value, row_id)
+    cursor_key = keyset_key(*decode_cursor(cursor))
+    return key < cursor_key if descending else key > cursor_key
+
+
+def keyset_key(sort_value: datetime, row_id: Any) -> tuple[datetime, str]:
+    """Build the in-memory sort key that cursors are compared against.
+
+    Args:
+        sort_value: Sort key of the row
+        row_id: ID of the row (tie-breaker)
+
+    Returns:
+        Tuple ordering rows the same way as is_after()
+    """
+    return _comparable(sort_value), str(row_id)
+
+
+def _comparable(value: datetime) -> datetime:
+    """Convert to naive UTC so naive (UTC) and aware timestamps compare consistently."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.replace(tzinfo=None)
@@ -0,0 +1,411 @@
+"""Full-text search over conversation messages and task input summaries.
+
+On SQLite, external-content FTS5 tables index ``conversation_messages.content``
+and ``tasks.input_summary`` by the base rows' rowids. Triggers keep them in
+sync on insert, update and delete, and results are ranked with bm25(). On PostgreSQL, GIN indexes on
+``to_tsvector('english', ...)`` expressions are used instead, ranked with
+ts_rank(). Because those are expression indexes, Postgres needs no extra
+tables or triggers.
+
+The index objects are created together with their base tables by
+``Database.create_tables()``. For databases created before search existed,
+run ``SearchIndex.rebuild()`` (``omniforge search reindex``). SQLite may
+renumber the rowids of these tables on VACUUM, so rebuild after a VACUUM too.
+"""
+
+import logging
+import re
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+from sqlalchemy import DDL, DateTime, Float, String, event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from omniforge.conversation.orm import ConversationMessageModel
+from omniforge.storage.database import Database
+from omniforge.storage.models import TaskModel
+
+logger = logging.getLogger(__name__)
+
+_SNIPPET_TOKENS = 16
+
+# SQLite external-content FTS5 tables and the triggers that keep them in sync
+# with base tables. The index is keyed by the base table's rowid, so each
+# trigger updates it with a rowid lookup ('delete' must be given the values
+# that were indexed).
+_SQLITE_MESSAGE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS conversation_messages_fts "
+    "USING fts5(content, content='conversation_messages', tokenize='porter unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS conversation_messages_fts_insert "
+    "AFTER INSERT ON conversation_messages BEGIN "
+    "INSERT INTO conversation_messages_fts(rowid, content) VALUES (new.rowid, new.content); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS conversation_messages_fts_update "
+    "AFTER UPDATE OF content ON conversation_messages BEGIN "
+    "INSERT INTO conversation_messages_fts(conversation_messages_fts, rowid, content) "
+    "VALUES ('delete', old.rowid, old.content); "
+    "INSERT INTO conversation_messages_fts(rowid, content) VALUES (new.rowid, new.content); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS conversation_messages_fts_delete "
+    "AFTER DELETE ON conversation_messages BEGIN "
+    "INSERT INTO conversation_messages_fts(conversation_messages_fts, rowid, content) "
+    "VALUES ('delete', old.rowid, old.content); "
+    "END",
+]
+
+# Every task row is indexed; a NULL input_summary simply has no terms
+_SQLITE_TASK_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts "
+    "USING fts5(input_summary, content='tasks', tokenize='porter unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_insert "
+    "AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, input_summary) VALUES (new.rowid, new.input_summary); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_update "
+    "AFTER UPDATE OF input_summary ON tasks "
+    "WHEN old.input_summary IS NOT new.input_summary BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, input_summary) "
+    "VALUES ('delete', old.rowid, old.input_summary); "
+    "INSERT INTO tasks_fts(rowid, input_summary) VALUES (new.rowid, new.input_summary); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_delete "
+    "AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, input_summary) "
+    "VALUES ('delete', old.rowid, old.input_summary); "
+    "END",
+]
+
+_SQLITE_FTS_TABLES = ("conversation_messages_fts", "tasks_fts")
+
+# Objects of the earlier contentful FTS tables, which were keyed by an
+# UNINDEXED id column and are replaced on upgrade
+_SQLITE_LEGACY_TRIGGERS = [
+    f"{table}_fts_{action}"
+    for table in ("conversation_messages", "tasks")
+    for action in ("insert", "update", "delete")
+]
+
+# PostgreSQL expression indexes (maintained by the database on every write)
+_POSTGRES_MESSAGE_DDL = [
+    "CREATE INDEX IF NOT EXISTS idx_conversation_messages_tsv ON conversation_messages "
+    "USING GIN (to_tsvector('english', content))",
+]
+
+_POSTGRES_TASK_DDL = [
+    "CREATE INDEX IF NOT EXISTS idx_tasks_input_summary_tsv ON tasks "
+    "USING GIN (to_tsvector('english', coalesce(input_summary, '')))",
+]
+
+_SQLITE_MESSAGE_QUERY = f"""
+    SELECT m.id AS id, m.conversation_id AS parent_id, m.created_at AS created_at,
+           snippet(conversation_messages_fts, 0, '[', ']', '...', {_SNIPPET_TOKENS}) AS snippet,
+           bm25(conversation_messages_fts) AS score
+    FROM conversation_messages_fts
+    JOIN conversation_messages m ON m.rowid = conversation_messages_fts.rowid
+    JOIN conversations c ON c.id = m.conversation_id
+    WHERE conversation_messages_fts MATCH :query AND c.tenant_id = :tenant_id
+    ORDER BY score, m.id
+    LIMIT :limit
+"""
+
+_SQLITE_TASK_QUERY = f"""
+    SELECT t.id AS id, t.agent_id AS parent_id, t.created_at AS created_at,
+           snippet(tasks_fts, 0, '[', ']', '...', {_SNIPPET_TOKENS}) AS snippet,
+           bm25(tasks_fts) AS score
+    FROM tasks_fts
+    JOIN tasks t ON t.rowid = tasks_fts.rowid
+    WHERE tasks_fts MATCH :query AND t.tenant_id = :tenant_id
+    ORDER BY score, t.id
+    LIMIT :limit
+"""
+
+_POSTGRES_MESSAGE_QUERY = """
+    SELECT m.id AS id, m.conversation_id AS parent_id, m.created_at AS created_at,
+           ts_headline('english', m.content, q,
+                       'StartSel=[, StopSel=], MaxWords=16, MinWords=4') AS snippet,
+           -ts_rank(to_tsvector('english', m.content), q) AS score
+    FROM conversation_messages m
+    JOIN conversations c ON c.id = m.conversation_id,
+         plainto_tsquery('english', :query) q
+    WHERE to_tsvector('english', m.content) @@ q AND c.tenant_id = :tenant_id
+    ORDER BY score, m.id
+    LIMIT :limit
+"""
+
+_POSTGRES_TASK_QUERY = """
+    SELECT t.id AS id, t.agent_id AS parent_id, t.created_at AS created_at,
+           ts_headline('english', t.input_summary, q,
+                       'StartSel=[, StopSel=], MaxWords=16, MinWords=4') AS snippet,
+           -ts_rank(to_tsvector('english', coalesce(t.input_summary, '')), q) AS score
+    FROM tasks t, plainto_tsquery('english', :query) q
+    WHERE to_tsvector('english', coalesce(t.input_summary, '')) @@ q
+      AND t.tenant_id = :tenant_id
+    ORDER BY score, t.id
+    LIMIT :limit
+"""
+
+
+def _install_ddl(
+    table: object, statements: list[str], dialect: str, event_name: str = "after_create"
+) -> None:
+    """Run DDL right after the base table is created (or dropped) on a dialect."""
+    for statement in statements:
+        # execute_if() returns a copy; its stub is wrongly annotated as None
+        ddl = DDL(statement).execute_if(dialect=dialect)  # type: ignore[func-returns-value]
+        event.listen(table, event_name, ddl)
+
+
+_install_ddl(ConversationMessageModel.__table__, _SQLITE_MESSAGE_DDL, "sqlite")
+_install_ddl(TaskModel.__table__, _SQLITE_TASK_DDL, "sqlite")
+# Triggers are dropped with their base table; the FTS tables must go explicitly
+_install_ddl(
+    ConversationMessageModel.__table__,
+    ["DROP TABLE IF EXISTS conversation_messages_fts"],
+    "sqlite",
+    "after_drop",
+)
+_install_ddl(TaskModel.__table__, ["DROP TABLE IF EXISTS tasks_fts"], "sqlite", "after_drop")
+_install_ddl(ConversationMessageModel.__table__, _POSTGRES_MESSAGE_DDL, "postgresql")
+_install_ddl(TaskModel.__table__, _POSTGRES_TASK_DDL, "postgresql")
+
+
+class SearchKind(str, Enum):
+    """Kinds of searchable content."""
+
+    MESSAGE = "message"
+    TASK = "task"
+
+
+class SearchResult(BaseModel):
+    """A single ranked search hit.
+
+    Attributes:
+        kind: Kind of content matched
+        id: Message ID or task ID
+        parent_id: Conversation ID for messages, agent ID for tasks
+        snippet: Matched text excerpt with terms wrapped in [brackets]
+        score: Relevance score (lower is more relevant)
+        created_at: Creation timestamp of the matched item
+    """
+
+    kind: SearchKind = Field(..., description="Kind of content matched")
+    id: str = Field(..., description="Message ID or task ID")
+    parent_id: Optional[str] = Field(
+        None, description="Conversation ID for messages, agent ID for tasks"
+    )
+    snippet: str = Field(..., description="Matched text excerpt")
+    score: float = Field(..., description="Relevance score (lower is more relevant)")
+    created_at: datetime = Field(..., description="Creation timestamp")
+
+
+class SearchIndex:
+    """Tenant-scoped full-text search over messages and tasks.
+
+    Attributes:
+        db: Database instance for session management
+    """
+
+    def __init__(self, db: Database):
+        """Initialize search index with database connection.
+
+        Args:
+            db: Database instance for session management
+        """
+        self.db = db
+
+    @property
+    def dialect(self) -> str:
+        """Name of the database dialect (e.g. "sqlite", "postgresql")."""
+        return str(self.db.engine.dialect.name)
+
+    @property
+    def supported(self) -> bool:
+        """Whether full-text search is available on the database dialect."""
+        return self.dialect in ("sqlite", "postgresql")
+
+    async def search(
+        self,
+        tenant_id: str,
+        query: str,
+        kinds: Optional[list[SearchKind]] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[SearchResult]:
+        """Search messages and tasks of a tenant, most relevant first.
+
+        Security critical: results are always filtered by tenant_id.
+
+        Args:
+            tenant_id: Tenant ID for filtering (required)
+            query: Free-text query; all terms must match
+            kinds: Kinds of content to search (default: all)
+            limit: Maximum number of results (default: 20)
+            offset: Number of ranked results to skip (default: 0)
+
+        Returns:
+            Ranked list of search results
+
+        Raises:
+            ValueError: If tenant_id is empty or the dialect is unsupported
+        """
+        if not tenant_id or not tenant_id.strip():
+            raise ValueError("tenant_id cannot be empty")
+
+        queries = self._queries()
+        match = self._match_expression(query)
+        if match is None or limit <= 0:
+            return []
+
+        # Each kind is ranked independently; fetch enough of each to fill the
+        # requested page and merge on score
+        window = offset + limit
+        results: list[SearchResult] = []
+        async with self.db.session() as session:
+            for kind in kinds or list(SearchKind):
+                results.extend(
+                    await self._search_kind(session, kind, queries[kind], tenant_id, match, window)
+                )
+
+        results.sort(key=lambda r: (r.score, r.id))
+        return results[offset:window]
+
+    async def create_index(self) -> None:
+        """Create missing index objects without reindexing existing rows.
+
+        Tables created by ``Database.create_tables()`` already have them; this
+        covers databases whose tables predate full-text search. Rows written
+        before the index existed are only searchable after ``rebuild()``.
+
+        Raises:
+            ValueError: If the dialect is unsupported
+        """
+        async with self.db.session() as session:
+            await self._create_index(session)
+
+    async def rebuild(self) -> dict[str, int]:
+        """Create missing index objects and (re)index all existing rows.
+
+        Needed for databases whose tables predate full-text search, or after
+        the index has been dropped. Safe to run repeatedly.
+
+        Returns:
+            Number of indexed rows per kind
+
+        Raises:
+            ValueError: If the dialect is unsupported
+        """
+        async with self.db.session() as session:
+            if not await self._create_index(session) and self.dialect == "sqlite":
+                await self._reindex_sqlite(session)
+            message_count = "SELECT count(*) FROM conversation_messages"
+            task_count = "SELECT count(*) FROM tasks WHERE input_summary IS NOT NULL"
+
+            counts = {
+                SearchKind.MESSAGE.value: (await session.execute(text(message_count))).scalar_one(),
+                SearchKind.TASK.value: (await session.execute(text(task_count))).scalar_one(),
+            }
+
+        logger.info(f"Rebuilt full-text search index: {counts}")
+        return counts
+
+    async def _create_index(self, session: AsyncSession) -> bool:
+        """Run the index DDL for the current dialect.
+
+        Legacy SQLite FTS tables are replaced and reindexed.
+
+        Returns:
+            True if existing rows were reindexed
+        """
+        if self.dialect == "sqlite":
+            upgraded = await self._drop_legacy_sqlite(session)
+            statements = _SQLITE_MESSAGE_DDL + _SQLITE_TASK_DDL
+        elif self.dialect == "postgresql":
+            upgraded = False
+            statements = _POSTGRES_MESSAGE_DDL + _POSTGRES_TASK_DDL
+        else:
+            raise ValueError(f"Full-text search is not supported on {self.dialect}")
+        for statement in statements:
+            await session.execute(text(statement))
+        if upgraded:
+            await self._reindex_sqlite(session)
+        return upgraded
+
+    async def _drop_legacy_sqlite(self, session: AsyncSession) -> bool:
+        """Drop FTS tables and triggers of the earlier id-keyed layout, if present."""
+        result = await session.execute(
+            text(
+                "SELECT count(*) FROM sqlite_master WHERE type = 'table' "
+                "AND name IN ('conversation_messages_fts', 'tasks_fts') AND sql LIKE '%UNINDEXED%'"
+            )
+        )
+        if not result.scalar_one():
+            return False
+        logger.info("Upgrading full-text search tables to external content")
+        for trigger in _SQLITE_LEGACY_TRIGGERS:
+            await session.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        for table in _SQLITE_FTS_TABLES:
+            await session.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        return True
+
+    async def _reindex_sqlite(self, session: AsyncSession) -> None:
+        """Rebuild the SQLite FTS tables from their base tables."""
+        for table in _SQLITE_FTS_TABLES:
+            await session.execute(text(f"INSERT INTO {table}({table}) VALUES ('rebuild')"))
+
+    async def _search_kind(
+        self,
+        session: AsyncSession,
+        kind: SearchKind,
+        sql: str,
+        tenant_id: str,
+        match: str,
+        limit: int,
+    ) -> list[SearchResult]:
+        """Run the ranked query for one kind of content."""
+        stmt = text(sql).columns(
+            id=String, parent_id=String, created_at=DateTime, snippet=String, score=Float
+        )
+        result = await session.execute(
+            stmt, {"query": match, "tenant_id": tenant_id, "limit": limit}
+        )
+        return [
+            SearchResult(
+                kind=kind,
+                id=row.id,
+                parent_id=row.parent_id,
+                snippet=row.snippet or "",
+                score=row.score,
+                created_at=row.created_at,
+            )
+            for row in result
+        ]
+
+    def _queries(self) -> dict[SearchKind, str]:
+        """Get the ranked query for each kind on the current dialect."""
+        if self.dialect == "sqlite":
+            return {SearchKind.MESSAGE: _SQLITE_MESSAGE_QUERY, SearchKind.TASK: _SQLITE_TASK_QUERY}
+        if self.dialect == "postgresql":
+            return {
+                SearchKind.MESSAGE: _POSTGRES_MESSAGE_QUERY,
+                SearchKind.TASK: _POSTGRES_TASK_QUERY,
+            }
+        raise ValueError(f"Full-text search is not supported on {self.dialect}")
+
+    def _match_expression(self, query: str) -> Optional[str]:
+        """Turn free text into a safe match expression for the dialect.
+
+        FTS5 treats quotes, operators and column filters in MATCH as syntax, so
+        each word is quoted as a literal term. Postgres' plainto_tsquery already
+        ignores syntax, so the words are passed through.
+
+        Returns:
+            Match expression, or None if the query has no searchable terms
+        """
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            return None
+        if self.dialect == "sqlite":
+            return " ".join(f'"{term}"' for term in terms)
+        return " ".join(terms)
@@ -0,0 +1,361 @@
+"""Shared-state backends for running the API with multiple worker processes.
+
+By default the API keeps its live state (tasks, registered agents, paused
+chat sessions, working memory) in process memory, which is only correct with
+a single worker. Setting ``OMNIFORGE_STATE_BACKEND=sqlite`` moves that state
+into a SQLite file shared by every worker process on the machine, so
+``uvicorn --workers N`` can use all cores of one box. A RateLimiter given
+get_state_store() as its store enforces its limits across workers as well.
+
+Task and chat event streams are not shared: the producer, its replay buffer
+and its overflow log live in the worker that started the run. Resuming a
+stream with ``Last-Event-ID`` therefore needs the reconnect routed to that
+worker (sticky sessions); on another worker the stream is not found.
+
+Configuration (environment variables):
+    OMNIFORGE_STATE_BACKEND: ``memory`` (default) or ``sqlite``
+    OMNIFORGE_STATE_PATH: SQLite file for shared state (default: ./omniforge_state.db)
+
+SQLiteStateStore is a small namespaced key-value store on top of the stdlib
+sqlite3 module. The file runs in WAL mode so readers in one worker are not
+blocked by a writer in another; transaction() takes the write lock up front
+for read-modify-write sequences such as rate-limit counters. Its methods
+block (for up to busy_timeout while another worker holds the write lock), so
+async code calls them through run(), which executes them in a worker thread.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from omniforge.storage.sqlite_connection import SQLiteConnection
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Expired rows are purged once every this many writes
+_PURGE_EVERY_WRITES = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS shared_state (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_shared_state_expires
+    ON shared_state (expires_at) WHERE expires_at IS NOT NULL;
+"""
+
+
+class StateBackend(str, Enum):
+    """Where the API keeps state that must be shared between workers."""
+
+    MEMORY = "memory"
+    SQLITE = "sqlite"
+
+
+class SharedStateConfig:
+    """Shared-state backend configuration.
+
+    Attributes:
+        backend: Selected backend
+        path: SQLite file used by the sqlite backend
+    """
+
+    def __init__(
+        self,
+        backend: StateBackend = StateBackend.MEMORY,
+        path: str = "./omniforge_state.db",
+    ) -> None:
+        self.backend = backend
+        self.path = path
+
+    @property
+    def shared(self) -> bool:
+        """Whether state is shared between processes."""
+        return self.backend is not StateBackend.MEMORY
+
+    @property
+    def database_url(self) -> str:
+        """SQLAlchemy URL of the shared SQLite file (for SQL-backed repositories)."""
+        return f"sqlite+aiosqlite:///{self.path}"
+
+    @classmethod
+    def from_env(cls) -> "SharedStateConfig":
+        """Read the configuration from environment variables.
+
+        Returns:
+            SharedStateConfig
+
+        Raises:
+            ValueError: If OMNIFORGE_STATE_BACKEND names an unknown backend
+        """
+        name = os.getenv("OMNIFORGE_STATE_BACKEND", StateBackend.MEMORY.value).strip().lower()
+        try:
+            backend = StateBackend(name)
+        except ValueError:
+            choices = ", ".join(b.value for b in StateBackend)
+            raise ValueError(
+                f"Unknown OMNIFORGE_STATE_BACKEND '{name}' (expected one of: {choices})"
+            ) from None
+        return cls(backend=backend, path=os.getenv("OMNIFORGE_STATE_PATH", "./omniforge_state.db"))
+
+
+class SQLiteStateStore:
+    """Namespaced JSON key-value store in a SQLite file shared across processes.
+
+    Values must be JSON-serializable. Entries can be given a TTL; expired
+    entries are invisible to reads and purged periodically.
+
+    The connection is opened lazily and reopened after a fork, so a store
+    created at import time is safe to use from worker processes.
+
+    Example:
+        >>> store = SQLiteStateStore("./state.db")
+        >>> store.set("sessions", "conv-1", {"delegated_agent_id": None})
+        >>> store.get("sessions", "conv-1")
+        {'delegated_agent_id': None}
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 5.0) -> None:
+        """Initialize the store.
+
+        Args:
+            path: SQLite file path (``:memory:`` for a private in-memory store)
+            busy_timeout: Seconds to wait for another process's write lock
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._conn = SQLiteConnection(path, _SCHEMA, busy_timeout)
+        self._writes = 0
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Read a value.
+
+        Args:
+            namespace: Namespace of the key
+            key: Key to read
+
+        Returns:
+            The stored value, or None if missing or expired
+        """
+        row = self._execute(
+            "SELECT value FROM shared_state WHERE namespace = ? AND key = ?"
+            " AND (expires_at IS NULL OR expires_at > ?)",
+            (namespace, key, time.time()),
+        ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def set(
+        self, namespace: str, key: str, value: Any, ttl_seconds: Optional[float] = None
+    ) -> None:
+        """Write a value, replacing any previous value.
+
+        Args:
+            namespace: Namespace of the key
+            key: Key to write
+            value: JSON-serializable value
+            ttl_seconds: Optional seconds after which the entry expires
+
+        Raises:
+            ValueError: If value is not JSON-serializable
+        """
+        try:
+            encoded = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Value for key '{key}' must be JSON-serialisable") from e
+        expires_at = time.time() + ttl_seconds if ttl_seconds is not None else None
+        # ON CONFLICT DO UPDATE keeps the rowid, so items() stays in insertion order
+        self._execute(
+            "INSERT INTO shared_state (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT (namespace, key) DO UPDATE"
+            " SET value = excluded.value, expires_at = excluded.expires_at",
+            (namespace, key, encoded, expires_at),
+        )
+        self._after_write()
+
+    def delete(self, namespace: str, key: str) -> None:
+        """Delete a key (no error if missing).
+
+        Args:
+            namespace: Namespace of the key
+            key: Key to delete
+        """
+        self._execute("DELETE FROM shared_state WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def keys(self, namespace: str) -> list[str]:
+        """Return the live keys of a namespace, in insertion order.
+
+        Args:
+            namespace: Namespace to list
+
+        Returns:
+            List of keys
+        """
+        return [key for key, _ in self.items(namespace)]
+
+    def items(self, namespace: str) -> list[tuple[str, Any]]:
+        """Return the live entries of a namespace, in insertion order.
+
+        Args:
+            namespace: Namespace to list
+
+        Returns:
+            List of (key, value) tuples
+        """
+        rows = self._execute(
+            "SELECT key, value FROM shared_state WHERE namespace = ?"
+            " AND (expires_at IS NULL OR expires_at > ?) ORDER BY rowid",
+            (namespace, time.time()),
+        ).fetchall()
+        return [(key, json.loads(value)) for key, value in rows]
+
+    def clear(self, namespace: str) -> None:
+        """Delete every key of a namespace.
+
+        Args:
+            namespace: Namespace to clear
+        """
+        self._execute("DELETE FROM shared_state WHERE namespace = ?", (namespace,))
+
+    async def run(self, operation: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run blocking store operations in a worker thread.
+
+        Use from async code so waiting for another worker's write lock does
+        not stall the event loop, e.g. ``await store.run(store.get, "ns", "key")``.
+        A function running a whole transaction() can be passed as well.
+
+        Args:
+            operation: Callable using this store
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            The callable's return value
+        """
+        return await asyncio.to_thread(operation, *args, **kwargs)
+
+    @contextmanager
+    def transaction(self) -> Iterator["SQLiteStateStore"]:
+        """Run several operations atomically with respect to other processes.
+
+        The write lock is taken when the transaction starts, so a
+        read-check-write sequence cannot interleave with another worker's.
+
+        Yields:
+            This store
+        """
+        with self._conn.lock:
+            conn = self._conn.get()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def purge_expired(self) -> int:
+        """Delete expired entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        cursor = self._execute(
+            "DELETE FROM shared_state WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the connection (it is reopened on next use)."""
+        self._conn.close()
+
+    def _execute(self, sql: str, params: tuple[Any, ...]) -> sqlite3.Cursor:
+        """Execute one statement on this process's connection."""
+        with self._conn.lock:
+            return self._conn.get().execute(sql, params)
+
+    def _after_write(self) -> None:
+        """Purge expired entries every _PURGE_EVERY_WRITES writes."""
+        self._writes += 1
+        if self._writes % _PURGE_EVERY_WRITES == 0 and not self._in_transaction():
+            self.purge_expired()
+
+    def _in_transaction(self) -> bool:
+        """Whether this process's connection is inside transaction()."""
+        return self._conn.in_transaction
+
+
+_stores: dict[str, SQLiteStateStore] = {}
+
+
+def get_state_store(config: Optional[SharedStateConfig] = None) -> SQLiteStateStore:
+    """Return the process-wide SQLiteStateStore for the configured path.
+
+    Args:
+        config: Shared-state configuration (read from the environment if omitted)
+
+    Returns:
+        SQLiteStateStore shared by all callers in this process
+    """
+    config = config or SharedStateConfig.from_env()
+    store = _stores.get(config.path)
+    if store is None:
+        store = _stores[config.path] = SQLiteStateStore(config.path)
+    return store
+
+
+def create_task_repository(config: Optional[SharedStateConfig] = None) -> Any:
+    """Create the task repository for the configured backend.
+
+    Args:
+        config: Shared-state configuration (read from the environment if omitted)
+
+    Returns:
+        InMemoryTaskRepository, or a DatabaseTaskRepository on the shared
+        SQLite file
+    """
+    config = config or SharedStateConfig.from_env()
+    if not config.shared:
+        from omniforge.storage.memory import InMemoryTaskRepository
+
+        return InMemoryTaskRepository()
+
+    from omniforge.storage.database import Database, DatabaseConfig
+    from omniforge.storage.task_repository import DatabaseTaskRepository
+
+    return DatabaseTaskRepository(Database(DatabaseConfig(url=config.database_url)))
+
+
+def create_agent_repository(
+    namespace: str = "agents", config: Optional[SharedStateConfig] = None
+) -> Any:
+    """Create an agent repository for the configured backend.
+
+    Args:
+        namespace: Namespace separating independent registries in the shared store
+        config: Shared-state configuration (read from the environment if omitted)
+
+    Returns:
+        InMemoryAgentRepository, or a SQLiteAgentRepository on the shared store
+    """
+    config = config or SharedStateConfig.from_env()
+    if not config.shared:
+        from omniforge.storage.memory import InMemoryAgentRepository
+
+        return InMemoryAgentRepository()
+
+    from omniforge.storage.agent_repository import SQLiteAgentRepository
+
+    return SQLiteAgentRepository(get_state_store(config), namespace=namespace)
+
@@ -0,0 +1,94 @@
+"""Fork-safe connection to a SQLite file shared by worker processes.
+
+SQLiteStateStore and SkillIndexStore keep small tables in a SQLite file that
+several worker processes open at once. SQLiteConnection holds the connection
+they share within a process: it is opened lazily (creating the parent
+directory and the schema), runs in WAL mode so readers in one worker are not
+blocked by a writer in another, and is reopened after a fork, since a
+connection inherited from the parent must not be used by the child.
+
+The connection is in autocommit mode; callers start transactions themselves
+and hold ``lock`` while using the connection from several threads.
+"""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+# Pragmas applied to every new connection. synchronous=NORMAL only fsyncs the
+# WAL at checkpoints, which is safe in WAL mode.
+SQLITE_FILE_PRAGMAS: dict[str, str] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+}
+
+
+class SQLiteConnection:
+    """Lazily opened per-process connection to a SQLite file.
+
+    Example:
+        >>> conn = SQLiteConnection("./state.db", "CREATE TABLE IF NOT EXISTS t (k TEXT)")
+        >>> with conn.lock:
+        ...     conn.get().execute("INSERT INTO t VALUES ('a')")
+    """
+
+    def __init__(self, path: Union[str, Path], schema: str, busy_timeout: float = 5.0) -> None:
+        """Initialize the connection (nothing is opened until get()).
+
+        Args:
+            path: SQLite file path (``:memory:`` for a private in-memory database)
+            schema: SQL script creating the tables, run on every open
+            busy_timeout: Seconds to wait for another process's write lock
+        """
+        self.path = str(path)
+        self.schema = schema
+        self.busy_timeout = busy_timeout
+        self.lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether the open connection is inside a transaction."""
+        return self._conn is not None and self._conn.in_transaction
+
+    def get(self) -> sqlite3.Connection:
+        """Return this process's connection, opening it if needed.
+
+        Returns:
+            The connection
+
+        Raises:
+            OSError: If the parent directory cannot be created
+            sqlite3.Error: If the file cannot be opened or the schema created
+        """
+        with self.lock:
+            pid = os.getpid()
+            if self._conn is None or self._pid != pid:
+                if self.path != ":memory:":
+                    Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(
+                    self.path,
+                    timeout=self.busy_timeout,
+                    isolation_level=None,  # autocommit unless a transaction is begun
+                    check_same_thread=False,
+                )
+                try:
+                    for name, value in SQLITE_FILE_PRAGMAS.items():
+                        conn.execute(f"PRAGMA {name}={value}")
+                    conn.executescript(self.schema)
+                except sqlite3.Error:
+                    conn.close()
+                    raise
+                self._conn = conn
+                self._pid = pid
+            return self._conn
+
+    def close(self) -> None:
+        """Close the connection (it is reopened on next get())."""
+        with self.lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,88 @@
+"""SQL-backed overflow log for resumable task streams.
+
+Frames evicted from a task stream's in-memory ring buffer are written here
+in batches, so a client reconnecting with an old Last-Event-ID can still be
+replayed everything it missed.
+"""
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from omniforge.storage.database import Database
+from omniforge.storage.models import TaskStreamFrameModel
+from omniforge.tasks.streams import StreamFrame
+
+
+class SQLStreamEventLog:
+    """StreamEventLog storing overflow frames in the task_stream_frames table.
+
+    Example:
+        >>> hub = TaskStreamHub(event_log=SQLStreamEventLog(database))
+    """
+
+    def __init__(self, db: Database) -> None:
+        """Initialize the log.
+
+        Args:
+            db: Database holding the task_stream_frames table
+        """
+        self.db = db
+
+    async def append(self, stream_id: str, frames: list[StreamFrame]) -> None:
+        """Store frames, in ID order.
+
+        Args:
+            stream_id: Stream the frames belong to
+            frames: Frames to store
+        """
+
+        async def _append(session: AsyncSession) -> None:
+            session.add_all(
+                TaskStreamFrameModel(stream_id=stream_id, frame_id=f.id, event=f.event, data=f.data)
+                for f in frames
+            )
+            await session.flush()
+
+        await self.db.write(_append)
+
+    async def read(self, stream_id: str, after_id: int, limit: int) -> list[StreamFrame]:
+        """Return frames after an ID.
+
+        Args:
+            stream_id: Stream to read
+            after_id: Only frames with a greater ID are returned
+            limit: Maximum number of frames to return
+
+        Returns:
+            Frames in ID order
+        """
+        stmt = (
+            select(
+                TaskStreamFrameModel.frame_id,
+                TaskStreamFrameModel.event,
+                TaskStreamFrameModel.data,
+            )
+            .where(
+                TaskStreamFrameModel.stream_id == stream_id,
+                TaskStreamFrameModel.frame_id > after_id,
+            )
+            .order_by(TaskStreamFrameModel.frame_id)
+            .limit(limit)
+        )
+        async with self.db.session() as session:
+            rows = (await session.execute(stmt)).all()
+        return [StreamFrame(frame_id, event, data) for frame_id, event, data in rows]
+
+    async def discard(self, stream_id: str) -> None:
+        """Remove all frames of a stream.
+
+        Args:
+            stream_id: Stream to remove
+        """
+
+        async def _discard(session: AsyncSession) -> None:
+            await session.execute(
+                delete(TaskStreamFrameModel).where(TaskStreamFrameModel.stream_id == stream_id)
+            )
+
+        await self.db.write(_discard)
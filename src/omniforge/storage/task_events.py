@@ -0,0 +1,201 @@
+"""Incremental task change sets for append-only task persistence.
+
+Streaming a task used to rewrite the whole task, including every message and
+artifact so far, on each event. That is O(N²) serialization over a stream of
+N events. Instead, each change is captured as a small change set holding the
+new state, error, and only the appended messages and artifacts. These change
+sets are appended to the ``task_events`` log in batches, and repositories
+fold them onto the last task snapshot when reading.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Optional, Protocol
+
+from omniforge.agents.models import Artifact
+from omniforge.tasks.models import Task, TaskError, TaskMessage, TaskState
+
+logger = logging.getLogger(__name__)
+
+TaskChanges = dict[str, Any]
+
+
+class TaskChangeSink(Protocol):
+    """Repository methods used by TaskChangeBuffer."""
+
+    async def update(self, task: Task) -> None:
+        """Replace the stored task with a full snapshot."""
+        ...
+
+    async def append_changes(self, task_id: str, changes: list[TaskChanges]) -> None:
+        """Append change sets to a task's event log."""
+        ...
+
+
+def diff_task(previous: Task, updated: Task) -> Optional[TaskChanges]:
+    """Capture the difference between two task snapshots as a change set.
+
+    Only the changes produced while a task runs can be expressed: state,
+    error, updated_at, and messages/artifacts appended to the end.
+
+    Args:
+        previous: Task before the change
+        updated: Task after the change
+
+    Returns:
+        JSON-serializable change set, or None if the difference can't be
+        expressed incrementally (the caller should write a full snapshot)
+    """
+    incremental_fields = {"state", "error", "updated_at", "messages", "artifacts"}
+    for name in Task.model_fields:
+        if name not in incremental_fields and getattr(previous, name) != getattr(updated, name):
+            return None
+
+    old_messages, new_messages = previous.messages, updated.messages
+    old_artifacts, new_artifacts = previous.artifacts, updated.artifacts
+    if (
+        new_messages[: len(old_messages)] != old_messages
+        or new_artifacts[: len(old_artifacts)] != old_artifacts
+    ):
+        return None
+
+    changes: TaskChanges = {"updated_at": updated.updated_at.isoformat()}
+    if updated.state != previous.state:
+        changes["state"] = updated.state.value
+    if updated.error != previous.error:
+        changes["error"] = updated.error.model_dump(mode="json") if updated.error else None
+    if len(new_messages) > len(old_messages):
+        changes["messages"] = [m.model_dump(mode="json") for m in new_messages[len(old_messages) :]]
+    if len(new_artifacts) > len(old_artifacts):
+        changes["artifacts"] = [
+            a.model_dump(mode="json") for a in new_artifacts[len(old_artifacts) :]
+        ]
+    return changes
+
+
+def apply_changes(task: Task, changes: list[TaskChanges]) -> Task:
+    """Fold change sets onto a task snapshot.
+
+    Args:
+        task: Task snapshot
+        changes: Change sets in the order they were recorded
+
+    Returns:
+        New Task with all changes applied (the same instance if there are none)
+    """
+    if not changes:
+        return task
+
+    update: dict[str, Any] = {}
+    messages = list(task.messages)
+    artifacts = list(task.artifacts)
+    for change in changes:
+        update["updated_at"] = datetime.fromisoformat(change["updated_at"])
+        if "state" in change:
+            update["state"] = TaskState(change["state"])
+        if "error" in change:
+            update["error"] = TaskError(**change["error"]) if change["error"] else None
+        messages.extend(TaskMessage(**m) for m in change.get("messages", ()))
+        artifacts.extend(Artifact(**a) for a in change.get("artifacts", ()))
+
+    update["messages"] = messages
+    update["artifacts"] = artifacts
+    return task.model_copy(update=update)
+
+
+class TaskChangeBuffer:
+    """Batches a streaming task's changes into append-only writes.
+
+    Changes are flushed to the repository's event log once ``batch_size``
+    have accumulated, the task reaches a terminal state, or a timer fires
+    ``flush_interval`` seconds after the first unflushed change was recorded,
+    so a task that goes quiet mid-stream is still persisted. Changes that
+    can't be expressed incrementally fall back to a full ``update``. Callers
+    must ``flush()`` when done, which also cancels the timer.
+
+    Example:
+        >>> buffer = TaskChangeBuffer(task_repo, task)
+        >>> await buffer.record(TaskManager.apply_event(buffer.task, event))
+        >>> await buffer.flush()
+    """
+
+    def __init__(
+        self,
+        repository: TaskChangeSink,
+        task: Task,
+        batch_size: int = 16,
+        flush_interval: float = 0.5,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            repository: Task repository supporting append_changes
+            task: Task snapshot as currently persisted
+            batch_size: Maximum number of buffered change sets
+            flush_interval: Maximum seconds a recorded change stays unflushed
+        """
+        self._repository = repository
+        self._task = task
+        self._pending: list[TaskChanges] = []
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        # Serializes flushes so change sets are appended in order
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._background: set[asyncio.Task] = set()
+
+    @property
+    def task(self) -> Task:
+        """Latest recorded task snapshot (including unflushed changes)."""
+        return self._task
+
+    async def record(self, updated: Task) -> None:
+        """Record a new task snapshot, flushing if a batch is due.
+
+        Args:
+            updated: Task after the latest change
+        """
+        changes = diff_task(self._task, updated)
+        if changes is None:
+            await self.flush()
+            await self._repository.update(updated)
+            self._task = updated
+            return
+
+        self._pending.append(changes)
+        self._task = updated
+        if len(self._pending) >= self._batch_size or updated.state.is_terminal():
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._flush_interval, self._flush_in_background
+            )
+
+    async def flush(self) -> None:
+        """Write all buffered change sets to the repository."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            if self._pending:
+                pending, self._pending = self._pending, []
+                try:
+                    await self._repository.append_changes(self._task.id, pending)
+                except BaseException:
+                    # Keep the changes for the next flush
+                    self._pending[:0] = pending
+                    raise
+
+    def _flush_in_background(self) -> None:
+        """Flush pending changes once the flush interval has elapsed."""
+        self._timer = None
+        flush = asyncio.get_running_loop().create_task(self.flush())
+        self._background.add(flush)
+        flush.add_done_callback(self._background_done)
+
+    def _background_done(self, flush: asyncio.Task) -> None:
+        """Forget a finished background flush, logging its failure."""
+        self._background.discard(flush)
+        if not flush.cancelled() and flush.exception() is not None:
+            logger.warning(f"Background flush of task {self._task.id} failed: {flush.exception()}")
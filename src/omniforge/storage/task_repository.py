@@ -2,15 +2,40 @@
 
 This module provides a SQLAlchemy-backed implementation of TaskRepository,
 with full multi-tenancy enforcement on all list queries.
+
+Streaming changes are appended to the ``task_events`` log instead of
+rewriting the task row; reads fold pending events onto the ``tasks`` row
+snapshot, which is compacted once enough events accumulate or the task
+reaches a terminal state.
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from omniforge.storage.models import TaskModel
-from omniforge.tasks.models import Task, TaskError, TaskMessage, TaskState
+from omniforge.storage.database import Database
+from omniforge.storage.models import TaskEventModel, TaskModel
+from omniforge.storage.pagination import seek_after
+from omniforge.storage.task_events import apply_changes
+from omniforge.tasks.models import Task, TaskError, TaskMessage, TaskState, TaskSummary
+
+T = TypeVar("T")
+
+# Scalar columns read for task summaries (never the JSON blobs)
+_SUMMARY_COLUMNS = (
+    TaskModel.id,
+    TaskModel.agent_id,
+    TaskModel.state,
+    TaskModel.tenant_id,
+    TaskModel.skill_name,
+    TaskModel.input_summary,
+    TaskModel.created_at,
+    TaskModel.updated_at,
+    TaskModel.message_count,
+    TaskModel.artifact_count,
+)
 
 
 class SQLTaskRepository:
@@ -24,13 +49,16 @@ class SQLTaskRepository:
         >>> retrieved = await repo.get(task.id)
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, compact_threshold: int = 64) -> None:
         """Initialize repository with database session.
 
         Args:
             session: SQLAlchemy async session
+            compact_threshold: Number of pending task events that triggers
+                folding them into the task snapshot (default: 64)
         """
         self.session = session
+        self.compact_threshold = compact_threshold
 
     async def save(self, task: Task) -> None:
         """Persist a new task.
@@ -61,7 +89,7 @@ class SQLTaskRepository:
         model = await self.session.get(TaskModel, task_id)
         if model is None:
             return None
-        return self._model_to_task(model)
+        return (await self._fold_events([model]))[0]
 
     async def update(self, task: Task) -> None:
         """Update an existing task.
@@ -80,11 +108,84 @@ class SQLTaskRepository:
         model.messages = [m.model_dump(mode="json") for m in task.messages]
         model.artifacts = [a.model_dump(mode="json") for a in task.artifacts]
         model.error = task.error.model_dump(mode="json") if task.error else None
+        model.message_count = len(task.messages)
+        model.artifact_count = len(task.artifacts)
         model.updated_at = task.updated_at
         model.skill_name = task.skill_name
         model.input_summary = task.input_summary
         model.trace_id = task.trace_id
         model.conversation_id = task.conversation_id
+
+        # A full snapshot supersedes any pending incremental changes
+        await self.session.execute(delete(TaskEventModel).where(TaskEventModel.task_id == task.id))
+        await self.session.flush()
+
+    async def append_changes(self, task_id: str, changes: list[dict[str, Any]]) -> None:
+        """Append incremental change sets to the task's event log.
+
+        Only the scalar state, updated_at and count columns of the task row
+        are updated, without reading the row, so the cost per change is
+        independent of the task's history size.
+
+        Args:
+            task_id: Unique identifier of the task
+            changes: Change sets produced by task_events.diff_task, in order
+
+        Raises:
+            ValueError: If task does not exist
+        """
+        if not changes:
+            return
+
+        # Only scalar columns are written; the JSON snapshot is never loaded
+        # here, and changes are folded onto it on read and at compaction
+        columns = TaskModel.__table__.c
+        values: dict[str, Any] = {
+            "updated_at": datetime.fromisoformat(changes[-1]["updated_at"]),
+            "message_count": columns.message_count
+            + sum(len(c.get("messages", ())) for c in changes),
+            "artifact_count": columns.artifact_count
+            + sum(len(c.get("artifacts", ())) for c in changes),
+        }
+        states = [c["state"] for c in changes if "state" in c]
+        if states:
+            values["state"] = states[-1]
+        result = await self.session.execute(
+            update(TaskModel).where(TaskModel.id == task_id).values(**values)
+        )
+        if result.rowcount == 0:  # type: ignore[attr-defined]
+            raise ValueError(f"Task with ID {task_id} does not exist")
+
+        self.session.add_all(TaskEventModel(task_id=task_id, changes=c) for c in changes)
+        await self.session.flush()
+
+        pending = await self.session.scalar(
+            select(func.count())
+            .select_from(TaskEventModel)
+            .where(TaskEventModel.task_id == task_id)
+        )
+        terminal = bool(states) and TaskState(states[-1]).is_terminal()
+        if terminal or (pending or 0) >= self.compact_threshold:
+            await self.compact(task_id)
+
+    async def compact(self, task_id: str) -> None:
+        """Fold pending task events into the task snapshot and drop them.
+
+        Args:
+            task_id: Unique identifier of the task
+        """
+        model = await self.session.get(TaskModel, task_id)
+        if model is None:
+            return
+        task = (await self._fold_events([model]))[0]
+        model.state = task.state.value
+        model.messages = [m.model_dump(mode="json") for m in task.messages]
+        model.artifacts = [a.model_dump(mode="json") for a in task.artifacts]
+        model.error = task.error.model_dump(mode="json") if task.error else None
+        model.message_count = len(task.messages)
+        model.artifact_count = len(task.artifacts)
+        model.updated_at = task.updated_at
+        await self.session.execute(delete(TaskEventModel).where(TaskEventModel.task_id == task_id))
         await self.session.flush()
 
     async def delete(self, task_id: str) -> None:
@@ -100,6 +201,7 @@ class SQLTaskRepository:
         if model is None:
             raise ValueError(f"Task with ID {task_id} does not exist")
 
+        await self.session.execute(delete(TaskEventModel).where(TaskEventModel.task_id == task_id))
         await self.session.delete(model)
         await self.session.flush()
 
@@ -120,7 +222,7 @@ class SQLTaskRepository:
             .limit(limit)
         )
         result = await self.session.execute(stmt)
-        return [self._model_to_task(m) for m in result.scalars().all()]
+        return await self._fold_events(result.scalars().all())
 
     async def list_by_parent(self, parent_task_id: str, limit: int = 100) -> list[Task]:
         """List child tasks for a parent task.
@@ -139,36 +241,47 @@ class SQLTaskRepository:
             .limit(limit)
         )
         result = await self.session.execute(stmt)
-        return [self._model_to_task(m) for m in result.scalars().all()]
+        return await self._fold_events(result.scalars().all())
 
     async def list_by_tenant(
-        self, tenant_id: str, limit: int = 100, offset: int = 0
+        self,
+        tenant_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> list[Task]:
         """List tasks for a tenant with pagination.
 
-        Multi-tenancy enforced: always filters by tenant_id.
+        Multi-tenancy enforced: always filters by tenant_id. When a cursor is
+        given, seeks on the (tenant_id, created_at, id) index instead of
+        skipping rows with OFFSET.
 
         Args:
             tenant_id: Tenant identifier to filter by
             limit: Maximum number of tasks to return (default: 100)
-            offset: Number of tasks to skip (default: 0)
+            offset: Number of tasks to skip (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
 
         Returns:
             List of tasks for the tenant, ordered by created_at desc
+
+        Raises:
+            ValueError: If cursor is malformed
         """
         stmt = (
             select(TaskModel)
             .where(TaskModel.tenant_id == tenant_id)
-            .order_by(TaskModel.created_at.desc())
+            .order_by(TaskModel.created_at.desc(), TaskModel.id.desc())
             .limit(limit)
-            .offset(offset)
         )
+        if cursor:
+            stmt = stmt.where(seek_after(TaskModel.created_at, TaskModel.id, cursor))
+        else:
+            stmt = stmt.offset(offset)
         result = await self.session.execute(stmt)
-        return [self._model_to_task(m) for m in result.scalars().all()]
+        return await self._fold_events(result.scalars().all())
 
-    async def list_by_skill(
-        self, tenant_id: str, skill_name: str, limit: int = 100
-    ) -> list[Task]:
+    async def list_by_skill(self, tenant_id: str, skill_name: str, limit: int = 100) -> list[Task]:
         """List tasks filtered by tenant and skill name.
 
         Multi-tenancy enforced: always filters by tenant_id.
@@ -188,7 +301,110 @@ class SQLTaskRepository:
             .limit(limit)
         )
         result = await self.session.execute(stmt)
-        return [self._model_to_task(m) for m in result.scalars().all()]
+        return await self._fold_events(result.scalars().all())
+
+    async def list_summaries(
+        self,
+        tenant_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        state: Optional[TaskState] = None,
+        skill_name: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> list[TaskSummary]:
+        """List task summaries matching all given filters, without loading messages.
+
+        All filters are pushed down into the query, which reads only scalar
+        columns and is served by the (tenant_id, state|skill_name, created_at,
+        id) and (agent_id, created_at, id) indexes.
+
+        Args:
+            tenant_id: Tenant identifier to filter by
+            agent_id: Agent identifier to filter by
+            state: Only tasks in this state
+            skill_name: Only tasks for this skill
+            created_after: Only tasks created after this time
+            created_before: Only tasks created before this time
+            limit: Maximum number of summaries to return (default: 100)
+            offset: Number of summaries to skip (default: 0), ignored when cursor is given
+            cursor: Opaque keyset cursor from a previous page (optional)
+
+        Returns:
+            Task summaries ordered by (created_at, id) desc
+
+        Raises:
+            ValueError: If neither tenant_id nor agent_id is given, or the
+                cursor is malformed
+        """
+        if tenant_id is None and agent_id is None:
+            raise ValueError("tenant_id or agent_id is required")
+
+        stmt = (
+            select(*_SUMMARY_COLUMNS)
+            .order_by(TaskModel.created_at.desc(), TaskModel.id.desc())
+            .limit(limit)
+        )
+        if tenant_id is not None:
+            stmt = stmt.where(TaskModel.tenant_id == tenant_id)
+        if agent_id is not None:
+            stmt = stmt.where(TaskModel.agent_id == agent_id)
+        if state is not None:
+            stmt = stmt.where(TaskModel.state == state.value)
+        if skill_name is not None:
+            stmt = stmt.where(TaskModel.skill_name == skill_name)
+        if created_after is not None:
+            stmt = stmt.where(TaskModel.created_at > created_after)
+        if created_before is not None:
+            stmt = stmt.where(TaskModel.created_at < created_before)
+        if cursor:
+            stmt = stmt.where(seek_after(TaskModel.created_at, TaskModel.id, cursor))
+        else:
+            stmt = stmt.offset(offset)
+
+        rows = (await self.session.execute(stmt)).all()
+        return [
+            TaskSummary(
+                id=row.id,
+                agent_id=row.agent_id,
+                state=TaskState(row.state),
+                tenant_id=row.tenant_id,
+                skill_name=row.skill_name,
+                input_summary=row.input_summary,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+                message_count=row.message_count,
+                artifact_count=row.artifact_count,
+            )
+            for row in rows
+        ]
+
+    async def _fold_events(self, models: Any) -> list[Task]:
+        """Convert task rows to tasks, applying their pending events.
+
+        Args:
+            models: ORM task models
+
+        Returns:
+            Tasks in the same order, reflecting all appended changes
+        """
+        tasks = [self._model_to_task(m) for m in models]
+        if not tasks:
+            return tasks
+
+        stmt = (
+            select(TaskEventModel.task_id, TaskEventModel.changes)
+            .where(TaskEventModel.task_id.in_([t.id for t in tasks]))
+            .order_by(TaskEventModel.id)
+        )
+        pending: dict[str, list[dict[str, Any]]] = {}
+        for task_id, changes in (await self.session.execute(stmt)).all():
+            pending.setdefault(task_id, []).append(changes)
+        if not pending:
+            return tasks
+        return [apply_changes(t, pending.get(t.id, [])) for t in tasks]
 
     def _task_to_model(self, task: Task) -> TaskModel:
         """Convert Pydantic Task to ORM TaskModel.
@@ -213,6 +429,8 @@ class SQLTaskRepository:
             messages=[m.model_dump(mode="json") for m in task.messages],
             artifacts=[a.model_dump(mode="json") for a in task.artifacts],
             error=task.error.model_dump(mode="json") if task.error else None,
+            message_count=len(task.messages),
+            artifact_count=len(task.artifacts),
             created_at=task.created_at,
             updated_at=task.updated_at,
         )
@@ -249,3 +467,119 @@ class SQLTaskRepository:
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
+
+
+class DatabaseTaskRepository:
+    """TaskRepository over a Database, using one short session per operation.
+
+    SQLTaskRepository is bound to a single request's session; this wrapper
+    can instead be shared for the lifetime of the application (including by
+    background producers that outlive the request), which makes it usable as
+    the API's task store when several worker processes share one database.
+    Writes go through Database.write() so they benefit from the write queue
+    when it is enabled. Tables are created on first use.
+
+    Example:
+        >>> repo = DatabaseTaskRepository(Database(DatabaseConfig(url=url)))
+        >>> await repo.save(task)
+    """
+
+    def __init__(self, database: Database, compact_threshold: int = 64) -> None:
+        """Initialize repository with a database.
+
+        Args:
+            database: Database holding the task tables
+            compact_threshold: Passed to SQLTaskRepository
+        """
+        self.database = database
+        self.compact_threshold = compact_threshold
+        self._tables_ready = False
+
+    async def save(self, task: Task) -> None:
+        """Persist a new task (see SQLTaskRepository.save)."""
+        await self._write(lambda repo: repo.save(task))
+
+    async def get(self, task_id: str) -> Optional[Task]:
+        """Retrieve a task by ID (see SQLTaskRepository.get)."""
+        return await self._read(lambda repo: repo.get(task_id))
+
+    async def update(self, task: Task) -> None:
+        """Update an existing task (see SQLTaskRepository.update)."""
+        await self._write(lambda repo: repo.update(task))
+
+    async def append_changes(self, task_id: str, changes: list[dict[str, Any]]) -> None:
+        """Append incremental change sets (see SQLTaskRepository.append_changes)."""
+        if changes:
+            await self._write(lambda repo: repo.append_changes(task_id, changes))
+
+    async def delete(self, task_id: str) -> None:
+        """Delete a task by ID (see SQLTaskRepository.delete)."""
+        await self._write(lambda repo: repo.delete(task_id))
+
+    async def list_by_agent(self, agent_id: str, limit: int = 100) -> list[Task]:
+        """List tasks for an agent (see SQLTaskRepository.list_by_agent)."""
+        return await self._read(lambda repo: repo.list_by_agent(agent_id, limit))
+
+    async def list_by_parent(self, parent_task_id: str, limit: int = 100) -> list[Task]:
+        """List child tasks (see SQLTaskRepository.list_by_parent)."""
+        return await self._read(lambda repo: repo.list_by_parent(parent_task_id, limit))
+
+    async def list_by_tenant(
+        self,
+        tenant_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> list[Task]:
+        """List tasks for a tenant (see SQLTaskRepository.list_by_tenant)."""
+        return await self._read(lambda repo: repo.list_by_tenant(tenant_id, limit, offset, cursor))
+
+    async def list_by_skill(self, tenant_id: str, skill_name: str, limit: int = 100) -> list[Task]:
+        """List tasks for a tenant and skill (see SQLTaskRepository.list_by_skill)."""
+        return await self._read(lambda repo: repo.list_by_skill(tenant_id, skill_name, limit))
+
+    async def list_summaries(
+        self,
+        tenant_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        state: Optional[TaskState] = None,
+        skill_name: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> list[TaskSummary]:
+        """List task summaries (see SQLTaskRepository.list_summaries)."""
+        return await self._read(
+            lambda repo: repo.list_summaries(
+                tenant_id=tenant_id,
+                agent_id=agent_id,
+                state=state,
+                skill_name=skill_name,
+                created_after=created_after,
+                created_before=created_before,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+            )
+        )
+
+    async def _ensure_tables(self) -> None:
+        """Create the tables once per process."""
+        if not self._tables_ready:
+            await self.database.create_tables()
+            self._tables_ready = True
+
+    async def _read(self, operation: Callable[[SQLTaskRepository], Awaitable[T]]) -> T:
+        """Run a read operation in its own session."""
+        await self._ensure_tables()
+        async with self.database.session() as session:
+            return await operation(SQLTaskRepository(session, self.compact_threshold))
+
+    async def _write(self, operation: Callable[[SQLTaskRepository], Awaitable[T]]) -> T:
+        """Run a write operation and return once it has been committed."""
+        await self._ensure_tables()
+        return await self.database.write(
+            lambda session: operation(SQLTaskRepository(session, self.compact_threshold))
+        )
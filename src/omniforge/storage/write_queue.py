@@ -0,0 +1,165 @@
+"""Group-commit write queue for database writes.
+
+SQLite serializes writers on a single lock and pays an fsync per committed
+transaction, so many tiny per-operation commits cap write throughput. This
+module provides a database-level queue drained by a single writer task. The
+writer collects the writes submitted by all repositories within a short time
+window, runs them in one session, commits once, and then resolves each
+caller's future.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+WriteOperation = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class WriteQueue:
+    """Single-writer queue that batches writes into group commits.
+
+    Each submitted operation is an async callable receiving the batch's
+    session. Operations in a batch run sequentially and are committed together.
+    If any operation or the commit fails, the batch is rolled back and each
+    operation is retried in its own transaction, so one bad write only fails
+    its own caller.
+
+    Operations must only touch the database through the given session, since
+    they may be re-run after a rollback. A caller that is cancelled while
+    waiting does not cancel its write.
+
+    Attributes:
+        batch_window: Seconds to wait for more writes after the first arrives
+        max_batch: Maximum number of operations per group commit
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        batch_window: float = 0.002,
+        max_batch: int = 128,
+    ) -> None:
+        """Initialize the write queue.
+
+        Args:
+            session_factory: Factory creating new async sessions
+            batch_window: Seconds to wait for more writes after the first
+                arrives (default: 2ms)
+            max_batch: Maximum number of operations per group commit
+        """
+        self._session_factory = session_factory
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._batch_count = 0
+        self._write_count = 0
+
+    async def submit(self, operation: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """Queue a write and wait until it has been committed.
+
+        Args:
+            operation: Async callable performing the write with the given session
+
+        Returns:
+            The operation's return value, once its batch has committed
+
+        Raises:
+            Exception: Whatever the operation (or its commit) raised
+        """
+        queue = self._ensure_started()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((operation, future))
+        return await asyncio.shield(future)
+
+    async def close(self) -> None:
+        """Commit all pending writes and stop the writer task."""
+        if self._writer is None or self._queue is None:
+            return
+        if not self._writer.done():
+            self._queue.put_nowait(None)
+            await self._writer
+        self._writer = None
+        self._queue = None
+
+    def stats(self) -> dict[str, Any]:
+        """Get write queue statistics.
+
+        Returns:
+            Dictionary with pending write count, committed batch and write counts
+        """
+        return {
+            "pending": self._queue.qsize() if self._queue else 0,
+            "batches": self._batch_count,
+            "writes": self._write_count,
+        }
+
+    def _ensure_started(self) -> asyncio.Queue:
+        """Start the writer task on the running loop if needed."""
+        if self._queue is None or self._writer is None or self._writer.done():
+            self._queue = asyncio.Queue()
+            self._writer = asyncio.get_running_loop().create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """Writer loop: gather a batch, group-commit it, repeat until closed."""
+        stopping = False
+        while not stopping:
+            first = await queue.get()
+            if first is None:
+                break
+
+            if self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)
+
+            batch = [first]
+            while len(batch) < self.max_batch and not queue.empty():
+                item = queue.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._commit_batch(batch)
+
+    async def _commit_batch(self, batch: list[tuple[WriteOperation, asyncio.Future]]) -> None:
+        """Run a batch in one transaction, falling back to one transaction per write."""
+        results = []
+        try:
+            async with self._session_factory() as session:
+                for operation, _ in batch:
+                    results.append(await operation(session))
+                await session.commit()
+        except Exception as e:
+            if len(batch) == 1:
+                self._settle(batch[0][1], error=e)
+                return
+            logger.warning(
+                f"Group commit of {len(batch)} writes failed, retrying individually: {e}"
+            )
+            for item in batch:
+                await self._commit_batch([item])
+            return
+
+        self._batch_count += 1
+        self._write_count += len(batch)
+        for (_, future), result in zip(batch, results):
+            self._settle(future, result=result)
+
+    @staticmethod
+    def _settle(
+        future: asyncio.Future, result: Any = None, error: Optional[BaseException] = None
+    ) -> None:
+        """Resolve a caller's future unless it was already cancelled."""
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
@@ -4,6 +4,9 @@ This module provides models for task management, state tracking, and
 lifecycle events in the OmniForge agent platform.
 """
 
+# Initialize omniforge.agents first: tasks.models imports agents.models, and
+# the agents package imports TaskState back from tasks.models while loading
+import omniforge.agents  # noqa: F401  # isort: skip
 from omniforge.tasks.models import (
     Artifact,
     MessagePart,
@@ -13,6 +16,7 @@ from omniforge.tasks.models import (
     TaskMessage,
     TaskSendRequest,
     TaskState,
+    TaskSummary,
 )
 
 __all__ = [
@@ -24,4 +28,5 @@ __all__ = [
     "TaskMessage",
     "TaskSendRequest",
     "TaskState",
+    "TaskSummary",
 ]
@@ -18,6 +18,7 @@ from omniforge.agents.events import (
     TaskStatusEvent,
 )
 from omniforge.storage.base import AgentRepository, TaskRepository
+from omniforge.storage.task_events import TaskChangeBuffer
 from omniforge.tasks.models import Task, TaskCreateRequest, TaskError, TaskMessage, TaskState
 
 
@@ -216,6 +217,8 @@ class TaskManager:
 
         Yields events as they arrive while keeping the task in the repository
         up-to-date so crash recovery, polling, and auditing work correctly.
+        Changes are appended to the task's event log in small batches; the
+        buffer is flushed on terminal states and when processing ends.
 
         Args:
             task: Task to process
@@ -234,11 +237,13 @@ class TaskManager:
         # Type narrow agent to BaseAgent for mypy
         agent = cast(BaseAgent, agent)
 
-        current_task = task
-        # Note: mypy has issues with AsyncIterator return type on async generators
-        async for event in agent.process_task(task):  # type: ignore[attr-defined]
-            updated = self.apply_event(current_task, event)
-            if updated is not current_task:
-                await self._task_repo.update(updated)
-                current_task = updated
-            yield event
+        changes = TaskChangeBuffer(self._task_repo, task)
+        try:
+            # Note: mypy has issues with AsyncIterator return type on async generators
+            async for event in agent.process_task(task):  # type: ignore[attr-defined]
+                updated = self.apply_event(changes.task, event)
+                if updated is not changes.task:
+                    await changes.record(updated)
+                yield event
+        finally:
+            await changes.flush()
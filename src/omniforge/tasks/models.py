@@ -192,6 +192,57 @@ class Task(BaseModel):
         return new_state in valid_transitions.get(self.state, set())
 
 
+class TaskSummary(BaseModel):
+    """Lightweight view of a task for listings, without messages or artifacts.
+
+    Attributes:
+        id: Unique identifier for the task
+        agent_id: ID of the agent handling this task
+        state: Current state of the task
+        tenant_id: Multi-tenancy identifier
+        skill_name: Skill the task was created for
+        input_summary: Brief summary of the task input
+        created_at: Timestamp when task was created
+        updated_at: Timestamp of last update
+        message_count: Number of messages in the task
+        artifact_count: Number of artifacts produced by the task
+    """
+
+    id: str
+    agent_id: str
+    state: TaskState
+    tenant_id: Optional[str] = None
+    skill_name: Optional[str] = None
+    input_summary: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    message_count: int = 0
+    artifact_count: int = 0
+
+    @classmethod
+    def from_task(cls, task: Task) -> "TaskSummary":
+        """Summarize a full task.
+
+        Args:
+            task: Task to summarize
+
+        Returns:
+            Summary of the task
+        """
+        return cls(
+            id=task.id,
+            agent_id=task.agent_id,
+            state=task.state,
+            tenant_id=task.tenant_id,
+            skill_name=task.skill_name,
+            input_summary=task.input_summary,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+            message_count=len(task.messages),
+            artifact_count=len(task.artifacts),
+        )
+
+
 class TaskCreateRequest(BaseModel):
     """Request model for creating a new task.
 
@@ -0,0 +1,636 @@
+"""Resumable task event streams.
+
+Each task's SSE stream is produced once, by a background producer that runs
+the agent, and fanned out to any number of subscribers. Every frame gets a
+monotonically increasing ID. Recent frames are kept in a bounded per-stream
+ring buffer, and frames evicted from the ring overflow to a StreamEventLog.
+A client that reconnects with ``Last-Event-ID`` therefore gets everything
+it missed replayed before it starts tailing live frames.
+
+The producer is detached from the HTTP request that started it. If every
+subscriber goes away, it keeps running for a grace period so a reconnecting
+client can pick the stream back up. After that it is cancelled so nobody
+pays for abandoned work: the stream's CancellationToken, current while the
+producer runs, cancels the agent's reasoning and in-flight tool/LLM calls.
+
+Frames are encoded to bytes once, however many subscribers they fan out
+to, and coalesce_frames() batches token-level partial message frames into
+fewer, larger writes per subscriber.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import AsyncIterator, Awaitable, Callable, Optional, Protocol
+
+from omniforge.execution.cancellation import CancellationToken, use_cancellation_token
+
+logger = logging.getLogger(__name__)
+
+# Number of expired streams whose last frame ID is remembered
+_MAX_EXPIRED_IDS = 10_000
+
+
+@lru_cache(maxsize=128)
+def _frame_prefix(event: str) -> bytes:
+    """Return the encoded leading lines of a frame of an event type."""
+    return f"event: {event}\ndata: ".encode()
+
+
+class StreamEvent(Protocol):
+    """Event that can be published to a stream (e.g. a TaskEvent)."""
+
+    @property
+    def type(self) -> str:
+        """SSE event type of the event."""
+        ...
+
+    def model_dump_json(self) -> str:
+        """Serialize the event to JSON."""
+        ...
+
+
+@dataclass(frozen=True)
+class StreamFrame:
+    """A single SSE frame of a task stream.
+
+    Attributes:
+        id: Position of the frame in its stream, starting at 1
+        event: SSE event type
+        data: JSON-encoded event payload
+        partial: Whether the frame carries a partial (token-level) message
+            that may be delayed briefly to be sent together with the next ones
+    """
+
+    id: int
+    event: str
+    data: str
+    partial: bool = field(default=False, compare=False)
+
+    def encode(self) -> str:
+        """Format the frame for the wire.
+
+        The ``id`` field comes last so the frame still starts with its
+        ``event`` line, as before streams were resumable.
+
+        Returns:
+            SSE-formatted frame: "event: {event}\\ndata: {data}\\nid: {id}\\n\\n"
+        """
+        return f"event: {self.event}\ndata: {self.data}\nid: {self.id}\n\n"
+
+    @cached_property
+    def encoded(self) -> bytes:
+        """The frame as sent on the wire, encoded once for all subscribers."""
+        return b"%s%s\nid: %d\n\n" % (_frame_prefix(self.event), self.data.encode(), self.id)
+
+
+class StreamEventLog(Protocol):
+    """Storage for frames that overflowed a stream's ring buffer."""
+
+    async def append(self, stream_id: str, frames: list[StreamFrame]) -> None:
+        """Store frames, in ID order."""
+        ...
+
+    async def read(self, stream_id: str, after_id: int, limit: int) -> list[StreamFrame]:
+        """Return up to limit frames with an ID greater than after_id, in ID order."""
+        ...
+
+    async def discard(self, stream_id: str) -> None:
+        """Remove all frames of a stream."""
+        ...
+
+
+class InMemoryStreamEventLog:
+    """Process-local StreamEventLog, used when no database is configured."""
+
+    def __init__(self) -> None:
+        """Initialize an empty log."""
+        self._frames: dict[str, list[StreamFrame]] = {}
+
+    async def append(self, stream_id: str, frames: list[StreamFrame]) -> None:
+        """Store frames, in ID order.
+
+        Args:
+            stream_id: Stream the frames belong to
+            frames: Frames to store
+        """
+        self._frames.setdefault(stream_id, []).extend(frames)
+
+    async def read(self, stream_id: str, after_id: int, limit: int) -> list[StreamFrame]:
+        """Return frames after an ID.
+
+        Args:
+            stream_id: Stream to read
+            after_id: Only frames with a greater ID are returned
+            limit: Maximum number of frames to return
+
+        Returns:
+            Frames in ID order
+        """
+        frames = self._frames.get(stream_id, [])
+        if not frames:
+            return []
+        # IDs are contiguous, so the position of after_id is known
+        start = max(after_id - frames[0].id + 1, 0)
+        return frames[start : start + limit]
+
+    async def discard(self, stream_id: str) -> None:
+        """Remove all frames of a stream.
+
+        Args:
+            stream_id: Stream to remove
+        """
+        self._frames.pop(stream_id, None)
+
+
+class TaskStream:
+    """Frames of one task's event stream, fanned out to subscribers.
+
+    Frames are published by the stream's producer and read by subscribers,
+    each starting from its own Last-Event-ID.
+    """
+
+    def __init__(
+        self,
+        stream_id: str,
+        event_log: StreamEventLog,
+        buffer_size: int = 256,
+        overflow_batch: int = 64,
+        start_id: int = 0,
+        tenant_id: Optional[str] = None,
+    ) -> None:
+        """Initialize the stream.
+
+        Args:
+            stream_id: Stream identifier (the task ID)
+            event_log: Log receiving frames evicted from the ring buffer
+            buffer_size: Number of recent frames kept in memory
+            overflow_batch: Number of evicted frames written to the log at once
+            start_id: ID after which this stream's frames are numbered, so IDs
+                keep increasing when a task is streamed again
+            tenant_id: Tenant that opened the stream (None if no tenant context)
+        """
+        self.stream_id = stream_id
+        self.tenant_id = tenant_id
+        self._event_log = event_log
+        self._ring: deque[StreamFrame] = deque(maxlen=buffer_size)
+        # Evicted from the ring but not yet written to the log
+        self._overflow: list[StreamFrame] = []
+        self._overflow_batch = overflow_batch
+        self._start_id = start_id
+        self._last_id = start_id
+        self._closed = False
+        self._published = asyncio.Event()
+        self.subscribers = 0
+        self.cancellation = CancellationToken()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the producer has finished."""
+        return self._closed
+
+    @property
+    def last_id(self) -> int:
+        """ID of the most recently published frame (0 if none)."""
+        return self._last_id
+
+    async def publish(self, event: str, data: str, partial: bool = False) -> StreamFrame:
+        """Append a frame and wake up subscribers.
+
+        Args:
+            event: SSE event type
+            data: JSON-encoded event payload
+            partial: Whether the frame carries a partial message (see StreamFrame)
+
+        Returns:
+            The published frame
+
+        Raises:
+            RuntimeError: If the stream is closed
+        """
+        if self._closed:
+            raise RuntimeError(f"Stream {self.stream_id} is closed")
+
+        self._last_id += 1
+        frame = StreamFrame(self._last_id, event, data, partial)
+        if len(self._ring) == self._ring.maxlen:
+            self._overflow.append(self._ring[0])
+        self._ring.append(frame)
+        self.wake()
+
+        if len(self._overflow) >= self._overflow_batch:
+            await self._flush_overflow()
+        return frame
+
+    async def publish_event(self, event: StreamEvent) -> StreamFrame:
+        """Serialize and publish an event.
+
+        Args:
+            event: Event to publish; message events with ``is_partial`` set
+                are published as partial frames
+
+        Returns:
+            The published frame
+        """
+        return await self.publish(
+            event.type, event.model_dump_json(), getattr(event, "is_partial", False)
+        )
+
+    async def close(self) -> None:
+        """Mark the stream as finished and persist pending overflow."""
+        if self._closed:
+            return
+        self._closed = True
+        self.wake()
+        await self._flush_overflow()
+
+    async def subscribe(
+        self, last_event_id: int = 0, stop: Optional[asyncio.Event] = None
+    ) -> AsyncIterator[StreamFrame]:
+        """Replay frames after last_event_id, then tail live frames.
+
+        Args:
+            last_event_id: ID of the last frame the client received (0 for all)
+            stop: Event ending the subscription early once set; call wake()
+                after setting it to interrupt a subscriber waiting for frames
+
+        Yields:
+            Frames in ID order, until the stream is closed or stop is set
+        """
+        cursor = last_event_id
+        self.subscribers += 1
+        try:
+            while stop is None or not stop.is_set():
+                published = self._published
+                frames = await self.read(cursor)
+                for frame in frames:
+                    yield frame
+                    cursor = frame.id
+                if frames:
+                    continue
+                if self._closed:
+                    return
+                await published.wait()
+        finally:
+            self.subscribers -= 1
+
+    async def read(self, after_id: int, limit: int = 500) -> list[StreamFrame]:
+        """Return available frames after an ID without waiting.
+
+        Args:
+            after_id: Only frames with a greater ID are returned
+            limit: Maximum number of frames read from the log
+
+        Returns:
+            Frames in ID order (empty if the caller is caught up)
+        """
+        # Frames of earlier runs of the same task are not replayed
+        after_id = max(after_id, self._start_id)
+        pending = self._last_id - after_id
+        if pending <= 0:
+            return []
+        ring = self._ring
+        if pending <= len(ring):
+            # Common case: a subscriber a few frames behind the producer
+            return [ring[i] for i in range(len(ring) - pending, len(ring))]
+
+        memory = self._overflow + list(ring)
+        first_in_memory = memory[0].id
+        if after_id + 1 < first_in_memory:
+            # The gap is older than anything in memory: read it from the log
+            return await self._event_log.read(
+                self.stream_id, after_id, min(limit, first_in_memory - after_id - 1)
+            )
+        return memory[after_id - first_in_memory + 1 :]
+
+    def wake(self) -> None:
+        """Wake up all subscribers waiting for a new frame."""
+        self._published.set()
+        self._published = asyncio.Event()
+
+    async def _flush_overflow(self) -> None:
+        """Write evicted frames to the log."""
+        if not self._overflow:
+            return
+        frames = list(self._overflow)
+        try:
+            await self._event_log.append(self.stream_id, frames)
+        except Exception as e:
+            # Keep them in memory: replay still works, just without the bound
+            logger.error(f"Failed to persist frames of stream {self.stream_id}: {e}")
+            return
+        # Frames evicted while writing stay pending
+        self._overflow = self._overflow[len(frames) :]
+
+
+StreamProducer = Callable[[TaskStream], Awaitable[None]]
+
+
+class TaskStreamHub:
+    """Registry of live task streams and their producers.
+
+    Attributes:
+        event_log: Log receiving frames that overflow a stream's ring buffer
+        buffer_size: Number of recent frames kept in memory per stream
+        resume_grace: Seconds a producer keeps running without subscribers
+        retention: Seconds a finished stream remains available for replay
+        flush_interval: Seconds partial frames may be held back to be coalesced
+        flush_bytes: Size at which coalesced frames are written regardless
+
+    Example:
+        >>> hub = TaskStreamHub()
+        >>> stream = hub.open(task.id, produce)
+        >>> async for chunk in hub.subscribe_encoded(stream.stream_id, last_event_id=0):
+        ...     yield chunk
+    """
+
+    def __init__(
+        self,
+        event_log: Optional[StreamEventLog] = None,
+        buffer_size: int = 256,
+        resume_grace: float = 30.0,
+        retention: float = 300.0,
+        flush_interval: float = 0.02,
+        flush_bytes: int = 4096,
+    ) -> None:
+        """Initialize the hub.
+
+        Args:
+            event_log: Overflow log (default: process-local InMemoryStreamEventLog)
+            buffer_size: Number of recent frames kept in memory per stream
+            resume_grace: Seconds a producer keeps running without subscribers
+            retention: Seconds a finished stream remains available for replay
+            flush_interval: Seconds partial frames may be held back to be coalesced
+            flush_bytes: Size at which coalesced frames are written regardless
+
+        Raises:
+            ValueError: If buffer_size is not positive
+        """
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be positive")
+        self.event_log: StreamEventLog = event_log or InMemoryStreamEventLog()
+        self.buffer_size = buffer_size
+        self.resume_grace = resume_grace
+        self.retention = retention
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self._streams: dict[str, TaskStream] = {}
+        self._producers: dict[str, asyncio.Task] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._discards: set[asyncio.Task] = set()
+        # Last frame IDs of expired streams, so a re-opened stream does not
+        # reuse IDs a client may still send as Last-Event-ID
+        self._expired_ids: OrderedDict[str, int] = OrderedDict()
+
+    def open(
+        self, stream_id: str, producer: StreamProducer, tenant_id: Optional[str] = None
+    ) -> TaskStream:
+        """Create a stream and start its producer in the background.
+
+        Args:
+            stream_id: Stream identifier (the task ID)
+            producer: Coroutine function publishing frames to the stream
+            tenant_id: Tenant that opened the stream, checked when resuming it
+
+        Returns:
+            The new stream
+
+        Raises:
+            ValueError: If a stream with this ID is still running
+        """
+        existing = self._streams.get(stream_id)
+        if existing is not None and not existing.closed:
+            raise ValueError(f"Stream {stream_id} is already running")
+        self._cancel_timer(stream_id)
+
+        if existing is not None:
+            start_id = existing.last_id
+        else:
+            start_id = self._expired_ids.pop(stream_id, 0)
+        stream = TaskStream(
+            stream_id,
+            self.event_log,
+            buffer_size=self.buffer_size,
+            start_id=start_id,
+            tenant_id=tenant_id,
+        )
+        self._streams[stream_id] = stream
+        self._producers[stream_id] = asyncio.get_running_loop().create_task(
+            self._run(stream, producer)
+        )
+        # Cancelled as soon as the first subscriber arrives
+        self._schedule(stream_id, self.resume_grace, self._abandon)
+        return stream
+
+    def get(self, stream_id: str) -> Optional[TaskStream]:
+        """Return a stream that is running or retained for replay.
+
+        Args:
+            stream_id: Stream identifier
+
+        Returns:
+            The stream, or None if unknown or expired
+        """
+        return self._streams.get(stream_id)
+
+    async def subscribe(
+        self, stream_id: str, last_event_id: int = 0, stop: Optional[asyncio.Event] = None
+    ) -> AsyncIterator[StreamFrame]:
+        """Replay and tail a stream, keeping its producer alive while subscribed.
+
+        Args:
+            stream_id: Stream identifier
+            last_event_id: ID of the last frame the client received (0 for all)
+            stop: Event ending the subscription early (see TaskStream.subscribe)
+
+        Yields:
+            Frames in ID order, until the stream is closed or stop is set
+
+        Raises:
+            ValueError: If the stream is unknown or expired
+        """
+        stream = self._streams.get(stream_id)
+        if stream is None:
+            raise ValueError(f"Stream {stream_id} not found")
+
+        if not stream.closed:
+            self._cancel_timer(stream_id)
+        try:
+            async for frame in stream.subscribe(last_event_id, stop):
+                yield frame
+        finally:
+            if stream.subscribers == 0 and not stream.closed:
+                self._schedule(stream_id, self.resume_grace, self._abandon)
+
+    def subscribe_encoded(
+        self, stream_id: str, last_event_id: int = 0, stop: Optional[asyncio.Event] = None
+    ) -> AsyncIterator[bytes]:
+        """Like subscribe(), but yield encoded, coalesced SSE chunks.
+
+        Args:
+            stream_id: Stream identifier
+            last_event_id: ID of the last frame the client received (0 for all)
+            stop: Event ending the subscription early (see TaskStream.subscribe)
+
+        Returns:
+            Iterator of SSE chunks, each holding one or more complete frames
+        """
+        return coalesce_frames(
+            self.subscribe(stream_id, last_event_id, stop),
+            flush_interval=self.flush_interval,
+            max_bytes=self.flush_bytes,
+        )
+
+    async def close(self) -> None:
+        """Cancel all producers and drop all streams."""
+        for handle in self._timers.values():
+            handle.cancel()
+        self._timers.clear()
+        producers = list(self._producers.values())
+        for stream_id, producer in self._producers.items():
+            self._streams[stream_id].cancellation.cancel("shutdown")
+            producer.cancel()
+        await asyncio.gather(*producers, return_exceptions=True)
+        await asyncio.gather(*self._discards, return_exceptions=True)
+        self._streams.clear()
+
+    async def _run(self, stream: TaskStream, producer: StreamProducer) -> None:
+        """Run a producer, then close its stream and schedule its expiry."""
+        # Agent code running on behalf of the stream finds its token in context
+        use_cancellation_token(stream.cancellation)
+        try:
+            await producer(stream)
+        except asyncio.CancelledError:
+            logger.info(f"Stream {stream.stream_id} producer cancelled")
+        except Exception as e:
+            logger.error(f"Stream {stream.stream_id} producer failed: {e}", exc_info=True)
+        finally:
+            self._producers.pop(stream.stream_id, None)
+            await stream.close()
+            self._schedule(stream.stream_id, self.retention, self._expire)
+
+    def _abandon(self, stream_id: str) -> None:
+        """Cancel a producer nobody has subscribed to within the grace period."""
+        producer = self._producers.get(stream_id)
+        stream = self._streams.get(stream_id)
+        if producer is not None and stream is not None and stream.subscribers == 0:
+            logger.info(f"Cancelling abandoned stream {stream_id}")
+            stream.cancellation.cancel("abandoned")
+            producer.cancel()
+
+    def _expire(self, stream_id: str) -> None:
+        """Forget a finished stream and its overflow frames."""
+        stream = self._streams.get(stream_id)
+        if stream is not None and stream.closed:
+            del self._streams[stream_id]
+            self._expired_ids[stream_id] = stream.last_id
+            if len(self._expired_ids) > _MAX_EXPIRED_IDS:
+                self._expired_ids.popitem(last=False)
+            discard = asyncio.get_running_loop().create_task(self.event_log.discard(stream_id))
+            self._discards.add(discard)
+            discard.add_done_callback(self._discard_done)
+
+    def _discard_done(self, discard: asyncio.Task) -> None:
+        """Forget a finished overflow discard, logging its failure."""
+        self._discards.discard(discard)
+        if not discard.cancelled() and discard.exception() is not None:
+            logger.warning(f"Failed to discard stream overflow: {discard.exception()}")
+
+    def _schedule(self, stream_id: str, delay: float, callback: Callable[[str], None]) -> None:
+        """Replace a stream's pending timer."""
+        self._cancel_timer(stream_id)
+
+        def fire() -> None:
+            self._timers.pop(stream_id, None)
+            callback(stream_id)
+
+        self._timers[stream_id] = asyncio.get_running_loop().call_later(delay, fire)
+
+    def _cancel_timer(self, stream_id: str) -> None:
+        """Cancel a stream's pending timer, if any."""
+        handle = self._timers.pop(stream_id, None)
+        if handle is not None:
+            handle.cancel()
+
+
+async def coalesce_frames(
+    frames: AsyncIterator[StreamFrame], flush_interval: float = 0.02, max_bytes: int = 4096
+) -> AsyncIterator[bytes]:
+    """Encode frames, batching partial message frames into fewer writes.
+
+    A partial frame is held back for up to flush_interval seconds, or until
+    max_bytes are pending, so that the tokens following it are written in
+    the same chunk. Any other frame (status, artifact, done, error, a final
+    message) is written immediately, together with whatever is pending.
+
+    Args:
+        frames: Frames to encode, e.g. from TaskStreamHub.subscribe()
+        flush_interval: Seconds a partial frame may be held back
+        max_bytes: Pending size at which frames are written regardless
+
+    Yields:
+        Chunks of one or more complete SSE frames
+    """
+    loop = asyncio.get_running_loop()
+    pending: list[bytes] = []
+    pending_size = 0
+    deadline = 0.0
+    # Next frame, awaited in a task only while frames are held back
+    next_frame: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if pending:
+                if next_frame is None:
+                    next_frame = asyncio.ensure_future(frames.__anext__())
+                done, _ = await asyncio.wait([next_frame], timeout=deadline - loop.time())
+                if not done:
+                    yield b"".join(pending)
+                    pending, pending_size = [], 0
+                    continue
+            try:
+                frame = await (next_frame if next_frame is not None else frames.__anext__())
+            except StopAsyncIteration:
+                break
+            next_frame = None
+
+            data = frame.encoded
+            pending.append(data)
+            pending_size += len(data)
+            if not frame.partial or pending_size >= max_bytes or flush_interval <= 0:
+                yield data if len(pending) == 1 else b"".join(pending)
+                pending, pending_size = [], 0
+            elif len(pending) == 1:
+                deadline = loop.time() + flush_interval
+
+        if pending:
+            yield b"".join(pending)
+    finally:
+        if next_frame is not None:
+            next_frame.cancel()
+            await asyncio.gather(next_frame, return_exceptions=True)
+        await frames.aclose()  # type: ignore[attr-defined]
+
+
+def parse_last_event_id(value: Optional[str]) -> int:
+    """Parse a Last-Event-ID header value.
+
+    Args:
+        value: Header value, if present
+
+    Returns:
+        The frame ID, or 0 if the header is missing
+
+    Raises:
+        ValueError: If the value is not a non-negative integer
+    """
+    if not value:
+        return 0
+    try:
+        last_event_id = int(value)
+    except ValueError:
+        raise ValueError(f"Invalid Last-Event-ID: {value}") from None
+    if last_event_id < 0:
+        raise ValueError(f"Invalid Last-Event-ID: {value}")
+    return last_event_id
@@ -192,6 +192,13 @@ class ToolCallContext(BaseModel):
         exclude=True,
         description="asyncio.Queue[TaskEvent] for forwarding events upstream (internal use)",
     )
+    # CancellationToken of the task; long-running tools should check
+    # cancellation.cancelled between units of work. Excluded like event_queue.
+    cancellation: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="CancellationToken of the task this call is part of (internal use)",
+    )
 
 
 class ToolResult(BaseModel):
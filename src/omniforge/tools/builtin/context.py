@@ -6,8 +6,9 @@ a TaskGraph pipeline to exchange structured data without embedding everything
 in task description strings.
 """
 
+import asyncio
 import time
-from typing import Any
+from typing import Any, Callable
 
 from omniforge.memory.working import get_context_store
 from omniforge.tools.base import (
@@ -21,6 +22,13 @@ from omniforge.tools.base import (
 from omniforge.tools.types import ToolType
 
 
+async def _call_store(operation: Callable[..., Any], *args: Any) -> Any:
+    """Call a context store method, in a worker thread if its backend blocks."""
+    if get_context_store().blocking:
+        return await asyncio.to_thread(operation, *args)
+    return operation(*args)
+
+
 class WriteContextTool(BaseTool):
     """Write a JSON-serialisable value into the shared context store.
 
@@ -75,7 +83,7 @@ class WriteContextTool(BaseTool):
 
         trace_id = context.trace_id or context.task_id
         try:
-            get_context_store().set(trace_id, key, value)
+            await _call_store(get_context_store().set, trace_id, key, value)
         except ValueError as exc:
             return ToolResult(
                 success=False,
@@ -129,7 +137,7 @@ class ReadContextTool(BaseTool):
             )
 
         trace_id = context.trace_id or context.task_id
-        value = get_context_store().get(trace_id, key)
+        value = await _call_store(get_context_store().get, trace_id, key)
 
         return ToolResult(
             success=True,
@@ -322,6 +322,7 @@ class ToolExecutor:
         Raises:
             ToolTimeoutError: If execution exceeds timeout
             ToolExecutionError: If execution fails after all retries
+            asyncio.CancelledError: If the task is cancelled
         """
         retry_config = tool.definition.retry_config
         timeout_seconds = tool.definition.timeout_ms / 1000.0
@@ -329,6 +330,10 @@ class ToolExecutor:
         retries_used = 0
 
         for attempt in range(retry_config.max_retries + 1):
+            # Stop retrying once the task has been cancelled
+            if context.cancellation is not None:
+                context.cancellation.raise_if_cancelled()
+
             start_time = time.time()
 
             try:
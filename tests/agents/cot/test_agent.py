@@ -1,5 +1,6 @@
 """Tests for CoTAgent base class."""
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
@@ -24,6 +25,7 @@ from omniforge.agents.models import (
     SkillOutputMode,
     TextPart,
 )
+from omniforge.execution.cancellation import CancellationToken, use_cancellation_token
 from omniforge.tasks.models import Task, TaskMessage, TaskState
 from omniforge.tools.registry import ToolRegistry
 
@@ -303,3 +305,66 @@ async def test_agent_card_generation(tool_registry: ToolRegistry) -> None:
     assert card.identity.name == "Simple CoT Agent"
     assert card.capabilities.streaming is True
     assert card.service_endpoint == "https://api.example.com/agents/simple-cot-agent"
+
+
+class BlockingCoTAgent(CoTAgent):
+    """CoT agent whose reasoning blocks until cancelled."""
+
+    identity = AgentIdentity(
+        id="blocking-cot-agent",
+        name="Blocking CoT Agent",
+        description="A CoT agent that never finishes reasoning",
+        version="1.0.0",
+    )
+    capabilities = AgentCapabilities(streaming=True)
+    skills = SimpleCoTAgent.skills
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.cancelled = asyncio.Event()
+
+    async def reason(self, task: Task, engine: ReasoningEngine) -> str:
+        """Emit one step, then wait (like a long tool call) until cancelled."""
+        engine.add_thinking("Waiting on a slow tool")
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+        return "unreachable"
+
+
+@pytest.mark.asyncio
+async def test_cot_agent_cancellation_token_cancels_reasoning(
+    tool_registry: ToolRegistry, sample_task: Task
+) -> None:
+    """Cancelling the current token should cancel in-flight reasoning."""
+    agent = BlockingCoTAgent(tool_registry=tool_registry)
+    token = CancellationToken()
+    use_cancellation_token(token)
+
+    events = agent.process_task(sample_task)
+    async for event in events:
+        if isinstance(event, ReasoningStepEvent):
+            break
+    token.cancel("client disconnected")
+
+    with pytest.raises(asyncio.CancelledError):
+        await events.__anext__()
+    assert agent.cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_cot_agent_closing_stream_cancels_reasoning(
+    tool_registry: ToolRegistry, sample_task: Task
+) -> None:
+    """Closing the event stream early should not leave reason() running."""
+    agent = BlockingCoTAgent(tool_registry=tool_registry)
+
+    events = agent.process_task(sample_task)
+    async for event in events:
+        if isinstance(event, ReasoningStepEvent):
+            break
+    await events.aclose()
+
+    await asyncio.wait_for(agent.cancelled.wait(), timeout=1)
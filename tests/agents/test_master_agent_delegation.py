@@ -440,3 +440,98 @@ class TestMakeSubtask:
         assert len(subtask.messages) == 6
         # The last message should be the current user message
         assert subtask.messages[-1].parts[0].text == "current"
+
+
+class TestSessionState:
+    """Tests for exporting and restoring resumable session state."""
+
+    @pytest.fixture
+    def offline_registry(
+        self, registry: AgentRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> AgentRegistry:
+        """Registry for agents whose built-in SkillCreationAgent needs no LLM credentials."""
+        from omniforge.skills.creation import agent as skill_creation_agent
+
+        monkeypatch.setattr(skill_creation_agent, "LLMResponseGenerator", MagicMock)
+        return registry
+
+    @pytest.mark.asyncio
+    async def test_round_trip_skill_creation_delegation(
+        self, offline_registry: AgentRegistry
+    ) -> None:
+        """Delegation to the built-in agent survives export and restore."""
+        agent = MasterAgent(agent_registry=offline_registry)
+        agent._set_delegated_agent(agent._skill_creation_agent)
+        agent._last_delegation_error = "previous failure"
+
+        restored = MasterAgent(agent_registry=offline_registry)
+        await restored.restore_session_state(agent.export_session_state())
+
+        assert restored._delegated_agent is restored._skill_creation_agent
+        assert restored._last_delegation_error == "previous failure"
+        assert restored._last_delegation_success is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_delegated_agent_is_dropped(
+        self, offline_registry: AgentRegistry
+    ) -> None:
+        """A delegated agent that no longer exists falls back to the master agent."""
+        agent = MasterAgent(agent_registry=offline_registry)
+        state = agent.export_session_state()
+        state["delegated_agent_id"] = "deleted-agent"
+
+        await agent.restore_session_state(state)
+
+        assert agent._delegated_agent is None
+
+    @pytest.mark.asyncio
+    async def test_round_trip_paused_hitl_session(self) -> None:
+        """Paused ReAct conversations are exported and restored."""
+        from omniforge.agents.autonomous_simple import PausedSession
+
+        agent = MasterAgent()
+        agent._hitl_sessions["conv-1"] = PausedSession(
+            conversation=[{"role": "user", "content": "make a skill"}],
+            question="For which language?",
+            task_id="task-1",
+        )
+
+        state = agent.export_session_state()
+        restored = MasterAgent()
+        await restored.restore_session_state(state)
+
+        paused = restored._hitl_sessions["conv-1"]
+        assert paused.conversation == [{"role": "user", "content": "make a skill"}]
+        assert paused.question == "For which language?"
+        assert paused.paused_at == agent._hitl_sessions["conv-1"].paused_at
+
+    def test_expired_hitl_sessions_not_exported(self) -> None:
+        """HITL sessions past their TTL are not exported."""
+        from datetime import timedelta
+
+        from omniforge.agents.autonomous_simple import PausedSession
+
+        agent = MasterAgent()
+        agent._hitl_sessions["conv-1"] = PausedSession(
+            conversation=[],
+            question="?",
+            task_id="task-1",
+            paused_at=datetime.utcnow() - timedelta(days=1),
+        )
+
+        assert agent.export_session_state()["hitl_sessions"] == {}
+
+    @pytest.mark.asyncio
+    async def test_aclose_disconnects_mcp(self) -> None:
+        """aclose() disconnects MCP servers and allows re-initialization."""
+        agent = MasterAgent()
+        manager = MagicMock()
+        manager.disconnect_all = AsyncMock()
+        agent._mcp_manager = manager
+        agent._mcp_initialized = True
+
+        await agent.aclose()
+
+        manager.disconnect_all.assert_awaited_once()
+        assert agent._mcp_manager is None
+        assert agent._mcp_initialized is False
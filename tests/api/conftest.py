@@ -79,3 +79,22 @@ def client() -> TestClient:
     with patch.object(chat_module, "_get_session_agent", return_value=mock_agent):
         with TestClient(app) as c:
             yield c
+
+
+@pytest.fixture
+def tenant_client() -> TestClient:
+    """Like client, but with tenant context taken from request headers."""
+    from omniforge.api.middleware.error_handler import setup_error_handlers
+    from omniforge.api.middleware.tenant import TenantMiddleware
+    from omniforge.api.routes.chat import router
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(TenantMiddleware)  # type: ignore[arg-type]
+    setup_error_handlers(app)
+
+    mock_agent = _MockChatAgent()
+
+    with patch.object(chat_module, "_get_session_agent", return_value=mock_agent):
+        with TestClient(app) as c:
+            yield c
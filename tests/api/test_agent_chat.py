@@ -92,14 +92,14 @@ async def registered_chat_agent() -> AsyncIterator[TestChatAgent]:
         TestChatAgent instance that is registered in the repository
     """
     # Clear task repository before each test to prevent data leakage
-    _task_repository._tasks.clear()
+    await _task_repository.clear()
 
     agent = TestChatAgent()
     await _agent_repository.save(agent)
     yield agent
     # Cleanup
     await _agent_repository.delete("chat-test-agent")
-    _task_repository._tasks.clear()
+    await _task_repository.clear()
 
 
 class TestChatEndpointStreaming:
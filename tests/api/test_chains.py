@@ -391,3 +391,51 @@ async def test_multiple_chains_for_task(client, repository):
 
     # Should return list or fail with auth
     assert response.status_code in [200, 401, 403]
+
+
+@pytest.mark.asyncio
+async def test_get_chain_steps_fills_page_past_hidden_steps(repository):
+    """Test that hidden steps are skipped and the page is filled from later rows."""
+    from omniforge.agents.cot.chain import VisibilityConfig
+    from omniforge.agents.cot.visibility import VisibilityConfiguration, VisibilityController
+    from omniforge.api.routes.chains import get_chain_steps
+
+    chain = ReasoningChain(task_id="task-1", agent_id="agent-1", tenant_id="tenant-1")
+    for i in range(120):
+        chain.add_step(
+            ReasoningStep(
+                step_number=i,
+                type=StepType.THINKING,
+                thinking=ThinkingInfo(content=f"Step {i}"),
+                # Only every fourth step is visible
+                visibility=VisibilityConfig(
+                    level=VisibilityLevel.FULL if i % 4 == 0 else VisibilityLevel.HIDDEN
+                ),
+            )
+        )
+    await repository.save(chain)
+    visibility = VisibilityController(VisibilityConfiguration())
+
+    async def page(cursor=None, offset=0):
+        return await get_chain_steps(
+            chain.id,
+            limit=20,
+            offset=offset,
+            cursor=cursor,
+            types=None,
+            repository=repository,
+            visibility=visibility,
+            user_role=None,
+            tenant_id=None,
+        )
+
+    first = await page()
+    second = await page(cursor=first.next_cursor)
+    by_offset = await page(offset=20)
+
+    assert [s["step_number"] for s in first.steps] == list(range(0, 80, 4))
+    assert first.next_cursor == 76
+    assert [s["step_number"] for s in second.steps] == list(range(80, 120, 4))
+    assert second.next_cursor is None
+    assert by_offset.steps == second.steps
+    assert first.total == 120
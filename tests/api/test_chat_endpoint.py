@@ -71,3 +71,39 @@ class TestChatEndpoint:
         )
 
         assert response.status_code == 200
+
+
+class TestChatResume:
+    """Tests for GET /api/v1/chat/{task_id}/events."""
+
+    def test_resume_replays_stream(self, tenant_client: TestClient) -> None:
+        """The tenant that opened a chat stream should be able to resume it."""
+        headers = {"X-Tenant-ID": "tenant-1"}
+        response = tenant_client.post("/api/v1/chat", json={"message": "Hello"}, headers=headers)
+        task_id = response.headers["X-Task-ID"]
+
+        resumed = tenant_client.get(
+            f"/api/v1/chat/{task_id}/events", headers={**headers, "Last-Event-ID": "1"}
+        )
+
+        assert resumed.status_code == 200
+        assert "final_state" in resumed.text
+
+    def test_resume_by_other_tenant_rejected(self, tenant_client: TestClient) -> None:
+        """Another tenant should not be able to replay a chat stream."""
+        response = tenant_client.post(
+            "/api/v1/chat", json={"message": "Hello"}, headers={"X-Tenant-ID": "tenant-1"}
+        )
+        task_id = response.headers["X-Task-ID"]
+
+        resumed = tenant_client.get(
+            f"/api/v1/chat/{task_id}/events", headers={"X-Tenant-ID": "tenant-2"}
+        )
+
+        assert resumed.status_code == 403
+
+    def test_resume_unknown_stream_returns_404(self, tenant_client: TestClient) -> None:
+        """Resuming a stream that does not exist should return 404."""
+        response = tenant_client.get("/api/v1/chat/missing/events")
+
+        assert response.status_code == 404
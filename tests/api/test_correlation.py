@@ -0,0 +1,92 @@
+"""Tests for correlation ID middleware."""
+
+from typing import AsyncIterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from omniforge.api.middleware.correlation import CorrelationIdMiddleware
+from omniforge.observability.logging import get_correlation_id
+
+
+class TestCorrelationIdMiddleware:
+    """Tests for CorrelationIdMiddleware."""
+
+    @pytest.fixture
+    def app(self) -> FastAPI:
+        """Create test FastAPI app with correlation ID middleware."""
+        test_app = FastAPI()
+        test_app.add_middleware(CorrelationIdMiddleware)  # type: ignore[arg-type]
+
+        @test_app.get("/test/id")
+        async def get_id(request: Request) -> dict:
+            return {
+                "context": get_correlation_id(),
+                "state": request.state.correlation_id,
+            }
+
+        @test_app.get("/test/stream")
+        async def stream() -> StreamingResponse:
+            async def chunks() -> AsyncIterator[str]:
+                for i in range(3):
+                    yield f"data: {i}\n\n"
+
+            return StreamingResponse(chunks(), media_type="text/event-stream")
+
+        @test_app.get("/test/fail")
+        async def fail() -> None:
+            raise RuntimeError("boom")
+
+        return test_app
+
+    @pytest.fixture
+    def client(self, app: FastAPI) -> TestClient:
+        """Create test client."""
+        return TestClient(app, raise_server_exceptions=False)
+
+    def test_generates_correlation_id(self, client: TestClient) -> None:
+        """A correlation ID should be generated and returned when none is sent."""
+        response = client.get("/test/id")
+
+        correlation_id = response.headers["X-Correlation-ID"]
+        assert correlation_id
+        assert response.json() == {"context": correlation_id, "state": correlation_id}
+
+    def test_propagates_incoming_correlation_id(self, client: TestClient) -> None:
+        """An incoming X-Correlation-ID should be reused."""
+        response = client.get("/test/id", headers={"X-Correlation-ID": "abc-123"})
+
+        assert response.headers["X-Correlation-ID"] == "abc-123"
+        assert response.json() == {"context": "abc-123", "state": "abc-123"}
+
+    def test_streaming_response_passes_through(self, client: TestClient) -> None:
+        """Streaming bodies should be delivered intact with the header attached."""
+        with client.stream("GET", "/test/stream") as response:
+            body = "".join(response.iter_text())
+
+        assert response.headers["X-Correlation-ID"]
+        assert body == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+
+    def test_records_metrics_after_response(self, client: TestClient) -> None:
+        """Request metrics should be recorded with the response status."""
+        collector = MagicMock()
+        with patch(
+            "omniforge.api.middleware.correlation.get_metrics_collector",
+            return_value=collector,
+        ):
+            client.get("/test/stream")
+
+        collector.record_http_request.assert_called_once()
+        kwargs = collector.record_http_request.call_args.kwargs
+        assert kwargs["method"] == "GET"
+        assert kwargs["endpoint"] == "/test/stream"
+        assert kwargs["status_code"] == 200
+
+    def test_exception_is_reraised(self, client: TestClient) -> None:
+        """Unhandled errors should propagate to the server error handler."""
+        response = client.get("/test/fail")
+
+        assert response.status_code == 500
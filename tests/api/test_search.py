@@ -0,0 +1,125 @@
+"""Tests for the full-text search API endpoint."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from omniforge.api.app import create_app
+from omniforge.api.routes.search import get_search_index
+from omniforge.conversation.models import MessageRole
+from omniforge.conversation.sqlite_repository import SQLiteConversationRepository
+from omniforge.storage.database import Database, DatabaseConfig
+from omniforge.storage.search import SearchIndex
+
+
+@pytest.fixture
+def database(tmp_path) -> Database:
+    """Create a file-backed database seeded with messages for two tenants."""
+    db = Database(DatabaseConfig(url=f"sqlite+aiosqlite:///{tmp_path / 'search.db'}"))
+
+    async def seed() -> None:
+        await db.create_tables()
+        repo = SQLiteConversationRepository(db)
+        for tenant_id in ("tenant-1", "tenant-2"):
+            conv = await repo.create_conversation(tenant_id, "user-1")
+            await repo.add_message(conv.id, tenant_id, MessageRole.USER, f"invoice for {tenant_id}")
+        # Release connections bound to this event loop
+        await db.close()
+
+    asyncio.run(seed())
+    return db
+
+
+@pytest.fixture
+def client(database: Database) -> TestClient:
+    """Create test client searching the seeded database."""
+    app = create_app()
+    app.dependency_overrides[get_search_index] = lambda: SearchIndex(database)
+    return TestClient(app)
+
+
+class TestSearchEndpoint:
+    """Tests for GET /api/v1/search."""
+
+    def test_search_returns_tenant_results(self, client: TestClient) -> None:
+        response = client.get(
+            "/api/v1/search", params={"q": "invoice"}, headers={"X-Tenant-ID": "tenant-1"}
+        )
+
+        assert response.status_code == 200
+        results = response.json()
+        assert len(results) == 1
+        assert results[0]["kind"] == "message"
+        assert results[0]["snippet"] == "[invoice] for tenant-1"
+
+    def test_search_filters_by_kind(self, client: TestClient) -> None:
+        response = client.get(
+            "/api/v1/search",
+            params={"q": "invoice", "kind": "task"},
+            headers={"X-Tenant-ID": "tenant-1"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_search_requires_tenant(self, client: TestClient) -> None:
+        response = client.get("/api/v1/search", params={"q": "invoice"})
+
+        assert response.status_code == 401
+
+    def test_search_requires_query(self, client: TestClient) -> None:
+        response = client.get("/api/v1/search", headers={"X-Tenant-ID": "tenant-1"})
+
+        assert response.status_code == 422
+
+
+class TestSearchDatabase:
+    """Tests for the database the search endpoint uses without overrides."""
+
+    def test_search_uses_application_database(
+        self, tmp_path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With the default config, search should query the lifespan database."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+        app = create_app()
+
+        async def seed() -> None:
+            repo = SQLiteConversationRepository(app.state.database)
+            conv = await repo.create_conversation("tenant-1", "user-1")
+            await repo.add_message(conv.id, "tenant-1", MessageRole.USER, "quarterly invoice")
+
+        with TestClient(app) as client:
+            client.portal.call(seed)
+            response = client.get(
+                "/api/v1/search", params={"q": "invoice"}, headers={"X-Tenant-ID": "tenant-1"}
+            )
+
+        assert response.status_code == 200
+        assert [result["snippet"] for result in response.json()] == ["quarterly [invoice]"]
+
+    def test_search_without_lifespan_creates_tables(self) -> None:
+        """Apps run without the lifespan should still serve search."""
+        client = TestClient(create_app())
+
+        response = client.get(
+            "/api/v1/search", params={"q": "invoice"}, headers={"X-Tenant-ID": "tenant-1"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_search_on_unsupported_dialect(self) -> None:
+        """Databases without full-text search should get 501, not 500."""
+        database = MagicMock()
+        database.engine.dialect.name = "mysql"
+        app = create_app()
+        app.dependency_overrides[get_search_index] = lambda: SearchIndex(database)
+
+        response = TestClient(app).get(
+            "/api/v1/search", params={"q": "invoice"}, headers={"X-Tenant-ID": "tenant-1"}
+        )
+
+        assert response.status_code == 501
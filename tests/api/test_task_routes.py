@@ -91,14 +91,14 @@ async def registered_agent() -> AsyncIterator[TestAgent]:
         TestAgent instance that is registered in the repository
     """
     # Clear task repository before each test to prevent data leakage
-    _task_repository._tasks.clear()
+    await _task_repository.clear()
 
     agent = TestAgent()
     await _agent_repository.save(agent)
     yield agent
     # Cleanup
     await _agent_repository.delete("test-agent")
-    _task_repository._tasks.clear()
+    await _task_repository.clear()
 
 
 class TestCreateTask:
@@ -240,6 +240,98 @@ class TestGetTaskStatus:
         assert data["code"] == "task_not_found"
 
 
+class TestSubscribeTaskEvents:
+    """Tests for resuming a task's SSE stream."""
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_after_last_event_id(
+        self, client: TestClient, registered_agent: TestAgent
+    ) -> None:
+        """Resuming should replay only the events after Last-Event-ID."""
+        response = client.post(
+            "/api/v1/agents/test-agent/tasks",
+            json={
+                "message_parts": [{"type": "text", "text": "Hello"}],
+                "tenant_id": "tenant-1",
+                "user_id": "user-1",
+            },
+        )
+        task_id = response.headers["X-Task-ID"]
+        assert "id: 1\n" in response.text
+        assert "id: 3\n" in response.text
+
+        resumed = client.get(
+            f"/api/v1/agents/test-agent/tasks/{task_id}/events",
+            headers={"Last-Event-ID": "1"},
+        )
+
+        assert resumed.status_code == 200
+        assert "event: status" not in resumed.text
+        assert "event: message" in resumed.text
+        assert "event: done" in resumed.text
+        assert "id: 2\n" in resumed.text
+
+    @pytest.mark.asyncio
+    async def test_resume_invalid_last_event_id(
+        self, client: TestClient, registered_agent: TestAgent
+    ) -> None:
+        """A malformed Last-Event-ID should return 400."""
+        response = client.post(
+            "/api/v1/agents/test-agent/tasks",
+            json={
+                "message_parts": [{"type": "text", "text": "Hello"}],
+                "tenant_id": "tenant-1",
+                "user_id": "user-1",
+            },
+        )
+        task_id = response.headers["X-Task-ID"]
+
+        resumed = client.get(
+            f"/api/v1/agents/test-agent/tasks/{task_id}/events",
+            headers={"Last-Event-ID": "abc"},
+        )
+
+        assert resumed.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_disconnect_ends_idle_stream(self) -> None:
+        """A client disconnect should end its stream even while no events arrive."""
+        import asyncio
+
+        from omniforge.api.sse import sse_frames
+        from omniforge.tasks.streams import TaskStream, TaskStreamHub
+
+        class DisconnectingRequest:
+            async def receive(self) -> dict:
+                await asyncio.sleep(0.01)
+                return {"type": "http.disconnect"}
+
+        hub = TaskStreamHub(resume_grace=0.01)
+        cancelled = asyncio.Event()
+
+        async def produce(stream: TaskStream) -> None:
+            await stream.publish("status", "{}")
+            try:
+                await asyncio.sleep(60)  # a long tool call
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        stream = hub.open("task-1", produce)
+        frames = [f async for f in sse_frames(hub, "task-1", DisconnectingRequest())]
+
+        assert len(frames) == 1
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert stream.cancellation.cancelled
+        await hub.close()
+
+    def test_resume_task_not_found(self, client: TestClient) -> None:
+        """Resuming a non-existent task should return 404."""
+        response = client.get("/api/v1/agents/test-agent/tasks/missing/events")
+
+        assert response.status_code == 404
+
+
 class TestSendMessage:
     """Tests for the send message endpoint."""
 
@@ -622,6 +714,83 @@ class TestTenantTaskList:
         await _task_repository.delete(t2.id)
         await _task_repository.delete(t3.id)
 
+    @pytest.mark.asyncio
+    async def test_list_tenant_tasks_cursor_pagination(
+        self, client: TestClient, registered_agent: TestAgent
+    ) -> None:
+        """GET /api/v1/tasks should return X-Next-Cursor and honour ?cursor=."""
+        from datetime import datetime, timedelta
+        from uuid import uuid4
+
+        now = datetime.utcnow()
+        saved = []
+        for i in range(3):
+            task = Task(
+                id=str(uuid4()),
+                agent_id="test-agent",
+                state=TaskState.COMPLETED,
+                messages=[],
+                created_at=now - timedelta(seconds=i),
+                updated_at=now,
+                tenant_id="tenant-cursor",
+                user_id="user-1",
+            )
+            await _task_repository.save(task)
+            saved.append(task.id)
+
+        headers = {"X-Tenant-ID": "tenant-cursor"}
+        first = client.get("/api/v1/tasks?limit=2", headers=headers)
+        assert first.status_code == 200
+        cursor = first.headers["X-Next-Cursor"]
+
+        second = client.get(f"/api/v1/tasks?limit=2&cursor={cursor}", headers=headers)
+        assert second.status_code == 200
+        assert "X-Next-Cursor" not in second.headers
+
+        ids = [t["id"] for t in first.json()] + [t["id"] for t in second.json()]
+        assert ids == saved
+
+        bad = client.get("/api/v1/tasks?cursor=garbage", headers=headers)
+        assert bad.status_code == 400
+
+        for task_id in saved:
+            await _task_repository.delete(task_id)
+
+    @pytest.mark.asyncio
+    async def test_list_tenant_tasks_state_filter_fills_page(
+        self, client: TestClient, registered_agent: TestAgent
+    ) -> None:
+        """GET /api/v1/tasks?state= should filter before applying the limit."""
+        from datetime import datetime, timedelta
+        from uuid import uuid4
+
+        now = datetime.utcnow()
+        working = []
+        for i in range(6):
+            task = Task(
+                id=str(uuid4()),
+                agent_id="test-agent",
+                state=TaskState.WORKING if i % 2 else TaskState.COMPLETED,
+                created_at=now - timedelta(seconds=i),
+                updated_at=now,
+                tenant_id="tenant-state",
+                user_id="user-1",
+            )
+            await _task_repository.save(task)
+            if task.state == TaskState.WORKING:
+                working.append(task.id)
+
+        headers = {"X-Tenant-ID": "tenant-state"}
+        response = client.get("/api/v1/tasks?state=working&limit=2", headers=headers)
+
+        assert response.status_code == 200
+        assert [t["id"] for t in response.json()] == working[:2]
+        assert all(t["message_count"] == 0 for t in response.json())
+        assert "X-Next-Cursor" in response.headers
+
+        bad = client.get("/api/v1/tasks?state=bogus", headers=headers)
+        assert bad.status_code == 400
+
     def test_list_tenant_tasks_no_tenant_returns_empty(
         self, client: TestClient
     ) -> None:
@@ -629,3 +798,81 @@ class TestTenantTaskList:
         response = client.get("/api/v1/tasks")
         assert response.status_code == 200
         assert response.json() == []
+
+
+class TestAdmission:
+    """Tests for admission control on task endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_create_task_sheds_with_retry_after(self, registered_agent: TestAgent) -> None:
+        """A request shed by admission control returns 429 with Retry-After."""
+        from omniforge.execution.admission import (
+            AdmissionConfig,
+            AdmissionController,
+            get_admission_controller,
+        )
+
+        admission = AdmissionController(AdmissionConfig(max_concurrent=1, max_queue=0))
+        await admission.acquire("tenant-1")
+        app = create_app()
+        app.dependency_overrides[get_admission_controller] = lambda: admission
+
+        response = TestClient(app).post(
+            "/api/v1/agents/test-agent/tasks",
+            json={
+                "message_parts": [{"type": "text", "text": "Hello"}],
+                "tenant_id": "tenant-1",
+                "user_id": "user-1",
+            },
+        )
+
+        assert response.status_code == 429
+        assert response.json()["code"] == "server_overloaded"
+        assert int(response.headers["Retry-After"]) >= 1
+        # The shed request was not accepted
+        assert await _task_repository.list_by_agent("test-agent") == []
+
+    @pytest.mark.asyncio
+    async def test_admission_keyed_on_request_tenant(self, registered_agent: TestAgent) -> None:
+        """The per-tenant limit applies to the request tenant, not body.tenant_id."""
+        from omniforge.execution.admission import (
+            AdmissionConfig,
+            AdmissionController,
+            get_admission_controller,
+        )
+
+        admission = AdmissionController(
+            AdmissionConfig(max_concurrent=2, max_per_tenant=1, max_queue=0)
+        )
+        await admission.acquire("tenant-1")
+        app = create_app()
+        app.dependency_overrides[get_admission_controller] = lambda: admission
+
+        response = TestClient(app).post(
+            "/api/v1/agents/test-agent/tasks",
+            headers={"X-Tenant-ID": "tenant-1"},
+            json={
+                "message_parts": [{"type": "text", "text": "Hello"}],
+                "tenant_id": "tenant-2",
+                "user_id": "user-1",
+            },
+        )
+
+        assert response.status_code == 429
+        assert admission.active == 1
+
+    @pytest.mark.asyncio
+    async def test_slot_is_released_when_task_finishes(
+        self, client: TestClient, registered_agent: TestAgent
+    ) -> None:
+        """The admission slot of a streamed task is released once it completes."""
+        from omniforge.execution.admission import get_admission_controller
+
+        active = get_admission_controller().active
+        response = client.post(
+            "/api/v1/agents/test-agent/chat",
+            json={"message": "Hello", "stream": False},
+        )
+
+        assert response.status_code == 200
+        assert get_admission_controller().active == active
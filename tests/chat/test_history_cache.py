@@ -0,0 +1,181 @@
+"""Tests for the conversation history cache and its ChatService integration."""
+
+from typing import AsyncIterator
+from uuid import uuid4
+
+import pytest
+
+from omniforge.chat.history_cache import ConversationHistoryCache
+from omniforge.chat.models import ChatRequest
+from omniforge.chat.service import ChatService
+from omniforge.conversation.memory_repository import InMemoryConversationRepository
+from omniforge.conversation.models import Message, MessageRole
+
+
+def make_message(content: str) -> Message:
+    """Create a test message."""
+    return Message(conversation_id=uuid4(), role=MessageRole.USER, content=content)
+
+
+class StubGenerator:
+    """Minimal response generator that records the history it receives."""
+
+    def __init__(self) -> None:
+        self.histories: list[list] = []
+
+    async def generate_stream(
+        self, message: str, conversation_history: list | None = None, session_id: str = ""
+    ) -> AsyncIterator[str]:
+        self.histories.append(list(conversation_history or []))
+        yield f"echo: {message}"
+
+    def count_tokens(self, text: str) -> int:
+        return len(text)
+
+
+class CountingRepository(InMemoryConversationRepository):
+    """In-memory repository that counts history reads."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.recent_reads = 0
+
+    async def get_recent_messages(self, conversation_id, tenant_id, count=10):
+        self.recent_reads += 1
+        return await super().get_recent_messages(conversation_id, tenant_id, count=count)
+
+
+class TestConversationHistoryCache:
+    """Tests for ConversationHistoryCache."""
+
+    def test_get_returns_window_for_matching_version(self) -> None:
+        cache = ConversationHistoryCache(window_size=3)
+        conv_id = uuid4()
+        messages = [make_message(f"m{i}") for i in range(3)]
+        cache.put("tenant-1", conv_id, 3, messages)
+
+        assert [m.content for m in cache.get("tenant-1", conv_id, 3, 3)] == ["m0", "m1", "m2"]
+        assert [m.content for m in cache.get("tenant-1", conv_id, 3, 2)] == ["m1", "m2"]
+
+    def test_get_misses_on_version_mismatch(self) -> None:
+        cache = ConversationHistoryCache()
+        conv_id = uuid4()
+        cache.put("tenant-1", conv_id, 1, [make_message("m0")])
+
+        assert cache.get("tenant-1", conv_id, 2, 20) is None
+        # Stale entry is dropped
+        assert cache.stats()["entries"] == 0
+
+    def test_get_is_tenant_scoped(self) -> None:
+        cache = ConversationHistoryCache()
+        conv_id = uuid4()
+        cache.put("tenant-1", conv_id, 0, [make_message("secret")])
+
+        assert cache.get("tenant-2", conv_id, 0, 20) is None
+
+    def test_append_bumps_version_and_trims_window(self) -> None:
+        cache = ConversationHistoryCache(window_size=2)
+        conv_id = uuid4()
+        cache.put("tenant-1", conv_id, 5, [make_message("a"), make_message("b")])
+        cache.append("tenant-1", conv_id, make_message("c"))
+
+        assert cache.get("tenant-1", conv_id, 5, 2) is None
+        cache.put("tenant-1", conv_id, 5, [make_message("a"), make_message("b")])
+        cache.append("tenant-1", conv_id, make_message("c"))
+        assert [m.content for m in cache.get("tenant-1", conv_id, 6, 2)] == ["b", "c"]
+
+    def test_append_without_entry_is_noop(self) -> None:
+        cache = ConversationHistoryCache()
+        cache.append("tenant-1", uuid4(), make_message("x"))
+        assert cache.stats()["entries"] == 0
+
+    def test_request_larger_than_window_misses(self) -> None:
+        cache = ConversationHistoryCache(window_size=5)
+        conv_id = uuid4()
+        cache.put("tenant-1", conv_id, 0, [])
+
+        assert cache.get("tenant-1", conv_id, 0, 10) is None
+
+    def test_max_entries_evicts_least_recently_used(self) -> None:
+        cache = ConversationHistoryCache(max_entries=2)
+        ids = [uuid4() for _ in range(3)]
+        cache.put("t", ids[0], 0, [])
+        cache.put("t", ids[1], 0, [])
+        cache.get("t", ids[0], 0, 1)
+        cache.put("t", ids[2], 0, [])
+
+        assert cache.get("t", ids[1], 0, 1) is None
+        assert cache.get("t", ids[0], 0, 1) == []
+
+    def test_max_bytes_bounds_total_size(self) -> None:
+        cache = ConversationHistoryCache(max_bytes=2000)
+        for _ in range(10):
+            cache.put("t", uuid4(), 0, [make_message("x" * 500)])
+
+        stats = cache.stats()
+        assert stats["size"] <= 2000
+        assert stats["entries"] < 10
+
+    def test_window_larger_than_max_bytes_is_not_cached(self) -> None:
+        cache = ConversationHistoryCache(max_bytes=100)
+        conv_id = uuid4()
+        cache.put("t", conv_id, 0, [make_message("x" * 1000)])
+
+        assert cache.get("t", conv_id, 0, 1) is None
+
+
+class TestChatServiceHistoryCache:
+    """Tests for ChatService read-through/write-through history caching."""
+
+    @pytest.mark.asyncio
+    async def test_second_turn_served_from_cache(self) -> None:
+        """History for an active conversation should not be re-read from storage."""
+        repository = CountingRepository()
+        generator = StubGenerator()
+        service = ChatService(
+            response_generator=generator,  # type: ignore[arg-type]
+            conversation_repository=repository,
+            tenant_id="tenant-1",
+            history_cache=ConversationHistoryCache(),
+        )
+
+        events = [e async for e in service.process_chat(ChatRequest(message="first"))]
+        conversation_id = (await repository.list_conversations("tenant-1"))[0].id
+        assert events[-1].startswith("event: done")
+
+        async for _ in service.process_chat(
+            ChatRequest(message="second", conversation_id=conversation_id)
+        ):
+            pass
+
+        assert repository.recent_reads == 0
+        assert [m.content for m in generator.histories[1]] == ["first", "echo: first"]
+
+    @pytest.mark.asyncio
+    async def test_foreign_write_invalidates_cached_window(self) -> None:
+        """Writes from another worker bump the version and force a reload."""
+        repository = CountingRepository()
+        generator = StubGenerator()
+        service = ChatService(
+            response_generator=generator,  # type: ignore[arg-type]
+            conversation_repository=repository,
+            tenant_id="tenant-1",
+            history_cache=ConversationHistoryCache(),
+        )
+
+        async for _ in service.process_chat(ChatRequest(message="first")):
+            pass
+        conversation_id = (await repository.list_conversations("tenant-1"))[0].id
+
+        # Simulate another worker writing directly to storage
+        await repository.add_message(
+            conversation_id, "tenant-1", MessageRole.USER, "from elsewhere"
+        )
+
+        async for _ in service.process_chat(
+            ChatRequest(message="second", conversation_id=conversation_id)
+        ):
+            pass
+
+        assert repository.recent_reads == 1
+        assert generator.histories[1][-1].content == "from elsewhere"
@@ -0,0 +1,314 @@
+"""Tests for the bounded per-session agent cache."""
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from omniforge.chat import session_cache
+from omniforge.chat.session_cache import (
+    ConversationSessionStateStore,
+    InMemorySessionStateStore,
+    SessionAgentCache,
+)
+
+
+class FakeAgent:
+    """Session agent with a single piece of resumable state."""
+
+    def __init__(self) -> None:
+        self.delegated_agent_id: Any = None
+        self.closed = False
+
+    def export_session_state(self) -> dict[str, Any]:
+        return {"delegated_agent_id": self.delegated_agent_id}
+
+    async def restore_session_state(self, state: dict[str, Any]) -> None:
+        self.delegated_agent_id = state["delegated_agent_id"]
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(session_cache.time, "monotonic", fake)
+    return fake
+
+
+class TestSessionAgentCache:
+    """Tests for SessionAgentCache."""
+
+    def test_rejects_invalid_bounds(self) -> None:
+        """Non-positive size or TTL should be rejected."""
+        with pytest.raises(ValueError):
+            SessionAgentCache(FakeAgent, max_sessions=0)
+        with pytest.raises(ValueError):
+            SessionAgentCache(FakeAgent, ttl_seconds=0)
+
+    @pytest.mark.asyncio
+    async def test_same_session_reuses_agent(self) -> None:
+        """Repeated gets for a session return the same agent."""
+        cache: SessionAgentCache[FakeAgent] = SessionAgentCache(FakeAgent)
+
+        first = await cache.get("s1")
+        second = await cache.get("s1")
+        other = await cache.get("s2")
+
+        assert first is second
+        assert other is not first
+        assert cache.stats()["hit_count"] == 1
+        assert cache.stats()["miss_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self) -> None:
+        """Exceeding max_sessions evicts and closes the least recently used agent."""
+        cache: SessionAgentCache[FakeAgent] = SessionAgentCache(FakeAgent, max_sessions=2)
+
+        a = await cache.get("a")
+        await cache.get("b")
+        await cache.get("a")  # b is now least recently used
+        b = cache._sessions["b"].agent
+        await cache.get("c")
+
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert b.closed and not a.closed
+        assert len(cache) == 2
+        assert cache.stats()["evictions"]["capacity"] == 1
+
+    @pytest.mark.asyncio
+    async def test_evicted_state_is_rehydrated(self) -> None:
+        """An evicted session's state is restored into its next agent."""
+        store = InMemorySessionStateStore()
+        cache: SessionAgentCache[FakeAgent] = SessionAgentCache(
+            FakeAgent, store=store, max_sessions=1
+        )
+
+        agent = await cache.get("a")
+        agent.delegated_agent_id = "skill-creation-assistant"
+        await cache.get("b")  # evicts a
+
+        assert await store.load("a") == {"delegated_agent_id": "skill-creation-assistant"}
+
+        rehydrated = await cache.get("a")
+
+        assert rehydrated is not agent
+        assert rehydrated.delegated_agent_id == "skill-creation-assistant"
+        assert await store.load("a") is None
+        assert cache.stats()["rehydrated_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_sessions_expire(self, clock: FakeClock) -> None:
+        """Agents idle longer than the TTL are evicted with their state saved."""
+        cache: SessionAgentCache[FakeAgent] = SessionAgentCache(FakeAgent, ttl_seconds=60)
+
+        idle = await cache.get("idle")
+        idle.delegated_agent_id = "agent-1"
+        clock.now += 30
+        await cache.get("active")
+        clock.now += 45  # idle: 75s, active: 45s
+        await cache.get("new")
+
+        assert "idle" not in cache and "active" in cache
+        assert idle.closed
+        assert cache.stats()["evictions"]["expired"] == 1
+
+        assert (await cache.get("idle")).delegated_agent_id == "agent-1"
+
+    @pytest.mark.asyncio
+    async def test_expired_session_is_replaced_on_access(self, clock: FakeClock) -> None:
+        """Accessing an expired session returns a fresh, rehydrated agent."""
+        cache: SessionAgentCache[FakeAgent] = SessionAgentCache(FakeAgent, ttl_seconds=60)
+
+        agent = await cache.get("a")
+        agent.delegated_agent_id = "agent-1"
+        clock.now += 61
+
+        fresh = await cache.get("a")
+
+        assert fresh is not agent
+        assert agent.closed
+        assert fresh.delegated_agent_id == "agent-1"
+
+    @pytest.mark.asyncio
+    async def test_clear_closes_without_saving(self) -> None:
+        """clear() closes live agents and does not offload their state."""
+        store = InMemorySessionStateStore()
+        cache: SessionAgentCache[FakeAgent] = SessionAgentCache(FakeAgent, store=store)
+        agent = await cache.get("a")
+        agent.delegated_agent_id = "agent-1"
+
+        await cache.clear()
+
+        assert len(cache) == 0
+        assert agent.closed
+        assert await store.load("a") is None
+
+
+class TestPinnedSessions:
+    """Tests for sessions pinned by a running turn."""
+
+    @pytest.mark.asyncio
+    async def test_pinned_session_survives_capacity_eviction(self) -> None:
+        """A session in use is skipped; it is evicted after release with its final state."""
+        store = InMemorySessionStateStore()
+        cache: SessionAgentCache[FakeAgent] = SessionAgentCache(
+            FakeAgent, store=store, max_sessions=1
+        )
+
+        running = await cache.get("a", pin=True)
+        await cache.get("b")  # over capacity, but a is pinned and b was just created
+        running.delegated_agent_id = "written-late-in-turn"
+
+        assert "a" in cache and "b" in cache
+        assert not running.closed
+
+        await cache.get("c")  # b is the only unpinned, older session
+
+        assert "a" in cache and "b" not in cache and "c" in cache
+
+        await cache.release("a")
+
+        assert "a" not in cache and running.closed
+        assert await store.load("a") == {"delegated_agent_id": "written-late-in-turn"}
+
+    @pytest.mark.asyncio
+    async def test_pinned_session_does_not_expire(self, clock: FakeClock) -> None:
+        """A long turn keeps its agent even past the idle TTL."""
+        cache: SessionAgentCache[FakeAgent] = SessionAgentCache(FakeAgent, ttl_seconds=60)
+
+        running = await cache.get("long-turn", pin=True)
+        clock.now += 120
+        await cache.get("other")
+
+        assert "long-turn" in cache
+        assert await cache.get("long-turn") is running
+
+        await cache.release("long-turn")
+        clock.now += 120
+        await cache.get("another")
+
+        assert "long-turn" not in cache and running.closed
+
+    @pytest.mark.asyncio
+    async def test_manual_eviction_waits_for_release(self) -> None:
+        """evict() on a pinned session takes effect when the turn releases it."""
+        store = InMemorySessionStateStore()
+        cache: SessionAgentCache[FakeAgent] = SessionAgentCache(FakeAgent, store=store)
+
+        running = await cache.get("a", pin=True)
+        await cache.evict("a")
+        running.delegated_agent_id = "agent-1"
+
+        assert "a" in cache
+
+        await cache.release("a")
+
+        assert "a" not in cache
+        assert await store.load("a") == {"delegated_agent_id": "agent-1"}
+
+    @pytest.mark.asyncio
+    async def test_release_of_unknown_session_is_ignored(self) -> None:
+        """Releasing a session that is not pinned does nothing."""
+        cache: SessionAgentCache[FakeAgent] = SessionAgentCache(FakeAgent)
+        await cache.get("a")
+
+        await cache.release("a")
+        await cache.release("missing")
+
+        assert "a" in cache
+
+
+class TestConversationSessionStateStore:
+    """Tests for ConversationSessionStateStore."""
+
+    @pytest.mark.asyncio
+    async def test_state_kept_in_conversation_metadata(self) -> None:
+        """State is stored in and removed from the conversation's state_metadata."""
+        from omniforge.conversation.sqlite_repository import SQLiteConversationRepository
+        from omniforge.storage.database import Database, DatabaseConfig
+
+        db = Database(DatabaseConfig(url="sqlite+aiosqlite:///:memory:"))
+        await db.create_tables()
+        repo = SQLiteConversationRepository(db)
+        conversation = await repo.create_conversation(tenant_id="t1", user_id="u1")
+        await repo.update_state(conversation.id, "t1", "active", {"other": 1})
+        store = ConversationSessionStateStore(repo, tenant_id="t1")
+        session_id = str(conversation.id)
+
+        await store.save(session_id, {"delegated_agent_id": "agent-1"})
+        assert await store.load(session_id) == {"delegated_agent_id": "agent-1"}
+
+        await store.delete(session_id)
+        assert await store.load(session_id) is None
+        stored = await repo.get_conversation(conversation.id, "t1")
+        assert stored is not None
+        assert stored.state_metadata == {"other": 1}
+        await db.close()
+
+    @pytest.mark.asyncio
+    async def test_unknown_conversation_is_ignored(self) -> None:
+        """Sessions without a stored conversation are neither saved nor loaded."""
+        from omniforge.conversation.memory_repository import InMemoryConversationRepository
+
+        store = ConversationSessionStateStore(InMemoryConversationRepository(), tenant_id="t1")
+
+        await store.save("not-a-uuid", {"delegated_agent_id": None})
+        await store.save(str(uuid4()), {"delegated_agent_id": None})
+
+        assert await store.load(str(uuid4())) is None
+
+
+class TestWriteThrough:
+    """Tests for write-through mode over a store shared by several processes."""
+
+    @pytest.mark.asyncio
+    async def test_state_follows_conversation_across_workers(self, tmp_path: Any) -> None:
+        """A turn handled by one worker is continued by another."""
+        from omniforge.chat.session_cache import SQLiteSessionStateStore
+        from omniforge.storage.shared_state import SQLiteStateStore
+
+        path = str(tmp_path / "state.db")
+        worker_1: SessionAgentCache[FakeAgent] = SessionAgentCache(
+            FakeAgent, store=SQLiteSessionStateStore(SQLiteStateStore(path)), write_through=True
+        )
+        worker_2: SessionAgentCache[FakeAgent] = SessionAgentCache(
+            FakeAgent, store=SQLiteSessionStateStore(SQLiteStateStore(path)), write_through=True
+        )
+
+        # Turn 1 on worker 1
+        agent_1 = await worker_1.get("conv")
+        agent_1.delegated_agent_id = "agent-1"
+        await worker_1.save("conv")
+
+        # Turn 2 on worker 2 sees turn 1's state and changes it
+        agent_2 = await worker_2.get("conv")
+        assert agent_2.delegated_agent_id == "agent-1"
+        agent_2.delegated_agent_id = None
+        await worker_2.save("conv")
+
+        # Turn 3 back on worker 1: its cached agent is refreshed from the store
+        assert (await worker_1.get("conv")) is agent_1
+        assert agent_1.delegated_agent_id is None
+
+    @pytest.mark.asyncio
+    async def test_save_is_noop_without_write_through(self) -> None:
+        """Without write-through, state is only saved on eviction."""
+        store = InMemorySessionStateStore()
+        cache: SessionAgentCache[FakeAgent] = SessionAgentCache(FakeAgent, store=store)
+        (await cache.get("a")).delegated_agent_id = "agent-1"
+
+        await cache.save("a")
+
+        assert await store.load("a") is None
@@ -0,0 +1,28 @@
+"""Tests for search CLI commands."""
+
+from click.testing import CliRunner
+
+from omniforge.cli.search import search
+
+
+class TestReindexCommand:
+    """Tests for `omniforge search reindex`."""
+
+    def test_reindex_creates_and_backfills_index(self, tmp_path) -> None:
+        db_url = f"sqlite+aiosqlite:///{tmp_path / 'cli.db'}"
+
+        result = CliRunner().invoke(search, ["reindex", "--database-url", db_url])
+
+        assert result.exit_code == 0, result.output
+        assert "Indexed 0 message rows" in result.output
+        assert "Search index rebuilt" in result.output
+
+    def test_reindex_reads_database_url_from_environment(self, tmp_path) -> None:
+        db_path = tmp_path / "env.db"
+
+        result = CliRunner().invoke(
+            search, ["reindex"], env={"DATABASE_URL": f"sqlite+aiosqlite:///{db_path}"}
+        )
+
+        assert result.exit_code == 0, result.output
+        assert db_path.exists()
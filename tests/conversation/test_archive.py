@@ -0,0 +1,160 @@
+"""Tests for hot/cold archival of conversation messages."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from omniforge.conversation.archive import (
+    ConversationArchiver,
+    pack_messages,
+    unpack_messages,
+)
+from omniforge.conversation.models import MessageRole
+from omniforge.conversation.orm import (
+    ConversationArchiveModel,
+    ConversationMessageModel,
+    ConversationModel,
+)
+from omniforge.conversation.sqlite_repository import SQLiteConversationRepository
+from omniforge.storage.database import Database, DatabaseConfig
+
+
+@pytest.fixture
+async def database():
+    """Create in-memory database for testing."""
+    db = Database(DatabaseConfig(url="sqlite+aiosqlite:///:memory:"))
+    await db.create_tables()
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+def repo(database: Database) -> SQLiteConversationRepository:
+    """Create conversation repository."""
+    return SQLiteConversationRepository(database)
+
+
+async def hot_message_count(database: Database) -> int:
+    """Count rows in the hot messages table."""
+    async with database.session() as session:
+        result = await session.execute(
+            select(func.count()).select_from(ConversationMessageModel)
+        )
+        return result.scalar_one()
+
+
+class TestPacking:
+    """Tests for message payload packing."""
+
+    @pytest.mark.parametrize("codec", ["zlib", "lzma"])
+    def test_round_trip(self, codec: str) -> None:
+        created = datetime(2024, 1, 1, 12, 0, 0)
+        rows = [
+            ConversationMessageModel(
+                id=f"msg-{i}",
+                conversation_id="conv-1",
+                role="user",
+                content="hello " * 50,
+                created_at=created + timedelta(seconds=i),
+                message_metadata={"i": i},
+            )
+            for i in range(3)
+        ]
+
+        payload, raw_size = pack_messages(rows, codec)
+        restored = unpack_messages(payload, codec, "conv-1")
+
+        assert len(payload) < raw_size
+        assert [(m.id, m.content, m.created_at, m.message_metadata) for m in restored] == [
+            (m.id, m.content, m.created_at, m.message_metadata) for m in rows
+        ]
+
+    def test_unknown_codec_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown archive codec"):
+            pack_messages([], "brotli")
+
+
+class TestConversationArchiver:
+    """Tests for compaction and transparent rehydration."""
+
+    @pytest.mark.asyncio
+    async def test_compact_archives_only_idle_conversations(
+        self, database: Database, repo: SQLiteConversationRepository
+    ) -> None:
+        idle = await repo.create_conversation("tenant-1", "user-1")
+        active = await repo.create_conversation("tenant-1", "user-1")
+        for i in range(3):
+            await repo.add_message(idle.id, "tenant-1", MessageRole.USER, f"old {i}")
+        await repo.add_message(active.id, "tenant-1", MessageRole.USER, "recent")
+
+        archiver = ConversationArchiver(database, idle_after=timedelta(days=30))
+        # Only conversations last updated before the cutoff are archived
+        async with database.session() as session:
+            conv = await session.get(ConversationModel, str(idle.id))
+            conv.updated_at = datetime.utcnow() - timedelta(days=31)
+
+        assert await archiver.compact() == 1
+        assert await hot_message_count(database) == 1
+
+        async with database.session() as session:
+            archive = await session.get(ConversationArchiveModel, str(idle.id))
+        assert archive is not None
+        assert archive.message_count == 3
+
+        # A second pass has nothing left to do
+        assert await archiver.compact() == 0
+
+    @pytest.mark.asyncio
+    async def test_reads_rehydrate_transparently(
+        self, database: Database, repo: SQLiteConversationRepository
+    ) -> None:
+        conv = await repo.create_conversation("tenant-1", "user-1")
+        originals = [
+            await repo.add_message(conv.id, "tenant-1", MessageRole.USER, f"m{i}")
+            for i in range(3)
+        ]
+
+        archiver = ConversationArchiver(database, idle_after=timedelta(minutes=5))
+        assert await archiver.compact(now=datetime.utcnow() + timedelta(minutes=6)) == 1
+        archived = await repo.get_conversation(conv.id, "tenant-1")
+        assert archived is not None and archived.archived_at is not None
+
+        messages = await repo.get_messages(conv.id, "tenant-1")
+
+        assert [(m.id, m.content) for m in messages] == [(m.id, m.content) for m in originals]
+        restored = await repo.get_conversation(conv.id, "tenant-1")
+        assert restored is not None and restored.archived_at is None
+        assert await hot_message_count(database) == 3
+
+        # Recently restored conversations are not immediately re-archived
+        assert await archiver.compact() == 0
+
+    @pytest.mark.asyncio
+    async def test_add_message_appends_after_archived_history(
+        self, database: Database, repo: SQLiteConversationRepository
+    ) -> None:
+        conv = await repo.create_conversation("tenant-1", "user-1")
+        await repo.add_message(conv.id, "tenant-1", MessageRole.USER, "before")
+        await ConversationArchiver(database, idle_after=timedelta(0)).compact(
+            now=datetime.utcnow() + timedelta(seconds=1)
+        )
+
+        await repo.add_message(conv.id, "tenant-1", MessageRole.ASSISTANT, "after")
+
+        recent = await repo.get_recent_messages(conv.id, "tenant-1", count=10)
+        assert [m.content for m in recent] == ["before", "after"]
+
+    @pytest.mark.asyncio
+    async def test_rehydration_enforces_tenant(
+        self, database: Database, repo: SQLiteConversationRepository
+    ) -> None:
+        conv = await repo.create_conversation("tenant-1", "user-1")
+        await repo.add_message(conv.id, "tenant-1", MessageRole.USER, "private")
+        await ConversationArchiver(database, idle_after=timedelta(0)).compact(
+            now=datetime.utcnow() + timedelta(seconds=1)
+        )
+
+        with pytest.raises(ValueError):
+            await repo.get_messages(conv.id, "tenant-2")
+        assert await hot_message_count(database) == 0
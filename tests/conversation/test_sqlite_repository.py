@@ -166,6 +166,50 @@ class TestSQLiteConversationRepository:
         page2_ids = {c.id for c in page2}
         assert len(page1_ids & page2_ids) == 0
 
+    async def test_list_conversations_cursor_pagination(self, repository):
+        """Should page through conversations with keyset cursors."""
+        from omniforge.storage.pagination import next_cursor
+
+        for i in range(5):
+            await repository.create_conversation("tenant-1", "user-1", f"Conv {i}")
+
+        page1 = await repository.list_conversations("tenant-1", limit=3)
+        cursor = next_cursor(page1, 3, "updated_at")
+        page2 = await repository.list_conversations("tenant-1", limit=3, cursor=cursor)
+
+        assert len(page1) == 3
+        assert len(page2) == 2
+        assert {c.id for c in page1}.isdisjoint({c.id for c in page2})
+        assert [c.id for c in page1 + page2] == [
+            c.id for c in await repository.list_conversations("tenant-1")
+        ]
+
+    async def test_get_conversations_by_type_cursor(self, repository):
+        """Should support cursors when filtering by conversation type."""
+        from omniforge.conversation.models import ConversationType
+        from omniforge.storage.pagination import next_cursor
+
+        for i in range(3):
+            await repository.create_conversation("tenant-1", "user-1", f"Conv {i}")
+
+        page1 = await repository.get_conversations_by_type(
+            "tenant-1", ConversationType.CHAT, limit=2
+        )
+        page2 = await repository.get_conversations_by_type(
+            "tenant-1",
+            ConversationType.CHAT,
+            limit=2,
+            cursor=next_cursor(page1, 2, "updated_at"),
+        )
+
+        assert len(page2) == 1
+        assert page2[0].id not in {c.id for c in page1}
+
+    async def test_list_conversations_invalid_cursor(self, repository):
+        """Should raise ValueError for a malformed cursor."""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            await repository.list_conversations("tenant-1", cursor="%%%")
+
     async def test_list_conversations_empty_tenant_id(self, repository):
         """Should raise ValueError for empty tenant_id."""
         with pytest.raises(ValueError, match="tenant_id cannot be empty"):
@@ -261,6 +305,17 @@ class TestSQLiteConversationRepository:
 
         assert updated_conversation.updated_at > original_updated_at
 
+    async def test_add_message_increments_version(self, repository):
+        """Adding a message should bump the conversation version counter."""
+        conv = await repository.create_conversation("tenant-1", "user-1")
+        assert conv.version == 0
+
+        await repository.add_message(conv.id, "tenant-1", MessageRole.USER, "Hi")
+        await repository.add_message(conv.id, "tenant-1", MessageRole.ASSISTANT, "Hello")
+
+        updated = await repository.get_conversation(conv.id, "tenant-1")
+        assert updated.version == 2
+
     async def test_add_message_wrong_tenant(self, repository):
         """Should raise ValueError when adding message with wrong tenant."""
         conversation = await repository.create_conversation(
@@ -339,6 +394,22 @@ class TestSQLiteConversationRepository:
         page2 = await repository.get_messages(conversation.id, "tenant-1", limit=2, offset=2)
         assert len(page2) == 2
 
+    async def test_get_messages_with_cursor(self, repository):
+        """Should seek past the cursor in chronological order."""
+        from omniforge.storage.pagination import next_cursor
+
+        conv = await repository.create_conversation("tenant-1", "user-1")
+        for i in range(5):
+            await repository.add_message(conv.id, "tenant-1", MessageRole.USER, f"Message {i}")
+
+        page1 = await repository.get_messages(conv.id, "tenant-1", limit=2)
+        page2 = await repository.get_messages(
+            conv.id, "tenant-1", limit=2, cursor=next_cursor(page1, 2, "created_at")
+        )
+
+        assert [m.content for m in page1] == ["Message 0", "Message 1"]
+        assert [m.content for m in page2] == ["Message 2", "Message 3"]
+
     async def test_get_messages_wrong_tenant(self, repository):
         """Should raise ValueError when getting messages with wrong tenant."""
         conversation = await repository.create_conversation("tenant-1", "user-1")
@@ -225,6 +225,30 @@ async def test_query_pagination(repository):
     assert len(page1_ids & page2_ids) == 0
 
 
+@pytest.mark.asyncio
+async def test_query_cursor_pagination(repository):
+    """Test keyset pagination in event queries."""
+    from omniforge.storage.pagination import next_cursor
+
+    for i in range(5):
+        event = AuditEvent(
+            tenant_id="tenant-1",
+            event_type=EventType.TOOL_CALL,
+            action=f"action{i}",
+            outcome=Outcome.SUCCESS,
+        )
+        await repository.save(event)
+
+    page1 = await repository.query(tenant_id="tenant-1", limit=3)
+    cursor = next_cursor(page1, 3, "timestamp")
+    page2 = await repository.query(tenant_id="tenant-1", limit=3, cursor=cursor)
+
+    assert len(page1) == 3
+    assert len(page2) == 2
+    assert next_cursor(page2, 3, "timestamp") is None
+    assert {e.id for e in page1}.isdisjoint({e.id for e in page2})
+
+
 @pytest.mark.asyncio
 async def test_count_events(repository):
     """Test counting audit events."""
@@ -296,3 +296,38 @@ async def test_rate_limiter_isolated_tenants():
     # Tenant-2 should still have full limit available
     assert await limiter.check_and_consume("tenant-2", ToolType.LLM) is True
     assert await limiter.check_and_consume("tenant-2", ToolType.LLM) is True
+
+
+@pytest.mark.asyncio
+async def test_shared_limits_are_enforced_across_processes(tmp_path):
+    """Test that limiters on one state file share their counters."""
+    from omniforge.storage.shared_state import SQLiteStateStore
+
+    path = str(tmp_path / "state.db")
+    config = RateLimitConfig(llm_calls_per_minute=3)
+    worker_1 = RateLimiter(default_config=config, store=SQLiteStateStore(path))
+    worker_2 = RateLimiter(default_config=config, store=SQLiteStateStore(path))
+
+    assert await worker_1.check_and_consume("tenant-1", ToolType.LLM) is True
+    assert await worker_2.check_and_consume("tenant-1", ToolType.LLM) is True
+    assert await worker_1.check_and_consume("tenant-1", ToolType.LLM) is True
+    assert await worker_2.check_and_consume("tenant-1", ToolType.LLM) is False
+
+    # Other tenants are unaffected
+    assert await worker_2.check_and_consume("tenant-2", ToolType.LLM) is True
+
+
+@pytest.mark.asyncio
+async def test_shared_limiter_consumes_nothing_when_denied(tmp_path):
+    """Test that a denied request does not consume any of its limits."""
+    from omniforge.enterprise.rate_limiter import SharedTenantLimiter
+    from omniforge.storage.shared_state import SQLiteStateStore
+
+    config = RateLimitConfig(tokens_per_minute=1000, cost_per_hour_usd=1.0)
+    limiter = SharedTenantLimiter("tenant-1", config, SQLiteStateStore(str(tmp_path / "s.db")))
+
+    assert await limiter.check_and_consume(ToolType.LLM, tokens=500, cost_usd=0.9) is True
+    # Tokens fit, cost does not: neither is consumed
+    assert await limiter.check_and_consume(ToolType.LLM, tokens=400, cost_usd=0.2) is False
+    assert await limiter.check_and_consume(ToolType.LLM, tokens=500) is True
+    assert await limiter.check_and_consume(ToolType.LLM, tokens=1) is False
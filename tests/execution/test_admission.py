@@ -0,0 +1,181 @@
+"""Tests for task admission control."""
+
+import asyncio
+
+import pytest
+
+from omniforge.agents.errors import AdmissionRejectedError
+from omniforge.execution.admission import (
+    DEFAULT_TENANT,
+    AdmissionConfig,
+    AdmissionController,
+    AdmissionPriority,
+)
+
+
+def make_controller(**limits: float) -> AdmissionController:
+    """Create a controller with small limits."""
+    config = {"max_concurrent": 1, "max_per_tenant": 1, "max_queue": 4, "queue_timeout": 1.0}
+    config.update(limits)
+    return AdmissionController(AdmissionConfig(**config))  # type: ignore[arg-type]
+
+
+class TestAdmissionConfig:
+    """Tests for AdmissionConfig."""
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Limits are read from the environment."""
+        monkeypatch.setenv("OMNIFORGE_MAX_CONCURRENT_TASKS", "8")
+        monkeypatch.setenv("OMNIFORGE_MAX_TENANT_TASKS", "2")
+        monkeypatch.setenv("OMNIFORGE_ADMISSION_QUEUE_SIZE", "0")
+        monkeypatch.setenv("OMNIFORGE_ADMISSION_QUEUE_TIMEOUT", "0.5")
+
+        config = AdmissionConfig.from_env()
+
+        assert config == AdmissionConfig(
+            max_concurrent=8, max_per_tenant=2, max_queue=0, queue_timeout=0.5
+        )
+
+    def test_rejects_invalid_limits(self) -> None:
+        """A controller must allow at least one running task."""
+        with pytest.raises(ValueError):
+            AdmissionConfig(max_concurrent=0)
+
+
+class TestAdmissionController:
+    """Tests for AdmissionController."""
+
+    @pytest.mark.asyncio
+    async def test_admits_up_to_limits(self) -> None:
+        """Requests within the global and tenant caps run immediately."""
+        controller = make_controller(max_concurrent=3, max_per_tenant=2)
+
+        await controller.acquire("tenant-1")
+        await controller.acquire("tenant-1")
+        ticket = await controller.acquire(None)
+
+        assert controller.active == 3
+        assert ticket.tenant_id == DEFAULT_TENANT
+
+    @pytest.mark.asyncio
+    async def test_queued_request_runs_when_slot_frees(self) -> None:
+        """A queued request is admitted when a running task releases its slot."""
+        controller = make_controller()
+        first = await controller.acquire("tenant-1")
+
+        waiting = asyncio.create_task(controller.acquire("tenant-2"))
+        await asyncio.sleep(0)
+        assert controller.queued == 1
+
+        controller.release(first)
+        second = await waiting
+
+        assert second.tenant_id == "tenant-2"
+        assert controller.active == 1
+        assert controller.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_interactive_requests_are_admitted_first(self) -> None:
+        """Queued interactive requests overtake earlier scheduled ones."""
+        controller = make_controller(max_per_tenant=4)
+        running = await controller.acquire("tenant-1")
+        order: list[str] = []
+
+        async def run(name: str, priority: AdmissionPriority) -> None:
+            async with controller.admit("tenant-1", priority):
+                order.append(name)
+
+        scheduled = asyncio.create_task(run("scheduled", AdmissionPriority.SCHEDULED))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(run("interactive", AdmissionPriority.INTERACTIVE))
+        await asyncio.sleep(0)
+
+        controller.release(running)
+        await asyncio.gather(scheduled, interactive)
+
+        assert order == ["interactive", "scheduled"]
+
+    @pytest.mark.asyncio
+    async def test_tenant_at_cap_does_not_block_others(self) -> None:
+        """A request for a tenant at its cap is skipped in favour of other tenants."""
+        controller = make_controller(max_concurrent=2, max_per_tenant=1)
+        busy = await controller.acquire("tenant-1")
+        other = await controller.acquire("tenant-2")
+
+        blocked = asyncio.create_task(controller.acquire("tenant-1"))
+        await asyncio.sleep(0)
+        free = asyncio.create_task(controller.acquire("tenant-3"))
+        await asyncio.sleep(0)
+
+        controller.release(other)
+        assert (await free).tenant_id == "tenant-3"
+        assert not blocked.done()
+
+        controller.release(busy)
+        assert (await blocked).tenant_id == "tenant-1"
+
+    @pytest.mark.asyncio
+    async def test_sheds_after_deadline(self) -> None:
+        """A request that waits past the queue timeout is rejected with a retry hint."""
+        controller = make_controller(queue_timeout=0.01)
+        await controller.acquire("tenant-1")
+
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            await controller.acquire("tenant-2")
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.reason == "timeout"
+        assert exc_info.value.retry_after >= 1
+        assert controller.queued == 0
+        assert controller.shed_count == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_displaces_lower_priority(self) -> None:
+        """With a full queue, higher priority requests displace lower priority ones."""
+        controller = make_controller(max_queue=1, max_per_tenant=4)
+        running = await controller.acquire("tenant-1")
+
+        scheduled = asyncio.create_task(
+            controller.acquire("tenant-1", AdmissionPriority.SCHEDULED)
+        )
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(
+            controller.acquire("tenant-1", AdmissionPriority.INTERACTIVE)
+        )
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejectedError, match="displaced"):
+            await scheduled
+        with pytest.raises(AdmissionRejectedError, match="queue_full"):
+            await controller.acquire("tenant-1", AdmissionPriority.SCHEDULED)
+
+        controller.release(running)
+        assert (await interactive).priority is AdmissionPriority.INTERACTIVE
+
+    @pytest.mark.asyncio
+    async def test_tenant_queue_is_bounded(self) -> None:
+        """A tenant cannot queue more requests than its concurrency cap."""
+        controller = make_controller()
+        await controller.acquire("tenant-1")
+        queued = asyncio.create_task(controller.acquire("tenant-1"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejectedError, match="tenant_limit"):
+            await controller.acquire("tenant-1")
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert controller.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_release_is_idempotent(self) -> None:
+        """Releasing a ticket twice frees only one slot."""
+        controller = make_controller(max_concurrent=2, max_per_tenant=2)
+        ticket = await controller.acquire("tenant-1")
+        await controller.acquire("tenant-1")
+
+        controller.release(ticket)
+        controller.release(ticket)
+
+        assert controller.active == 1
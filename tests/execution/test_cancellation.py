@@ -0,0 +1,76 @@
+"""Tests for cooperative cancellation tokens."""
+
+import asyncio
+
+import pytest
+
+from omniforge.execution.cancellation import (
+    CancellationToken,
+    current_cancellation_token,
+    use_cancellation_token,
+)
+
+
+class TestCancellationToken:
+    """Tests for CancellationToken."""
+
+    def test_cancel_runs_callbacks_once(self) -> None:
+        """Callbacks should run once, on the first cancel() only."""
+        token = CancellationToken()
+        calls: list[str] = []
+        token.add_callback(lambda: calls.append("a"))
+        remove = token.add_callback(lambda: calls.append("b"))
+        remove()
+
+        token.cancel("client disconnected")
+        token.cancel("again")
+
+        assert calls == ["a"]
+        assert token.cancelled
+        assert token.reason == "client disconnected"
+
+    def test_callback_added_after_cancel_runs_immediately(self) -> None:
+        """Registering on a cancelled token should run the callback right away."""
+        token = CancellationToken()
+        token.cancel()
+        calls: list[int] = []
+
+        token.add_callback(lambda: calls.append(1))
+
+        assert calls == [1]
+
+    def test_raise_if_cancelled(self) -> None:
+        """raise_if_cancelled() should raise only after cancel()."""
+        token = CancellationToken()
+        token.raise_if_cancelled()
+
+        token.cancel("stop")
+
+        with pytest.raises(asyncio.CancelledError):
+            token.raise_if_cancelled()
+
+    @pytest.mark.asyncio
+    async def test_link_cancels_task(self) -> None:
+        """Cancelling the token should cancel linked tasks."""
+        token = CancellationToken()
+        task = asyncio.create_task(asyncio.sleep(60))
+        token.link(task)
+
+        token.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    @pytest.mark.asyncio
+    async def test_current_token_inherited_by_tasks(self) -> None:
+        """Tasks created after use_cancellation_token() should see the token."""
+        token = CancellationToken()
+
+        async def worker() -> None:
+            use_cancellation_token(token)
+            inner = asyncio.create_task(asyncio.sleep(0, result=None))
+            await inner
+            assert current_cancellation_token() is token
+
+        await asyncio.create_task(worker())
+        assert current_cancellation_token() is None
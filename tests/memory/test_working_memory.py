@@ -3,6 +3,7 @@
 import pytest
 
 from omniforge.memory.backends.in_memory import InMemoryBackend
+from omniforge.memory.backends.sqlite import SQLiteBackend
 from omniforge.memory.working import AgentContextStore, get_context_store
 
 
@@ -121,3 +122,36 @@ class TestGetContextStore:
 
     def test_returns_agent_context_store(self) -> None:
         assert isinstance(get_context_store(), AgentContextStore)
+
+
+class TestSQLiteBackend:
+    """Unit tests for SQLiteBackend."""
+
+    @pytest.fixture
+    def backend(self, tmp_path) -> SQLiteBackend:
+        from omniforge.storage.shared_state import SQLiteStateStore
+
+        return SQLiteBackend(SQLiteStateStore(str(tmp_path / "state.db")))
+
+    def test_set_get_list_and_clear(self, backend: SQLiteBackend) -> None:
+        backend.set("trace-1", "alpha", {"hello": "world"})
+        backend.set("trace-1", "beta", 2)
+        backend.set("trace-2", "alpha", 3)
+
+        assert backend.get("trace-1", "alpha") == {"hello": "world"}
+        assert backend.list_keys("trace-1") == ["alpha", "beta"]
+
+        backend.clear("trace-1")
+        assert backend.list_keys("trace-1") == []
+        assert backend.get("trace-2", "alpha") == 3
+
+    def test_rejects_oversized_and_unserialisable_values(self, backend: SQLiteBackend) -> None:
+        with pytest.raises(ValueError, match="1 MB"):
+            backend.set("trace-1", "big", "x" * (1024 * 1024 + 1))
+        with pytest.raises(ValueError, match="JSON-serialisable"):
+            backend.set("trace-1", "bad", object())
+
+    def test_context_store_uses_given_backend(self, backend: SQLiteBackend) -> None:
+        store = AgentContextStore(backend)
+        store.set("trace-1", "key", "value")
+        assert backend.get("trace-1", "key") == "value"
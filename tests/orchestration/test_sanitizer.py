@@ -110,6 +110,33 @@ class TestContextSanitizer:
         expected = "Call [PHONE] or use SSN [SSN]"
         assert sanitizer.sanitize(text) == expected
 
+    def test_find_matches_reports_rule_names(self) -> None:
+        """Should report each matching rule once, in the order rules were added."""
+        sanitizer = ContextSanitizer()
+        sanitizer.add_pattern(r"\b\d{3}-\d{2}-\d{4}\b", "[SSN]", name="ssn")
+
+        text = "token=abc card 1234-5678-9012-3456, ssn 123-45-6789, token=def"
+
+        assert sanitizer.find_matches(text) == ["card", "credential", "ssn"]
+        assert sanitizer.find_matches("This is safe text") == []
+
+    def test_custom_pattern_keywords(self) -> None:
+        """A custom pattern with keywords runs only when one of them occurs."""
+        sanitizer = ContextSanitizer()
+        sanitizer.add_pattern(r"(?i)\bssn:\s*\d+", "[SSN]", name="ssn", keywords=("ssn",))
+
+        assert sanitizer.sanitize("SSN: 123456789") == "[SSN]"
+        assert sanitizer.find_matches("ssn: 42") == ["ssn"]
+        assert sanitizer.is_clean("number: 123456789") is True
+
+    def test_keywords_respect_case_folding(self) -> None:
+        """Characters that case-insensitively match ASCII letters are still redacted."""
+        sanitizer = ContextSanitizer()
+
+        # Long s matches "s" under re.IGNORECASE
+        assert sanitizer.sanitize("\u017fecret=hunter2") == "\u017fecret=[REDACTED]"
+        assert sanitizer.is_clean("\u017fecret=hunter2") is False
+
     def test_is_clean_detects_sensitive_data(self) -> None:
         """Should return False when text contains sensitive patterns."""
         sanitizer = ContextSanitizer()
@@ -1,7 +1,8 @@
 """Tests for cache manager with two-tier caching."""
 
+import asyncio
 from datetime import datetime
-from typing import Optional
+from typing import Awaitable, Callable, Optional, Set
 
 import pytest
 
@@ -15,6 +16,7 @@ class MockRedisClient:
     def __init__(self) -> None:
         """Initialize mock Redis client."""
         self._storage: dict[str, str] = {}
+        self._sets: dict[str, set[str]] = {}
         self._should_fail = False
 
     async def get(self, key: str) -> Optional[str]:
@@ -35,6 +37,24 @@ class MockRedisClient:
             raise Exception("Redis connection error")
         for key in keys:
             self._storage.pop(key, None)
+            self._sets.pop(key, None)
+
+    async def sadd(self, key: str, *members: str) -> None:
+        """Mock set-add operation."""
+        if self._should_fail:
+            raise Exception("Redis connection error")
+        self._sets.setdefault(key, set()).update(members)
+
+    async def smembers(self, key: str) -> Set[bytes]:
+        """Mock set-members operation (returns bytes like redis-py)."""
+        if self._should_fail:
+            raise Exception("Redis connection error")
+        return {member.encode("utf-8") for member in self._sets.get(key, set())}
+
+    async def expire(self, key: str, seconds: int) -> None:
+        """Mock expire operation (TTL is not simulated)."""
+        if self._should_fail:
+            raise Exception("Redis connection error")
 
     async def scan(self, cursor: int, match: str, count: int) -> tuple[int, list[str]]:
         """Mock scan operation for pattern matching."""
@@ -56,6 +76,7 @@ class MockRedisClient:
         if self._should_fail:
             raise Exception("Redis connection error")
         self._storage.clear()
+        self._sets.clear()
 
     def set_failure_mode(self, should_fail: bool) -> None:
         """Set whether Redis operations should fail."""
@@ -193,6 +214,39 @@ class TestCacheManagerMemoryOnly:
         assert await manager.get("tenant:123:prompt:2") is None
         assert await manager.get("tenant:456:prompt:1") is not None
 
+    @pytest.mark.asyncio
+    async def test_invalidate_dependents(self, sample_composed_prompt: ComposedPrompt) -> None:
+        """Should invalidate exactly the entries composed from a prompt."""
+        manager = CacheManager()
+
+        await manager.set("key-1", sample_composed_prompt, dependencies=["system", "agent-1"])
+        await manager.set("key-2", sample_composed_prompt, dependencies=["system", "agent-2"])
+        await manager.set("key-3", sample_composed_prompt)
+
+        assert await manager.invalidate_dependents("agent-1") == 1
+        assert await manager.get("key-1") is None
+        assert await manager.get("key-2") is not None
+
+        assert await manager.invalidate_dependents("system") == 1
+        assert await manager.get("key-2") is None
+        assert await manager.get("key-3") is not None
+        assert manager._dependents == {}
+
+    @pytest.mark.asyncio
+    async def test_evicted_entries_leave_dependency_index(
+        self, sample_composed_prompt: ComposedPrompt
+    ) -> None:
+        """Should drop evicted and overwritten entries from the dependency index."""
+        manager = CacheManager(max_memory_items=1)
+
+        await manager.set("key-1", sample_composed_prompt, dependencies=["agent-1"])
+        await manager.set("key-1", sample_composed_prompt, dependencies=["agent-2"])
+        assert manager._dependents == {"agent-2": {"key-1"}}
+
+        await manager.set("key-2", sample_composed_prompt, dependencies=["agent-3"])
+        assert manager._dependents == {"agent-3": {"key-2"}}
+        assert manager._dependencies == {"key-2": frozenset({"agent-3"})}
+
 
 class TestCacheManagerWithRedis:
     """Tests for CacheManager with Redis backend."""
@@ -308,6 +362,149 @@ class TestCacheManagerWithRedis:
         # We can't directly verify TTL in mock, but ensure no error
         assert "test-key" in mock_redis._storage
 
+    @pytest.mark.asyncio
+    async def test_invalidate_dependents_across_workers(
+        self, mock_redis: MockRedisClient, sample_composed_prompt: ComposedPrompt
+    ) -> None:
+        """Should invalidate entries another worker cached, using the Redis index."""
+        worker_1 = CacheManager(redis_client=mock_redis)
+        worker_2 = CacheManager(redis_client=mock_redis)
+
+        await worker_1.set("key-1", sample_composed_prompt, dependencies=["agent-1"])
+        await worker_1.set("key-2", sample_composed_prompt, dependencies=["agent-2"])
+        assert await worker_2.get("key-1") is not None
+
+        count = await worker_2.invalidate_dependents("agent-1")
+
+        assert count == 1
+        assert "key-1" not in mock_redis._storage
+        assert "key-1" not in worker_2._memory_cache
+        assert "prompt-deps:agent-1" not in mock_redis._sets
+        assert "key-2" in mock_redis._storage
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_restores_dependencies(
+        self, mock_redis: MockRedisClient, sample_composed_prompt: ComposedPrompt
+    ) -> None:
+        """An entry loaded from Redis should be evicted when its prompt changes."""
+        writer = CacheManager(redis_client=mock_redis)
+        reader = CacheManager(redis_client=mock_redis)
+        await writer.set("key-1", sample_composed_prompt, dependencies=["agent-1"])
+
+        assert await reader.get("key-1") == sample_composed_prompt
+        assert reader._dependents == {"agent-1": {"key-1"}}
+
+        mock_redis.set_failure_mode(True)
+        await reader.invalidate_dependents("agent-1")
+        assert "key-1" not in reader._memory_cache
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_reads_bare_values(
+        self, mock_redis: MockRedisClient, sample_composed_prompt: ComposedPrompt
+    ) -> None:
+        """Values stored without dependencies by older versions should still load."""
+        mock_redis._storage["key-1"] = sample_composed_prompt.model_dump_json()
+        manager = CacheManager(redis_client=mock_redis)
+
+        assert await manager.get("key-1") == sample_composed_prompt
+
+
+class GatedRedisClient(MockRedisClient):
+    """Mock Redis client whose get and set replies are held until released.
+
+    get reads its value before waiting and set writes after waiting, like a
+    reply and a request still in flight.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with both gates closed."""
+        super().__init__()
+        self.entered = asyncio.Event()
+        self.release = asyncio.Event()
+        self.gated = False
+
+    async def get(self, key: str) -> Optional[str]:
+        """Mock get operation that waits for the gate when enabled."""
+        value = await super().get(key)
+        await self._wait()
+        return value
+
+    async def set(self, key: str, value: str, ex: int) -> None:
+        """Mock set operation that waits for the gate when enabled."""
+        await self._wait()
+        await super().set(key, value, ex)
+
+    async def _wait(self) -> None:
+        """Signal entry and wait for release when the gate is enabled."""
+        if self.gated:
+            self.entered.set()
+            await self.release.wait()
+
+
+class TestCacheManagerInvalidationRaces:
+    """Tests for invalidations that run while Redis is being awaited."""
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_l2_read_not_undone(
+        self, sample_composed_prompt: ComposedPrompt
+    ) -> None:
+        """An L2 read that an invalidation overlaps should not repopulate L1."""
+        redis = GatedRedisClient()
+        writer = CacheManager(redis_client=redis)
+        reader = CacheManager(redis_client=redis)
+        await writer.set("key-1", sample_composed_prompt, dependencies=["agent-1"])
+
+        redis.gated = True
+        read = asyncio.create_task(reader.get("key-1"))
+        await redis.entered.wait()
+        await reader.invalidate_dependents("agent-1")
+        redis.release.set()
+
+        assert await read is None
+        assert "key-1" not in reader._memory_cache
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_l2_write_not_undone(
+        self, sample_composed_prompt: ComposedPrompt
+    ) -> None:
+        """A write that an invalidation overlaps should not leave the value in L2."""
+        redis = GatedRedisClient()
+        manager = CacheManager(redis_client=redis)
+
+        redis.gated = True
+        write = asyncio.create_task(
+            manager.set("key-1", sample_composed_prompt, dependencies=["agent-1"])
+        )
+        await redis.entered.wait()
+        await manager.invalidate_dependents("agent-1")
+        redis.release.set()
+        await write
+
+        assert "key-1" not in redis._storage
+        assert "key-1" not in manager._memory_cache
+        assert await manager.get("key-1") is None
+
+    @pytest.mark.asyncio
+    async def test_write_indexed_before_value_stored(
+        self, sample_composed_prompt: ComposedPrompt
+    ) -> None:
+        """Another worker's invalidation should find a value as soon as it is visible."""
+        redis = GatedRedisClient()
+        writer = CacheManager(redis_client=redis)
+        other = CacheManager(redis_client=redis)
+
+        redis.gated = True
+        write = asyncio.create_task(
+            writer.set("key-1", sample_composed_prompt, dependencies=["agent-1"])
+        )
+        await redis.entered.wait()
+
+        assert redis._sets["prompt-deps:agent-1"] == {"key-1"}
+        redis.release.set()
+        await write
+        assert await other.invalidate_dependents("agent-1") == 1
+        assert "key-1" not in redis._storage
+
 
 class TestCacheManagerRedisErrorHandling:
     """Tests for graceful Redis error handling."""
@@ -403,6 +600,19 @@ class TestCacheManagerRedisErrorHandling:
         # Memory cache should still be cleared
         assert manager.stats()["size"] == 0
 
+    @pytest.mark.asyncio
+    async def test_invalidate_dependents_continues_on_redis_error(
+        self, mock_redis: MockRedisClient, sample_composed_prompt: ComposedPrompt
+    ) -> None:
+        """Should still invalidate L1 entries when Redis fails."""
+        manager = CacheManager(redis_client=mock_redis)
+        await manager.set("key-1", sample_composed_prompt, dependencies=["agent-1"])
+
+        mock_redis.set_failure_mode(True)
+
+        assert await manager.invalidate_dependents("agent-1") == 1
+        assert "key-1" not in manager._memory_cache
+
 
 class TestCacheManagerThreadSafety:
     """Tests for thread-safe cache operations."""
@@ -433,3 +643,135 @@ class TestCacheManagerThreadSafety:
 
         stats = manager.stats()
         assert stats["size"] == 10
+
+
+class TestCacheManagerGetOrCompute:
+    """Tests for single-flight fills and stale-while-revalidate."""
+
+    @staticmethod
+    def make_factory(
+        sample: ComposedPrompt, calls: list[int], delay: float = 0.01
+    ) -> Callable[[], Awaitable[ComposedPrompt]]:
+        """Create a factory that counts its calls."""
+
+        async def factory() -> ComposedPrompt:
+            calls.append(1)
+            await asyncio.sleep(delay)
+            return sample.model_copy(update={"content": f"composed {len(calls)}"})
+
+        return factory
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_compute_once(
+        self, mock_redis: MockRedisClient, sample_composed_prompt: ComposedPrompt
+    ) -> None:
+        """Should run the factory once for concurrent misses of the same key."""
+        manager = CacheManager(redis_client=mock_redis)
+        calls: list[int] = []
+        factory = self.make_factory(sample_composed_prompt, calls)
+
+        results = await asyncio.gather(
+            *[manager.get_or_compute("key-1", factory) for _ in range(10)]
+        )
+
+        assert len(calls) == 1
+        assert {r.content for r in results} == {"composed 1"}
+        assert "key-1" in mock_redis._storage
+        assert (await manager.get_or_compute("key-1", factory)).content == "composed 1"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_redis_does_not_block_other_keys(
+        self, mock_redis: MockRedisClient, sample_composed_prompt: ComposedPrompt
+    ) -> None:
+        """Should serve L1 hits while another key waits on Redis."""
+        manager = CacheManager(redis_client=mock_redis)
+        await manager.set("cached", sample_composed_prompt)
+        redis_get = mock_redis.get
+        release = asyncio.Event()
+
+        async def slow_get(key: str) -> Optional[str]:
+            await release.wait()
+            return await redis_get(key)
+
+        mock_redis.get = slow_get  # type: ignore[method-assign]
+        pending = asyncio.create_task(manager.get("missing"))
+        await asyncio.sleep(0)
+
+        assert await asyncio.wait_for(manager.get("cached"), timeout=1) is not None
+        release.set()
+        assert await pending is None
+
+    @pytest.mark.asyncio
+    async def test_failure_is_shared_and_not_cached(self) -> None:
+        """Should raise the factory error to every waiter and cache nothing."""
+        manager = CacheManager()
+        calls: list[int] = []
+
+        async def failing() -> ComposedPrompt:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise RuntimeError("composition failed")
+
+        results = await asyncio.gather(
+            *[manager.get_or_compute("key-1", failing) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+        assert len(calls) == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert manager.stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_entry_near_expiry_is_refreshed_in_background(
+        self, sample_composed_prompt: ComposedPrompt
+    ) -> None:
+        """Should serve an entry near expiry and refresh it in the background."""
+        manager = CacheManager(refresh_ahead=0.5)
+        calls: list[int] = []
+        factory = self.make_factory(sample_composed_prompt, calls)
+        await manager.get_or_compute("key-1", factory)
+
+        # Move the entry into its refresh window
+        _, expires_at = manager._deadlines["key-1"]
+        manager._deadlines["key-1"] = (0.0, expires_at)
+
+        stale = await manager.get_or_compute("key-1", factory)
+        assert stale.content == "composed 1"
+        await manager._flights["key-1"]
+
+        assert len(calls) == 2
+        assert (await manager.get("key-1")).content == "composed 2"  # type: ignore[union-attr]
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self, sample_composed_prompt: ComposedPrompt) -> None:
+        """Should not serve L1 entries past their TTL."""
+        manager = CacheManager()
+        await manager.set("key-1", sample_composed_prompt)
+        manager._deadlines["key-1"] = (0.0, 0.0)
+
+        assert await manager.get("key-1") is None
+        assert manager.stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fill_invalidated_while_computing_is_not_cached(
+        self, sample_composed_prompt: ComposedPrompt
+    ) -> None:
+        """Should not cache a value whose prompts changed while it was composed."""
+        manager = CacheManager()
+        calls: list[int] = []
+        factory = self.make_factory(sample_composed_prompt, calls, delay=0.05)
+
+        fill = asyncio.create_task(
+            manager.get_or_compute("key-1", factory, dependencies=["agent-1"])
+        )
+        await asyncio.sleep(0.01)
+        await manager.invalidate_dependents("agent-1")
+
+        assert (await fill).content == "composed 1"
+        assert await manager.get("key-1") is None
+
+    def test_rejects_invalid_refresh_ahead(self) -> None:
+        """Should reject a refresh window outside [0, 1)."""
+        with pytest.raises(ValueError, match="refresh_ahead"):
+            CacheManager(refresh_ahead=1.0)
@@ -1,5 +1,6 @@
 """Tests for CompositionEngine."""
 
+import asyncio
 from uuid import uuid4
 
 import pytest
@@ -357,6 +358,45 @@ class TestCompositionEngine:
         assert "feature" in result.layer_versions
         assert result.layer_versions["feature"] == 1
 
+    @pytest.mark.asyncio
+    async def test_layer_prompts_are_loaded_concurrently_once(
+        self,
+        repository: InMemoryPromptRepository,
+        system_prompt: Prompt,
+        agent_prompt: Prompt,
+        agent_id: str,
+        tenant_id: str,
+    ) -> None:
+        """Layer lookups should run concurrently, with duplicate features loaded once."""
+        lookups: list[tuple[PromptLayer, str]] = []
+        in_flight = 0
+        max_in_flight = 0
+        get_by_layer = repository.get_by_layer
+
+        async def slow_get_by_layer(
+            layer: PromptLayer, scope_id: str, tenant_id: object = None
+        ) -> object:
+            nonlocal in_flight, max_in_flight
+            lookups.append((layer, scope_id))
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return await get_by_layer(layer, scope_id, tenant_id)  # type: ignore[arg-type]
+
+        repository.get_by_layer = slow_get_by_layer  # type: ignore[method-assign]
+        engine = CompositionEngine(repository=repository, cache=CacheManager())
+
+        await engine.compose(
+            agent_id=agent_id,
+            tenant_id=tenant_id,
+            feature_ids=["feature-1", "feature-2", "feature-1"],
+        )
+
+        assert len(lookups) == 5
+        assert lookups.count((PromptLayer.FEATURE, "feature-1")) == 1
+        assert max_in_flight == 5
+
     @pytest.mark.asyncio
     async def test_compose_missing_system_prompt_raises_error(
         self,
@@ -413,6 +453,33 @@ class TestCompositionEngine:
         assert result1.content == result2.content
         assert result1.cache_key == result2.cache_key
 
+    @pytest.mark.asyncio
+    async def test_concurrent_compositions_share_one_render(
+        self,
+        engine_with_cache: CompositionEngine,
+        system_prompt: Prompt,
+        agent_prompt: Prompt,
+        agent_id: str,
+    ) -> None:
+        """Concurrent cache misses for the same prompt should compose it once."""
+        renders = 0
+        render = engine_with_cache._renderer.render
+
+        async def counting_render(*args: object, **kwargs: object) -> str:
+            nonlocal renders
+            renders += 1
+            await asyncio.sleep(0.01)
+            return await render(*args, **kwargs)  # type: ignore[arg-type]
+
+        engine_with_cache._renderer.render = counting_render  # type: ignore[method-assign]
+
+        results = await asyncio.gather(
+            *[engine_with_cache.compose(agent_id=agent_id) for _ in range(5)]
+        )
+
+        assert renders == 1
+        assert len({r.content for r in results}) == 1
+
     @pytest.mark.asyncio
     async def test_compose_skip_cache_bypasses_cache(
         self,
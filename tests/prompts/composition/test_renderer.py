@@ -389,3 +389,75 @@ class TestTemplateRendererValidation:
         errors = renderer.validate_syntax(template)
 
         assert errors == []
+
+
+class TestTemplateRendererCache:
+    """Tests for the compiled template cache."""
+
+    @pytest.mark.asyncio
+    async def test_render_reuses_compiled_template(self) -> None:
+        """Rendering the same source twice compiles it only once."""
+        renderer = TemplateRenderer()
+        template = "Hello {{ name }}!"
+
+        assert await renderer.render(template, {"name": "Alice"}) == "Hello Alice!"
+        assert await renderer.render(template, {"name": "Bob"}) == "Hello Bob!"
+
+        assert renderer.cache_info() == {
+            "entries": 1,
+            "bytes": len(template),
+            "hits": 1,
+            "misses": 1,
+        }
+
+    def test_get_variables(self) -> None:
+        """Only variables read from the context are reported."""
+        renderer = TemplateRenderer()
+        template = (
+            "{% set greeting = 'Hi' %}{{ greeting }} {{ user.name }}"
+            "{% for t in tools %}{{ t }}{% endfor %}"
+        )
+
+        assert renderer.get_variables(template) == frozenset({"user", "tools"})
+
+    def test_evicts_least_recently_used(self) -> None:
+        """The least recently used template is evicted when the cache is full."""
+        renderer = TemplateRenderer(cache_size=2)
+        first = renderer.compile("{{ a }}")
+        renderer.compile("{{ b }}")
+        renderer.compile("{{ a }}")
+        renderer.compile("{{ c }}")
+
+        assert renderer.compile("{{ a }}") is first
+        assert renderer.cache_info()["entries"] == 2
+        assert renderer.cache_misses == 3
+
+        renderer.compile("{{ b }}")
+        assert renderer.cache_misses == 4
+
+    def test_evicts_by_total_size(self) -> None:
+        """Templates are evicted to keep the cached source size within bounds."""
+        renderer = TemplateRenderer(cache_max_bytes=20)
+        renderer.compile("{{ a }} " + "x" * 8)
+        renderer.compile("{{ b }} " + "y" * 8)
+
+        assert renderer.cache_info()["entries"] == 1
+        assert renderer.cache_info()["bytes"] == 16
+
+        renderer.compile("{{ c }} " + "z" * 40)
+        assert renderer.cache_info()["entries"] == 1
+
+    def test_cache_can_be_disabled(self) -> None:
+        """A cache size of zero compiles templates on every use."""
+        renderer = TemplateRenderer(cache_size=0)
+
+        assert renderer.compile("{{ a }}") is not renderer.compile("{{ a }}")
+        assert renderer.cache_info()["entries"] == 0
+
+    def test_syntax_errors_are_not_cached(self) -> None:
+        """Invalid templates are reported every time and never cached."""
+        renderer = TemplateRenderer()
+
+        assert renderer.validate_syntax("{{ unclosed")
+        assert renderer.validate_syntax("{{ unclosed")
+        assert renderer.cache_info()["entries"] == 0
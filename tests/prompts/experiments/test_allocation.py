@@ -1,7 +1,16 @@
 """Tests for traffic allocation module."""
 
+import hashlib
+from collections import Counter
+
+import pytest
+
 from omniforge.prompts.enums import ExperimentStatus
-from omniforge.prompts.experiments.allocation import TrafficAllocator
+from omniforge.prompts.experiments.allocation import (
+    ALLOCATION_V1,
+    ALLOCATION_V2,
+    TrafficAllocator,
+)
 from omniforge.prompts.models import ExperimentVariant, PromptExperiment
 
 
@@ -286,3 +295,81 @@ class TestTrafficAllocator:
 
         variant_id = allocator.get_variant_for_identifier(experiment, "user-123")
         assert variant_id in ["variant-a", "variant-b"]
+
+
+def make_experiment(percentages: list[float], allocation_version: int = 1) -> PromptExperiment:
+    """Create a running experiment with one variant per traffic percentage."""
+    return PromptExperiment(
+        id="exp-weights",
+        name="Weighted Experiment",
+        prompt_id="prompt-1",
+        status=ExperimentStatus.RUNNING,
+        variants=[
+            ExperimentVariant(
+                id=f"variant-{i}",
+                name=f"Variant {i}",
+                prompt_version_id=f"prompt-1-v{i}",
+                traffic_percentage=percentage,
+            )
+            for i, percentage in enumerate(percentages)
+        ],
+        success_metric="conversion_rate",
+        allocation_version=allocation_version,
+    )
+
+
+class TestVersionedAllocation:
+    """Tests for allocation schemes and bulk allocation."""
+
+    @staticmethod
+    def legacy_allocate(experiment: PromptExperiment, identifier: str) -> str:
+        """Original SHA-256 linear-walk allocation."""
+        digest = hashlib.sha256(f"{experiment.id}:{identifier}".encode("utf-8")).hexdigest()
+        percentage = (int(digest[:8], 16) % 10000) / 100.0
+        cumulative = 0.0
+        for variant in experiment.variants:
+            cumulative += variant.traffic_percentage
+            if percentage < cumulative:
+                return variant.id
+        return experiment.variants[-1].id
+
+    def test_version_1_keeps_existing_assignments(self) -> None:
+        """Experiments without a version keep their SHA-256 assignments."""
+        experiment = make_experiment([10.0, 0.0, 33.3, 56.7])
+        allocator = TrafficAllocator()
+        users = [f"user-{i}" for i in range(2000)]
+
+        assert experiment.allocation_version == ALLOCATION_V1
+        assert allocator.allocate_many(experiment, users) == {
+            user: self.legacy_allocate(experiment, user) for user in users
+        }
+
+    def test_version_2_distribution(self) -> None:
+        """The BLAKE2b scheme splits traffic according to the percentages."""
+        experiment = make_experiment([20.0, 30.0, 50.0], allocation_version=ALLOCATION_V2)
+
+        assignments = TrafficAllocator().allocate_many(
+            experiment, (f"user-{i}" for i in range(10000))
+        )
+        counts = Counter(assignments.values())
+
+        assert 1800 < counts["variant-0"] < 2200
+        assert 2750 < counts["variant-1"] < 3250
+        assert 4700 < counts["variant-2"] < 5300
+
+    def test_allocate_matches_allocate_many(self) -> None:
+        """Single and bulk allocation agree."""
+        experiment = make_experiment([25.0, 25.0, 25.0, 25.0], allocation_version=ALLOCATION_V2)
+        allocator = TrafficAllocator()
+        users = [f"user-{i}" for i in range(100)]
+
+        bulk = allocator.allocate_many(experiment, users)
+
+        assert bulk == {user: allocator.allocate(experiment, user) for user in users}
+
+    def test_unknown_version_raises(self) -> None:
+        """An experiment with an unknown allocation version cannot be allocated."""
+        experiment = make_experiment([50.0, 50.0], allocation_version=99)
+
+        with pytest.raises(ValueError, match="allocation version"):
+            TrafficAllocator().allocate(experiment, "user-1")
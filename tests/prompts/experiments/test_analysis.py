@@ -1,8 +1,14 @@
 """Tests for experiment analysis module."""
 
+import random
+import statistics
+
+import pytest
+
 from omniforge.prompts.enums import ExperimentStatus
 from omniforge.prompts.experiments.analysis import (
     ExperimentAnalyzer,
+    RunningStats,
 )
 from omniforge.prompts.models import ExperimentVariant, PromptExperiment
 
@@ -361,3 +367,162 @@ class TestExperimentAnalyzer:
         if result.is_significant:
             assert "Treatment" in result.recommendation
             assert "clear winner" in result.recommendation or "promoting" in result.recommendation
+
+
+def make_experiment() -> PromptExperiment:
+    """Create a running two-variant experiment."""
+    return PromptExperiment(
+        id="exp-1",
+        name="Test Experiment",
+        prompt_id="prompt-1",
+        status=ExperimentStatus.RUNNING,
+        variants=[
+            ExperimentVariant(
+                id="variant-a",
+                name="Control",
+                prompt_version_id="prompt-1-v1",
+                traffic_percentage=50.0,
+            ),
+            ExperimentVariant(
+                id="variant-b",
+                name="Treatment",
+                prompt_version_id="prompt-1-v2",
+                traffic_percentage=50.0,
+            ),
+        ],
+        success_metric="conversion_rate",
+    )
+
+
+class TestRunningStats:
+    """Tests for the RunningStats accumulator."""
+
+    def test_matches_batch_statistics(self) -> None:
+        """Online updates should match statistics computed over all values."""
+        rng = random.Random(7)
+        values = [rng.gauss(10.0, 3.0) for _ in range(500)]
+
+        stats = RunningStats()
+        for value in values:
+            stats.update(value)
+
+        assert stats.count == 500
+        assert stats.mean == pytest.approx(statistics.mean(values))
+        assert stats.std_dev == pytest.approx(statistics.stdev(values))
+
+    def test_merge(self) -> None:
+        """Merging accumulators should equal accumulating all values at once."""
+        values = [0.1, 0.4, 0.35, 0.9, 0.7, 0.2, 0.55]
+        left, right, combined = RunningStats(), RunningStats(), RunningStats()
+        for value in values[:3]:
+            left.update(value)
+        for value in values[3:]:
+            right.update(value)
+        for value in values:
+            combined.update(value)
+
+        left.merge(right)
+
+        assert left.count == combined.count
+        assert left.mean == pytest.approx(combined.mean)
+        assert left.m2 == pytest.approx(combined.m2)
+
+    def test_metrics_round_trip(self) -> None:
+        """Statistics should survive serialization to variant metrics."""
+        stats = RunningStats()
+        for value in (1.0, 2.0, 4.0):
+            stats.update(value)
+
+        assert RunningStats.from_metrics(stats.to_metrics()) == stats
+        assert RunningStats.from_metrics(None) == RunningStats()
+
+
+class TestSequentialAnalysis:
+    """Tests for analysis from running statistics and sequential testing."""
+
+    def test_analyze_reads_running_stats_from_variants(self) -> None:
+        """Without explicit metrics, stored running statistics are analyzed."""
+        experiment = make_experiment()
+        rng = random.Random(1)
+        for variant, mean in zip(experiment.variants, (0.3, 0.5)):
+            stats = RunningStats()
+            for _ in range(200):
+                stats.update(rng.gauss(mean, 0.15))
+            variant.metrics = stats.to_metrics()
+
+        result = ExperimentAnalyzer().analyze(experiment)
+
+        assert result.is_significant is True
+        assert result.winner == "variant-b"
+        assert result.variant_stats["variant-b"].std_dev == pytest.approx(0.15, rel=0.2)
+
+    def test_sequential_test_stops_early_on_large_effect(self) -> None:
+        """A large effect is significant before the minimum sample size."""
+        metrics = {
+            "variant-a": {"sample_size": 50, "mean": 0.30, "std_dev": 0.10},
+            "variant-b": {"sample_size": 50, "mean": 0.50, "std_dev": 0.10},
+        }
+
+        fixed = ExperimentAnalyzer().analyze(make_experiment(), metrics)
+        sequential = ExperimentAnalyzer(sequential=True).analyze(make_experiment(), metrics)
+
+        assert fixed.is_significant is False
+        assert sequential.stopped_early is True
+        assert sequential.is_significant is True
+        assert sequential.winner == "variant-b"
+        assert sequential.p_value is not None and sequential.p_value < 0.05
+        assert "Statistically significant" in sequential.recommendation
+
+    def test_sequential_test_continues_without_effect(self) -> None:
+        """Without a real difference the sequential test does not stop."""
+        metrics = {
+            "variant-a": {"sample_size": 50, "mean": 0.50, "std_dev": 0.10},
+            "variant-b": {"sample_size": 50, "mean": 0.51, "std_dev": 0.10},
+        }
+
+        result = ExperimentAnalyzer(sequential=True).analyze(make_experiment(), metrics)
+
+        assert result.stopped_early is False
+        assert result.is_significant is False
+        assert result.winner is None
+
+    def test_sequential_false_positive_rate_under_monitoring(self) -> None:
+        """Analyzing after every observation keeps the false positive rate near alpha."""
+        rng = random.Random(42)
+        analyzer = ExperimentAnalyzer(sequential=True)
+        experiment = make_experiment()
+        false_positives = 0
+
+        for _ in range(100):
+            stats = {"variant-a": RunningStats(), "variant-b": RunningStats()}
+            for _ in range(analyzer.MIN_SAMPLE_SIZE):
+                for accumulator in stats.values():
+                    accumulator.update(rng.gauss(0.5, 0.1))
+                metrics = {vid: acc.to_metrics() for vid, acc in stats.items()}
+                if analyzer.analyze(experiment, metrics).stopped_early:  # type: ignore[arg-type]
+                    false_positives += 1
+                    break
+
+        assert false_positives <= 10
+
+    def test_sequential_test_used_past_minimum_sample_size(self) -> None:
+        """Past MIN_SAMPLE_SIZE the mSPRT p-value is still used, not the fixed test."""
+        metrics = {
+            "variant-a": {"sample_size": 200, "mean": 0.500, "std_dev": 0.10},
+            "variant-b": {"sample_size": 200, "mean": 0.522, "std_dev": 0.10},
+        }
+
+        fixed = ExperimentAnalyzer().analyze(make_experiment(), metrics)
+        sequential = ExperimentAnalyzer(sequential=True).analyze(make_experiment(), metrics)
+
+        assert fixed.is_significant is True
+        assert sequential.is_significant is False
+        assert sequential.stopped_early is False
+        assert sequential.sample_size_sufficient is True
+        assert fixed.p_value is not None and sequential.p_value is not None
+        assert sequential.p_value > fixed.p_value
+
+    def test_rejects_non_positive_effect_size(self) -> None:
+        """The mixture effect size must be positive."""
+        with pytest.raises(ValueError):
+            ExperimentAnalyzer(sequential=True, effect_size=0)
@@ -9,6 +9,7 @@ from omniforge.prompts.errors import (
     PromptNotFoundError,
     PromptValidationError,
 )
+from omniforge.prompts.experiments.allocation import LATEST_ALLOCATION_VERSION
 from omniforge.prompts.experiments.manager import ExperimentManager, VariantSelection
 from omniforge.prompts.models import ExperimentVariant, Prompt, PromptVersion
 from omniforge.prompts.storage.memory import InMemoryPromptRepository
@@ -78,6 +79,7 @@ class TestExperimentManager:
         assert len(experiment.variants) == 2
         assert experiment.success_metric == "conversion_rate"
         assert experiment.created_by == "user-123"
+        assert experiment.allocation_version == LATEST_ALLOCATION_VERSION
 
     @pytest.mark.asyncio
     async def test_create_experiment_prompt_not_found(self, manager: ExperimentManager) -> None:
@@ -346,6 +348,50 @@ class TestExperimentManager:
         assert completed_experiment.status == ExperimentStatus.COMPLETED
         assert completed_experiment.end_time is not None
 
+    @pytest.mark.asyncio
+    async def test_record_result_updates_running_stats(
+        self,
+        manager: ExperimentManager,
+        sample_prompt: Prompt,
+    ) -> None:
+        """Should fold each observation into the variant's running statistics."""
+        variants = [
+            ExperimentVariant(
+                id="variant-a",
+                name="Control",
+                prompt_version_id="prompt-1-v1",
+                traffic_percentage=50.0,
+            ),
+            ExperimentVariant(
+                id="variant-b",
+                name="Treatment",
+                prompt_version_id="prompt-1-v2",
+                traffic_percentage=50.0,
+            ),
+        ]
+
+        experiment = await manager.create_experiment(
+            prompt_id=sample_prompt.id,
+            name="Test",
+            description="Test",
+            success_metric="conversion_rate",
+            variants=variants,
+        )
+
+        with pytest.raises(ExperimentStateError):
+            await manager.record_result(experiment.id, "variant-a", 1.0)
+
+        await manager.start_experiment(experiment.id)
+        for value in (1.0, 2.0, 3.0):
+            updated = await manager.record_result(experiment.id, "variant-a", value)
+
+        metrics = updated.variants[0].metrics
+        assert metrics == {"sample_size": 3, "mean": 2.0, "m2": 2.0}
+        assert updated.variants[1].metrics is None
+
+        with pytest.raises(PromptValidationError):
+            await manager.record_result(experiment.id, "variant-x", 1.0)
+
     @pytest.mark.asyncio
     async def test_cancel_experiment(
         self,
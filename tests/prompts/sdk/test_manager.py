@@ -470,6 +470,42 @@ class TestComposition:
         stats = manager.get_cache_stats()
         assert stats["hit_count"] >= 0
 
+    @pytest.mark.asyncio
+    async def test_update_prompt_invalidates_dependent_compositions(self) -> None:
+        """Should invalidate only the cached compositions that used the updated prompt."""
+        manager = PromptManager(tenant_id="tenant-1")
+
+        await manager.create_prompt(
+            layer=PromptLayer.SYSTEM,
+            name="system",
+            content="System",
+            scope_id="default",
+            created_by="system",
+        )
+        agent_1 = await manager.create_prompt(
+            layer=PromptLayer.AGENT,
+            name="agent-1",
+            content="Agent one",
+            scope_id="agent-1",
+            created_by="user-1",
+        )
+        await manager.create_prompt(
+            layer=PromptLayer.AGENT,
+            name="agent-2",
+            content="Agent two",
+            scope_id="agent-2",
+            created_by="user-1",
+        )
+        await manager.compose_prompt(agent_id="agent-1")
+        await manager.compose_prompt(agent_id="agent-2")
+        assert manager.get_cache_stats()["size"] == 2
+
+        await manager.update_prompt(
+            agent_1.id, content="Agent one v2", change_message="Update", changed_by="user-1"
+        )
+
+        assert manager.get_cache_stats()["size"] == 1
+
 
 class TestValidation:
     """Tests for validation operations."""
@@ -327,6 +327,29 @@ class TestInMemoryPromptRepositoryPromptCRUD:
 
         assert len(result) == 3
 
+    @pytest.mark.asyncio
+    async def test_indexes_follow_scope_and_tenant_changes(
+        self,
+        repository: InMemoryPromptRepository,
+        sample_prompt: Prompt,
+    ) -> None:
+        """Should find prompts under their updated scope and tenant only."""
+        await repository.create(sample_prompt)
+
+        moved = sample_prompt.model_copy(update={"scope_id": "moved", "tenant_id": "tenant-2"})
+        await repository.update(moved)
+
+        assert await repository.get_by_layer(PromptLayer.SYSTEM, "default") is None
+        assert await repository.get_by_layer(PromptLayer.SYSTEM, "moved") is not None
+        assert await repository.list_by_tenant("tenant-1") == []
+        assert [p.id for p in await repository.list_by_tenant("tenant-2")] == [sample_prompt.id]
+
+        await repository.delete(sample_prompt.id)
+
+        assert await repository.get_by_layer(PromptLayer.SYSTEM, "moved") is None
+        assert await repository.list_by_tenant("tenant-2") == []
+        assert repository._prompts_by_scope == {}
+
 
 class TestInMemoryPromptRepositoryVersionOperations:
     """Tests for version operations."""
@@ -516,6 +539,31 @@ class TestInMemoryPromptRepositoryVersionOperations:
         with pytest.raises(PromptVersionNotFoundError):
             await repository.set_current_version(sample_prompt.id, 999)
 
+    @pytest.mark.asyncio
+    async def test_versions_created_out_of_order(
+        self,
+        repository: InMemoryPromptRepository,
+        sample_prompt: Prompt,
+    ) -> None:
+        """Should list and look up versions by number regardless of creation order."""
+        for number in [2, 5, 1, 4, 3]:
+            await repository.create_version(
+                PromptVersion(
+                    id=str(uuid4()),
+                    prompt_id=sample_prompt.id,
+                    version_number=number,
+                    content=f"Version {number} content",
+                )
+            )
+
+        versions = await repository.list_versions(sample_prompt.id, limit=2, offset=1)
+        version = await repository.get_version(sample_prompt.id, 3)
+
+        assert [v.version_number for v in versions] == [4, 3]
+        assert version is not None and version.content == "Version 3 content"
+        assert await repository.get_version(sample_prompt.id, 6) is None
+        assert await repository.list_versions(sample_prompt.id, offset=5) == []
+
 
 class TestInMemoryPromptRepositoryExperimentOperations:
     """Tests for experiment operations."""
@@ -835,6 +883,27 @@ class TestInMemoryPromptRepositoryExperimentOperations:
 
         assert len(result) == 3
 
+    @pytest.mark.asyncio
+    async def test_active_experiment_follows_status_updates(
+        self,
+        repository: InMemoryPromptRepository,
+        sample_prompt: Prompt,
+        sample_experiment: PromptExperiment,
+    ) -> None:
+        """Should track the running experiment as its status is updated."""
+        await repository.create_experiment(sample_experiment)
+        assert await repository.get_active_experiment(sample_prompt.id) is None
+
+        sample_experiment.status = ExperimentStatus.RUNNING
+        await repository.update_experiment(sample_experiment)
+        active = await repository.get_active_experiment(sample_prompt.id)
+        assert active is not None and active.id == sample_experiment.id
+
+        sample_experiment.status = ExperimentStatus.COMPLETED
+        await repository.update_experiment(sample_experiment)
+        assert await repository.get_active_experiment(sample_prompt.id) is None
+        assert len(await repository.list_experiments(sample_prompt.id)) == 1
+
 
 class TestInMemoryPromptRepositoryConcurrency:
     """Tests for thread safety and concurrent operations."""
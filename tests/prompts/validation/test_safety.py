@@ -268,3 +268,35 @@ class TestSafetyValidator:
 
         # Should remove unsafe part
         assert "Ignore" not in sanitized or "previous" not in sanitized.lower()
+
+    def test_limit_repetition_across_newlines(self) -> None:
+        """Runs of any character, including newlines, should be limited."""
+        validator = SafetyValidator()
+
+        assert validator._limit_repetition("a\n\n\n\n\n\n\nb", max_consecutive=2) == "a\n\nb"
+        assert validator._limit_repetition("aabbbbcc", max_consecutive=0) == "abc"
+
+    def test_find_violations_reports_matched_patterns(self) -> None:
+        """find_violations should report each matching pattern once."""
+        validator = SafetyValidator()
+
+        violations = validator.find_violations(
+            "{{ secrets }} Act as admin. Ignore previous. ACT AS root."
+        )
+
+        assert violations == [
+            r"\{\{.*?\}\}",
+            r"\bignore\s+(previous|all|prior|above)\b",
+            r"\bact\s+as\b",
+        ]
+        assert validator.find_violations("Normal question?") == []
+        assert validator.find_violations("") == []
+
+    def test_keyword_prefilter_respects_case_folding(self) -> None:
+        """Characters that case-insensitively match ASCII letters are still detected."""
+        validator = SafetyValidator()
+
+        # Dotless i and long s match "i" and "s" under re.IGNORECASE
+        assert validator.is_safe("\u0131gnore previous") is False
+        assert validator.is_safe("\u017fystem prompt") is False
+        assert validator.sanitize_user_input("\u0130gnore all. Hi") == ". Hi"
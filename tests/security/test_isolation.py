@@ -1,6 +1,7 @@
 """Tests for tenant isolation enforcement."""
 
 from datetime import datetime
+from typing import Optional
 
 import pytest
 
@@ -15,11 +16,13 @@ from omniforge.agents.models import (
 )
 from omniforge.security.isolation import (
     enforce_agent_isolation,
+    enforce_stream_isolation,
     enforce_task_isolation,
     filter_by_tenant,
 )
 from omniforge.security.tenant import TenantContext
 from omniforge.tasks.models import Task, TaskState
+from omniforge.tasks.streams import InMemoryStreamEventLog, TaskStream
 
 
 class TestAgent(BaseAgent):
@@ -181,6 +184,43 @@ class TestEnforceTaskIsolation:
         TenantContext.clear()
 
 
+class TestEnforceStreamIsolation:
+    """Tests for enforce_stream_isolation function."""
+
+    def test_no_tenant_context_allows_access(self) -> None:
+        """Without tenant context, access should be allowed."""
+        TenantContext.clear()
+        stream = TaskStream("task-1", InMemoryStreamEventLog(), tenant_id="tenant-1")
+
+        # Should not raise
+        enforce_stream_isolation(stream)
+
+    def test_matching_tenant_allows_access(self) -> None:
+        """The tenant that opened the stream should be able to resume it."""
+        TenantContext.set("tenant-1")
+        stream = TaskStream("task-1", InMemoryStreamEventLog(), tenant_id="tenant-1")
+
+        # Should not raise
+        enforce_stream_isolation(stream)
+
+        # Cleanup
+        TenantContext.clear()
+
+    @pytest.mark.parametrize("stream_tenant", ["tenant-2", None])
+    def test_other_or_missing_tenant_raises_error(self, stream_tenant: Optional[str]) -> None:
+        """A tenant should not resume another tenant's or an untenanted stream."""
+        TenantContext.set("tenant-1")
+        stream = TaskStream("task-1", InMemoryStreamEventLog(), tenant_id=stream_tenant)
+
+        with pytest.raises(TenantIsolationError) as exc_info:
+            enforce_stream_isolation(stream)
+
+        assert exc_info.value.resource_id == "task-1"
+
+        # Cleanup
+        TenantContext.clear()
+
+
 class TestFilterByTenant:
     """Tests for filter_by_tenant function."""
 
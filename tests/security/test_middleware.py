@@ -1,7 +1,10 @@
 """Integration tests for tenant middleware."""
 
+from typing import AsyncIterator
+
 import pytest
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
 
 from omniforge.api.middleware.tenant import TenantMiddleware
@@ -21,6 +24,22 @@ def app() -> FastAPI:
     async def get_tenant() -> dict:
         return {"tenant_id": get_tenant_id()}
 
+    @test_app.get("/test/state")
+    async def get_state(request: Request) -> dict:
+        return {
+            "tenant_id": getattr(request.state, "tenant_id", None),
+            "user_role": getattr(request.state, "user_role", None),
+        }
+
+    @test_app.get("/test/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[str]:
+            for _ in range(3):
+                # Context must stay set while the body is being streamed
+                yield f"data: {get_tenant_id()}\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
     return test_app
 
 
@@ -102,3 +121,19 @@ class TestTenantMiddleware:
 
         assert response1.json()["tenant_id"] == "tenant-1"
         assert response2.json()["tenant_id"] == "tenant-2"
+
+    def test_request_state_populated(self, client: TestClient) -> None:
+        """Tenant ID and role should be available on request.state."""
+        response = client.get(
+            "/test/state",
+            headers={"X-API-Key": "tenant-456:developer:secret-key-abc123"},
+        )
+
+        assert response.json() == {"tenant_id": "tenant-456", "user_role": "developer"}
+
+    def test_context_set_while_streaming(self, client: TestClient) -> None:
+        """Tenant context should be visible to a streaming response body."""
+        response = client.get("/test/stream", headers={"X-Tenant-ID": "tenant-1"})
+
+        assert response.status_code == 200
+        assert response.text == "data: tenant-1\n\n" * 3
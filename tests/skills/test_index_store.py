@@ -0,0 +1,180 @@
+"""Tests for the persistent skill index store."""
+
+import os
+import time
+from pathlib import Path
+
+from omniforge.skills.index_store import SkillFileRecord, SkillIndexStore
+from omniforge.skills.models import SkillIndexEntry
+
+# An mtime old enough to be trusted by the store
+OLD_MTIME_NS = time.time_ns() - 60_000_000_000
+
+
+def make_entry(path: Path) -> SkillIndexEntry:
+    """Create an index entry for a skill file."""
+    return SkillIndexEntry(
+        name="test-skill",
+        description="A test skill",
+        path=path,
+        storage_layer="project",
+        tags=["test"],
+        priority=2,
+    )
+
+
+def write_old_file(path: Path, content: str) -> os.stat_result:
+    """Write a file with an old modification time and return its stat result."""
+    path.write_text(content)
+    os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+    return path.stat()
+
+
+class TestSkillFileRecords:
+    """Tests for cached skill file records."""
+
+    def test_get_missing_file_returns_none(self, tmp_path: Path) -> None:
+        """get_file should return None for a file that was never stored."""
+        store = SkillIndexStore(tmp_path / "index.db")
+
+        assert store.get_file(tmp_path / "SKILL.md", "project") is None
+
+    def test_put_and_get_file_round_trip(self, tmp_path: Path) -> None:
+        """Stored records should be read back including the parsed entry."""
+        store = SkillIndexStore(tmp_path / "index.db")
+        skill_file = tmp_path / "SKILL.md"
+        entry = make_entry(skill_file)
+
+        store.put_file(skill_file, "project", SkillFileRecord(1, 2, "abc", entry=entry))
+        record = store.get_file(skill_file, "project")
+
+        assert record is not None
+        assert (record.mtime_ns, record.size, record.content_hash) == (1, 2, "abc")
+        assert record.entry == entry
+        assert record.error is None
+        assert record.recorded_ns > 0
+
+    def test_records_are_keyed_by_storage_layer(self, tmp_path: Path) -> None:
+        """The same path in another storage layer should be a separate record."""
+        store = SkillIndexStore(tmp_path / "index.db")
+        skill_file = tmp_path / "SKILL.md"
+
+        store.put_file(skill_file, "project", SkillFileRecord(1, 2, "abc", error="bad"))
+
+        assert store.get_file(skill_file, "personal") is None
+
+    def test_records_persist_across_instances(self, tmp_path: Path) -> None:
+        """A new store on the same file should see previously stored records."""
+        skill_file = tmp_path / "SKILL.md"
+        first = SkillIndexStore(tmp_path / "index.db")
+        first.put_file(skill_file, "project", SkillFileRecord(1, 2, "abc", error="bad"))
+        first.close()
+
+        record = SkillIndexStore(tmp_path / "index.db").get_file(skill_file, "project")
+
+        assert record is not None
+        assert record.error == "bad"
+
+    def test_record_matches_unchanged_settled_file(self, tmp_path: Path) -> None:
+        """A record should match a file whose mtime and size are unchanged."""
+        stat = write_old_file(tmp_path / "SKILL.md", "content")
+        record = SkillFileRecord(stat.st_mtime_ns, stat.st_size, "abc", recorded_ns=time.time_ns())
+
+        assert record.matches(stat)
+
+    def test_record_does_not_match_changed_file(self, tmp_path: Path) -> None:
+        """A record should not match after the file size changes."""
+        skill_file = tmp_path / "SKILL.md"
+        stat = write_old_file(skill_file, "content")
+        record = SkillFileRecord(stat.st_mtime_ns, stat.st_size, "abc", recorded_ns=time.time_ns())
+
+        assert not record.matches(write_old_file(skill_file, "changed content"))
+
+    def test_record_of_recently_modified_file_does_not_match(self, tmp_path: Path) -> None:
+        """A record taken right after a write should not be trusted by mtime alone."""
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_text("content")
+        stat = skill_file.stat()
+        record = SkillFileRecord(stat.st_mtime_ns, stat.st_size, "abc", recorded_ns=time.time_ns())
+
+        assert not record.matches(stat)
+
+    def test_retain_files_deletes_other_records(self, tmp_path: Path) -> None:
+        """retain_files should delete records not in the given keys."""
+        store = SkillIndexStore(tmp_path / "index.db")
+        kept = tmp_path / "kept" / "SKILL.md"
+        removed = tmp_path / "removed" / "SKILL.md"
+        store.put_file(kept, "project", SkillFileRecord(1, 2, "abc", error="bad"))
+        store.put_file(removed, "project", SkillFileRecord(1, 2, "abc", error="bad"))
+
+        deleted = store.retain_files([(kept, "project")])
+
+        assert deleted == 1
+        assert store.get_file(kept, "project") is not None
+        assert store.get_file(removed, "project") is None
+
+
+class TestSkillDirectoryListings:
+    """Tests for cached directory listings."""
+
+    def test_get_directory_with_same_mtime(self, tmp_path: Path) -> None:
+        """A listing should be returned while the directory mtime is unchanged."""
+        store = SkillIndexStore(tmp_path / "index.db")
+
+        store.put_directory(tmp_path, OLD_MTIME_NS, ["a", "b"])
+
+        assert store.get_directory(tmp_path, OLD_MTIME_NS) == ["a", "b"]
+
+    def test_get_directory_with_changed_mtime(self, tmp_path: Path) -> None:
+        """A listing should be ignored once the directory mtime changes."""
+        store = SkillIndexStore(tmp_path / "index.db")
+
+        store.put_directory(tmp_path, OLD_MTIME_NS, ["a"])
+
+        assert store.get_directory(tmp_path, OLD_MTIME_NS + 1) is None
+
+    def test_get_directory_listed_right_after_change(self, tmp_path: Path) -> None:
+        """A listing taken within the timestamp granularity should not be trusted."""
+        store = SkillIndexStore(tmp_path / "index.db")
+        mtime_ns = time.time_ns()
+
+        store.put_directory(tmp_path, mtime_ns, ["a"])
+
+        assert store.get_directory(tmp_path, mtime_ns) is None
+
+
+class TestSkillIndexStoreErrors:
+    """Tests for error handling in the store."""
+
+    def test_unusable_path_disables_store(self, tmp_path: Path) -> None:
+        """A store that cannot be opened should behave as an empty cache."""
+        blocker = tmp_path / "not-a-directory"
+        blocker.write_text("")
+        store = SkillIndexStore(blocker / "index.db")
+
+        store.put_directory(tmp_path, OLD_MTIME_NS, ["a"])
+        with store.transaction():
+            store.put_file(tmp_path / "SKILL.md", "project", SkillFileRecord(1, 2, "abc"))
+
+        assert store.get_directory(tmp_path, OLD_MTIME_NS) is None
+        assert store.get_file(tmp_path / "SKILL.md", "project") is None
+        assert store.retain_files([]) == 0
+
+    def test_corrupt_database_disables_store(self, tmp_path: Path) -> None:
+        """A file that is not a SQLite database should disable the store."""
+        db_path = tmp_path / "index.db"
+        db_path.write_bytes(b"not a database" * 100)
+        store = SkillIndexStore(db_path)
+
+        assert store.get_file(tmp_path / "SKILL.md", "project") is None
+        assert store.get_directory(tmp_path, OLD_MTIME_NS) is None
+
+    def test_transaction_commits_writes(self, tmp_path: Path) -> None:
+        """Writes inside a transaction should be visible to other connections."""
+        store = SkillIndexStore(tmp_path / "index.db")
+
+        with store.transaction():
+            store.put_directory(tmp_path, OLD_MTIME_NS, ["a"])
+
+        other = SkillIndexStore(tmp_path / "index.db")
+        assert other.get_directory(tmp_path, OLD_MTIME_NS) == ["a"]
@@ -4,6 +4,7 @@ This module tests skill indexing, caching, priority resolution,
 and thread-safe operations.
 """
 
+import os
 import time
 from pathlib import Path
 from threading import Thread
@@ -956,3 +957,103 @@ Content for skill {i}
         assert count == 100
         # Target: < 100ms for 1000 skills, so < 10ms for 100 skills
         assert elapsed < 0.1, f"Index build took {elapsed*1000:.1f}ms (target: <100ms)"
+
+
+class TestSkillLoaderIndexStore:
+    """Tests for SkillLoader with a persistent index store."""
+
+    OLD_MTIME_NS = time.time_ns() - 60_000_000_000
+
+    def _write_skill(self, skills_dir: Path, name: str, description: str) -> Path:
+        """Write a skill file with an old modification time."""
+        skill_dir = skills_dir / name
+        skill_dir.mkdir(exist_ok=True)
+        skill_file = skill_dir / "SKILL.md"
+        skill_file.write_text(f"---\nname: {name}\ndescription: {description}\n---\n\nContent\n")
+        os.utime(skill_file, ns=(self.OLD_MTIME_NS, self.OLD_MTIME_NS))
+        return skill_file
+
+    def _count_parses(self, loader: SkillLoader, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+        """Record the paths parsed by a loader's parser."""
+        parsed: list[Path] = []
+        parse_metadata = loader._parser.parse_metadata
+
+        def counting_parse(path: Path, storage_layer: str) -> SkillIndexEntry:
+            parsed.append(path)
+            return parse_metadata(path, storage_layer)
+
+        monkeypatch.setattr(loader._parser, "parse_metadata", counting_parse)
+        return parsed
+
+    def test_rebuild_reuses_unchanged_skills(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A new loader should not re-parse skills recorded in the index store."""
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        self._write_skill(skills_dir, "skill-a", "First skill")
+        self._write_skill(skills_dir, "skill-b", "Second skill")
+        config = StorageConfig(project_path=skills_dir, index_path=tmp_path / "index.db")
+        assert SkillLoader(config).build_index() == 2
+
+        loader = SkillLoader(config)
+        parsed = self._count_parses(loader, monkeypatch)
+
+        assert loader.build_index() == 2
+        assert parsed == []
+        assert loader.get_skill_metadata("skill-b").description == "Second skill"
+
+    def test_rebuild_reparses_changed_skill(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Only skills whose file changed should be re-parsed."""
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        self._write_skill(skills_dir, "skill-a", "First skill")
+        self._write_skill(skills_dir, "skill-b", "Second skill")
+        config = StorageConfig(project_path=skills_dir, index_path=tmp_path / "index.db")
+        SkillLoader(config).build_index()
+
+        changed = self._write_skill(skills_dir, "skill-b", "Updated second skill")
+        loader = SkillLoader(config)
+        parsed = self._count_parses(loader, monkeypatch)
+        loader.build_index()
+
+        assert parsed == [changed]
+        assert loader.get_skill_metadata("skill-b").description == "Updated second skill"
+
+    def test_rebuild_drops_deleted_skill(self, tmp_path: Path) -> None:
+        """Skills removed from disk should disappear from the index and the store."""
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        self._write_skill(skills_dir, "skill-a", "First skill")
+        removed = self._write_skill(skills_dir, "skill-b", "Second skill")
+        config = StorageConfig(project_path=skills_dir, index_path=tmp_path / "index.db")
+        loader = SkillLoader(config)
+        loader.build_index()
+
+        removed.unlink()
+        removed.parent.rmdir()
+
+        assert loader.build_index(force=True) == 1
+        assert not loader.has_skill("skill-b")
+        assert loader._index_store is not None
+        assert loader._index_store.get_file(removed, "project") is None
+
+    def test_invalid_skill_is_not_reparsed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Parse failures should be remembered until the file changes."""
+        skills_dir = tmp_path / "skills"
+        (skills_dir / "broken").mkdir(parents=True)
+        broken = skills_dir / "broken" / "SKILL.md"
+        broken.write_text("no frontmatter")
+        os.utime(broken, ns=(self.OLD_MTIME_NS, self.OLD_MTIME_NS))
+        config = StorageConfig(project_path=skills_dir, index_path=tmp_path / "index.db")
+        assert SkillLoader(config).build_index() == 0
+
+        loader = SkillLoader(config)
+        parsed = self._count_parses(loader, monkeypatch)
+
+        assert loader.build_index() == 0
+        assert parsed == []
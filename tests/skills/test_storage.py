@@ -4,10 +4,13 @@ This module tests the storage configuration and management system for the
 4-layer skill hierarchy.
 """
 
+import os
+import time
 from pathlib import Path
 
 import pytest
 
+from omniforge.skills.index_store import SkillIndexStore
 from omniforge.skills.storage import SkillStorageManager, StorageConfig
 
 
@@ -330,3 +333,39 @@ class TestSkillStorageManager:
         paths = list(manager.get_all_skill_paths())
         assert len(paths) == 1
         assert paths[0][1] == valid_skill / "SKILL.md"
+
+    def test_get_all_skill_files_includes_stat(self, tmp_path: Path) -> None:
+        """get_all_skill_files should yield each skill file with its stat result."""
+        skill_dir = tmp_path / "skill-a"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("# Skill A")
+
+        manager = SkillStorageManager(StorageConfig(project_path=tmp_path))
+
+        files = list(manager.get_all_skill_files())
+        assert len(files) == 1
+        layer, path, file_stat = files[0]
+        assert (layer, path) == ("project", skill_dir / "SKILL.md")
+        assert file_stat.st_size == len("# Skill A")
+
+    def test_scan_directory_reuses_listing_of_unchanged_directory(self, tmp_path: Path) -> None:
+        """A layer directory whose mtime is unchanged should not be listed again."""
+        base_path = tmp_path / "skills"
+        (base_path / "skill-a").mkdir(parents=True)
+        (base_path / "skill-a" / "SKILL.md").write_text("# Skill A")
+        old_mtime_ns = time.time_ns() - 60_000_000_000
+        os.utime(base_path, ns=(old_mtime_ns, old_mtime_ns))
+
+        store = SkillIndexStore(tmp_path / "index.db")
+        manager = SkillStorageManager(StorageConfig(project_path=base_path), index_store=store)
+        assert len(list(manager.get_all_skill_paths())) == 1
+
+        # Add a skill but restore the directory mtime: the recorded listing is used
+        (base_path / "skill-b").mkdir()
+        (base_path / "skill-b" / "SKILL.md").write_text("# Skill B")
+        os.utime(base_path, ns=(old_mtime_ns, old_mtime_ns))
+        assert len(list(manager.get_all_skill_paths())) == 1
+
+        # Once the directory mtime changes it is listed again
+        os.utime(base_path, ns=(old_mtime_ns + 1, old_mtime_ns + 1))
+        assert len(list(manager.get_all_skill_paths())) == 2
@@ -0,0 +1,122 @@
+"""Tests for SQLiteAgentRepository."""
+
+from pathlib import Path
+
+import pytest
+
+from omniforge.agents.autonomous_simple import SimpleAutonomousAgent
+from omniforge.agents.models import AgentIdentity, AgentSkill, SkillInputMode, SkillOutputMode
+from omniforge.storage.agent_repository import SQLiteAgentRepository
+from omniforge.storage.shared_state import SQLiteStateStore
+
+
+def make_agent(agent_id: str = "data-bot", tenant_id: str = "tenant-1") -> SimpleAutonomousAgent:
+    """Create an agent the way CreateAgentTool does (dynamic subclass)."""
+    agent_class = type(
+        "Agent_data_bot",
+        (SimpleAutonomousAgent,),
+        {
+            "identity": AgentIdentity(
+                id=agent_id, name="Data Bot", description="Processes data", version="1.0.0"
+            )
+        },
+    )
+    agent: SimpleAutonomousAgent = agent_class(
+        system_prompt="You are Data Bot.", model="gpt-4o-mini", tenant_id=tenant_id
+    )
+    return agent
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> str:
+    """Path of a fresh shared state file."""
+    return str(tmp_path / "state.db")
+
+
+class TestSQLiteAgentRepository:
+    """Tests for SQLiteAgentRepository."""
+
+    @pytest.mark.asyncio
+    async def test_agent_is_rebuilt_in_other_process(self, path: str) -> None:
+        """An agent saved by one worker can be loaded by another."""
+        await SQLiteAgentRepository(SQLiteStateStore(path)).save(make_agent())
+
+        agent = await SQLiteAgentRepository(SQLiteStateStore(path)).get("data-bot")
+
+        assert isinstance(agent, SimpleAutonomousAgent)
+        assert agent.identity.name == "Data Bot"
+        assert agent.tenant_id == "tenant-1"
+        assert agent._custom_system_prompt == "You are Data Bot."
+        assert agent._model == "gpt-4o-mini"
+
+    @pytest.mark.asyncio
+    async def test_rebuilt_agent_is_reused_until_changed(self, path: str) -> None:
+        """Each process reuses its rebuilt agent until another process updates it."""
+        writer = SQLiteAgentRepository(SQLiteStateStore(path))
+        reader = SQLiteAgentRepository(SQLiteStateStore(path))
+        original = make_agent()
+        await writer.save(original)
+
+        first = await reader.get("data-bot")
+        assert await reader.get("data-bot") is first
+
+        original.skills = list(original.skills) + [
+            AgentSkill(
+                id="pdf",
+                name="PDF",
+                description="Reads PDFs",
+                input_modes=[SkillInputMode.TEXT],
+                output_modes=[SkillOutputMode.TEXT],
+            )
+        ]
+        await writer.update(original)
+
+        updated = await reader.get("data-bot")
+        assert updated is not first
+        assert [s.id for s in updated.skills][-1] == "pdf"
+
+    @pytest.mark.asyncio
+    async def test_duplicate_and_missing_agents(self, path: str) -> None:
+        """Saving a duplicate or deleting a missing agent raises ValueError."""
+        repo = SQLiteAgentRepository(SQLiteStateStore(path))
+        await repo.save(make_agent())
+
+        with pytest.raises(ValueError, match="already exists"):
+            await repo.save(make_agent())
+
+        await repo.delete("data-bot")
+        assert await repo.get("data-bot") is None
+        with pytest.raises(ValueError, match="does not exist"):
+            await repo.delete("data-bot")
+
+    @pytest.mark.asyncio
+    async def test_list_by_tenant(self, path: str) -> None:
+        """Agents are listed in registration order, filtered by tenant."""
+        repo = SQLiteAgentRepository(SQLiteStateStore(path))
+        await repo.save(make_agent("a", "tenant-1"))
+        await repo.save(make_agent("b", "tenant-2"))
+        await repo.save(make_agent("c", "tenant-1"))
+
+        assert [a.identity.id for a in await repo.list_all()] == ["a", "b", "c"]
+        assert [a.identity.id for a in await repo.list_by_tenant("tenant-1")] == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_namespaces_are_separate(self, path: str) -> None:
+        """Repositories in different namespaces do not see each other's agents."""
+        store = SQLiteStateStore(path)
+        await SQLiteAgentRepository(store, namespace="chat_agents").save(make_agent())
+
+        assert await SQLiteAgentRepository(store).get("data-bot") is None
+
+    @pytest.mark.asyncio
+    async def test_rejects_agents_that_cannot_be_rebuilt(self, path: str) -> None:
+        """Agents with custom constructors cannot be shared."""
+
+        class CustomAgent(SimpleAutonomousAgent):
+            def __init__(self) -> None:
+                super().__init__(system_prompt="custom")
+
+        repo = SQLiteAgentRepository(SQLiteStateStore(path))
+
+        with pytest.raises(ValueError, match="cannot be stored"):
+            await repo.save(CustomAgent())
@@ -462,3 +462,65 @@ async def test_list_by_tenant_ordered_by_started_at(repository):
     # Should be ordered by started_at DESC (newest first)
     assert chains[0].task_id == "task-2"
     assert chains[1].task_id == "task-1"
+
+
+def create_long_chain(step_count: int) -> ReasoningChain:
+    """Create a chain alternating thinking and tool call steps."""
+    chain = ReasoningChain(task_id="task-1", agent_id="agent-1", tenant_id="tenant-1")
+    for i in range(step_count):
+        if i % 2:
+            step = ReasoningStep(
+                step_number=i,
+                type=StepType.TOOL_CALL,
+                tool_call=ToolCallInfo(
+                    tool_name="search", tool_type=ToolType.FUNCTION, parameters={"q": i}
+                ),
+            )
+        else:
+            step = ReasoningStep(
+                step_number=i, type=StepType.THINKING, thinking=ThinkingInfo(content=f"Step {i}")
+            )
+        chain.add_step(step)
+    return chain
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_without_steps(repository):
+    """Test reading only chain metadata."""
+    chain = create_long_chain(5)
+    await repository.save(chain)
+
+    retrieved = await repository.get_by_id(chain.id, include_steps=False)
+
+    assert retrieved.id == chain.id
+    assert retrieved.steps == []
+
+
+@pytest.mark.asyncio
+async def test_get_steps_pages_with_cursor(repository):
+    """Test reading steps a page at a time after a cursor."""
+    chain = create_long_chain(7)
+    await repository.save(chain)
+
+    first = await repository.get_steps(chain.id, limit=3)
+    second = await repository.get_steps(chain.id, cursor=first[-1].step_number, limit=3)
+    last = await repository.get_steps(chain.id, cursor=second[-1].step_number, limit=3)
+
+    assert [s.step_number for s in first] == [0, 1, 2]
+    assert [s.step_number for s in second] == [3, 4, 5]
+    assert [s.step_number for s in last] == [6]
+    assert last[0].thinking.content == "Step 6"
+
+
+@pytest.mark.asyncio
+async def test_get_steps_filters_by_type(repository):
+    """Test restricting steps and counts to given step types."""
+    chain = create_long_chain(7)
+    await repository.save(chain)
+
+    steps = await repository.get_steps(chain.id, limit=10, types=[StepType.TOOL_CALL])
+
+    assert [s.step_number for s in steps] == [1, 3, 5]
+    assert steps[0].tool_call.parameters == {"q": 1}
+    assert await repository.count_steps(chain.id) == 7
+    assert await repository.count_steps(chain.id, types=[StepType.TOOL_CALL]) == 3
@@ -416,6 +416,95 @@ class TestInMemoryTaskRepository:
         result = await repo.list_by_skill("tenant-1", "chat", limit=3)
         assert len(result) == 3
 
+    @pytest.mark.asyncio
+    async def test_indexes_follow_update_and_delete(self, repo: InMemoryTaskRepository) -> None:
+        """Lists should reflect tasks moved between index keys and deleted tasks."""
+        now = datetime.now(timezone.utc)
+        task = Task(
+            id="t1",
+            agent_id="agent-1",
+            state=TaskState.SUBMITTED,
+            created_at=now,
+            updated_at=now,
+            tenant_id="tenant-1",
+            user_id="user-1",
+            skill_name="chat",
+        )
+        await repo.save(task)
+
+        moved = task.model_copy(update={"agent_id": "agent-2", "skill_name": "search"})
+        await repo.update(moved)
+
+        assert await repo.list_by_agent("agent-1") == []
+        assert [t.id for t in await repo.list_by_agent("agent-2")] == ["t1"]
+        assert await repo.list_by_skill("tenant-1", "chat") == []
+        assert [t.skill_name for t in await repo.list_by_skill("tenant-1", "search")] == [
+            "search"
+        ]
+        # Lists return the latest version of the task
+        assert (await repo.list_by_tenant("tenant-1"))[0].agent_id == "agent-2"
+
+        await repo.delete("t1")
+        assert await repo.list_by_tenant("tenant-1") == []
+        assert await repo.list_by_agent("agent-2") == []
+
+    @pytest.mark.asyncio
+    async def test_list_by_tenant_cursor(self, repo: InMemoryTaskRepository) -> None:
+        """list_by_tenant() should seek past a cursor in (created_at, id) desc order."""
+        from datetime import timedelta
+
+        from omniforge.storage.pagination import next_cursor
+
+        now = datetime.now(timezone.utc)
+        for i in range(5):
+            await repo.save(
+                Task(
+                    id=f"t{i}",
+                    agent_id="agent-1",
+                    state=TaskState.SUBMITTED,
+                    # t3 and t4 share a timestamp: ties are broken by ID
+                    created_at=now - timedelta(seconds=min(i, 3)),
+                    updated_at=now,
+                    tenant_id="tenant-1",
+                    user_id="user-1",
+                )
+            )
+
+        page1 = await repo.list_by_tenant("tenant-1", limit=2)
+        page2 = await repo.list_by_tenant(
+            "tenant-1", limit=2, cursor=next_cursor(page1, 2, "created_at")
+        )
+        page3 = await repo.list_by_tenant(
+            "tenant-1", limit=2, cursor=next_cursor(page2, 2, "created_at")
+        )
+
+        assert [t.id for t in page1 + page2 + page3] == ["t0", "t1", "t2", "t4", "t3"]
+
+    @pytest.mark.asyncio
+    async def test_list_by_parent_orders_by_created_at_asc(
+        self, repo: InMemoryTaskRepository
+    ) -> None:
+        """list_by_parent() should return children oldest first."""
+        from datetime import timedelta
+
+        now = datetime.now(timezone.utc)
+        for i in range(3):
+            await repo.save(
+                Task(
+                    id=f"child-{i}",
+                    agent_id="agent-1",
+                    state=TaskState.SUBMITTED,
+                    created_at=now - timedelta(seconds=i),
+                    updated_at=now,
+                    tenant_id="tenant-1",
+                    user_id="user-1",
+                    parent_task_id="parent",
+                )
+            )
+
+        children = await repo.list_by_parent("parent", limit=2)
+        assert [t.id for t in children] == ["child-2", "child-1"]
+
 
 class TestInMemoryAgentRepository:
     """Tests for InMemoryAgentRepository."""
@@ -551,3 +640,79 @@ class TestInMemoryAgentRepository:
 
         agents = await repo.list_by_tenant("tenant-1", limit=3)
         assert len(agents) == 3
+
+    @pytest.mark.asyncio
+    async def test_list_by_tenant_follows_update_and_delete(
+        self, repo: InMemoryAgentRepository
+    ) -> None:
+        """list_by_tenant() should reflect agents moved between tenants and deleted."""
+        agent = MockAgent()
+        agent.identity = AgentIdentity(
+            id="agent-1", name="Agent 1", description="First", version="1.0.0"
+        )
+        agent.tenant_id = "tenant-1"  # type: ignore[attr-defined]
+        await repo.save(agent)
+
+        moved = MockAgent()
+        moved.identity = agent.identity
+        moved.tenant_id = "tenant-2"  # type: ignore[attr-defined]
+        await repo.update(moved)
+
+        assert await repo.list_by_tenant("tenant-1") == []
+        assert await repo.list_by_tenant("tenant-2") == [moved]
+
+        await repo.delete("agent-1")
+        assert await repo.list_by_tenant("tenant-2") == []
+
+
+class TestInMemoryTaskSummaries:
+    """Tests for InMemoryTaskRepository.list_summaries()."""
+
+    @pytest.mark.asyncio
+    async def test_filters_and_pagination(self) -> None:
+        """Filters should be applied before limit/offset and honour the time range."""
+        from datetime import timedelta
+
+        repo = InMemoryTaskRepository()
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for i in range(6):
+            await repo.save(
+                Task(
+                    id=f"t{i}",
+                    agent_id="agent-1",
+                    state=TaskState.WORKING if i % 2 == 0 else TaskState.SUBMITTED,
+                    messages=[
+                        TaskMessage(
+                            id=f"msg-{i}",
+                            role="user",
+                            parts=[TextPart(text="Hi")],
+                            created_at=base,
+                        )
+                    ],
+                    created_at=base + timedelta(minutes=i),
+                    updated_at=base,
+                    tenant_id="tenant-1",
+                    user_id="user-1",
+                    skill_name="chat" if i < 4 else "search",
+                )
+            )
+
+        working = await repo.list_summaries(
+            tenant_id="tenant-1", state=TaskState.WORKING, limit=2, offset=1
+        )
+        assert [s.id for s in working] == ["t2", "t0"]
+        assert working[0].message_count == 1
+
+        in_range = await repo.list_summaries(
+            tenant_id="tenant-1",
+            skill_name="chat",
+            created_after=base,
+            created_before=base + timedelta(minutes=3),
+        )
+        assert [s.id for s in in_range] == ["t2", "t1"]
+
+        by_agent = await repo.list_summaries(agent_id="agent-1", limit=3)
+        assert [s.id for s in by_agent] == ["t5", "t4", "t3"]
+
+        with pytest.raises(ValueError):
+            await repo.list_summaries()
@@ -0,0 +1,161 @@
+"""Tests for upgrading databases created by earlier versions."""
+
+from uuid import UUID
+
+import pytest
+from sqlalchemy import inspect, text
+
+from omniforge.conversation.models import MessageRole
+from omniforge.conversation.sqlite_repository import SQLiteConversationRepository
+from omniforge.storage.database import Database, DatabaseConfig
+
+# conversations and conversation_messages as created before versions and archival
+LEGACY_CONVERSATION_DDL = [
+    """CREATE TABLE conversations (
+        id VARCHAR(36) NOT NULL PRIMARY KEY,
+        tenant_id VARCHAR(255) NOT NULL,
+        user_id VARCHAR(255) NOT NULL,
+        conversation_type VARCHAR(50) NOT NULL,
+        state VARCHAR(100),
+        state_metadata JSON,
+        title VARCHAR(500),
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL,
+        conversation_metadata JSON
+    )""",
+    "CREATE INDEX idx_conversation_tenant_updated ON conversations (tenant_id, updated_at)",
+    """CREATE TABLE conversation_messages (
+        id VARCHAR(36) NOT NULL PRIMARY KEY,
+        conversation_id VARCHAR(36) NOT NULL REFERENCES conversations (id) ON DELETE CASCADE,
+        role VARCHAR(50) NOT NULL,
+        content TEXT NOT NULL,
+        created_at DATETIME NOT NULL,
+        message_metadata JSON
+    )""",
+    """INSERT INTO conversations VALUES (
+        'c0000000-0000-0000-0000-000000000001', 'tenant-1', 'user-1', 'chat', NULL, NULL,
+        'Old', '2026-01-01 00:00:00', '2026-01-01 00:00:00', NULL
+    )""",
+]
+
+# tasks as created before the change log and denormalized counts existed
+LEGACY_TASK_DDL = [
+    """CREATE TABLE tasks (
+        id VARCHAR(255) NOT NULL PRIMARY KEY,
+        tenant_id VARCHAR(255),
+        agent_id VARCHAR(255) NOT NULL,
+        user_id VARCHAR(255) NOT NULL,
+        state VARCHAR(50) NOT NULL,
+        skill_name VARCHAR(255),
+        input_summary VARCHAR(500),
+        parent_task_id VARCHAR(255),
+        conversation_id VARCHAR(255),
+        trace_id VARCHAR(255),
+        messages JSON NOT NULL,
+        artifacts JSON NOT NULL,
+        error JSON,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL
+    )""",
+    """INSERT INTO tasks VALUES (
+        'task-1', 'tenant-1', 'agent-1', 'user-1', 'completed', NULL, NULL, NULL, NULL,
+        NULL, '[{"id": "m1"}, {"id": "m2"}]', '[]', NULL,
+        '2026-01-01 00:00:00', '2026-01-01 00:00:00'
+    )""",
+]
+
+CONVERSATION_ID = UUID("c0000000-0000-0000-0000-000000000001")
+
+
+@pytest.fixture
+async def legacy_database(tmp_path):
+    """Create a file database with tables in an earlier layout."""
+    db = Database(DatabaseConfig(url=f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}"))
+    async with db.engine.begin() as conn:
+        for statement in LEGACY_CONVERSATION_DDL + LEGACY_TASK_DDL:
+            await conn.execute(text(statement))
+    yield db
+    await db.close()
+
+
+async def table_layout(db: Database, table: str) -> tuple[set[str], dict[str, list[str]]]:
+    """Return a table's column names and index columns by index name."""
+
+    def read(conn):
+        inspector = inspect(conn)
+        columns = {c["name"] for c in inspector.get_columns(table)}
+        indexes = {i["name"]: i["column_names"] for i in inspector.get_indexes(table)}
+        return columns, indexes
+
+    async with db.engine.connect() as conn:
+        return await conn.run_sync(read)
+
+
+class TestUpgradeSchema:
+    """Tests for the upgrade run by Database.create_tables()."""
+
+    @pytest.mark.asyncio
+    async def test_adds_archive_columns_and_table(self, legacy_database: Database) -> None:
+        """Archival columns, indexes and table should be added to an old database."""
+        await legacy_database.create_tables()
+
+        columns, indexes = await table_layout(legacy_database, "conversations")
+        assert {"archived_at", "rehydrated_at"} <= columns
+        assert indexes["idx_conversation_archived_updated"] == ["archived_at", "updated_at"]
+        assert indexes["idx_conversation_tenant_updated"] == ["tenant_id", "updated_at", "id"]
+
+        repo = SQLiteConversationRepository(legacy_database)
+        conversation = await repo.get_conversation(CONVERSATION_ID, "tenant-1")
+        assert conversation is not None
+        assert conversation.archived_at is None
+        await repo.add_message(CONVERSATION_ID, "tenant-1", MessageRole.USER, "still works")
+        assert len(await repo.get_messages(CONVERSATION_ID, "tenant-1")) == 1
+
+    @pytest.mark.asyncio
+    async def test_adds_conversation_version(self, legacy_database: Database) -> None:
+        """Existing conversations should start at version 0 and be bumped by writes."""
+        await legacy_database.create_tables()
+
+        columns, _ = await table_layout(legacy_database, "conversations")
+        assert "version" in columns
+
+        repo = SQLiteConversationRepository(legacy_database)
+        before = await repo.get_conversation(CONVERSATION_ID, "tenant-1")
+        await repo.add_message(CONVERSATION_ID, "tenant-1", MessageRole.USER, "hello")
+        after = await repo.get_conversation(CONVERSATION_ID, "tenant-1")
+        assert (before.version, after.version) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_adds_task_counts_and_event_tables(self, legacy_database: Database) -> None:
+        """Task counts should be added and backfilled, and the log tables created."""
+        await legacy_database.create_tables()
+
+        columns, indexes = await table_layout(legacy_database, "tasks")
+        assert {"message_count", "artifact_count"} <= columns
+        assert indexes["idx_task_agent_created"] == ["agent_id", "created_at", "id"]
+        _, event_indexes = await table_layout(legacy_database, "task_events")
+        assert "idx_task_events_task_id" in event_indexes
+
+        async with legacy_database.session() as session:
+            counts = await session.execute(text("SELECT message_count, artifact_count FROM tasks"))
+            assert counts.one() == (2, 0)
+
+    @pytest.mark.asyncio
+    async def test_upgrade_is_idempotent(self, legacy_database: Database) -> None:
+        """Running create_tables() again should not change an upgraded schema."""
+        from omniforge.storage.migrations import upgrade_schema
+
+        await legacy_database.create_tables()
+        async with legacy_database.engine.begin() as conn:
+            assert await conn.run_sync(upgrade_schema) == []
+
+    @pytest.mark.asyncio
+    async def test_new_database_needs_no_upgrade(self, tmp_path) -> None:
+        """Tables created from the current models should already be up to date."""
+        from omniforge.storage.migrations import upgrade_schema
+
+        db = Database(DatabaseConfig(url=f"sqlite+aiosqlite:///{tmp_path / 'new.db'}"))
+        await db.create_tables()
+        async with db.engine.begin() as conn:
+            assert await conn.run_sync(upgrade_schema) == []
+        await db.close()
@@ -0,0 +1,38 @@
+"""Tests for keyset pagination cursors."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from omniforge.storage.pagination import decode_cursor, encode_cursor, is_after, keyset_key
+
+
+class TestCursors:
+    """Tests for cursor encoding and in-memory comparison."""
+
+    def test_round_trip(self) -> None:
+        """A decoded cursor should return the encoded position."""
+        now = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+        assert decode_cursor(encode_cursor(now, 42)) == (now, "42")
+
+    def test_invalid_cursor(self) -> None:
+        """A malformed cursor should raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor("not-a-cursor")
+
+    def test_aware_timestamps_compared_in_utc(self) -> None:
+        """Aware timestamps in other zones should be ordered by their UTC instant."""
+        utc = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+        plus_two = utc.astimezone(timezone(timedelta(hours=2)))
+
+        assert keyset_key(plus_two, "a") == keyset_key(utc, "a")
+        assert keyset_key(plus_two, "a") == keyset_key(utc.replace(tzinfo=None), "a")
+
+    def test_is_after_with_mixed_offsets(self) -> None:
+        """Rows earlier than the cursor instant should come after it, newest first."""
+        cursor = encode_cursor(datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc), "b")
+        # 13:30+02:00 is 11:30 UTC, earlier than the cursor
+        earlier = datetime(2026, 1, 1, 13, 30, tzinfo=timezone(timedelta(hours=2)))
+
+        assert is_after(earlier, "z", cursor)
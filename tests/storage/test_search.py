@@ -0,0 +1,238 @@
+"""Tests for the full-text search index."""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from omniforge.agents.models import TextPart
+from omniforge.conversation.models import MessageRole
+from omniforge.conversation.sqlite_repository import SQLiteConversationRepository
+from omniforge.storage.database import Database, DatabaseConfig
+from omniforge.storage.search import SearchIndex, SearchKind
+from omniforge.storage.task_repository import SQLTaskRepository
+from omniforge.tasks.models import Task, TaskMessage, TaskState
+
+
+@pytest.fixture
+async def database():
+    """Create in-memory database for testing."""
+    db = Database(DatabaseConfig(url="sqlite+aiosqlite:///:memory:"))
+    await db.create_tables()
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+def conversations(database: Database) -> SQLiteConversationRepository:
+    """Create conversation repository."""
+    return SQLiteConversationRepository(database)
+
+
+async def save_task(database: Database, task_id: str, tenant_id: str, summary: str) -> Task:
+    """Persist a task with the given input summary."""
+    now = datetime.utcnow()
+    task = Task(
+        id=task_id,
+        agent_id="agent-1",
+        tenant_id=tenant_id,
+        user_id="user-1",
+        state=TaskState.SUBMITTED,
+        input_summary=summary,
+        messages=[
+            TaskMessage(id="msg-1", role="user", parts=[TextPart(text=summary)], created_at=now)
+        ],
+        created_at=now,
+        updated_at=now,
+    )
+    async with database.session() as session:
+        await SQLTaskRepository(session).save(task)
+    return task
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex on SQLite FTS5."""
+
+    @pytest.mark.asyncio
+    async def test_inserted_messages_are_searchable(
+        self, database: Database, conversations: SQLiteConversationRepository
+    ) -> None:
+        conv = await conversations.create_conversation("tenant-1", "user-1")
+        message = await conversations.add_message(
+            conv.id, "tenant-1", MessageRole.USER, "Please reconcile the invoice totals"
+        )
+        await conversations.add_message(conv.id, "tenant-1", MessageRole.USER, "Nice weather")
+
+        results = await SearchIndex(database).search("tenant-1", "invoices")
+
+        assert [r.id for r in results] == [str(message.id)]
+        assert results[0].kind == SearchKind.MESSAGE
+        assert results[0].parent_id == str(conv.id)
+        assert "[invoice]" in results[0].snippet
+
+    @pytest.mark.asyncio
+    async def test_search_is_tenant_scoped(
+        self, database: Database, conversations: SQLiteConversationRepository
+    ) -> None:
+        conv = await conversations.create_conversation("tenant-1", "user-1")
+        await conversations.add_message(conv.id, "tenant-1", MessageRole.USER, "secret roadmap")
+        await save_task(database, "task-1", "tenant-1", "secret roadmap review")
+
+        assert await SearchIndex(database).search("tenant-2", "secret roadmap") == []
+
+    @pytest.mark.asyncio
+    async def test_results_are_ranked_across_kinds(
+        self, database: Database, conversations: SQLiteConversationRepository
+    ) -> None:
+        conv = await conversations.create_conversation("tenant-1", "user-1")
+        await conversations.add_message(
+            conv.id,
+            "tenant-1",
+            MessageRole.USER,
+            "A long message that mentions deploy once among many other unrelated words here",
+        )
+        await save_task(database, "task-1", "tenant-1", "deploy deploy")
+
+        results = await SearchIndex(database).search("tenant-1", "deploy")
+
+        assert [r.kind for r in results] == [SearchKind.TASK, SearchKind.MESSAGE]
+        assert results[0].score <= results[1].score
+
+    @pytest.mark.asyncio
+    async def test_kind_filter_and_pagination(
+        self, database: Database, conversations: SQLiteConversationRepository
+    ) -> None:
+        conv = await conversations.create_conversation("tenant-1", "user-1")
+        for i in range(5):
+            await conversations.add_message(conv.id, "tenant-1", MessageRole.USER, f"report {i}")
+        await save_task(database, "task-1", "tenant-1", "report")
+
+        index = SearchIndex(database)
+        first = await index.search("tenant-1", "report", kinds=[SearchKind.MESSAGE], limit=3)
+        second = await index.search(
+            "tenant-1", "report", kinds=[SearchKind.MESSAGE], limit=3, offset=3
+        )
+
+        assert len(first) == 3
+        assert len(second) == 2
+        assert {r.kind for r in first + second} == {SearchKind.MESSAGE}
+        assert not {r.id for r in first} & {r.id for r in second}
+
+    @pytest.mark.asyncio
+    async def test_query_syntax_is_treated_as_text(
+        self, database: Database, conversations: SQLiteConversationRepository
+    ) -> None:
+        conv = await conversations.create_conversation("tenant-1", "user-1")
+        await conversations.add_message(conv.id, "tenant-1", MessageRole.USER, "near or not")
+
+        index = SearchIndex(database)
+        assert len(await index.search("tenant-1", 'NEAR(" OR')) == 1
+        assert await index.search("tenant-1", '"*()') == []
+
+    @pytest.mark.asyncio
+    async def test_task_summary_updates_and_deletes_are_synced(self, database: Database) -> None:
+        task = await save_task(database, "task-1", "tenant-1", "draft the quarterly plan")
+        index = SearchIndex(database)
+
+        task.input_summary = "review the budget"
+        async with database.session() as session:
+            await SQLTaskRepository(session).update(task)
+
+        assert await index.search("tenant-1", "quarterly") == []
+        assert [r.id for r in await index.search("tenant-1", "budget")] == ["task-1"]
+
+        async with database.session() as session:
+            await SQLTaskRepository(session).delete("task-1")
+
+        assert await index.search("tenant-1", "budget") == []
+
+    @pytest.mark.asyncio
+    async def test_rebuild_backfills_existing_rows(
+        self, database: Database, conversations: SQLiteConversationRepository
+    ) -> None:
+        conv = await conversations.create_conversation("tenant-1", "user-1")
+        await conversations.add_message(conv.id, "tenant-1", MessageRole.USER, "legacy data")
+        await save_task(database, "task-1", "tenant-1", "legacy task")
+
+        # Simulate a database created before search existed
+        async with database.session() as session:
+            for name in ("conversation_messages_fts", "tasks_fts"):
+                await session.execute(text(f"DROP TABLE {name}"))
+
+        index = SearchIndex(database)
+        counts = await index.rebuild()
+
+        assert counts == {"message": 1, "task": 1}
+        assert len(await index.search("tenant-1", "legacy")) == 2
+
+        # Triggers are recreated too
+        await conversations.add_message(conv.id, "tenant-1", MessageRole.USER, "legacy again")
+        assert len(await index.search("tenant-1", "legacy")) == 3
+
+    @pytest.mark.asyncio
+    async def test_rebuild_upgrades_legacy_tables(
+        self, database: Database, conversations: SQLiteConversationRepository
+    ) -> None:
+        conv = await conversations.create_conversation("tenant-1", "user-1")
+        await conversations.add_message(conv.id, "tenant-1", MessageRole.USER, "legacy data")
+
+        # Simulate the earlier layout keyed by an UNINDEXED id column
+        async with database.session() as session:
+            await session.execute(text("DROP TABLE conversation_messages_fts"))
+            await session.execute(
+                text(
+                    "CREATE VIRTUAL TABLE conversation_messages_fts "
+                    "USING fts5(content, message_id UNINDEXED)"
+                )
+            )
+
+        index = SearchIndex(database)
+        await index.create_index()
+
+        assert len(await index.search("tenant-1", "legacy")) == 1
+        await conversations.add_message(conv.id, "tenant-1", MessageRole.USER, "legacy again")
+        assert len(await index.search("tenant-1", "legacy")) == 2
+
+
+class TestSearchTriggerCost:
+    """The sync triggers must not scan the FTS tables."""
+
+    @staticmethod
+    def delete_steps(path: str, rows: int) -> int:
+        """Count VM steps spent deleting one task from a table of ``rows`` tasks."""
+        conn = sqlite3.connect(path)
+        try:
+            conn.executemany(
+                "INSERT INTO tasks (id, agent_id, user_id, state, input_summary, messages, "
+                "artifacts, created_at, updated_at) VALUES (?, 'agent-1', 'user-1', "
+                "'submitted', ?, '[]', '[]', '2026-01-01', '2026-01-01')",
+                [(f"task-{i}", f"summary number {i}") for i in range(rows)],
+            )
+            conn.commit()
+            steps = 0
+
+            def count() -> int:
+                nonlocal steps
+                steps += 1
+                return 0
+
+            conn.set_progress_handler(count, 1)
+            conn.execute("DELETE FROM tasks WHERE id = 'task-0'")
+            conn.set_progress_handler(None, 1)
+            return steps
+        finally:
+            conn.close()
+
+    @pytest.mark.asyncio
+    async def test_delete_cost_independent_of_table_size(self, tmp_path) -> None:
+        costs = []
+        for rows in (50, 2000):
+            path = tmp_path / f"search-{rows}.db"
+            db = Database(DatabaseConfig(url=f"sqlite+aiosqlite:///{path}"))
+            await db.create_tables()
+            await db.close()
+            costs.append(self.delete_steps(str(path), rows))
+
+        # A scan of the FTS table would grow with the 40x larger table
+        assert costs[1] < costs[0] * 3
@@ -0,0 +1,157 @@
+"""Tests for the shared-state backends."""
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from omniforge.storage.shared_state import (
+    SharedStateConfig,
+    SQLiteStateStore,
+    StateBackend,
+    create_agent_repository,
+    create_task_repository,
+)
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> str:
+    """Path of a fresh shared state file."""
+    return str(tmp_path / "state.db")
+
+
+class TestSharedStateConfig:
+    """Tests for SharedStateConfig."""
+
+    def test_defaults_to_memory(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without configuration, state stays in process memory."""
+        monkeypatch.delenv("OMNIFORGE_STATE_BACKEND", raising=False)
+
+        config = SharedStateConfig.from_env()
+
+        assert config.backend is StateBackend.MEMORY
+        assert not config.shared
+
+    def test_reads_sqlite_backend(self, monkeypatch: pytest.MonkeyPatch, path: str) -> None:
+        """The sqlite backend and its file are read from the environment."""
+        monkeypatch.setenv("OMNIFORGE_STATE_BACKEND", "SQLite")
+        monkeypatch.setenv("OMNIFORGE_STATE_PATH", path)
+
+        config = SharedStateConfig.from_env()
+
+        assert config.backend is StateBackend.SQLITE
+        assert config.shared
+        assert config.database_url == f"sqlite+aiosqlite:///{path}"
+
+    def test_rejects_unknown_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An unknown backend name is a configuration error."""
+        monkeypatch.setenv("OMNIFORGE_STATE_BACKEND", "redis")
+
+        with pytest.raises(ValueError, match="OMNIFORGE_STATE_BACKEND"):
+            SharedStateConfig.from_env()
+
+    def test_factories_follow_backend(self, path: str) -> None:
+        """Repository factories return in-memory or shared implementations."""
+        from omniforge.storage.agent_repository import SQLiteAgentRepository
+        from omniforge.storage.memory import InMemoryAgentRepository, InMemoryTaskRepository
+        from omniforge.storage.task_repository import DatabaseTaskRepository
+
+        memory = SharedStateConfig()
+        sqlite = SharedStateConfig(backend=StateBackend.SQLITE, path=path)
+
+        assert isinstance(create_task_repository(memory), InMemoryTaskRepository)
+        assert isinstance(create_agent_repository(config=memory), InMemoryAgentRepository)
+        assert isinstance(create_task_repository(sqlite), DatabaseTaskRepository)
+        assert isinstance(create_agent_repository(config=sqlite), SQLiteAgentRepository)
+
+
+class TestSQLiteStateStore:
+    """Tests for SQLiteStateStore."""
+
+    def test_set_get_delete(self, path: str) -> None:
+        """Values round-trip as JSON and can be deleted."""
+        store = SQLiteStateStore(path)
+
+        store.set("ns", "key", {"a": [1, 2]})
+        assert store.get("ns", "key") == {"a": [1, 2]}
+
+        store.delete("ns", "key")
+        assert store.get("ns", "key") is None
+
+    def test_visible_to_other_connections(self, path: str) -> None:
+        """Writes are visible to another store on the same file (another worker)."""
+        writer = SQLiteStateStore(path)
+        reader = SQLiteStateStore(path)
+
+        writer.set("ns", "key", "value")
+
+        assert reader.get("ns", "key") == "value"
+
+    def test_items_in_insertion_order(self, path: str) -> None:
+        """Overwriting a key keeps its original position."""
+        store = SQLiteStateStore(path)
+        store.set("ns", "b", 1)
+        store.set("ns", "a", 2)
+        store.set("ns", "b", 3)
+        store.set("other", "c", 4)
+
+        assert store.items("ns") == [("b", 3), ("a", 2)]
+        assert store.keys("ns") == ["b", "a"]
+
+    def test_expired_entries_are_hidden_and_purged(self, path: str) -> None:
+        """Entries past their TTL are not returned and can be purged."""
+        store = SQLiteStateStore(path)
+        store.set("ns", "expired", 1, ttl_seconds=-1)
+        store.set("ns", "live", 2, ttl_seconds=60)
+
+        assert store.get("ns", "expired") is None
+        assert store.keys("ns") == ["live"]
+        assert store.purge_expired() == 1
+
+    def test_clear_namespace(self, path: str) -> None:
+        """clear() only removes keys of the given namespace."""
+        store = SQLiteStateStore(path)
+        store.set("ns", "a", 1)
+        store.set("other", "a", 2)
+
+        store.clear("ns")
+
+        assert store.keys("ns") == []
+        assert store.get("other", "a") == 2
+
+    def test_transaction_rolls_back_on_error(self, path: str) -> None:
+        """Writes inside a failed transaction are discarded."""
+        store = SQLiteStateStore(path)
+
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.set("ns", "key", 1)
+                raise RuntimeError("boom")
+
+        assert store.get("ns", "key") is None
+
+    def test_rejects_unserializable_values(self, path: str) -> None:
+        """Values must be JSON-serializable."""
+        store = SQLiteStateStore(path)
+
+        with pytest.raises(ValueError, match="JSON-serialisable"):
+            store.set("ns", "key", object())
+
+    @pytest.mark.asyncio
+    async def test_run_does_not_block_event_loop(self, path: str) -> None:
+        """Waiting for another process's write lock happens off the event loop."""
+        store = SQLiteStateStore(path, busy_timeout=5.0)
+        store.set("ns", "key", 0)
+        other = sqlite3.connect(path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+
+        write = asyncio.create_task(store.run(store.set, "ns", "key", 1))
+        # The loop keeps running while the write waits for the lock
+        await asyncio.sleep(0.1)
+        assert not write.done()
+
+        other.execute("COMMIT")
+        other.close()
+        await write
+        assert store.get("ns", "key") == 1
@@ -0,0 +1,60 @@
+"""Tests for the shared fork-safe SQLite connection."""
+
+from pathlib import Path
+
+import pytest
+
+from omniforge.storage.sqlite_connection import SQLiteConnection
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS items (name TEXT NOT NULL);"
+
+
+class TestSQLiteConnection:
+    """Tests for SQLiteConnection."""
+
+    def test_opens_lazily_with_schema_and_wal(self, tmp_path: Path) -> None:
+        """The first get() creates the parent directory, the schema and a WAL file."""
+        path = tmp_path / "nested" / "state.db"
+        conn = SQLiteConnection(path, SCHEMA)
+        assert not path.parent.exists()
+
+        connection = conn.get()
+
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert connection.execute("SELECT COUNT(*) FROM items").fetchone() == (0,)
+        assert conn.get() is connection
+        conn.close()
+
+    def test_reopened_after_close(self, tmp_path: Path) -> None:
+        """Data written before close() is visible on the reopened connection."""
+        conn = SQLiteConnection(tmp_path / "state.db", SCHEMA)
+        conn.get().execute("INSERT INTO items VALUES ('a')")
+        conn.close()
+
+        assert conn.get().execute("SELECT name FROM items").fetchall() == [("a",)]
+        conn.close()
+
+    def test_reopened_in_forked_child(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A connection opened by another process id is not reused."""
+        conn = SQLiteConnection(tmp_path / "state.db", SCHEMA)
+        parent = conn.get()
+
+        monkeypatch.setattr("os.getpid", lambda: -1)
+
+        assert conn.get() is not parent
+        conn.close()
+        parent.close()
+
+    def test_in_transaction(self, tmp_path: Path) -> None:
+        """in_transaction follows explicit BEGIN and COMMIT."""
+        conn = SQLiteConnection(tmp_path / "state.db", SCHEMA)
+        assert conn.in_transaction is False
+
+        conn.get().execute("BEGIN")
+        assert conn.in_transaction is True
+        conn.get().execute("COMMIT")
+
+        assert conn.in_transaction is False
+        conn.close()
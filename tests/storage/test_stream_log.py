@@ -0,0 +1,55 @@
+"""Tests for the SQL-backed stream overflow log."""
+
+import pytest
+
+from omniforge.storage.database import Database, DatabaseConfig
+from omniforge.storage.stream_log import SQLStreamEventLog
+from omniforge.tasks.streams import StreamFrame, TaskStream
+
+
+@pytest.fixture
+async def db():
+    """Create in-memory database for testing."""
+    database = Database(DatabaseConfig(url="sqlite+aiosqlite:///:memory:"))
+    await database.create_tables()
+    yield database
+    await database.close()
+
+
+class TestSQLStreamEventLog:
+    """Tests for SQLStreamEventLog."""
+
+    @pytest.mark.asyncio
+    async def test_append_and_read(self, db: Database) -> None:
+        """Frames should be read back in order after an ID, per stream."""
+        log = SQLStreamEventLog(db)
+        await log.append("task-1", [StreamFrame(i, "message", str(i)) for i in range(1, 6)])
+        await log.append("task-2", [StreamFrame(1, "done", "{}")])
+
+        frames = await log.read("task-1", after_id=2, limit=2)
+
+        assert frames == [StreamFrame(3, "message", "3"), StreamFrame(4, "message", "4")]
+
+    @pytest.mark.asyncio
+    async def test_discard(self, db: Database) -> None:
+        """Discarding a stream should remove only its frames."""
+        log = SQLStreamEventLog(db)
+        await log.append("task-1", [StreamFrame(1, "message", "a")])
+        await log.append("task-2", [StreamFrame(1, "message", "b")])
+
+        await log.discard("task-1")
+
+        assert await log.read("task-1", 0, 10) == []
+        assert len(await log.read("task-2", 0, 10)) == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_overflow_round_trip(self, db: Database) -> None:
+        """A stream should replay overflowed frames from the database."""
+        stream = TaskStream("task-1", SQLStreamEventLog(db), buffer_size=2, overflow_batch=1)
+        for i in range(6):
+            await stream.publish("message", str(i))
+        await stream.close()
+
+        frames = [f async for f in stream.subscribe()]
+
+        assert [f.data for f in frames] == [str(i) for i in range(6)]
@@ -0,0 +1,169 @@
+"""Tests for incremental task change sets."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from omniforge.agents.models import Artifact, TextPart
+from omniforge.storage.memory import InMemoryTaskRepository
+from omniforge.storage.task_events import TaskChangeBuffer, apply_changes, diff_task
+from omniforge.tasks.models import Task, TaskError, TaskMessage, TaskState
+
+
+def make_task() -> Task:
+    """Create a test task with one user message."""
+    now = datetime.now(timezone.utc)
+    return Task(
+        id="task-1",
+        agent_id="agent-1",
+        tenant_id="tenant-1",
+        user_id="user-1",
+        state=TaskState.SUBMITTED,
+        messages=[
+            TaskMessage(id="msg-1", role="user", parts=[TextPart(text="Hi")], created_at=now)
+        ],
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def with_message(task: Task, message_id: str, **update) -> Task:
+    """Return a copy of the task with an agent message appended."""
+    message = TaskMessage(
+        id=message_id,
+        role="agent",
+        parts=[TextPart(text=message_id)],
+        created_at=datetime.now(timezone.utc),
+    )
+    return task.model_copy(
+        update={
+            "messages": [*task.messages, message],
+            "updated_at": task.updated_at + timedelta(seconds=1),
+            **update,
+        }
+    )
+
+
+class TestDiffAndApply:
+    """Tests for diff_task and apply_changes."""
+
+    def test_round_trip(self) -> None:
+        """Applying a diff to the original should reproduce the update."""
+        task = make_task()
+        artifact = Artifact(
+            type="document", title="Report", inline_content="body", tenant_id="tenant-1"
+        )
+        updated = with_message(
+            task,
+            "msg-2",
+            state=TaskState.FAILED,
+            artifacts=[artifact],
+            error=TaskError(code="boom", message="failed"),
+        )
+
+        changes = diff_task(task, updated)
+
+        assert changes is not None
+        assert [m["id"] for m in changes["messages"]] == ["msg-2"]
+        assert apply_changes(task, [changes]) == updated
+
+    def test_only_appended_messages_recorded(self) -> None:
+        """Change sets should not repeat earlier messages."""
+        task = with_message(make_task(), "msg-2")
+        updated = with_message(task, "msg-3")
+
+        changes = diff_task(task, updated)
+
+        assert changes is not None
+        assert [m["id"] for m in changes["messages"]] == ["msg-3"]
+        assert "state" not in changes
+
+    def test_non_append_change_not_incremental(self) -> None:
+        """Rewriting history or metadata should require a full snapshot."""
+        task = with_message(make_task(), "msg-2")
+
+        assert diff_task(task, task.model_copy(update={"messages": task.messages[:1]})) is None
+        assert diff_task(task, task.model_copy(update={"skill_name": "other"})) is None
+
+
+class TestTaskChangeBuffer:
+    """Tests for batched change persistence."""
+
+    @pytest.mark.asyncio
+    async def test_batches_until_terminal_state(self) -> None:
+        """Changes should be held back until a terminal state is recorded."""
+        repo = InMemoryTaskRepository()
+        task = make_task()
+        await repo.save(task)
+        buffer = TaskChangeBuffer(repo, task, flush_interval=60)
+
+        await buffer.record(with_message(buffer.task, "msg-2", state=TaskState.WORKING))
+        stored = await repo.get(task.id)
+        assert stored is not None and stored.state == TaskState.SUBMITTED
+
+        await buffer.record(with_message(buffer.task, "msg-3", state=TaskState.COMPLETED))
+        stored = await repo.get(task.id)
+        assert stored == buffer.task
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_full(self) -> None:
+        """A full batch should be written without waiting for the interval."""
+        repo = InMemoryTaskRepository()
+        task = make_task()
+        await repo.save(task)
+        buffer = TaskChangeBuffer(repo, task, batch_size=2, flush_interval=60)
+
+        await buffer.record(with_message(buffer.task, "msg-2"))
+        await buffer.record(with_message(buffer.task, "msg-3"))
+
+        stored = await repo.get(task.id)
+        assert stored is not None and len(stored.messages) == 3
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_update(self) -> None:
+        """Non-incremental changes should flush pending changes, then update."""
+        repo = InMemoryTaskRepository()
+        task = make_task()
+        await repo.save(task)
+        buffer = TaskChangeBuffer(repo, task, flush_interval=60)
+
+        await buffer.record(with_message(buffer.task, "msg-2"))
+        await buffer.record(buffer.task.model_copy(update={"input_summary": "changed"}))
+
+        stored = await repo.get(task.id)
+        assert stored is not None
+        assert stored.input_summary == "changed"
+        assert len(stored.messages) == 2
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_interval_without_new_changes(self) -> None:
+        """Pending changes should be written once the interval elapses, even if idle."""
+        repo = InMemoryTaskRepository()
+        task = make_task()
+        await repo.save(task)
+        buffer = TaskChangeBuffer(repo, task, flush_interval=0.01)
+
+        await buffer.record(with_message(buffer.task, "msg-2", state=TaskState.WORKING))
+        await asyncio.sleep(0.05)
+
+        stored = await repo.get(task.id)
+        assert stored is not None and stored.state == TaskState.WORKING
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_changes(self) -> None:
+        """Changes whose append fails should be written by the next flush."""
+        repo = InMemoryTaskRepository()
+        task = make_task()
+        await repo.save(task)
+        buffer = TaskChangeBuffer(repo, task, flush_interval=60)
+        await buffer.record(with_message(buffer.task, "msg-2"))
+
+        with patch.object(repo, "append_changes", side_effect=RuntimeError("down")):
+            with pytest.raises(RuntimeError):
+                await buffer.flush()
+        await buffer.flush()
+
+        stored = await repo.get(task.id)
+        assert stored is not None and len(stored.messages) == 2
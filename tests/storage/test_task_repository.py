@@ -133,9 +133,7 @@ class TestSQLTaskRepositoryListByAgent:
     """Tests for list_by_agent."""
 
     @pytest.mark.asyncio
-    async def test_list_by_agent_returns_only_agent_tasks(
-        self, repo: SQLTaskRepository
-    ) -> None:
+    async def test_list_by_agent_returns_only_agent_tasks(self, repo: SQLTaskRepository) -> None:
         """list_by_agent() should only return tasks for the given agent."""
         await repo.save(make_task("t1", agent_id="agent-1"))
         await repo.save(make_task("t2", agent_id="agent-1"))
@@ -158,9 +156,7 @@ class TestSQLTaskRepositoryTenantIsolation:
     """Tests for multi-tenancy enforcement in list_by_tenant."""
 
     @pytest.mark.asyncio
-    async def test_list_by_tenant_isolates_tenants(
-        self, repo: SQLTaskRepository
-    ) -> None:
+    async def test_list_by_tenant_isolates_tenants(self, repo: SQLTaskRepository) -> None:
         """list_by_tenant() must not return tasks from other tenants."""
         await repo.save(make_task("t1", tenant_id="tenant-a"))
         await repo.save(make_task("t2", tenant_id="tenant-a"))
@@ -193,6 +189,56 @@ class TestSQLTaskRepositoryTenantIsolation:
         # No overlap
         assert {t.id for t in page1}.isdisjoint({t.id for t in page2})
 
+    @pytest.mark.asyncio
+    async def test_list_by_tenant_cursor_pagination(self, repo: SQLTaskRepository) -> None:
+        """list_by_tenant() should seek past a cursor, including timestamp ties."""
+        from omniforge.storage.pagination import next_cursor
+
+        now = datetime.now(timezone.utc)
+        for i in range(5):
+            # All share one created_at so ordering relies on the id tie-breaker
+            await repo.save(make_task(f"t{i}").model_copy(update={"created_at": now}))
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = await repo.list_by_tenant("tenant-1", limit=2, cursor=cursor)
+            seen.extend(t.id for t in page)
+            cursor = next_cursor(page, 2, "created_at")
+            if cursor is None:
+                break
+
+        assert seen == ["t4", "t3", "t2", "t1", "t0"]
+
+    @pytest.mark.asyncio
+    async def test_list_by_tenant_cursor_stable_under_inserts(
+        self, repo: SQLTaskRepository
+    ) -> None:
+        """New tasks must not shift later cursor pages."""
+        from datetime import timedelta
+
+        from omniforge.storage.pagination import next_cursor
+
+        now = datetime.now(timezone.utc)
+        for i in range(4):
+            t = make_task(f"t{i}").model_copy(update={"created_at": now - timedelta(seconds=i)})
+            await repo.save(t)
+
+        page1 = await repo.list_by_tenant("tenant-1", limit=2)
+        await repo.save(make_task("new").model_copy(update={"created_at": now + timedelta(1)}))
+        page2 = await repo.list_by_tenant(
+            "tenant-1", limit=2, cursor=next_cursor(page1, 2, "created_at")
+        )
+
+        assert [t.id for t in page1] == ["t0", "t1"]
+        assert [t.id for t in page2] == ["t2", "t3"]
+
+    @pytest.mark.asyncio
+    async def test_list_by_tenant_invalid_cursor(self, repo: SQLTaskRepository) -> None:
+        """list_by_tenant() should reject malformed cursors."""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            await repo.list_by_tenant("tenant-1", cursor="not-a-cursor")
+
     @pytest.mark.asyncio
     async def test_list_by_tenant_empty(self, repo: SQLTaskRepository) -> None:
         """list_by_tenant() should return empty list for unknown tenant."""
@@ -204,17 +250,13 @@ class TestSQLTaskRepositoryListBySkill:
     """Tests for list_by_skill."""
 
     @pytest.mark.asyncio
-    async def test_list_by_skill_filters_correctly(
-        self, repo: SQLTaskRepository
-    ) -> None:
+    async def test_list_by_skill_filters_correctly(self, repo: SQLTaskRepository) -> None:
         """list_by_skill() should filter by both tenant and skill."""
         await repo.save(make_task("t1", skill_name="invoice-extraction"))
         await repo.save(make_task("t2", skill_name="invoice-extraction"))
         await repo.save(make_task("t3", skill_name="chat"))
         # Same skill, different tenant — must NOT appear
-        await repo.save(
-            make_task("t4", tenant_id="tenant-2", skill_name="invoice-extraction")
-        )
+        await repo.save(make_task("t4", tenant_id="tenant-2", skill_name="invoice-extraction"))
 
         tasks = await repo.list_by_skill("tenant-1", "invoice-extraction")
         assert len(tasks) == 2
@@ -232,13 +274,284 @@ class TestSQLTaskRepositoryListBySkill:
     @pytest.mark.asyncio
     async def test_list_by_skill_no_cross_tenant(self, repo: SQLTaskRepository) -> None:
         """list_by_skill() must never return tasks from other tenants."""
-        await repo.save(
-            make_task("t1", tenant_id="tenant-a", skill_name="invoice-extraction")
-        )
-        await repo.save(
-            make_task("t2", tenant_id="tenant-b", skill_name="invoice-extraction")
-        )
+        await repo.save(make_task("t1", tenant_id="tenant-a", skill_name="invoice-extraction"))
+        await repo.save(make_task("t2", tenant_id="tenant-b", skill_name="invoice-extraction"))
 
         result = await repo.list_by_skill("tenant-a", "invoice-extraction")
         assert len(result) == 1
         assert result[0].id == "t1"
+
+
+def make_message(message_id: str, text: str) -> TaskMessage:
+    """Create an agent message to append to a task."""
+    return TaskMessage(
+        id=message_id,
+        role="agent",
+        parts=[TextPart(text=text)],
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def append_change(message: TaskMessage, state: TaskState | None = None) -> dict:
+    """Build a change set appending one message."""
+    change: dict = {
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "messages": [message.model_dump(mode="json")],
+    }
+    if state is not None:
+        change["state"] = state.value
+    return change
+
+
+class TestSQLTaskRepositoryEventLog:
+    """Tests for append-only task change persistence."""
+
+    @pytest.mark.asyncio
+    async def test_append_changes_folded_on_read(self, repo: SQLTaskRepository) -> None:
+        """get() and list queries should reflect appended changes."""
+        await repo.save(make_task())
+
+        await repo.append_changes(
+            "task-1",
+            [
+                append_change(make_message("msg-2", "one"), TaskState.WORKING),
+                append_change(make_message("msg-3", "two")),
+            ],
+        )
+
+        task = await repo.get("task-1")
+        assert task is not None
+        assert task.state == TaskState.WORKING
+        assert [m.id for m in task.messages] == ["msg-1", "msg-2", "msg-3"]
+
+        listed = await repo.list_by_tenant("tenant-1")
+        assert [m.id for m in listed[0].messages] == ["msg-1", "msg-2", "msg-3"]
+
+    @pytest.mark.asyncio
+    async def test_append_changes_updates_state_column(
+        self, repo: SQLTaskRepository, session
+    ) -> None:
+        """append_changes() should keep the indexed state column current."""
+        from omniforge.storage.models import TaskModel
+
+        await repo.save(make_task())
+        await repo.append_changes(
+            "task-1", [append_change(make_message("msg-2", "one"), TaskState.WORKING)]
+        )
+
+        model = await session.get(TaskModel, "task-1")
+        assert model.state == TaskState.WORKING.value
+        # The snapshot itself is untouched until compaction
+        assert len(model.messages) == 1
+
+    @pytest.mark.asyncio
+    async def test_terminal_state_compacts(self, repo: SQLTaskRepository, session) -> None:
+        """Reaching a terminal state should fold events into the snapshot."""
+        from sqlalchemy import func, select
+
+        from omniforge.storage.models import TaskEventModel, TaskModel
+
+        await repo.save(make_task())
+        await repo.append_changes("task-1", [append_change(make_message("msg-2", "one"))])
+        await repo.append_changes(
+            "task-1", [append_change(make_message("msg-3", "done"), TaskState.COMPLETED)]
+        )
+
+        pending = await session.scalar(select(func.count()).select_from(TaskEventModel))
+        model = await session.get(TaskModel, "task-1")
+        assert pending == 0
+        assert [m["id"] for m in model.messages] == ["msg-1", "msg-2", "msg-3"]
+        assert model.state == TaskState.COMPLETED.value
+
+    @pytest.mark.asyncio
+    async def test_threshold_compacts(self, session) -> None:
+        """Reaching compact_threshold pending events should trigger compaction."""
+        repo = SQLTaskRepository(session, compact_threshold=3)
+        await repo.save(make_task())
+
+        for i in range(3):
+            await repo.append_changes(
+                "task-1", [append_change(make_message(f"msg-{i + 2}", str(i)))]
+            )
+
+        task = await repo.get("task-1")
+        assert task is not None
+        assert len(task.messages) == 4
+        await repo.append_changes("task-1", [append_change(make_message("msg-5", "4"))])
+        task = await repo.get("task-1")
+        assert task is not None
+        assert [m.id for m in task.messages][-2:] == ["msg-4", "msg-5"]
+
+    @pytest.mark.asyncio
+    async def test_update_supersedes_pending_changes(self, repo: SQLTaskRepository) -> None:
+        """A full update() should discard pending events."""
+        await repo.save(make_task())
+        await repo.append_changes("task-1", [append_change(make_message("msg-2", "one"))])
+
+        replacement = make_task(state=TaskState.CANCELLED)
+        await repo.update(replacement)
+
+        task = await repo.get("task-1")
+        assert task is not None
+        assert task.state == TaskState.CANCELLED
+        assert [m.id for m in task.messages] == ["msg-1"]
+
+    @pytest.mark.asyncio
+    async def test_append_cost_independent_of_history(self, db, repo: SQLTaskRepository) -> None:
+        """append_changes() should not read the snapshot, however long the history."""
+        from sqlalchemy import event
+
+        short = make_task("task-short")
+        long = make_task("task-long")
+        long.messages.extend(make_message(f"msg-{i}", "x" * 100) for i in range(2, 500))
+        await repo.save(short)
+        await repo.save(long)
+        repo.session.expunge_all()
+
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany) -> None:
+            statements.append(statement)
+
+        costs = []
+        event.listen(db.engine.sync_engine, "before_cursor_execute", record)
+        try:
+            for task_id in ("task-short", "task-long"):
+                statements.clear()
+                await repo.append_changes(task_id, [append_change(make_message("new", "y"))])
+                costs.append(list(statements))
+        finally:
+            event.remove(db.engine.sync_engine, "before_cursor_execute", record)
+
+        assert costs[0] == costs[1]
+        assert not any("tasks.messages" in statement for statement in costs[1])
+        summaries = await repo.list_summaries(tenant_id="tenant-1")
+        counts = {summary.id: summary.message_count for summary in summaries}
+        assert counts == {"task-short": 2, "task-long": 500}
+
+    @pytest.mark.asyncio
+    async def test_append_changes_nonexistent_raises(self, repo: SQLTaskRepository) -> None:
+        """append_changes() on an unknown task should raise ValueError."""
+        with pytest.raises(ValueError, match="does not exist"):
+            await repo.append_changes("missing", [append_change(make_message("m", "x"))])
+
+
+class TestSQLTaskRepositorySummaries:
+    """Tests for filtered task summary listings."""
+
+    async def save_series(self, repo: SQLTaskRepository) -> datetime:
+        """Save six tasks a minute apart, alternating WORKING/SUBMITTED; return the base time."""
+        from datetime import timedelta
+
+        base = datetime(2025, 1, 1, 12, 0)
+        for i in range(6):
+            task = make_task(
+                f"task-{i}",
+                skill_name="chat" if i < 4 else "search",
+                state=TaskState.WORKING if i % 2 == 0 else TaskState.SUBMITTED,
+            )
+            await repo.save(task.model_copy(update={"created_at": base + timedelta(minutes=i)}))
+        return base
+
+    @pytest.mark.asyncio
+    async def test_filters_applied_before_pagination(self, repo: SQLTaskRepository) -> None:
+        """Filtered pages should be full and continue via cursor."""
+        from omniforge.storage.pagination import next_cursor
+
+        await self.save_series(repo)
+
+        page1 = await repo.list_summaries(tenant_id="tenant-1", state=TaskState.WORKING, limit=2)
+        page2 = await repo.list_summaries(
+            tenant_id="tenant-1",
+            state=TaskState.WORKING,
+            limit=2,
+            cursor=next_cursor(page1, 2, "created_at"),
+        )
+
+        assert [s.id for s in page1] == ["task-4", "task-2"]
+        assert [s.id for s in page2] == ["task-0"]
+
+    @pytest.mark.asyncio
+    async def test_skill_and_time_range_filters(self, repo: SQLTaskRepository) -> None:
+        """Skill and created_at range filters should combine."""
+        from datetime import timedelta
+
+        base = await self.save_series(repo)
+
+        summaries = await repo.list_summaries(
+            tenant_id="tenant-1",
+            skill_name="chat",
+            created_after=base,
+            created_before=base + timedelta(minutes=3),
+        )
+
+        assert [s.id for s in summaries] == ["task-2", "task-1"]
+
+    @pytest.mark.asyncio
+    async def test_counts_reflect_appended_changes(self, repo: SQLTaskRepository) -> None:
+        """Summaries should report counts including appended, uncompacted messages."""
+        await repo.save(make_task())
+        await repo.append_changes(
+            "task-1",
+            [
+                append_change(make_message("msg-2", "one")),
+                append_change(make_message("msg-3", "two")),
+            ],
+        )
+
+        (summary,) = await repo.list_summaries(agent_id="agent-1")
+
+        assert summary.message_count == 3
+        assert summary.artifact_count == 0
+        assert summary.input_summary == "Test input"
+
+    @pytest.mark.asyncio
+    async def test_requires_tenant_or_agent(self, repo: SQLTaskRepository) -> None:
+        """An unscoped listing should be rejected."""
+        with pytest.raises(ValueError, match="tenant_id or agent_id"):
+            await repo.list_summaries(state=TaskState.WORKING)
+
+
+class TestDatabaseTaskRepository:
+    """Tests for DatabaseTaskRepository (one session per operation)."""
+
+    @pytest.mark.asyncio
+    async def test_shared_between_instances(self, tmp_path) -> None:
+        """Two repositories on one database file see each other's writes."""
+        from omniforge.storage.task_repository import DatabaseTaskRepository
+
+        url = f"sqlite+aiosqlite:///{tmp_path}/tasks.db"
+        first = DatabaseTaskRepository(Database(DatabaseConfig(url=url)))
+        second = DatabaseTaskRepository(Database(DatabaseConfig(url=url)))
+
+        await first.save(make_task())
+        await first.append_changes(
+            "task-1", [append_change(make_message("msg-2", "Hi"), TaskState.WORKING)]
+        )
+
+        task = await second.get("task-1")
+        assert task is not None
+        assert task.state == TaskState.WORKING
+        assert [m.id for m in task.messages] == ["msg-1", "msg-2"]
+
+        summaries = await second.list_summaries(tenant_id="tenant-1")
+        assert [s.message_count for s in summaries] == [2]
+
+        await second.delete("task-1")
+        assert await first.get("task-1") is None
+
+        await first.database.close()
+        await second.database.close()
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self, db) -> None:
+        """Repository errors surface unchanged."""
+        from omniforge.storage.task_repository import DatabaseTaskRepository
+
+        repo = DatabaseTaskRepository(db)
+        await repo.save(make_task())
+
+        with pytest.raises(ValueError, match="already exists"):
+            await repo.save(make_task())
+        with pytest.raises(ValueError):
+            await repo.list_summaries()
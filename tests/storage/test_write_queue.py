@@ -0,0 +1,193 @@
+"""Tests for the group-commit write queue and SQLite connection pragmas."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select, text
+
+from omniforge.agents.cot.chain import ReasoningChain
+from omniforge.conversation.models import MessageRole
+from omniforge.conversation.orm import ConversationMessageModel
+from omniforge.conversation.sqlite_repository import SQLiteConversationRepository
+from omniforge.enterprise.audit import AuditEvent, AuditLogger, EventType, Outcome
+from omniforge.storage.audit_repository import AuditRepository, DatabaseAuditRepository
+from omniforge.storage.chain_repository import ChainRepository
+from omniforge.storage.database import Database, DatabaseConfig
+
+
+@pytest.fixture
+async def database(tmp_path):
+    """Create a file-backed database with the write queue enabled."""
+    config = DatabaseConfig(
+        url=f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        write_queue=True,
+        write_batch_window=0.01,
+    )
+    db = Database(config)
+    await db.create_tables()
+    yield db
+    await db.close()
+
+
+def make_audit_event(resource_id: str) -> AuditEvent:
+    """Create a test audit event."""
+    return AuditEvent(
+        tenant_id="tenant-1",
+        user_id="user-1",
+        event_type=EventType.TOOL_CALL,
+        resource_type="agent",
+        resource_id=resource_id,
+        action="execute",
+        outcome=Outcome.SUCCESS,
+    )
+
+
+class TestSQLitePragmas:
+    """Tests for pragmas applied at connect."""
+
+    @pytest.mark.asyncio
+    async def test_file_database_uses_wal(self, database: Database) -> None:
+        async with database.session() as session:
+            journal_mode = (await session.execute(text("PRAGMA journal_mode"))).scalar()
+            synchronous = (await session.execute(text("PRAGMA synchronous"))).scalar()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+
+    @pytest.mark.asyncio
+    async def test_pragmas_can_be_disabled(self, tmp_path) -> None:
+        db = Database(
+            DatabaseConfig(url=f"sqlite+aiosqlite:///{tmp_path / 'plain.db'}", sqlite_pragmas={})
+        )
+        async with db.session() as session:
+            journal_mode = (await session.execute(text("PRAGMA journal_mode"))).scalar()
+        await db.close()
+
+        assert journal_mode == "delete"
+
+
+class TestWriteQueue:
+    """Tests for Database.write() with group commit enabled."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_are_group_committed(self, database: Database) -> None:
+        repo = SQLiteConversationRepository(database)
+        conversation = await repo.create_conversation("tenant-1", "user-1")
+
+        messages = await asyncio.gather(
+            *(
+                repo.add_message(conversation.id, "tenant-1", MessageRole.USER, f"m{i}")
+                for i in range(20)
+            )
+        )
+
+        assert len(messages) == 20
+        stats = database.write_queue.stats()  # type: ignore[union-attr]
+        assert stats["writes"] == 21
+        assert stats["batches"] < stats["writes"]
+
+        updated = await repo.get_conversation(conversation.id, "tenant-1")
+        assert updated is not None
+        assert updated.version == 20
+
+    @pytest.mark.asyncio
+    async def test_failing_write_does_not_fail_batch(self, database: Database) -> None:
+        repo = SQLiteConversationRepository(database)
+        conversation = await repo.create_conversation("tenant-1", "user-1")
+        missing = (await repo.create_conversation("tenant-2", "user-2")).id
+
+        results = await asyncio.gather(
+            repo.add_message(conversation.id, "tenant-1", MessageRole.USER, "ok-1"),
+            repo.add_message(missing, "tenant-1", MessageRole.USER, "wrong tenant"),
+            repo.add_message(conversation.id, "tenant-1", MessageRole.USER, "ok-2"),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[1], ValueError)
+        async with database.session() as session:
+            count = (
+                await session.execute(select(func.count()).select_from(ConversationMessageModel))
+            ).scalar()
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_session_repositories_share_group_commit(self, database: Database) -> None:
+        events = [make_audit_event(f"agent-{i}") for i in range(5)]
+
+        await asyncio.gather(
+            *(database.write(lambda s, e=e: AuditRepository(s).save(e)) for e in events)
+        )
+
+        async with database.session() as session:
+            stored = await AuditRepository(session).query(tenant_id="tenant-1")
+        assert len(stored) == 5
+
+    @pytest.mark.asyncio
+    async def test_audit_logger_writes_through_queue(self, database: Database) -> None:
+        repository = DatabaseAuditRepository(database)
+        audit_logger = AuditLogger(repository)
+        submitted = []
+        submit = database.write_queue.submit
+
+        async def record(operation):
+            submitted.append(operation)
+            return await submit(operation)
+
+        database.write_queue.submit = record  # type: ignore[method-assign]
+
+        await asyncio.gather(
+            *(
+                audit_logger.log_access("tenant-1", "user-1", "agent", f"agent-{i}", "read", True)
+                for i in range(3)
+            )
+        )
+
+        assert len(submitted) == 3
+        assert await repository.count(tenant_id="tenant-1") == 3
+
+    @pytest.mark.asyncio
+    async def test_chain_repository_writes_group_committed(self, database: Database) -> None:
+        chains = [
+            ReasoningChain(task_id=f"task-{i}", agent_id="agent-1", tenant_id="tenant-1")
+            for i in range(3)
+        ]
+
+        await asyncio.gather(
+            *(database.write(lambda s, c=c: ChainRepository(s).save(c)) for c in chains)
+        )
+
+        async with database.session() as session:
+            stored = await ChainRepository(session).list_by_tenant("tenant-1")
+        assert len(stored) == 3
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_writes(self, tmp_path) -> None:
+        url = f"sqlite+aiosqlite:///{tmp_path / 'flush.db'}"
+        db = Database(DatabaseConfig(url=url, write_queue=True, write_batch_window=0.05))
+        await db.create_tables()
+
+        pending = asyncio.ensure_future(
+            db.write(lambda s: AuditRepository(s).save(make_audit_event("agent-1")))
+        )
+        await asyncio.sleep(0)
+        await db.close()
+        await pending
+
+        db = Database(DatabaseConfig(url=url))
+        async with db.session() as session:
+            stored = await AuditRepository(session).query(tenant_id="tenant-1")
+        await db.close()
+        assert len(stored) == 1
+
+    @pytest.mark.asyncio
+    async def test_write_without_queue_commits_immediately(self) -> None:
+        db = Database(DatabaseConfig(url="sqlite+aiosqlite:///:memory:"))
+        await db.create_tables()
+
+        assert db.write_queue is None
+        await db.write(lambda s: AuditRepository(s).save(make_audit_event("agent-1")))
+        async with db.session() as session:
+            stored = await AuditRepository(session).query(tenant_id="tenant-1")
+        await db.close()
+
+        assert [e.resource_id for e in stored] == ["agent-1"]
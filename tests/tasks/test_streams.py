@@ -0,0 +1,308 @@
+"""Tests for resumable task event streams."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from omniforge.agents.events import TaskDoneEvent
+from omniforge.tasks.models import TaskState
+from omniforge.tasks.streams import (
+    InMemoryStreamEventLog,
+    StreamFrame,
+    TaskStream,
+    TaskStreamHub,
+    coalesce_frames,
+    parse_last_event_id,
+)
+
+
+async def collect(frames) -> list[StreamFrame]:
+    """Drain an async iterator of frames."""
+    return [frame async for frame in frames]
+
+
+class TestTaskStream:
+    """Tests for the per-task ring buffer."""
+
+    @pytest.mark.asyncio
+    async def test_frames_numbered_and_encoded(self) -> None:
+        """Frames should get increasing IDs and encode with an id field."""
+        stream = TaskStream("task-1", InMemoryStreamEventLog())
+
+        first = await stream.publish("status", '{"state": "working"}')
+        second = await stream.publish("done", "{}")
+
+        assert (first.id, second.id) == (1, 2)
+        assert first.encode() == 'event: status\ndata: {"state": "working"}\nid: 1\n\n'
+        assert first.encoded == first.encode().encode()
+
+    @pytest.mark.asyncio
+    async def test_replay_after_last_event_id(self) -> None:
+        """Subscribing with a Last-Event-ID should skip frames already received."""
+        stream = TaskStream("task-1", InMemoryStreamEventLog())
+        for i in range(5):
+            await stream.publish("message", str(i))
+        await stream.close()
+
+        frames = await collect(stream.subscribe(last_event_id=3))
+
+        assert [f.id for f in frames] == [4, 5]
+
+    @pytest.mark.asyncio
+    async def test_overflow_replayed_from_log(self) -> None:
+        """Frames evicted from the ring buffer should be replayed from the log."""
+        log = InMemoryStreamEventLog()
+        stream = TaskStream("task-1", log, buffer_size=4, overflow_batch=2)
+        for i in range(10):
+            await stream.publish("message", str(i))
+        await stream.close()
+
+        assert [f.id for f in await log.read("task-1", 0, 100)] == [1, 2, 3, 4, 5, 6]
+        frames = await collect(stream.subscribe())
+        assert [f.id for f in frames] == list(range(1, 11))
+
+    @pytest.mark.asyncio
+    async def test_subscriber_tails_live_frames(self) -> None:
+        """A subscriber should receive frames published after it subscribed."""
+        stream = TaskStream("task-1", InMemoryStreamEventLog())
+        reader = asyncio.create_task(collect(stream.subscribe()))
+        await asyncio.sleep(0)
+
+        await stream.publish("message", "a")
+        await stream.publish("done", "b")
+        await stream.close()
+
+        assert [f.data for f in await reader] == ["a", "b"]
+
+
+class TestTaskStreamHub:
+    """Tests for producer lifecycle management."""
+
+    @pytest.mark.asyncio
+    async def test_producer_survives_reconnect(self) -> None:
+        """A client reconnecting within the grace period should resume the stream."""
+        hub = TaskStreamHub(resume_grace=5.0)
+        release = asyncio.Event()
+
+        async def produce(stream: TaskStream) -> None:
+            await stream.publish("status", "working")
+            await release.wait()
+            await stream.publish("done", "completed")
+
+        hub.open("task-1", produce)
+        first = hub.subscribe("task-1")
+        frame = await first.__anext__()
+        await first.aclose()  # client disconnects
+
+        release.set()
+        frames = await collect(hub.subscribe("task-1", last_event_id=frame.id))
+
+        assert [f.data for f in frames] == ["completed"]
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_abandoned_producer_cancelled(self) -> None:
+        """A producer without subscribers should be cancelled after the grace period."""
+        hub = TaskStreamHub(resume_grace=0.01)
+        cancelled = asyncio.Event()
+
+        async def produce(stream: TaskStream) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        stream = hub.open("task-1", produce)
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        await asyncio.sleep(0)
+
+        assert stream.closed
+        assert stream.cancellation.reason == "abandoned"
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_stop_event_ends_waiting_subscriber(self) -> None:
+        """Setting stop and waking the stream should end an idle subscription."""
+        hub = TaskStreamHub(resume_grace=5.0)
+        release = asyncio.Event()
+
+        async def produce(stream: TaskStream) -> None:
+            await release.wait()
+
+        stream = hub.open("task-1", produce)
+        stop = asyncio.Event()
+        reader = asyncio.create_task(collect(hub.subscribe("task-1", stop=stop)))
+        await asyncio.sleep(0)
+
+        stop.set()
+        stream.wake()
+
+        assert await asyncio.wait_for(reader, timeout=1) == []
+        assert stream.subscribers == 0
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_reopen_continues_numbering(self) -> None:
+        """Streaming a task again should continue frame IDs after the previous run."""
+        hub = TaskStreamHub()
+
+        async def produce(stream: TaskStream) -> None:
+            await stream.publish("done", "{}")
+
+        hub.open("task-1", produce)
+        await collect(hub.subscribe("task-1"))
+        hub.open("task-1", produce)
+        frames = await collect(hub.subscribe("task-1"))
+
+        assert [f.id for f in frames] == [2]
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_reopen_after_expiry_continues_numbering(self) -> None:
+        """A stream opened again after expiring should not reuse old frame IDs."""
+        hub = TaskStreamHub(retention=0.0)
+
+        async def produce(stream: TaskStream) -> None:
+            await stream.publish("done", "{}")
+
+        hub.open("task-1", produce)
+        await collect(hub.subscribe("task-1"))
+        await asyncio.sleep(0.01)
+        assert hub.get("task-1") is None
+
+        hub.open("task-1", produce)
+        frames = await collect(hub.subscribe("task-1"))
+
+        assert [f.id for f in frames] == [2]
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_expiry_discards_overflow_frames(self) -> None:
+        """An expired stream's overflow frames should be dropped from the log."""
+        log = InMemoryStreamEventLog()
+        hub = TaskStreamHub(event_log=log, buffer_size=1, retention=0.0)
+
+        async def produce(stream: TaskStream) -> None:
+            for i in range(100):
+                await stream.publish("status", str(i))
+
+        hub.open("task-1", produce)
+        await collect(hub.subscribe("task-1"))
+        await asyncio.sleep(0.01)
+        await hub.close()
+
+        assert await log.read("task-1", after_id=0, limit=1000) == []
+
+    @pytest.mark.asyncio
+    async def test_open_records_tenant(self) -> None:
+        """The tenant that opened a stream should be kept on the stream."""
+        hub = TaskStreamHub()
+
+        async def produce(stream: TaskStream) -> None:
+            await stream.publish("done", "{}")
+
+        stream = hub.open("task-1", produce, tenant_id="tenant-1")
+
+        assert stream.tenant_id == "tenant-1"
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_unknown_stream_rejected(self) -> None:
+        """Subscribing to an unknown stream should raise ValueError."""
+        hub = TaskStreamHub()
+        with pytest.raises(ValueError, match="not found"):
+            await collect(hub.subscribe("missing"))
+
+
+class TestCoalesceFrames:
+    """Tests for batching partial message frames into fewer writes."""
+
+    @pytest.mark.asyncio
+    async def test_partial_frames_coalesced_until_final_frame(self) -> None:
+        """Available partial frames should be written together with the next final frame."""
+        stream = TaskStream("task-1", InMemoryStreamEventLog())
+        for token in ("a", "b", "c"):
+            await stream.publish("message", token, partial=True)
+        await stream.publish("done", "{}")
+        await stream.close()
+
+        chunks = [c async for c in coalesce_frames(stream.subscribe(), flush_interval=10)]
+
+        assert len(chunks) == 1
+        assert chunks[0] == b"".join(f.encoded for f in await stream.read(0))
+
+    @pytest.mark.asyncio
+    async def test_final_frames_written_immediately(self) -> None:
+        """Frames that are not partial should each be written on their own."""
+        stream = TaskStream("task-1", InMemoryStreamEventLog())
+        await stream.publish("status", "{}")
+        await stream.publish("artifact", "{}")
+        await stream.close()
+
+        chunks = [c async for c in coalesce_frames(stream.subscribe(), flush_interval=10)]
+
+        assert [c.split(b"\n")[0] for c in chunks] == [b"event: status", b"event: artifact"]
+
+    @pytest.mark.asyncio
+    async def test_partial_frame_flushed_after_interval(self) -> None:
+        """A held-back partial frame should be written once the window closes."""
+        stream = TaskStream("task-1", InMemoryStreamEventLog())
+        chunks = coalesce_frames(stream.subscribe(), flush_interval=0.01)
+
+        frame = await stream.publish("message", "a", partial=True)
+
+        assert await asyncio.wait_for(chunks.__anext__(), timeout=1) == frame.encoded
+        await chunks.aclose()
+        assert stream.subscribers == 0
+
+    @pytest.mark.asyncio
+    async def test_partial_frames_flushed_at_size_limit(self) -> None:
+        """Pending frames should be written once they reach max_bytes."""
+        stream = TaskStream("task-1", InMemoryStreamEventLog())
+        for _ in range(4):
+            await stream.publish("message", "x" * 40, partial=True)
+        await stream.close()
+        frame_size = len((await stream.read(0))[0].encoded)
+
+        chunks = [
+            c
+            async for c in coalesce_frames(
+                stream.subscribe(), flush_interval=10, max_bytes=2 * frame_size
+            )
+        ]
+
+        assert [len(c) for c in chunks] == [2 * frame_size, 2 * frame_size]
+
+    @pytest.mark.asyncio
+    async def test_hub_subscribe_encoded(self) -> None:
+        """The hub should serve coalesced chunks of a stream."""
+        hub = TaskStreamHub(flush_interval=10)
+        done = TaskDoneEvent(
+            task_id="task-1", timestamp=datetime.utcnow(), final_state=TaskState.COMPLETED
+        )
+
+        async def produce(stream: TaskStream) -> None:
+            await stream.publish("message", "a", partial=True)
+            await stream.publish_event(done)
+
+        hub.open("task-1", produce)
+        chunks = [c async for c in hub.subscribe_encoded("task-1")]
+
+        assert len(chunks) == 1
+        assert chunks[0].endswith(b"\nid: 2\n\n")
+        await hub.close()
+
+
+class TestParseLastEventId:
+    """Tests for Last-Event-ID parsing."""
+
+    def test_parse(self) -> None:
+        assert parse_last_event_id(None) == 0
+        assert parse_last_event_id("42") == 42
+
+    @pytest.mark.parametrize("value", ["abc", "-1"])
+    def test_invalid(self, value: str) -> None:
+        with pytest.raises(ValueError, match="Invalid Last-Event-ID"):
+            parse_last_event_id(value)